@@ -0,0 +1,576 @@
+"""
+Drone Filo Optimizasyonu: Performans Ölçüm Modülü
+Bu modül, çözücülerin ve yardımcı bileşenlerin performansını ölçen benchmark'ları içerir.
+"""
+
+import argparse
+import os
+import tempfile
+import time as zaman_modulu
+from dataclasses import replace
+from datetime import time
+from typing import Dict, Callable
+
+import numpy as np
+
+from data_generator import VeriUreteci, SenaryoFarki, KOLONLU_UZANTI, SIKISTIRMA_MODULLERI
+from csp import KisitCozucu
+from plan import PlanSonucu
+
+
+def ekleme_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    KisitCozucu.ekle ile çevrimiçi teslimat eklemenin gecikmesini ölçer.
+    
+    Senaryonun teslimatlarının bir kısmı coz ile planlanır, kalanlar tek tek ekle ile
+    mevcut plana yerleştirilir. Karşılaştırma için tüm teslimatlar üzerinde çözücünün
+    baştan kurulup çalıştırılma süresi de ölçülür.
+    
+    Args:
+        olcek (float): Drone ve teslimat sayılarının çarpanı
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Gecikme yüzdelikleri (ms), eklenen teslimat oranı ve tam çözüm süresi
+    """
+    dron_sayisi = max(int(20 * olcek), 1)
+    teslimat_sayisi = max(int(1000 * olcek), 1)
+    yeni_teslimat_sayisi = max(int(200 * olcek), 1)
+    mevcut_zaman = time(8, 0)
+    
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(
+        dron_sayisi=dron_sayisi,
+        teslimat_sayisi=teslimat_sayisi + yeni_teslimat_sayisi,
+        ucus_yasak_bolge_sayisi=5,
+        dron_baslangic_poz=(10.0, 10.0)
+    )
+    
+    print(f"Ekleme benchmark'ı: {dron_sayisi} drone, {teslimat_sayisi} planlı + "
+          f"{yeni_teslimat_sayisi} çevrimiçi teslimat")
+    
+    kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari[:teslimat_sayisi], ucus_yasak_bolgeleri, mevcut_zaman)
+    kisit_cozucu.coz()
+    
+    gecikmeler = []
+    eklenen = 0
+    for teslimat in teslimat_noktalari[teslimat_sayisi:]:
+        baslangic = zaman_modulu.perf_counter()
+        sonuc = kisit_cozucu.ekle(teslimat)
+        gecikmeler.append(zaman_modulu.perf_counter() - baslangic)
+        if sonuc is not None:
+            eklenen += 1
+    
+    baslangic = zaman_modulu.perf_counter()
+    tam_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
+    tam_cozucu.coz()
+    tam_cozum_suresi = zaman_modulu.perf_counter() - baslangic
+    
+    # İlk ekleme plan önbelleğini kurduğundan ayrı raporlanır
+    ilk_ekleme_ms = gecikmeler[0] * 1000
+    gecikmeler_ms = np.array(gecikmeler[1:] or gecikmeler) * 1000
+    sonuclar = {
+        "ilk_ekleme_ms": ilk_ekleme_ms,
+        "medyan_ms": float(np.median(gecikmeler_ms)),
+        "p95_ms": float(np.percentile(gecikmeler_ms, 95)),
+        "en_kotu_ms": float(gecikmeler_ms.max()),
+        "eklenen_orani": eklenen / yeni_teslimat_sayisi * 100,
+        "eklemeli_tamamlanma_orani": kisit_cozucu.teslimat_istatistiklerini_al()["tamamlanma_orani"],
+        "tam_cozum_suresi": tam_cozum_suresi,
+        "tam_cozum_tamamlanma_orani": tam_cozucu.teslimat_istatistiklerini_al()["tamamlanma_orani"]
+    }
+    
+    print(f"Ekleme gecikmesi: medyan {sonuclar['medyan_ms']:.3f} ms, p95 {sonuclar['p95_ms']:.3f} ms, "
+          f"en kötü {sonuclar['en_kotu_ms']:.3f} ms")
+    print(f"İlk ekleme (plan önbelleği kurulumu dahil): {ilk_ekleme_ms:.3f} ms")
+    print(f"Yerleştirilen çevrimiçi teslimatlar: {sonuclar['eklenen_orani']:.2f}% "
+          f"(toplam tamamlanma: {sonuclar['eklemeli_tamamlanma_orani']:.2f}%)")
+    print(f"Karşılaştırma - baştan çözüm: {tam_cozum_suresi * 1000:.1f} ms "
+          f"(tamamlanma: {sonuclar['tam_cozum_tamamlanma_orani']:.2f}%)")
+    
+    return sonuclar
+
+
+def kolonlu_yukleme_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Kolonlu senaryo dosyasının kaydetme ve bellek eşlemeli yükleme sürelerini ölçer.
+    
+    Args:
+        olcek (float): Teslimat sayısının çarpanı (1.0 = 1.000.000 teslimat)
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Kaydetme, açma ve nesne oluşturma süreleri (s) ile dosya boyutu (MB)
+    """
+    teslimat_sayisi = max(int(1_000_000 * olcek), 1)
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    kolonlu_senaryo = veri_ureteci.kolonlu_senaryo_uret(
+        dron_sayisi=20,
+        teslimat_sayisi=teslimat_sayisi,
+        ucus_yasak_bolge_sayisi=5
+    )
+    
+    print(f"Kolonlu yükleme benchmark'ı: {teslimat_sayisi} teslimat")
+    
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya_adi = os.path.join(dizin, "senaryo" + KOLONLU_UZANTI)
+        
+        baslangic = zaman_modulu.perf_counter()
+        kolonlu_senaryo.kaydet(dosya_adi)
+        kaydetme_suresi = zaman_modulu.perf_counter() - baslangic
+        
+        baslangic = zaman_modulu.perf_counter()
+        kolonlu_senaryo = veri_ureteci.senaryoyu_kolonlu_yukle(dosya_adi)
+        acma_suresi = zaman_modulu.perf_counter() - baslangic
+        
+        baslangic = zaman_modulu.perf_counter()
+        kolonlu_senaryo.teslimat_noktalarini_al(slice(0, 1000))
+        kismi_nesne_suresi = zaman_modulu.perf_counter() - baslangic
+        
+        baslangic = zaman_modulu.perf_counter()
+        kolonlu_senaryo.teslimat_noktalarini_al()
+        nesne_suresi = zaman_modulu.perf_counter() - baslangic
+        
+        sonuclar = {
+            "kaydetme_suresi": kaydetme_suresi,
+            "acma_suresi": acma_suresi,
+            "kismi_nesne_suresi": kismi_nesne_suresi,
+            "nesne_suresi": nesne_suresi,
+            "dosya_boyutu_mb": os.path.getsize(dosya_adi) / 2**20
+        }
+        del kolonlu_senaryo
+    
+    print(f"Kaydetme: {kaydetme_suresi * 1000:.1f} ms ({sonuclar['dosya_boyutu_mb']:.1f} MB)")
+    print(f"Bellek eşlemeli açma: {acma_suresi * 1000:.3f} ms")
+    print(f"İlk 1000 teslimat nesnesi: {kismi_nesne_suresi * 1000:.3f} ms, "
+          f"tüm teslimat nesneleri: {nesne_suresi * 1000:.1f} ms")
+    
+    return sonuclar
+
+
+def uretim_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Nesne tabanlı ve NumPy ile toplu senaryo üretimini karşılaştırır.
+    
+    Args:
+        olcek (float): Teslimat sayısının çarpanı (1.0 = 1.000.000 teslimat)
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Her iki yol için üretim süresi (s)
+    """
+    teslimat_sayisi = max(int(1_000_000 * olcek), 1)
+    ucus_yasak_bolge_sayisi = max(int(1000 * olcek), 1)
+    
+    print(f"Üretim benchmark'ı: {teslimat_sayisi} teslimat, {ucus_yasak_bolge_sayisi} uçuşa yasak bölge")
+    
+    baslangic = zaman_modulu.perf_counter()
+    VeriUreteci(tohum=tohum).senaryo_uret(100, teslimat_sayisi, ucus_yasak_bolge_sayisi)
+    nesne_suresi = zaman_modulu.perf_counter() - baslangic
+    
+    baslangic = zaman_modulu.perf_counter()
+    VeriUreteci(tohum=tohum).kolonlu_senaryo_uret(100, teslimat_sayisi, ucus_yasak_bolge_sayisi)
+    kolonlu_sure = zaman_modulu.perf_counter() - baslangic
+    
+    print(f"Nesne tabanlı üretim (senaryo_uret): {nesne_suresi * 1000:.1f} ms")
+    print(f"Toplu üretim (kolonlu_senaryo_uret): {kolonlu_sure * 1000:.1f} ms "
+          f"({nesne_suresi / kolonlu_sure:.0f}x)")
+    
+    return {"nesne_suresi": nesne_suresi, "kolonlu_sure": kolonlu_sure}
+
+
+def olcekleme_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Şehir senaryolarında üretim ve CSP çözüm süresinin teslimat sayısıyla değişimini ölçer.
+    
+    10'dan 10^6'ya kadar teslimatlı senaryolar sehir_senaryosu_uret ile üretilir;
+    çözüm süresi yalnızca 10^4 * olcek teslimata kadar ölçülür.
+    
+    Args:
+        olcek (float): Çözülecek en büyük senaryonun çarpanı
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Boyut başına üretim ve çözüm süreleri (s) ile tamamlanma oranları
+    """
+    sonuclar = {}
+    print("Ölçekleme benchmark'ı: şehir senaryoları, 3 depo, 1000x1000 alan")
+    
+    for teslimat_sayisi in [10, 100, 1000, 10_000, 100_000, 1_000_000]:
+        veri_ureteci = VeriUreteci(alan_boyutu=(1000.0, 1000.0), tohum=tohum)
+        baslangic = zaman_modulu.perf_counter()
+        kolonlu_senaryo = veri_ureteci.sehir_senaryosu_uret(teslimat_sayisi, depo_sayisi=3)
+        uretim_suresi = zaman_modulu.perf_counter() - baslangic
+        sonuclar[f"uretim_suresi_{teslimat_sayisi}"] = uretim_suresi
+        satir = (f"{teslimat_sayisi:>8} teslimat, {kolonlu_senaryo.dron_sayisi:>6} drone: "
+                 f"üretim {uretim_suresi * 1000:.1f} ms")
+        
+        if teslimat_sayisi <= 10_000 * olcek:
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = kolonlu_senaryo.nesneleri_al()
+            kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(8, 0))
+            baslangic = zaman_modulu.perf_counter()
+            kisit_cozucu.coz()
+            cozum_suresi = zaman_modulu.perf_counter() - baslangic
+            tamamlanma_orani = kisit_cozucu.teslimat_istatistiklerini_al()["tamamlanma_orani"]
+            sonuclar[f"cozum_suresi_{teslimat_sayisi}"] = cozum_suresi
+            sonuclar[f"tamamlanma_orani_{teslimat_sayisi}"] = tamamlanma_orani
+            satir += f", CSP çözümü {cozum_suresi * 1000:.1f} ms (tamamlanma: {tamamlanma_orani:.2f}%)"
+        
+        print(satir)
+    
+    return sonuclar
+
+
+def pismanlik_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    CSP çözücünün pişmanlık-k ekleme modunu açgözlü modla karşılaştırır.
+    
+    Args:
+        olcek (float): Drone ve teslimat sayılarının çarpanı
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Her yöntem için çalışma süresi (s), tamamlanma oranı ve ortalama enerji
+    """
+    dron_sayisi = max(int(20 * olcek), 1)
+    teslimat_sayisi = max(int(300 * olcek), 1)
+    mevcut_zaman = time(8, 0)
+    
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(
+        dron_sayisi=dron_sayisi,
+        teslimat_sayisi=teslimat_sayisi,
+        ucus_yasak_bolge_sayisi=5,
+        dron_baslangic_poz=(10.0, 10.0)
+    )
+    
+    print(f"Pişmanlık benchmark'ı: {dron_sayisi} drone, {teslimat_sayisi} teslimat")
+    
+    sonuclar = {}
+    for yontem in ["acgozlu", "pismanlik"]:
+        kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
+        baslangic = zaman_modulu.perf_counter()
+        kisit_cozucu.coz(yontem=yontem)
+        sure = zaman_modulu.perf_counter() - baslangic
+        istatistikler = kisit_cozucu.teslimat_istatistiklerini_al()
+        
+        sonuclar[f"{yontem}_suresi"] = sure
+        sonuclar[f"{yontem}_tamamlanma_orani"] = istatistikler["tamamlanma_orani"]
+        sonuclar[f"{yontem}_ortalama_enerji"] = istatistikler["ortalama_enerji_tuketimi"]
+        print(f"{yontem}: {sure * 1000:.1f} ms, tamamlanma {istatistikler['tamamlanma_orani']:.2f}%, "
+              f"ortalama enerji {istatistikler['ortalama_enerji_tuketimi']:.2f} mAh, "
+              f"sefer {istatistikler['toplam_sefer_sayisi']}")
+    
+    return sonuclar
+
+
+def fark_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Küçük bir senaryo farkının uygulanmasını CSP çözücüsünün baştan kurulmasıyla karşılaştırır.
+    
+    Fark, teslimatların %0.1'ini günceller, aynı sayıda teslimat siler ve ekler; bir
+    uçuşa yasak bölgeyi de kaydırır.
+    
+    Args:
+        olcek (float): Drone ve teslimat sayılarının çarpanı
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Baştan kurulum ve fark uygulama süreleri (s) ile hızlanma oranı
+    """
+    dron_sayisi = max(int(50 * olcek), 1)
+    teslimat_sayisi = max(int(10000 * olcek), 1)
+    degisen_sayisi = max(teslimat_sayisi // 1000, 1)
+    mevcut_zaman = time(8, 0)
+    
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(
+        dron_sayisi=dron_sayisi,
+        teslimat_sayisi=teslimat_sayisi,
+        ucus_yasak_bolge_sayisi=5
+    )
+    
+    # Fark: güncelleme, silme, ekleme ve bir bölgenin kaydırılması
+    fark = SenaryoFarki()
+    fark.guncellenenler["TESLIMAT_NOKTALARI"] = [
+        replace(nokta, agirlik=nokta.agirlik * 0.5) for nokta in teslimat_noktalari[:degisen_sayisi]
+    ]
+    fark.silinenler["TESLIMAT_NOKTALARI"] = [
+        nokta.id for nokta in teslimat_noktalari[degisen_sayisi:2 * degisen_sayisi]
+    ]
+    en_buyuk_id = max(nokta.id for nokta in teslimat_noktalari)
+    fark.eklenenler["TESLIMAT_NOKTALARI"] = [
+        replace(nokta, id=en_buyuk_id + 1 + i)
+        for i, nokta in enumerate(veri_ureteci.teslimat_noktalari_uret(degisen_sayisi))
+    ]
+    if ucus_yasak_bolgeleri:
+        bolge = ucus_yasak_bolgeleri[0]
+        fark.guncellenenler["UCUS_YASAK_BOLGELERI"] = [
+            replace(bolge, koordinatlar=[(x + 2.0, y + 2.0) for x, y in bolge.koordinatlar])
+        ]
+    yeni_senaryo = fark.uygula(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri)
+    
+    print(f"Fark benchmark'ı: {dron_sayisi} drone, {teslimat_sayisi} teslimat, "
+          f"{3 * degisen_sayisi} teslimat işlemi")
+    
+    baslangic = zaman_modulu.perf_counter()
+    KisitCozucu(*yeni_senaryo, mevcut_zaman)
+    tam_kurulum_suresi = zaman_modulu.perf_counter() - baslangic
+    
+    kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
+    baslangic = zaman_modulu.perf_counter()
+    yeniden_hesaplanan = kisit_cozucu.farki_uygula(fark)
+    fark_suresi = zaman_modulu.perf_counter() - baslangic
+    
+    print(f"Baştan kurulum: {tam_kurulum_suresi * 1000:.1f} ms")
+    print(f"Fark uygulama: {fark_suresi * 1000:.1f} ms "
+          f"({yeniden_hesaplanan['yeniden_hesaplanan_teslimat']} teslimat sütunu yeniden hesaplandı)")
+    
+    return {
+        "tam_kurulum_suresi": tam_kurulum_suresi,
+        "fark_suresi": fark_suresi,
+        "hizlanma": tam_kurulum_suresi / fark_suresi if fark_suresi > 0 else float("inf")
+    }
+
+
+def dogrulama_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Senaryo doğrulamasının süresini yükleme ve nesne oluşturma süreleriyle karşılaştırır.
+    
+    Args:
+        olcek (float): Teslimat sayısının çarpanı (1.0 = 1.000.000 teslimat)
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Bellek eşlemeli açma, doğrulama ve nesne oluşturma süreleri (s) ile
+                          bulunan sorun sayısı
+    """
+    teslimat_sayisi = max(int(1_000_000 * olcek), 1)
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    kolonlu_senaryo = veri_ureteci.sehir_senaryosu_uret(teslimat_sayisi)
+    
+    print(f"Doğrulama benchmark'ı: {teslimat_sayisi} teslimat, "
+          f"{kolonlu_senaryo.ucus_yasak_bolge_sayisi} uçuşa yasak bölge")
+    
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya_adi = os.path.join(dizin, "senaryo" + KOLONLU_UZANTI)
+        kolonlu_senaryo.kaydet(dosya_adi)
+        
+        baslangic = zaman_modulu.perf_counter()
+        kolonlu_senaryo = veri_ureteci.senaryoyu_kolonlu_yukle(dosya_adi)
+        acma_suresi = zaman_modulu.perf_counter() - baslangic
+        
+        baslangic = zaman_modulu.perf_counter()
+        sorunlar = kolonlu_senaryo.dogrula()
+        dogrulama_suresi = zaman_modulu.perf_counter() - baslangic
+        
+        baslangic = zaman_modulu.perf_counter()
+        kolonlu_senaryo.teslimat_noktalarini_al()
+        nesne_suresi = zaman_modulu.perf_counter() - baslangic
+        del kolonlu_senaryo
+    
+    print(f"Bellek eşlemeli açma: {acma_suresi * 1000:.3f} ms")
+    print(f"Doğrulama: {dogrulama_suresi * 1000:.1f} ms ({len(sorunlar)} sorun)")
+    print(f"Tüm teslimat nesneleri: {nesne_suresi * 1000:.1f} ms")
+    
+    return {
+        "acma_suresi": acma_suresi,
+        "dogrulama_suresi": dogrulama_suresi,
+        "nesne_suresi": nesne_suresi,
+        "sorun_sayisi": len(sorunlar)
+    }
+
+
+def paralel_yukleme_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Metin senaryo dosyasının nesne tabanlı yüklenmesini parçalı paralel yüklemeyle karşılaştırır.
+    
+    Args:
+        olcek (float): Teslimat sayısının çarpanı (1.0 = 1.000.000 teslimat)
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Her yükleme yöntemi için süre (s) ve satır hızı (satır/s)
+    """
+    teslimat_sayisi = max(int(1_000_000 * olcek), 1)
+    isci_sayisi = os.cpu_count() or 1
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.kolonlu_senaryo_uret(
+        dron_sayisi=20,
+        teslimat_sayisi=teslimat_sayisi,
+        ucus_yasak_bolge_sayisi=5
+    ).nesneleri_al()
+    
+    sonuclar = {}
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya_adi = os.path.join(dizin, "senaryo.txt")
+        veri_ureteci.senaryoyu_dosyaya_kaydet(dosya_adi, dronlar, teslimat_noktalari, ucus_yasak_bolgeleri)
+        del dronlar, teslimat_noktalari, ucus_yasak_bolgeleri
+        
+        print(f"Paralel yükleme benchmark'ı: {teslimat_sayisi} teslimat, "
+              f"{os.path.getsize(dosya_adi) / 2**20:.1f} MB, {isci_sayisi} işlemci")
+        
+        baslangic = zaman_modulu.perf_counter()
+        veri_ureteci.senaryoyu_dosyadan_yukle(dosya_adi)
+        sure = zaman_modulu.perf_counter() - baslangic
+        sonuclar["nesne_suresi"] = sure
+        sonuclar["nesne_satir_hizi"] = teslimat_sayisi / sure
+        print(f"Nesne tabanlı yükleme: {sure:.3f} s ({teslimat_sayisi / sure:.0f} satır/s)")
+        
+        for isci in sorted({1, isci_sayisi}):
+            # Parçalar, her işçiye birkaç parça düşecek boyutta seçilir
+            parca_boyutu = max(os.path.getsize(dosya_adi) // (4 * isci), 2**20)
+            veri_ureteci.senaryoyu_paralel_yukle(dosya_adi, isci_sayisi=isci, parca_boyutu=parca_boyutu)
+            istatistikler = veri_ureteci.yukleme_istatistikleri
+            sonuclar[f"paralel_{isci}_suresi"] = istatistikler["sure"]
+            sonuclar[f"paralel_{isci}_satir_hizi"] = istatistikler["satir_hizi"]
+            print(f"Paralel yükleme ({isci} işçi, {istatistikler['parca_sayisi']} parça): "
+                  f"{istatistikler['sure']:.3f} s ({istatistikler['satir_hizi']:.0f} satır/s)")
+    
+    return sonuclar
+
+
+def sikistirma_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Metin senaryo dosyasının sıkıştırma biçimlerine göre boyutunu, yazma ve yükleme sürelerini ölçer.
+    
+    Args:
+        olcek (float): Teslimat sayısının çarpanı (1.0 = 200.000 teslimat)
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Her biçim ve seviye için dosya boyutu (MB), yazma ve yükleme süreleri (s)
+    """
+    teslimat_sayisi = max(int(200_000 * olcek), 1)
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.sehir_senaryosu_uret(
+        teslimat_sayisi
+    ).nesneleri_al()
+    
+    print(f"Sıkıştırma benchmark'ı: {teslimat_sayisi} teslimat")
+    
+    sonuclar = {}
+    with tempfile.TemporaryDirectory() as dizin:
+        # Varsayılan seviyelere ek olarak her biçimin en yüksek seviyesi
+        bicimler = [("yok", "", None)]
+        for uzanti in SIKISTIRMA_MODULLERI:
+            bicimler.append((uzanti[1:], uzanti, None))
+            bicimler.append((f"{uzanti[1:]}_en_yuksek", uzanti, {".xz": 9, ".zst": 19}.get(uzanti, 9)))
+        
+        for ad, uzanti, seviye in bicimler:
+            dosya_adi = os.path.join(dizin, "senaryo.txt" + uzanti)
+            
+            baslangic = zaman_modulu.perf_counter()
+            veri_ureteci.senaryoyu_dosyaya_kaydet(
+                dosya_adi, dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, sikistirma_seviyesi=seviye
+            )
+            yazma_suresi = zaman_modulu.perf_counter() - baslangic
+            
+            baslangic = zaman_modulu.perf_counter()
+            veri_ureteci.senaryoyu_dosyadan_yukle(dosya_adi)
+            yukleme_suresi = zaman_modulu.perf_counter() - baslangic
+            
+            boyut = os.path.getsize(dosya_adi) / 2**20
+            sonuclar[f"{ad}_boyutu_mb"] = boyut
+            sonuclar[f"{ad}_yazma_suresi"] = yazma_suresi
+            sonuclar[f"{ad}_yukleme_suresi"] = yukleme_suresi
+            print(f"{ad:>14}: {boyut:7.2f} MB, yazma {yazma_suresi:.3f} s, yükleme {yukleme_suresi:.3f} s")
+    
+    return sonuclar
+
+
+def plan_benchmarki(olcek: float = 1.0, tohum: int = 42) -> Dict[str, float]:
+    """
+    Ortak plan nesnesinin oluşturulma süresini ve dışa aktarım biçimlerinin boyut ve hızlarını ölçer.
+    
+    Şehir senaryosunun teslimatları drone'lara rastgele dağıtılıp beşer teslimatlık
+    seferlere bölünür; böylece ölçüm çözücüden bağımsız olarak çok sayıda ayak üzerinde yapılır.
+    
+    Args:
+        olcek (float): Teslimat sayısının çarpanı (1.0 = 100.000 teslimat)
+        tohum (int): Rastgele sayı üreteci için tohum değeri
+    
+    Returns:
+        Dict[str, float]: Plan oluşturma süresi ile her biçim için dosya boyutu (MB), yazma ve okuma süreleri (s)
+    """
+    teslimat_sayisi = max(int(100_000 * olcek), 1)
+    veri_ureteci = VeriUreteci(alan_boyutu=(100.0, 100.0), tohum=tohum)
+    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.sehir_senaryosu_uret(
+        teslimat_sayisi
+    ).nesneleri_al()
+    
+    rng = np.random.default_rng(tohum)
+    dron_idleri = rng.choice([dron.id for dron in dronlar], size=len(teslimat_noktalari))
+    dron_teslimatlari = {dron.id: [] for dron in dronlar}
+    for teslimat, dron_id in zip(teslimat_noktalari, dron_idleri.tolist()):
+        dron_teslimatlari[dron_id].append(teslimat.id)
+    seferler = {dron_id: [idler[i:i + 5] for i in range(0, len(idler), 5)] for dron_id, idler in dron_teslimatlari.items()}
+    
+    baslangic = zaman_modulu.perf_counter()
+    plan = PlanSonucu.seferlerden_olustur(
+        "benchmark", dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(8, 0), seferler
+    )
+    olusturma_suresi = zaman_modulu.perf_counter() - baslangic
+    
+    print(f"Plan benchmark'ı: {len(dronlar)} drone, {len(plan)} ayak, oluşturma {olusturma_suresi:.3f} s")
+    
+    sonuclar = {"ayak_sayisi": len(plan), "olusturma_suresi": olusturma_suresi}
+    with tempfile.TemporaryDirectory() as dizin:
+        for uzanti in (".dfp", ".jsonl", ".csv", ".dfp.gz", ".jsonl.gz"):
+            dosya_adi = os.path.join(dizin, "plan" + uzanti)
+            ad = uzanti[1:].replace(".", "_")
+            
+            baslangic = zaman_modulu.perf_counter()
+            plan.kaydet(dosya_adi)
+            yazma_suresi = zaman_modulu.perf_counter() - baslangic
+            
+            boyut = os.path.getsize(dosya_adi) / 2**20
+            sonuclar[f"{ad}_boyutu_mb"] = boyut
+            sonuclar[f"{ad}_yazma_suresi"] = yazma_suresi
+            
+            # CSV yalnızca dışa aktarım biçimidir
+            okuma_metni = ""
+            if not uzanti.startswith(".csv"):
+                baslangic = zaman_modulu.perf_counter()
+                PlanSonucu.yukle(dosya_adi)
+                sonuclar[f"{ad}_okuma_suresi"] = zaman_modulu.perf_counter() - baslangic
+                okuma_metni = f", okuma {sonuclar[f'{ad}_okuma_suresi']:.3f} s"
+            print(f"{uzanti:>10}: {boyut:7.2f} MB, yazma {yazma_suresi:.3f} s{okuma_metni}")
+    
+    return sonuclar
+
+
+# Komut satırından seçilebilen benchmark'lar
+BENCHMARKLAR: Dict[str, Callable[..., Dict[str, float]]] = {
+    "ekleme": ekleme_benchmarki,
+    "kolonlu_yukleme": kolonlu_yukleme_benchmarki,
+    "uretim": uretim_benchmarki,
+    "olcekleme": olcekleme_benchmarki,
+    "pismanlik": pismanlik_benchmarki,
+    "fark": fark_benchmarki,
+    "dogrulama": dogrulama_benchmarki,
+    "paralel_yukleme": paralel_yukleme_benchmarki,
+    "sikistirma": sikistirma_benchmarki,
+    "plan": plan_benchmarki,
+}
+
+
+def main():
+    """
+    Ana fonksiyon.
+    """
+    parser = argparse.ArgumentParser(description='Drone Filo Optimizasyonu - Performans Ölçümleri')
+    parser.add_argument('benchmark', nargs='?', choices=list(BENCHMARKLAR) + ['hepsi'], default='hepsi',
+                        help='Çalıştırılacak benchmark')
+    parser.add_argument('--olcek', type=float, default=1.0, help='Problem boyutu çarpanı')
+    parser.add_argument('--tohum', type=int, default=42, help='Rastgele sayı üreteci için tohum değeri')
+    args = parser.parse_args()
+    
+    secilenler = list(BENCHMARKLAR) if args.benchmark == 'hepsi' else [args.benchmark]
+    for ad in secilenler:
+        BENCHMARKLAR[ad](olcek=args.olcek, tohum=args.tohum)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,460 @@ Drone Filo Optimizasyonu: Kısıt Tatmin Problemi (CSP) Modülü
 Bu modül, drone teslimat rotalarının optimizasyonu için CSP kısıtlarını uygular.
 """
 
-from typing import List, Dict, Tuple, Set, Optional
-from datetime import time, datetime, timedelta
-import copy
+from typing import List, Dict, Tuple, Set, Optional, Iterator, TYPE_CHECKING
+from datetime import time
+import heapq
+import math
+import time as zaman_modulu
+from collections import deque
 
-from models import Drone, TeslimatNoktasi, UcusYasakBolgesi
+import numpy as np
+
+from models import Drone, TeslimatNoktasi, UcusYasakBolgesi, Sefer, KimlikKaydi, kapasiteli_ekle
+
+if TYPE_CHECKING:
+    from data_generator import SenaryoFarki
+
+
+# Plan zamanları mikrosaniye çözünürlüğünde saklandığından bu kadarlık farklar gecikme sayılmaz
+_ZAMAN_TOLERANSI = 1e-6
+
+def zamani_saniyeye_cevir(t: time) -> float:
+    """Bir zaman nesnesini gece yarısından itibaren geçen saniyeye çevirir."""
+    return t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1e6
+
+
+def saniyeyi_zamana_cevir(saniye: float) -> time:
+    """Gece yarısından itibaren geçen saniyeyi aynı gün içindeki bir zaman nesnesine çevirir."""
+    mikrosaniye = min(max(int(round(saniye * 1e6)), 0), 86400 * 10**6 - 1)
+    saniye, mikrosaniye = divmod(mikrosaniye, 10**6)
+    dakika, saniye = divmod(saniye, 60)
+    saat, dakika = divmod(dakika, 60)
+    return time(saat, dakika, saniye, mikrosaniye)
+
+
+def statik_alanlari_hesapla(
+    dronlar: List[Drone], 
+    teslimat_noktalari: List[TeslimatNoktasi], 
+    ucus_yasak_bolgeleri: List[UcusYasakBolgesi],
+    baslangic_zamani: time,
+    tum_teslimatlar_zorunlu: bool = False
+) -> Tuple[Dict[int, int], Dict[str, int]]:
+    """
+    Drone-teslimat alanlarını statik kısıtlarla daraltır ve bit kümeleri olarak döndürür.
+    
+    Kurallar için bkz. statik_uygunluk_matrisi_hesapla.
+    
+    Args:
+        dronlar (List[Drone]): Drone'ların listesi
+        teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+        ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+        baslangic_zamani (time): Planlamanın başlangıç zamanı
+        tum_teslimatlar_zorunlu (bool): İkili AC-3 yayılımını uygula
+        
+    Returns:
+        Tuple[Dict[int, int], Dict[str, int]]: Teslimat ID'sine göre alan bit kümeleri ve
+                                               kurala göre çıkarılan çift sayıları
+    """
+    uygun, istatistikler = statik_uygunluk_matrisi_hesapla(
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, baslangic_zamani, tum_teslimatlar_zorunlu
+    )
+    return _alanlari_paketle(uygun, teslimat_noktalari), istatistikler
+
+
+def statik_uygunluk_matrisi_hesapla(
+    dronlar: List[Drone], 
+    teslimat_noktalari: List[TeslimatNoktasi], 
+    ucus_yasak_bolgeleri: List[UcusYasakBolgesi],
+    baslangic_zamani: time,
+    tum_teslimatlar_zorunlu: bool = False
+) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Drone-teslimat alanlarını statik kısıtlarla daraltır (AC-3 tarzı ön işleme).
+    
+    Sonuç, i. satırı dronlar listesindeki i. drone'a, j. sütunu j. teslimata karşılık
+    gelen bir uygunluk matrisidir; her çift yalnızca onu ilk eleyen kural için sayılır.
+    Çözümden bağımsız olarak imkansız olan çiftler çıkarılır:
+    - Ağırlık drone'un maksimum_agirlik değerini aşıyor
+    - Tam dolu batarya, başlangıç noktasından teslimata ve geri yüksüz doğrudan uçuşa
+      bile yetmiyor (her sefer depoya dönüşle biter)
+    - Teslimat penceresi, başlangıç zamanında başlangıç noktasından en yüksek hızla
+      doğrudan uçulsa bile kaçırılıyor
+    - Teslimat noktası, başlangıç zamanından pencere bitişine kadar sürekli aktif bir
+      uçuşa yasak bölgenin içinde (her yol kapalı)
+    
+    tum_teslimatlar_zorunlu True ise (her teslimat mutlaka bir drone'a atanacaksa),
+    ardından AC-3 ile ikili kısıt yayılımı yapılır: alanı tek drone'a inmiş bir teslimat
+    ile aynı drone'u paylaşan başka bir teslimat, zaman pencereleri iki sırada da
+    uyuşmuyorsa o drone'u alanından kaybeder. Atlamaya izin veren çözücüler için bu adım
+    geçerli değildir ve varsayılan olarak kapalıdır.
+    
+    Args:
+        dronlar (List[Drone]): Drone'ların listesi
+        teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+        ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+        baslangic_zamani (time): Planlamanın başlangıç zamanı
+        tum_teslimatlar_zorunlu (bool): İkili AC-3 yayılımını uygula
+        
+    Returns:
+        Tuple[np.ndarray, Dict[str, int]]: (drone sayısı, teslimat sayısı) boyutlu uygunluk
+                                           matrisi ve kurala göre çıkarılan çift sayıları
+    """
+    istatistikler = {
+        "toplam_cift": len(dronlar) * len(teslimat_noktalari),
+        "kapasite": 0,
+        "batarya": 0,
+        "zaman_penceresi": 0,
+        "yasak_bolge": 0,
+        "ac3": 0
+    }
+    if not dronlar or not teslimat_noktalari:
+        return np.zeros((len(dronlar), len(teslimat_noktalari)), dtype=bool), istatistikler
+    
+    t0 = zamani_saniyeye_cevir(baslangic_zamani)
+    
+    dron_poz = np.array([dron.baslangic_poz for dron in dronlar], dtype=np.float64)
+    kapasite = np.array([dron.maksimum_agirlik for dron in dronlar], dtype=np.float64)
+    batarya = np.array([dron.batarya for dron in dronlar], dtype=np.float64)
+    hiz = np.array([dron.hiz for dron in dronlar], dtype=np.float64)
+    
+    teslimat_poz = np.array([nokta.poz for nokta in teslimat_noktalari], dtype=np.float64)
+    agirlik = np.array([nokta.agirlik for nokta in teslimat_noktalari], dtype=np.float64)
+    pencere_baslangic = np.array(
+        [zamani_saniyeye_cevir(nokta.zaman_araligi[0]) for nokta in teslimat_noktalari]
+    )
+    pencere_bitis = np.array(
+        [zamani_saniyeye_cevir(nokta.zaman_araligi[1]) for nokta in teslimat_noktalari]
+    )
+    
+    # Drone × teslimat doğrudan mesafe matrisi
+    mesafe = np.hypot(
+        teslimat_poz[None, :, 0] - dron_poz[:, None, 0],
+        teslimat_poz[None, :, 1] - dron_poz[:, None, 1]
+    )
+    
+    uygun = np.ones(mesafe.shape, dtype=bool)
+    
+    def kurali_uygula(ad: str, gecerli: np.ndarray):
+        nonlocal uygun
+        yeni = uygun & gecerli
+        istatistikler[ad] += int(np.count_nonzero(uygun & ~yeni))
+        uygun = yeni
+    
+    kurali_uygula("kapasite", agirlik[None, :] <= kapasite[:, None])
+    
+    # Yüksüz gidiş-dönüşün enerjisi her seferin alt sınırıdır (Drone.enerji_tuketimi_hesapla ile aynı model)
+    kurali_uygula("batarya", 2 * np.floor(mesafe * 10) <= batarya[:, None])
+    
+    en_erken_varis = t0 + mesafe / hiz[:, None]
+    kurali_uygula("zaman_penceresi", en_erken_varis <= pencere_bitis[None, :])
+    
+    # Başlangıçtan pencere sonuna kadar aktif kalan bir bölgenin içindeki teslimatlar
+    kapali = np.zeros(len(teslimat_noktalari), dtype=bool)
+    for bolge in ucus_yasak_bolgeleri:
+        if zamani_saniyeye_cevir(bolge.aktif_zaman[0]) > t0:
+            continue
+        adaylar = np.flatnonzero(~kapali & (pencere_bitis <= zamani_saniyeye_cevir(bolge.aktif_zaman[1])))
+        kapali[adaylar[bolge.noktalar_iceriyor_mu(teslimat_poz[adaylar])]] = True
+    kurali_uygula("yasak_bolge", ~kapali[None, :])
+    
+    if tum_teslimatlar_zorunlu:
+        en_erken = np.maximum(en_erken_varis, pencere_baslangic[None, :])
+        istatistikler["ac3"] = _ac3_yay(uygun, en_erken, teslimat_poz, hiz, pencere_baslangic, pencere_bitis)
+    
+    return uygun, istatistikler
+
+
+def _alanlari_paketle(uygun: np.ndarray, teslimat_noktalari: List[TeslimatNoktasi]) -> Dict[int, int]:
+    """Drone × teslimat uygunluk matrisinin sütunlarını bit kümelerine dönüştürür (i. bit = i. drone)."""
+    paketli = np.packbits(uygun, axis=0, bitorder='little')
+    return {
+        nokta.id: int.from_bytes(paketli[:, j].tobytes(), 'little')
+        for j, nokta in enumerate(teslimat_noktalari)
+    }
+
+
+def _kalan_indeksleri_eslestir(kayit: KimlikKaydi, kalanlar: np.ndarray, yeni_nesneler: list) -> np.ndarray:
+    """
+    Yeni nesne listesindeki her nesnenin, aynen korunuyorsa eski kayıttaki indeksini bulur.
+    
+    Args:
+        kayit (KimlikKaydi): Eski kayıt
+        kalanlar (np.ndarray): Eski kayıt sırasıyla, aynen korunan nesneler için True
+        yeni_nesneler (list): Yeni nesne listesi
+        
+    Returns:
+        np.ndarray: Yeni nesne başına eski indeks (yeni ya da değişmiş nesneler için -1)
+    """
+    indeksler = np.array([kayit.indeksler.get(nesne.id, -1) for nesne in yeni_nesneler], dtype=np.int64)
+    mevcut = indeksler >= 0
+    indeksler[mevcut] = np.where(kalanlar[indeksler[mevcut]], indeksler[mevcut], -1)
+    return indeksler
+
+
+def _ac3_yay(
+    uygun: np.ndarray, 
+    en_erken: np.ndarray, 
+    teslimat_poz: np.ndarray, 
+    hiz: np.ndarray,
+    pencere_baslangic: np.ndarray, 
+    pencere_bitis: np.ndarray
+) -> int:
+    """
+    "Aynı drone'a atanan iki teslimat bir sırayla yapılabilmeli" ikili kısıtını AC-3 ile yayar.
+    
+    Args:
+        uygun (np.ndarray): Drone × teslimat uygunluk matrisi (yerinde güncellenir)
+        en_erken (np.ndarray): Drone × teslimat en erken hizmet zamanı (saniye)
+        teslimat_poz (np.ndarray): Teslimat pozisyonları
+        hiz (np.ndarray): Drone hızları
+        pencere_baslangic (np.ndarray): Teslimat pencere başlangıçları (saniye)
+        pencere_bitis (np.ndarray): Teslimat pencere bitişleri (saniye)
+        
+    Returns:
+        int: Çıkarılan drone-teslimat çifti sayısı
+    """
+    def sirayla_yapilabilir_mi(k: int, once: int, sonra: int) -> bool:
+        ara_mesafe = float(np.hypot(*(teslimat_poz[sonra] - teslimat_poz[once])))
+        varis = max(pencere_baslangic[sonra], en_erken[k, once] + ara_mesafe / hiz[k])
+        return varis <= pencere_bitis[sonra]
+    
+    cikarilan = 0
+    alan_boyutlari = uygun.sum(axis=0)
+    
+    # Yalnızca alanı tek drone'a inmiş teslimatlardan çıkan yaylar bir şey daraltabilir
+    kuyruk = deque(int(j) for j in np.flatnonzero(alan_boyutlari == 1))
+    
+    while kuyruk:
+        y = kuyruk.popleft()
+        if alan_boyutlari[y] != 1:
+            continue
+        k = int(np.flatnonzero(uygun[:, y])[0])
+        
+        for z in np.flatnonzero(uygun[k]):
+            z = int(z)
+            if z == y:
+                continue
+            if sirayla_yapilabilir_mi(k, y, z) or sirayla_yapilabilir_mi(k, z, y):
+                continue
+            
+            # Revise(z, y): z'nin k değeri için y'de destek yok
+            uygun[k, z] = False
+            alan_boyutlari[z] -= 1
+            cikarilan += 1
+            if alan_boyutlari[z] == 1:
+                kuyruk.append(z)
+    
+    return cikarilan
+
+
+class DronIzgarasi:
+    """
+    Drone pozisyonları için düzgün ızgara tabanlı uzamsal indeks.
+    
+    Harita eşit boyutlu hücrelere bölünür ve her hücrede bulunan drone'lar tutulur.
+    Sorgular, sorgu noktasının hücresinden başlayıp halka halka genişleyerek
+    drone'ları artan mesafe sırasıyla döndürür. Dolu hücrelerin sınır kutusu
+    ekleme/çıkarma sırasında güncel tutulur; böylece sorgu, taramanın nerede
+    biteceğini bulmak için tüm hücreleri dolaşmaz.
+    """
+    def __init__(self, hucre_boyutu: float):
+        """
+        Args:
+            hucre_boyutu (float): Bir ızgara hücresinin kenar uzunluğu
+        """
+        self.hucre_boyutu = hucre_boyutu
+        self.hucreler: Dict[Tuple[int, int], Set[int]] = {}
+        self.pozisyonlar: Dict[int, Tuple[float, float]] = {}
+        self.siralar: Dict[int, int] = {}
+        # Her hücre sütunu/satırındaki drone sayısı ve dolu hücrelerin sınır kutusu
+        self._sutun_sayilari: Dict[int, int] = {}
+        self._satir_sayilari: Dict[int, int] = {}
+        self._sinirlar: Optional[Tuple[int, int, int, int]] = None
+    
+    def _hucre_al(self, poz: Tuple[float, float]) -> Tuple[int, int]:
+        """Bir pozisyonun bulunduğu hücrenin indekslerini döndürür."""
+        return (math.floor(poz[0] / self.hucre_boyutu), math.floor(poz[1] / self.hucre_boyutu))
+    
+    def ekle(self, dron_id: int, poz: Tuple[float, float], sira: int = 0):
+        """
+        İndekse bir drone ekler.
+        
+        Args:
+            dron_id (int): Drone ID
+            poz (Tuple[float, float]): Drone'un pozisyonu
+            sira (int): Eşit mesafeli drone'lar arasında sıralama anahtarı
+        """
+        self.pozisyonlar[dron_id] = poz
+        self.siralar[dron_id] = sira
+        hucre_x, hucre_y = self._hucre_al(poz)
+        self.hucreler.setdefault((hucre_x, hucre_y), set()).add(dron_id)
+        
+        self._sutun_sayilari[hucre_x] = self._sutun_sayilari.get(hucre_x, 0) + 1
+        self._satir_sayilari[hucre_y] = self._satir_sayilari.get(hucre_y, 0) + 1
+        if self._sinirlar is None:
+            self._sinirlar = (hucre_x, hucre_x, hucre_y, hucre_y)
+        else:
+            min_x, max_x, min_y, max_y = self._sinirlar
+            self._sinirlar = (min(min_x, hucre_x), max(max_x, hucre_x),
+                              min(min_y, hucre_y), max(max_y, hucre_y))
+    
+    def cikar(self, dron_id: int):
+        """İndeksten bir drone'u çıkarır."""
+        hucre = self._hucre_al(self.pozisyonlar.pop(dron_id))
+        self.hucreler[hucre].discard(dron_id)
+        if not self.hucreler[hucre]:
+            del self.hucreler[hucre]
+        del self.siralar[dron_id]
+        
+        # Sınır kutusu yalnızca kenardaki son sütun/satır boşaldığında yeniden hesaplanır
+        hucre_x, hucre_y = hucre
+        sutun_bosaldi = self._sayaci_azalt(self._sutun_sayilari, hucre_x)
+        satir_bosaldi = self._sayaci_azalt(self._satir_sayilari, hucre_y)
+        if not self._sutun_sayilari:
+            self._sinirlar = None
+        elif sutun_bosaldi or satir_bosaldi:
+            min_x, max_x, min_y, max_y = self._sinirlar
+            if sutun_bosaldi and hucre_x in (min_x, max_x):
+                min_x, max_x = min(self._sutun_sayilari), max(self._sutun_sayilari)
+            if satir_bosaldi and hucre_y in (min_y, max_y):
+                min_y, max_y = min(self._satir_sayilari), max(self._satir_sayilari)
+            self._sinirlar = (min_x, max_x, min_y, max_y)
+    
+    @staticmethod
+    def _sayaci_azalt(sayilar: Dict[int, int], anahtar: int) -> bool:
+        """Bir sütun/satır sayacını azaltır; sayaç sıfırlanıp silindiyse True döndürür."""
+        sayilar[anahtar] -= 1
+        if sayilar[anahtar] == 0:
+            del sayilar[anahtar]
+            return True
+        return False
+    
+    def guncelle(self, dron_id: int, poz: Tuple[float, float]):
+        """Bir drone'un indeksteki pozisyonunu günceller."""
+        sira = self.siralar[dron_id]
+        self.cikar(dron_id)
+        self.ekle(dron_id, poz, sira)
+    
+    def yakindan_uzaga(self, poz: Tuple[float, float]) -> Iterator[Tuple[float, int]]:
+        """
+        Drone'ları sorgu noktasına artan mesafe sırasıyla döndürür.
+        
+        r. halkadaki hücreler tarandıktan sonra, henüz taranmamış hücrelerdeki her
+        drone en az r × hucre_boyutu uzaklıktadır; bu sınırdan yakın olan adaylar
+        güvenle döndürülebilir. Üreteç erken bırakılırsa uzak hücreler hiç taranmaz.
+        
+        Args:
+            poz (Tuple[float, float]): Sorgu noktası
+            
+        Yields:
+            Tuple[float, int]: (mesafe, drone ID) çiftleri
+        """
+        if not self.hucreler:
+            return
+        
+        merkez_x, merkez_y = self._hucre_al(poz)
+        
+        # Dolu hücrelerin sınır kutusuna ulaşınca halka taraması biter
+        min_x, max_x, min_y, max_y = self._sinirlar
+        en_buyuk_halka = max(merkez_x - min_x, max_x - merkez_x, merkez_y - min_y, max_y - merkez_y, 0)
+        
+        adaylar: List[Tuple[float, int, int]] = []
+        for halka in range(en_buyuk_halka + 1):
+            for hucre in self._halka_hucreleri(merkez_x, merkez_y, halka):
+                for dron_id in self.hucreler.get(hucre, ()):
+                    dron_poz = self.pozisyonlar[dron_id]
+                    mesafe = ((dron_poz[0] - poz[0])**2 + (dron_poz[1] - poz[1])**2)**0.5
+                    heapq.heappush(adaylar, (mesafe, self.siralar[dron_id], dron_id))
+            
+            sinir = halka * self.hucre_boyutu
+            while adaylar and adaylar[0][0] <= sinir:
+                mesafe, _, dron_id = heapq.heappop(adaylar)
+                yield mesafe, dron_id
+        
+        while adaylar:
+            mesafe, _, dron_id = heapq.heappop(adaylar)
+            yield mesafe, dron_id
+    
+    def _halka_hucreleri(self, merkez_x: int, merkez_y: int, halka: int) -> Iterator[Tuple[int, int]]:
+        """Merkez hücreye Chebyshev uzaklığı tam olarak 'halka' olan hücreleri döndürür."""
+        if halka == 0:
+            yield (merkez_x, merkez_y)
+            return
+        
+        for dx in range(-halka, halka + 1):
+            yield (merkez_x + dx, merkez_y - halka)
+            yield (merkez_x + dx, merkez_y + halka)
+        for dy in range(-halka + 1, halka):
+            yield (merkez_x - halka, merkez_y + dy)
+            yield (merkez_x + halka, merkez_y + dy)
+
+
+class CozucuDurumu:
+    """
+    Değişmez senaryo üzerinde hafif, değiştirilebilir çözüm durumu.
+    
+    Drone ve teslimat nesneleri kopyalanmaz; çözüm boyunca değişen değerler,
+    KimlikKaydi yoğun indeks sırasındaki NumPy dizilerinde tutulur. Böylece aynı
+    senaryo nesneleri birçok çözücü çalıştırması arasında kopyalanmadan paylaşılır.
+    
+    Attributes:
+        pozlar (np.ndarray): (drone sayısı, 2) boyutlu mevcut drone pozisyonları
+        bataryalar (np.ndarray): Drone'ların mevcut batarya seviyeleri (mAh)
+        zamanlar (np.ndarray): Drone'ların müsait olacağı zamanlar (gece yarısından saniye)
+        musait (np.ndarray): Drone'ların müsaitlik bayrakları
+        teslim_edildi (np.ndarray): Teslimatların yapılıp yapılmadığı
+    """
+    
+    def __init__(
+        self, 
+        pozlar: np.ndarray, 
+        bataryalar: np.ndarray, 
+        zamanlar: np.ndarray, 
+        musait: np.ndarray, 
+        teslim_edildi: np.ndarray
+    ):
+        self.pozlar = pozlar
+        self.bataryalar = bataryalar
+        self.zamanlar = zamanlar
+        self.musait = musait
+        self.teslim_edildi = teslim_edildi
+    
+    @classmethod
+    def senaryodan_olustur(
+        cls, 
+        dronlar: List[Drone], 
+        teslimat_noktalari: List[TeslimatNoktasi], 
+        baslangic_saniyesi: float
+    ) -> "CozucuDurumu":
+        """
+        Senaryo nesnelerinin mevcut değerlerinden bir başlangıç durumu oluşturur.
+        
+        Args:
+            dronlar (List[Drone]): Drone'lar (yoğun indeks sırasıyla)
+            teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktaları (yoğun indeks sırasıyla)
+            baslangic_saniyesi (float): Tüm drone'ların müsait olduğu başlangıç zamanı
+            
+        Returns:
+            CozucuDurumu: Yeni durum
+        """
+        return cls(
+            pozlar=np.array([dron.mevcut_poz for dron in dronlar], dtype=np.float64).reshape(-1, 2),
+            bataryalar=np.array([dron.mevcut_batarya for dron in dronlar], dtype=np.int64),
+            zamanlar=np.full(len(dronlar), baslangic_saniyesi, dtype=np.float64),
+            musait=np.array([dron.musait_mi for dron in dronlar], dtype=bool),
+            teslim_edildi=np.array([nokta.teslim_edildi_mi for nokta in teslimat_noktalari], dtype=bool)
+        )
+    
+    def kopyala(self) -> "CozucuDurumu":
+        """Durumun bağımsız bir kopyasını döndürür (yalnızca diziler kopyalanır)."""
+        return CozucuDurumu(
+            self.pozlar.copy(), 
+            self.bataryalar.copy(), 
+            self.zamanlar.copy(), 
+            self.musait.copy(), 
+            self.teslim_edildi.copy()
+        )
 
 
 class KisitCozucu:
@@ -35,19 +484,146 @@ class KisitCozucu:
         self.ucus_yasak_bolgeleri = ucus_yasak_bolgeleri
         self.baslangic_zamani = baslangic_zamani
         
-        # Drone'ların mevcut durumlarını takip et
-        self.dron_durumlari = {dron.id: copy.deepcopy(dron) for dron in dronlar}
+        # Geri izlemeli aramanın istatistikleri
+        self.arama_istatistikleri: Dict[str, float] = {}
         
-        # Teslimat noktalarının durumlarını takip et
-        self.teslimat_durumlari = {nokta.id: copy.deepcopy(nokta) for nokta in teslimat_noktalari}
+        # ID → nesne/yoğun indeks kayıtları ve vektörel hesaplar için sabit teslimat dizileri
+        self.dron_kaydi = KimlikKaydi(dronlar)
+        self.teslimat_kaydi = KimlikKaydi(teslimat_noktalari)
+        # Çevrimiçi eklenen teslimatlar çağıranın listesini değiştirmesin diye kaydın listesi kullanılır
+        self.teslimat_noktalari = self.teslimat_kaydi.nesneler
+        self._teslimat_dizilerini_ayarla()
+        # Çevrimiçi eklemede uzatılan teslimat dizilerinin kapasiteli tamponları
+        self._ekleme_tamponlari: Dict[str, np.ndarray] = {}
+        self._bolge_araliklari = [
+            (zamani_saniyeye_cevir(bolge.aktif_zaman[0]), zamani_saniyeye_cevir(bolge.aktif_zaman[1]))
+            for bolge in ucus_yasak_bolgeleri
+        ]
+        
+        # Statik olarak imkansız drone-teslimat çiftleri çıkarılmış alanlar (matris ve bit kümeleri)
+        self.dron_bitleri = {dron.id: 1 << sira for sira, dron in enumerate(dronlar)}
+        self._statik_matris, self.alan_daraltma_istatistikleri = statik_uygunluk_matrisi_hesapla(
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, baslangic_zamani
+        )
+        self.statik_alanlar = _alanlari_paketle(self._statik_matris, teslimat_noktalari)
+        
+        self._dron_dizilerini_ayarla()
+        
+        self._durumu_sifirla()
+    
+    def _teslimat_dizilerini_ayarla(self, eski_indeksler: Optional[np.ndarray] = None):
+        """
+        Vektörel hesaplarda kullanılan sabit teslimat dizilerini kayıttaki sırayla oluşturur.
+        
+        Args:
+            eski_indeksler (Optional[np.ndarray]): Teslimat başına mevcut dizilerdeki indeks;
+                                                   -1 olanlar nesneden hesaplanır, diğerleri
+                                                   mevcut dizilerden kopyalanır (None ise tümü
+                                                   hesaplanır)
+        """
+        noktalar = self.teslimat_kaydi.nesneler
+        if eski_indeksler is None:
+            eski_indeksler = np.full(len(noktalar), -1, dtype=np.int64)
+            eski_diziler = None
+        else:
+            eski_diziler = (
+                self._teslimat_pozlari, self._teslimat_agirliklari, self._pencere_baslangiclari,
+                self._pencere_bitisleri, self._oncelik_faktorleri
+            )
+        
+        yeniler = np.flatnonzero(eski_indeksler < 0)
+        yeni_noktalar = [noktalar[i] for i in yeniler]
+        hesaplanan = (
+            np.array([nokta.poz for nokta in yeni_noktalar], dtype=np.float64).reshape(-1, 2),
+            np.array([nokta.agirlik for nokta in yeni_noktalar], dtype=np.float64),
+            np.array([zamani_saniyeye_cevir(nokta.zaman_araligi[0]) for nokta in yeni_noktalar], dtype=np.float64),
+            np.array([zamani_saniyeye_cevir(nokta.zaman_araligi[1]) for nokta in yeni_noktalar], dtype=np.float64),
+            np.array([(6 - nokta.oncelik) * 100 for nokta in yeni_noktalar], dtype=np.float64)  # 5 için 100, 1 için 500
+        )
+        
+        if eski_diziler is None:
+            diziler = hesaplanan
+        else:
+            kalanlar = np.flatnonzero(eski_indeksler >= 0)
+            diziler = []
+            for eski, yeni in zip(eski_diziler, hesaplanan):
+                dizi = np.empty((len(noktalar),) + eski.shape[1:], dtype=eski.dtype)
+                dizi[kalanlar] = eski[eski_indeksler[kalanlar]]
+                dizi[yeniler] = yeni
+                diziler.append(dizi)
+        
+        (self._teslimat_pozlari, self._teslimat_agirliklari, self._pencere_baslangiclari,
+         self._pencere_bitisleri, self._oncelik_faktorleri) = diziler
+    
+    def _dron_dizilerini_ayarla(self):
+        """Drone'ların değişmeyen özelliklerini yoğun indeks sırasıyla dizilere alır."""
+        dronlar = self.dron_kaydi.nesneler
+        self._dron_kapasiteleri = np.array([dron.maksimum_agirlik for dron in dronlar], dtype=np.float64)
+        self._dron_hizlari = np.array([dron.hiz for dron in dronlar], dtype=np.float64)
+        self._depo_pozlari = np.array([dron.baslangic_poz for dron in dronlar], dtype=np.float64).reshape(-1, 2)
+        self._izgara_hucre_boyutu = self._izgara_hucre_boyutu_hesapla()
+    
+    def _alan_bitlerini_ac(self, bitler: int) -> np.ndarray:
+        """Bir teslimatın alan bit kümesini drone sırasına göre boolean vektöre açar."""
+        dron_sayisi = len(self.dronlar)
+        bayt_sayisi = max((dron_sayisi + 7) // 8, 1)
+        baytlar = np.frombuffer(bitler.to_bytes(bayt_sayisi, 'little'), dtype=np.uint8)
+        return np.unpackbits(baytlar, bitorder='little')[:dron_sayisi].astype(bool)
+    
+    def _durumu_sifirla(self):
+        """Drone, teslimat ve atama durumlarını başlangıç haline getirir."""
+        # Drone pozisyon/batarya/zaman ve teslimat durumları (senaryo nesneleri kopyalanmaz)
+        self.durum = CozucuDurumu.senaryodan_olustur(
+            self.dron_kaydi.nesneler, 
+            self.teslimat_kaydi.nesneler, 
+            zamani_saniyeye_cevir(self.baslangic_zamani)
+        )
         
         # Drone'lara atanmış teslimatları takip et
-        self.atamalar: Dict[int, List[int]] = {dron.id: [] for dron in dronlar}
+        self.atamalar: Dict[int, List[int]] = {dron.id: [] for dron in self.dronlar}
         
         # Drone'ların tahmini varış zamanlarını takip et
         self.tahmini_varis_zamanlari: Dict[int, Dict[int, time]] = {
-            dron.id: {} for dron in dronlar
+            dron.id: {} for dron in self.dronlar
         }
+        
+        # Her drone'un seferleri (sonuncusu sürüyor olabilir) ve toplam enerji tüketimi
+        self.seferler: Dict[int, List[Sefer]] = {dron.id: [] for dron in self.dronlar}
+        self.tuketilen_enerjiler: Dict[int, int] = {dron.id: 0 for dron in self.dronlar}
+        
+        # Drone'ların mevcut pozisyonları için uzamsal indeks
+        self.dron_izgarasi = DronIzgarasi(self._izgara_hucre_boyutu)
+        for sira, dron_id in enumerate(self.dron_kaydi.idler):
+            self.dron_izgarasi.ekle(dron_id, self._dron_pozu(sira), sira)
+        
+        # Çevrimiçi ekleme için plan önbelleği (ilk ekle çağrısında oluşturulur)
+        self._ekleme_onbellegi: Optional[Dict] = None
+    
+    def _dron_pozu(self, sira: int) -> Tuple[float, float]:
+        """Yoğun indeksi verilen drone'un durumdaki mevcut pozisyonunu döndürür."""
+        return (float(self.durum.pozlar[sira, 0]), float(self.durum.pozlar[sira, 1]))
+    
+    def _izgara_hucre_boyutu_hesapla(self) -> float:
+        """
+        Uzamsal indeks için hücre boyutunu hesaplar.
+        
+        Hücre boyutu, harita alanı drone sayısına bölündüğünde hücre başına yaklaşık
+        bir drone düşecek şekilde seçilir.
+        
+        Returns:
+            float: Hücre kenar uzunluğu
+        """
+        noktalar = [dron.baslangic_poz for dron in self.dronlar] + [
+            nokta.poz for nokta in self.teslimat_noktalari
+        ]
+        if not noktalar:
+            return 1.0
+        
+        genislik = max(p[0] for p in noktalar) - min(p[0] for p in noktalar)
+        yukseklik = max(p[1] for p in noktalar) - min(p[1] for p in noktalar)
+        alan = max(genislik, 1.0) * max(yukseklik, 1.0)
+        
+        return math.sqrt(alan / max(len(self.dronlar), 1))
     
     def _mesafe_hesapla(self, poz1: Tuple[float, float], poz2: Tuple[float, float]) -> float:
         """İki nokta arasındaki Öklid mesafesini hesaplar."""
@@ -73,26 +649,41 @@ class KisitCozucu:
         mesafe = self._mesafe_hesapla(baslangic_poz, bitis_poz)
         return mesafe / dron.hiz
     
-    def _zaman_ekle(self, t: time, saniyeler: float) -> time:
+    def _ucus_zamanlamasi_hesapla(
+        self, 
+        dron_id: int, 
+        teslimat_id: int
+    ) -> Tuple[float, float, float]:
         """
-        Bir zaman nesnesine belirli saniye ekler.
+        Drone'un mevcut pozisyonundan teslimat noktasına uçuşunun zamanlamasını hesaplar.
+        
+        Drone, kendi zaman çizelgesindeki müsaitlik anında kalkar; teslimat penceresi
+        henüz açılmamışsa pencere başında varacak şekilde mevcut pozisyonunda bekler.
         
         Args:
-            t (time): Zaman nesnesi
-            saniyeler (float): Eklenecek saniye
+            dron_id (int): Drone ID
+            teslimat_id (int): Teslimat noktası ID
             
         Returns:
-            time: Yeni zaman nesnesi
+            Tuple[float, float, float]: Mesafe, kalkış ve varış zamanı (gece yarısından saniye)
         """
-        dt = datetime.combine(datetime.today(), t)
-        dt = dt + timedelta(seconds=saniyeler)
-        return dt.time()
+        sira = self.dron_kaydi.indeks(dron_id)
+        dron = self.dron_kaydi[dron_id]
+        teslimat = self.teslimat_kaydi[teslimat_id]
+        
+        mesafe = self._mesafe_hesapla(self._dron_pozu(sira), teslimat.poz)
+        seyahat_suresi = mesafe / dron.hiz
+        pencere_baslangic = zamani_saniyeye_cevir(teslimat.zaman_araligi[0])
+        
+        kalkis = max(float(self.durum.zamanlar[sira]), pencere_baslangic - seyahat_suresi)
+        return mesafe, kalkis, kalkis + seyahat_suresi
     
     def _yol_gecerli_mi(
         self, 
         baslangic_poz: Tuple[float, float], 
         bitis_poz: Tuple[float, float], 
-        mevcut_zaman: time
+        kalkis: float,
+        varis: float
     ) -> bool:
         """
         İki nokta arasındaki yolun geçerli olup olmadığını kontrol eder.
@@ -100,211 +691,1738 @@ class KisitCozucu:
         Args:
             baslangic_poz (Tuple[float, float]): Başlangıç pozisyonu
             bitis_poz (Tuple[float, float]): Bitiş pozisyonu
-            mevcut_zaman (time): Mevcut zaman
+            kalkis (float): Kalkış zamanı (gece yarısından saniye)
+            varis (float): Varış zamanı (gece yarısından saniye)
             
         Returns:
             bool: Yol geçerliyse True, değilse False
         """
-        # Aktif uçuşa yasak bölgeleri kontrol et
-        for bolge in self.ucus_yasak_bolgeleri:
-            if bolge.aktif_mi(mevcut_zaman) and bolge.cizgi_kesisiyor_mu(baslangic_poz, bitis_poz):
+        # Uçuş süresince herhangi bir anda aktif olan uçuşa yasak bölgeleri kontrol et
+        for bolge, (aktif_baslangic, aktif_bitis) in zip(self.ucus_yasak_bolgeleri, self._bolge_araliklari):
+            if (aktif_baslangic <= varis and kalkis <= aktif_bitis and
+                    bolge.cizgi_kesisiyor_mu(baslangic_poz, bitis_poz)):
                 return False
         return True
     
-    def _dron_teslimat_yapabilir_mi(
-        self, 
-        dron_id: int, 
-        teslimat_id: int, 
-        mevcut_zaman: time
-    ) -> bool:
+    def _dron_teslimat_yapabilir_mi(self, dron_id: int, teslimat_id: int) -> bool:
         """
-        Bir drone'un belirli bir teslimatı yapıp yapamayacağını kontrol eder.
+        Bir drone'un belirli bir teslimatı kendi zaman çizelgesine göre yapıp yapamayacağını kontrol eder.
         
         Args:
             dron_id (int): Drone ID
             teslimat_id (int): Teslimat noktası ID
-            mevcut_zaman (time): Mevcut zaman
             
         Returns:
             bool: Drone teslimatı yapabilirse True, değilse False
         """
-        dron = self.dron_durumlari[dron_id]
-        teslimat = self.teslimat_durumlari[teslimat_id]
+        # Statik olarak imkansız çiftleri hemen ele
+        if not self.statik_alanlar[teslimat_id] & self.dron_bitleri[dron_id]:
+            return False
+        
+        sira = self.dron_kaydi.indeks(dron_id)
+        dron = self.dron_kaydi[dron_id]
+        teslimat = self.teslimat_kaydi[teslimat_id]
+        dron_pozu = self._dron_pozu(sira)
         
         # Drone'un taşıma kapasitesini kontrol et
         if not dron.tasiyabilir_mi(teslimat.agirlik):
             return False
         
-        # Drone'un mevcut pozisyonundan teslimat noktasına olan yolu kontrol et
-        if not self._yol_gecerli_mi(dron.mevcut_poz, teslimat.poz, mevcut_zaman):
+        # Drone'un batarya durumunu kontrol et (depoya dönüş için yedek dahil)
+        mesafe, kalkis, varis = self._ucus_zamanlamasi_hesapla(dron_id, teslimat_id)
+        donus_mesafesi = self._mesafe_hesapla(teslimat.poz, dron.baslangic_poz)
+        gereken_enerji = (
+            dron.enerji_tuketimi_hesapla(mesafe, teslimat.agirlik) +
+            dron.enerji_tuketimi_hesapla(donus_mesafesi, 0)
+        )
+        if self.durum.bataryalar[sira] < gereken_enerji:
             return False
         
-        # Drone'un batarya durumunu kontrol et
-        mesafe = self._mesafe_hesapla(dron.mevcut_poz, teslimat.poz)
-        if not dron.yeterli_batarya_var_mi(mesafe, teslimat.agirlik):
+        # Teslimat zaman aralığını kontrol et (erken varışta beklenebildiği için yalnızca bitiş)
+        if varis > zamani_saniyeye_cevir(teslimat.zaman_araligi[1]):
             return False
         
-        # Teslimat zaman aralığını kontrol et
-        seyahat_suresi = self._seyahat_suresi_hesapla(dron, dron.mevcut_poz, teslimat.poz)
-        tahmini_varis = self._zaman_ekle(mevcut_zaman, seyahat_suresi)
-        
-        if not (teslimat.zaman_araligi[0] <= tahmini_varis <= teslimat.zaman_araligi[1]):
+        # Drone'un mevcut pozisyonundan teslimat noktasına olan yolu kontrol et
+        # (en pahalı kontrol olduğundan en sona bırakılır)
+        if not self._yol_gecerli_mi(dron_pozu, teslimat.poz, kalkis, varis):
             return False
         
         return True
     
-    def _dron_durumunu_guncelle(
+    def _uygunluk_ve_zamanlama_hesapla(
         self, 
-        dron_id: int, 
-        teslimat_id: int, 
-        mevcut_zaman: time
-    ) -> time:
+        dron_idleri: List[int],
+        teslimat_maskesi: Optional[np.ndarray] = None,
+        yol_kontrolu: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Bir drone'un durumunu günceller ve tahmini varış zamanını döndürür.
+        Verilen drone'lar için uygunluk, mesafe ve kalkış zamanı matrislerini hesaplar.
         
         Args:
-            dron_id (int): Drone ID
-            teslimat_id (int): Teslimat noktası ID
-            mevcut_zaman (time): Mevcut zaman
+            dron_idleri (List[int]): Hesaplanacak drone'lar
+            teslimat_maskesi (Optional[np.ndarray]): Yalnızca True olan teslimatlar uygun sayılabilir
+            yol_kontrolu (bool): Uçuşa yasak bölge kontrolünü yap (False ise çağıran yapmalıdır)
             
         Returns:
-            time: Tahmini varış zamanı
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (len(dron_idleri), teslimat sayısı) boyutlu
+                                                       uygunluk, mesafe ve kalkış zamanı matrisleri
         """
-        dron = self.dron_durumlari[dron_id]
-        teslimat = self.teslimat_durumlari[teslimat_id]
+        siralar = self.dron_kaydi.indeksleri_al(dron_idleri)
+        pozlar = self.durum.pozlar[siralar]
+        depolar = self._depo_pozlari[siralar]
+        bataryalar = self.durum.bataryalar[siralar]
+        kapasiteler = self._dron_kapasiteleri[siralar]
+        hizlar = self._dron_hizlari[siralar]
+        musaitlik = self.durum.zamanlar[siralar]
         
-        # Mesafeyi hesapla
-        mesafe = self._mesafe_hesapla(dron.mevcut_poz, teslimat.poz)
+        # Statik olarak imkansız çiftler baştan elenir
+        uygun = self._statik_matris[siralar]
+        if teslimat_maskesi is not None:
+            uygun &= teslimat_maskesi[None, :]
         
-        # Seyahat süresini hesapla
-        seyahat_suresi = self._seyahat_suresi_hesapla(dron, dron.mevcut_poz, teslimat.poz)
+        # Kapasite
+        uygun &= self._teslimat_agirliklari[None, :] <= kapasiteler[:, None]
         
-        # Tahmini varış zamanını hesapla
-        varis_zamani = self._zaman_ekle(mevcut_zaman, seyahat_suresi)
+        # Batarya: teslimat ve depoya yüksüz dönüş (Drone.enerji_tuketimi_hesapla ile aynı model)
+        dx = self._teslimat_pozlari[None, :, 0] - pozlar[:, None, 0]
+        dy = self._teslimat_pozlari[None, :, 1] - pozlar[:, None, 1]
+        mesafeler = np.sqrt(dx * dx + dy * dy)
+        dx = depolar[:, None, 0] - self._teslimat_pozlari[None, :, 0]
+        dy = depolar[:, None, 1] - self._teslimat_pozlari[None, :, 1]
+        donus_mesafeleri = np.sqrt(dx * dx + dy * dy)
+        gereken_enerji = (
+            np.floor(mesafeler * (1 + self._teslimat_agirliklari[None, :] / 10) * 10) +
+            np.floor(donus_mesafeleri * 10)
+        )
+        uygun &= bataryalar[:, None] >= gereken_enerji
         
-        # Drone'un pozisyonunu güncelle
-        dron.pozisyon_guncelle(teslimat.poz, mesafe, teslimat.agirlik)
+        # Zaman aralığı: pencere açılmadan varılacaksa kalkış ertelenir
+        seyahat_sureleri = mesafeler / hizlar[:, None]
+        kalkislar = np.maximum(musaitlik[:, None], self._pencere_baslangiclari[None, :] - seyahat_sureleri)
+        varislar = kalkislar + seyahat_sureleri
+        uygun &= varislar <= self._pencere_bitisleri[None, :]
         
-        # Drone'un yükünü güncelle (teslimat yapıldıktan sonra yük sıfırlanır)
-        dron.mevcut_yuk = 0.0
+        # Yol: yalnızca hâlâ uygun olan ve uçuşu bölgenin aktif aralığına denk gelen çiftler test edilir
+        for bolge, (aktif_baslangic, aktif_bitis) in zip(self.ucus_yasak_bolgeleri, self._bolge_araliklari):
+            if not yol_kontrolu:
+                break
+            adaylar = uygun & (aktif_baslangic <= varislar) & (kalkislar <= aktif_bitis)
+            satirlar, sutunlar = np.nonzero(adaylar)
+            if len(satirlar) == 0:
+                continue
+            kesisiyor = bolge.cizgiler_kesisiyor_mu(pozlar[satirlar], self._teslimat_pozlari[sutunlar])
+            uygun[satirlar[kesisiyor], sutunlar[kesisiyor]] = False
         
-        # Teslimat durumunu güncelle
-        teslimat.teslim_edildi_mi = True
+        return uygun, mesafeler, kalkislar
+    
+    def uygunluk_matrisi_hesapla(self, dron_idleri: Optional[List[int]] = None) -> np.ndarray:
+        """
+        Drone'ların mevcut durumlarına göre drone × teslimat uygunluk matrisini hesaplar.
+        
+        _dron_teslimat_yapabilir_mi ile aynı kontroller (kapasite, batarya, zaman aralığı
+        ve yol) her drone'un kendi zaman çizelgesiyle tüm çiftler için tek seferde
+        vektörel olarak yapılır.
+        
+        Args:
+            dron_idleri (Optional[List[int]]): Hesaplanacak drone'lar (varsayılan: tümü)
+            
+        Returns:
+            np.ndarray: (len(dron_idleri), teslimat sayısı) boyutlu boolean matris
+        """
+        if dron_idleri is None:
+            dron_idleri = [dron.id for dron in self.dronlar]
         
-        return varis_zamani
+        return self._uygunluk_ve_zamanlama_hesapla(dron_idleri)[0]
     
-    def _teslimat_icin_en_iyi_dronu_sec(
-        self, 
-        teslimat_id: int, 
-        mevcut_zaman: time
-    ) -> Optional[int]:
+    def _dron_durumunu_guncelle(self, dron_id: int, teslimat_id: int) -> time:
         """
-        Belirli bir teslimat için en uygun drone'u seçer.
+        Bir drone'un durumunu ve zaman çizelgesini günceller, tahmini varış zamanını döndürür.
         
         Args:
+            dron_id (int): Drone ID
             teslimat_id (int): Teslimat noktası ID
-            mevcut_zaman (time): Mevcut zaman
             
         Returns:
-            Optional[int]: En uygun drone'un ID'si, uygun drone yoksa None
+            time: Tahmini varış zamanı
         """
-        teslimat = self.teslimat_durumlari[teslimat_id]
-        en_iyi_dron_id = None
-        en_iyi_skor = float('inf')
+        sira = self.dron_kaydi.indeks(dron_id)
+        dron = self.dron_kaydi[dron_id]
+        teslimat = self.teslimat_kaydi[teslimat_id]
         
-        for dron_id, dron in self.dron_durumlari.items():
-            # Drone müsait değilse atla
-            if not dron.musait_mi:
-                continue
-            
-            # Drone teslimatı yapabilir mi?
-            if not self._dron_teslimat_yapabilir_mi(dron_id, teslimat_id, mevcut_zaman):
-                continue
-            
-            # Mesafeyi hesapla
-            mesafe = self._mesafe_hesapla(dron.mevcut_poz, teslimat.poz)
-            
-            # Skor hesapla (mesafe ve öncelik faktörü)
-            # Düşük mesafe ve yüksek öncelik daha iyi
-            oncelik_faktoru = (6 - teslimat.oncelik) * 100  # 5 için 100, 1 için 500
-            skor = mesafe + oncelik_faktoru
-            
-            if skor < en_iyi_skor:
-                en_iyi_skor = skor
-                en_iyi_dron_id = dron_id
+        # Mesafeyi ve uçuş zamanlamasını hesapla
+        mesafe, kalkis, varis = self._ucus_zamanlamasi_hesapla(dron_id, teslimat_id)
         
-        return en_iyi_dron_id
+        # Depodan kalkışta yeni bir sefer başlar
+        seferler = self.seferler[dron_id]
+        if not seferler or seferler[-1].tamamlandi_mi:
+            seferler.append(Sefer(dron_id, saniyeyi_zamana_cevir(kalkis)))
+        seferler[-1].teslimatlar.append(teslimat_id)
+        
+        # Drone'un pozisyonunu ve müsaitlik zamanını güncelle
+        tuketilen_enerji = dron.enerji_tuketimi_hesapla(mesafe, teslimat.agirlik)
+        self.tuketilen_enerjiler[dron_id] += tuketilen_enerji
+        self.durum.bataryalar[sira] -= tuketilen_enerji
+        self.durum.pozlar[sira] = teslimat.poz
+        self.durum.zamanlar[sira] = varis
+        self.dron_izgarasi.guncelle(dron_id, teslimat.poz)
+        
+        # Teslimat durumunu güncelle
+        self.durum.teslim_edildi[self.teslimat_kaydi.indeks(teslimat_id)] = True
+        
+        return saniyeyi_zamana_cevir(varis)
     
-    def coz(self) -> Dict[int, List[Tuple[int, time]]]:
+    def _engelsiz_kalkis_zamani_bul(
+        self, 
+        baslangic_poz: Tuple[float, float], 
+        bitis_poz: Tuple[float, float], 
+        kalkis: float, 
+        seyahat_suresi: float
+    ) -> float:
         """
-        CSP problemini çözer ve her drone için teslimat planını döndürür.
+        Yolu kesen uçuşa yasak bölgeler kapanana kadar bekleyerek en erken kalkış zamanını bulur.
         
+        Args:
+            baslangic_poz (Tuple[float, float]): Başlangıç pozisyonu
+            bitis_poz (Tuple[float, float]): Bitiş pozisyonu
+            kalkis (float): En erken kalkış zamanı (gece yarısından saniye)
+            seyahat_suresi (float): Uçuş süresi (saniye)
+            
         Returns:
-            Dict[int, List[Tuple[int, time]]]: Her drone için (teslimat ID, tahmini varış zamanı) çiftlerinin listesi
+            float: Uçuşun hiçbir aktif bölgeyle kesişmediği en erken kalkış zamanı
         """
-        # Teslimat noktalarını önceliğe göre sırala (yüksek öncelik önce)
-        siralanmis_teslimatlar = sorted(
-            self.teslimat_noktalari, 
-            key=lambda x: x.oncelik, 
-            reverse=True
-        )
+        while True:
+            engel_bitisleri = [
+                aktif_bitis
+                for bolge, (aktif_baslangic, aktif_bitis) in zip(self.ucus_yasak_bolgeleri, self._bolge_araliklari)
+                if (aktif_baslangic <= kalkis + seyahat_suresi and kalkis <= aktif_bitis and
+                    bolge.cizgi_kesisiyor_mu(baslangic_poz, bitis_poz))
+            ]
+            if not engel_bitisleri:
+                return kalkis
+            
+            # Bölge kapandıktan bir saniye sonra yeniden dene
+            kalkis = max(engel_bitisleri) + 1.0
+    
+    def _depoya_don(self, dron_id: int):
+        """
+        Drone'u depoya (başlangıç pozisyonuna) döndürür, şarj eder ve seferini kapatır.
         
-        mevcut_zaman = self.baslangic_zamani
-        sonuc: Dict[int, List[Tuple[int, time]]] = {dron.id: [] for dron in self.dronlar}
+        Dönüş yolu aktif bir uçuşa yasak bölgeden geçiyorsa drone bölge kapanana kadar
+        bekler. Drone'un müsaitlik zamanı şarjın bittiği ana ilerletilir.
+        
+        Args:
+            dron_id (int): Drone ID
+        """
+        sira = self.dron_kaydi.indeks(dron_id)
+        dron = self.dron_kaydi[dron_id]
+        dron_pozu = self._dron_pozu(sira)
+        varis = float(self.durum.zamanlar[sira])
         
-        # Her teslimat için en uygun drone'u seç
-        for teslimat in siralanmis_teslimatlar:
-            en_iyi_dron_id = self._teslimat_icin_en_iyi_dronu_sec(teslimat.id, mevcut_zaman)
+        if dron_pozu != dron.baslangic_poz:
+            mesafe = self._mesafe_hesapla(dron_pozu, dron.baslangic_poz)
+            seyahat_suresi = mesafe / dron.hiz
+            kalkis = self._engelsiz_kalkis_zamani_bul(dron_pozu, dron.baslangic_poz, varis, seyahat_suresi)
+            varis = kalkis + seyahat_suresi
             
-            if en_iyi_dron_id is not None:
-                # Drone'u teslimat noktasına ata
-                self.atamalar[en_iyi_dron_id].append(teslimat.id)
-                
-                # Drone'un durumunu güncelle ve tahmini varış zamanını al
-                varis_zamani = self._dron_durumunu_guncelle(en_iyi_dron_id, teslimat.id, mevcut_zaman)
-                
-                # Sonuçları kaydet
-                sonuc[en_iyi_dron_id].append((teslimat.id, varis_zamani))
-                
-                # Tahmini varış zamanını kaydet
-                self.tahmini_varis_zamanlari[en_iyi_dron_id][teslimat.id] = varis_zamani
+            tuketilen_enerji = dron.enerji_tuketimi_hesapla(mesafe, 0)
+            self.tuketilen_enerjiler[dron_id] += tuketilen_enerji
+            self.durum.bataryalar[sira] -= tuketilen_enerji
+            self.durum.pozlar[sira] = dron.baslangic_poz
+            self.dron_izgarasi.guncelle(dron_id, dron.baslangic_poz)
         
-        return sonuc
+        sarj_bitisi = varis + dron.sarj_suresi_hesapla(int(self.durum.bataryalar[sira]))
+        self.durum.bataryalar[sira] = dron.batarya
+        self.durum.zamanlar[sira] = sarj_bitisi
+        
+        seferler = self.seferler[dron_id]
+        if seferler and not seferler[-1].tamamlandi_mi:
+            seferler[-1].donus_zamani = saniyeyi_zamana_cevir(varis)
+            seferler[-1].sarj_bitis_zamani = saniyeyi_zamana_cevir(sarj_bitisi)
     
-    def atanmamis_teslimatlari_al(self) -> List[int]:
+    def _depoda_ve_sarjli_mi(self, dron_id: int) -> bool:
+        """Drone'un depoda ve bataryasının tam dolu olup olmadığını kontrol eder."""
+        sira = self.dron_kaydi.indeks(dron_id)
+        dron = self.dron_kaydi[dron_id]
+        return self._dron_pozu(sira) == dron.baslangic_poz and self.durum.bataryalar[sira] == dron.batarya
+    
+    def _acik_seferleri_kapat(self):
+        """Planlama bittiğinde dışarıda kalan drone'ları depoya döndürür."""
+        for dron_id, seferler in self.seferler.items():
+            if seferler and not seferler[-1].tamamlandi_mi:
+                self._depoya_don(dron_id)
+    
+    def _uygunluk_satirini_al(self, sira: int) -> np.ndarray:
         """
-        Atanmamış teslimatların ID'lerini döndürür.
+        Drone'un uygunluk matrisi satırını (yol kontrolü hariç) döndürür.
         
+        Satır yalnızca drone hareket ettiğinde ya da zamanı ilerlediğinde (geçersiz
+        işaretlendiğinde) yeniden hesaplanır; diğer drone'ların satırları etkilenmez.
+        
+        Args:
+            sira (int): Drone'un yoğun indeksi
+            
         Returns:
-            List[int]: Atanmamış teslimat ID'lerinin listesi
+            np.ndarray: Teslimat sırasına göre uygunluk satırı
         """
-        atanmis_teslimatlar = set()
-        for dron_id, teslimatlar in self.atamalar.items():
-            atanmis_teslimatlar.update(teslimatlar)
+        if not self._gecerli_satirlar[sira]:
+            self.uygunluk_matrisi[sira] = self._uygunluk_ve_zamanlama_hesapla(
+                [self.dron_kaydi.idler[sira]], yol_kontrolu=False
+            )[0][0]
+            self._gecerli_satirlar[sira] = True
+        return self.uygunluk_matrisi[sira]
+    
+    def _dron_icin_en_iyi_teslimati_sec(
+        self, 
+        dron_id: int, 
+        bekleyen: np.ndarray
+    ) -> Tuple[Optional[int], float]:
+        """
+        Müsait hale gelen bir drone için bekleyen teslimatlar arasından en uygununu seçer.
         
-        tum_teslimatlar = {teslimat.id for teslimat in self.teslimat_noktalari}
-        return list(tum_teslimatlar - atanmis_teslimatlar)
+        Skor; öncelik faktörü, mesafe ve pencere açılana kadar beklenecek sürenin drone
+        hızıyla mesafeye çevrilmiş karşılığının toplamıdır. Düşük skor daha iyidir; eşit
+        skorlarda yüksek öncelikli teslimat önce gelir. Yol kontrolü pahalı olduğundan
+        adaylar skor sırasıyla tek tek denetlenir ve yolu geçerli ilk aday seçilir.
+        
+        Args:
+            dron_id (int): Drone ID
+            bekleyen (np.ndarray): Teslimat sırasına göre henüz atanmamış teslimatların maskesi
+            
+        Returns:
+            Tuple[Optional[int], float]: Seçilen teslimatın sırası ve skoru, uygun teslimat yoksa (None, inf)
+        """
+        sira = self.dron_kaydi.indeks(dron_id)
+        adaylar = np.flatnonzero(self._uygunluk_satirini_al(sira) & bekleyen)
+        if len(adaylar) == 0:
+            return None, float('inf')
+        
+        dron = self.dron_kaydi[dron_id]
+        dron_pozu = self._dron_pozu(sira)
+        dx = self._teslimat_pozlari[adaylar, 0] - dron_pozu[0]
+        dy = self._teslimat_pozlari[adaylar, 1] - dron_pozu[1]
+        mesafeler = np.sqrt(dx * dx + dy * dy)
+        seyahat_sureleri = mesafeler / dron.hiz
+        kalkislar = np.maximum(self.durum.zamanlar[sira], self._pencere_baslangiclari[adaylar] - seyahat_sureleri)
+        bekleme = kalkislar - self.durum.zamanlar[sira]
+        skorlar = self._oncelik_faktorleri[adaylar] + mesafeler + bekleme * dron.hiz
+        
+        for k in np.lexsort((self._oncelik_faktorleri[adaylar], skorlar)):
+            kalkis = float(kalkislar[k])
+            teslimat_poz = self.teslimat_kaydi.nesneler[adaylar[k]].poz
+            if self._yol_gecerli_mi(dron_pozu, teslimat_poz, kalkis, kalkis + seyahat_sureleri[k]):
+                return int(adaylar[k]), float(skorlar[k])
+        
+        return None, float('inf')
     
-    def dron_rotalarini_al(self) -> Dict[int, List[Tuple[float, float]]]:
+    def _teslimat_icin_en_iyi_dronu_sec(
+        self, 
+        teslimat_sirasi: int, 
+        mevcut_saniye: float, 
+        en_iyi_dron_id: int, 
+        en_iyi_skor: float, 
+        aktif: np.ndarray
+    ) -> int:
         """
-        Her drone için rota koordinatlarını döndürür.
+        Bir teslimatı, olayın zamanında boşta olan aktif drone'lar arasından ona en iyi
+        skoru verene yönlendirir.
+        
+        Drone'lar uzamsal indeksten artan mesafe sırasıyla değerlendirilir. Bekleme
+        negatif olamayacağından bir drone'un skoru en az öncelik faktörü + mesafedir;
+        bu sınır mevcut en iyi skora ulaşınca kalan (daha uzak) drone'lara bakılmaz.
         
+        Args:
+            teslimat_sirasi (int): Teslimatın sırası
+            mevcut_saniye (float): Olayın zamanı (gece yarısından saniye)
+            en_iyi_dron_id (int): Teslimatı seçen drone
+            en_iyi_skor (float): Seçen drone'un teslimat için skoru
+            aktif (np.ndarray): Olay kuyruğunda bulunan drone'ların maskesi
+            
         Returns:
-            Dict[int, List[Tuple[float, float]]]: Her drone için koordinat listesi
+            int: Teslimatı yapacak drone'un ID'si
         """
-        rotalar = {}
+        teslimat_id = self.teslimat_kaydi.idler[teslimat_sirasi]
+        teslimat_poz = self.teslimat_kaydi.nesneler[teslimat_sirasi].poz
+        oncelik_faktoru = float(self._oncelik_faktorleri[teslimat_sirasi])
         
-        for dron in self.dronlar:
-            dron_id = dron.id
-            rota = [dron.baslangic_poz]
+        for mesafe, dron_id in self.dron_izgarasi.yakindan_uzaga(teslimat_poz):
+            # Skor sınırı: kalan drone'lar daha uzakta olduğundan daha iyi skor veremez
+            if oncelik_faktoru + mesafe >= en_iyi_skor:
+                break
             
-            for teslimat_id in self.atamalar.get(dron_id, []):
-                teslimat = next(d for d in self.teslimat_noktalari if d.id == teslimat_id)
-                rota.append(teslimat.poz)
+            sira = self.dron_kaydi.indeks(dron_id)
+            if dron_id == en_iyi_dron_id or not aktif[sira] or self.durum.zamanlar[sira] > mevcut_saniye:
+                continue
             
-            rotalar[dron_id] = rota
+            _, kalkis, _ = self._ucus_zamanlamasi_hesapla(dron_id, teslimat_id)
+            skor = oncelik_faktoru + mesafe + (kalkis - mevcut_saniye) * self._dron_hizlari[sira]
+            if skor < en_iyi_skor and self._dron_teslimat_yapabilir_mi(dron_id, teslimat_id):
+                en_iyi_skor = skor
+                en_iyi_dron_id = dron_id
         
-        return rotalar
+        return en_iyi_dron_id
+    
+    def _sonraki_bolge_bitisi(self, mevcut_saniye: float) -> Optional[float]:
+        """
+        Verilen andan sonra sona eren ilk uçuşa yasak bölge aktifliğini döndürür.
+        
+        Args:
+            mevcut_saniye (float): Mevcut zaman (gece yarısından saniye)
+            
+        Returns:
+            Optional[float]: Bölge bitiş zamanı, yoksa None
+        """
+        bitisler = [bitis for _, bitis in self._bolge_araliklari if bitis > mevcut_saniye]
+        return min(bitisler) if bitisler else None
+    
+    def coz(
+        self, 
+        yontem: str = "acgozlu", 
+        dugum_butcesi: int = 100000, 
+        zaman_butcesi: float = 10.0,
+        pismanlik_k: int = 2
+    ) -> Dict[int, List[Tuple[int, time]]]:
+        """
+        CSP problemini çözer ve her drone için teslimat planını döndürür.
+        
+        Açgözlü yöntem olay güdümlüdür: drone'lar müsait olma zamanlarına göre bir öncelik
+        kuyruğunda tutulur; kuyruktan çıkan drone kendi zamanında en iyi bekleyen teslimatı
+        seçer (eşit skorlarda yüksek öncelikli olanı). O anda boşta olan drone'lardan bu
+        teslimata daha iyi skor veren varsa (uzamsal indeksle, skor sınırıyla aranır)
+        teslimat ona atanır. Teslimatı alan drone varış zamanıyla kuyruğa geri döner. Her teslimat depoya dönüş enerjisini
+        yedekte bırakmalıdır. Hiçbir teslimatı yapamayan drone depoya döner, şarj olur ve
+        şarj bitiminde yeni bir sefer için kuyruğa girer; depoda ve tam şarjlıyken de
+        yapamıyorsa bir uçuşa yasak bölgenin kapanmasına ertelenir ya da devreden çıkar.
+        Planlama bitince dışarıda kalan drone'lar depoya döndürülür.
+        
+        Args:
+            yontem (str): "acgozlu" (olay kuyruklu zaman çizelgesi), "geri_izleme"
+                          (MRV, ileri kontrol ve çatışma yönlendirmeli geri sıçramalı arama)
+                          veya "pismanlik" (pişmanlık-k ekleme sezgiseli)
+            dugum_butcesi (int): Geri izlemeli aramada ziyaret edilecek en fazla düğüm sayısı
+            zaman_butcesi (float): Geri izlemeli arama için süre sınırı (saniye)
+            pismanlik_k (int): Pişmanlık sezgiselinde hesaba katılan seçenek sayısı
+        
+        Returns:
+            Dict[int, List[Tuple[int, time]]]: Her drone için (teslimat ID, tahmini varış zamanı) çiftlerinin listesi
+        """
+        if yontem == "geri_izleme":
+            return self._geri_izleme_ile_coz(dugum_butcesi, zaman_butcesi)
+        if yontem == "pismanlik":
+            return self._pismanlik_ile_coz(pismanlik_k)
+        if yontem != "acgozlu":
+            raise ValueError(f"Bilinmeyen çözüm yöntemi: {yontem}")
+        
+        self._durumu_sifirla()
+        sonuc: Dict[int, List[Tuple[int, time]]] = {dron.id: [] for dron in self.dronlar}
+        self._olay_kuyrugu_ile_planla(sonuc)
+        
+        return sonuc
+    
+    def _olay_kuyrugu_ile_planla(self, sonuc: Dict[int, List[Tuple[int, time]]]):
+        """
+        Henüz teslim edilmemiş teslimatları drone'ların mevcut durumundan başlayarak
+        olay kuyruğuyla planlar ve sonunda açık seferleri kapatır.
+        
+        Kuyruktan çıkan drone'un seçtiği teslimat, uzamsal indeksle bulunan ve o teslimat
+        için daha iyi skor veren başka bir aktif drone varsa ona atanır; bu durumda
+        kuyruktan çıkan drone aynı zamanda yeniden değerlendirilir. Uygunluk matrisinin
+        yalnızca durumu değişen drone'ların satırları yeniden hesaplanır.
+        
+        Args:
+            sonuc (Dict[int, List[Tuple[int, time]]]): Atamaların ekleneceği drone planları
+        """
+        bekleyen = ~self.durum.teslim_edildi
+        dron_sayisi = len(self.dron_kaydi)
+        self.uygunluk_matrisi = np.zeros((dron_sayisi, len(self.teslimat_kaydi)), dtype=bool)
+        self._gecerli_satirlar = np.zeros(dron_sayisi, dtype=bool)
+        aktif = self.durum.musait.copy()
+        
+        # Olay kuyruğu: (müsait olma zamanı, drone sırası, drone ID, sürüm); drone'un
+        # durumu değişince sürümü artar ve eski kayıtları atlanır
+        surumler = np.zeros(dron_sayisi, dtype=np.int64)
+        olay_kuyrugu = [
+            (float(self.durum.zamanlar[sira]), sira, dron_id, 0)
+            for sira, dron_id in enumerate(self.dron_kaydi.idler)
+            if aktif[sira]
+        ]
+        heapq.heapify(olay_kuyrugu)
+        
+        def durum_degisti(sira: int, dron_id: int):
+            self._gecerli_satirlar[sira] = False
+            surumler[sira] += 1
+            heapq.heappush(olay_kuyrugu, (float(self.durum.zamanlar[sira]), sira, dron_id, int(surumler[sira])))
+        
+        while olay_kuyrugu and bekleyen.any():
+            musait_zaman, sira, dron_id, surum = heapq.heappop(olay_kuyrugu)
+            if surum != surumler[sira]:
+                continue
+            
+            teslimat_sirasi, skor = self._dron_icin_en_iyi_teslimati_sec(dron_id, bekleyen)
+            
+            if teslimat_sirasi is None:
+                # Depoya dönüp şarj olduktan sonra yeni bir sefere çıkabilir
+                if not self._depoda_ve_sarjli_mi(dron_id):
+                    self._depoya_don(dron_id)
+                    durum_degisti(sira, dron_id)
+                    continue
+                
+                # Kapanan bir bölge yeni yollar açabilir; yoksa drone devreden çıkar
+                sonraki_zaman = self._sonraki_bolge_bitisi(musait_zaman)
+                if sonraki_zaman is not None:
+                    self.durum.zamanlar[sira] = sonraki_zaman
+                    durum_degisti(sira, dron_id)
+                else:
+                    aktif[sira] = False
+                continue
+            
+            teslimat_id = self.teslimat_kaydi.idler[teslimat_sirasi]
+            bekleyen[teslimat_sirasi] = False
+            
+            # Aynı anda boşta başka drone varsa teslimat ona daha iyi skor veren drone'a gider
+            atanan_id = dron_id
+            if olay_kuyrugu and olay_kuyrugu[0][0] <= musait_zaman:
+                atanan_id = self._teslimat_icin_en_iyi_dronu_sec(teslimat_sirasi, musait_zaman, dron_id, skor, aktif)
+            atanan_sira = self.dron_kaydi.indeks(atanan_id)
+            
+            # Drone'u teslimat noktasına ata ve zaman çizelgesini ilerlet
+            self.atamalar[atanan_id].append(teslimat_id)
+            varis_zamani = self._dron_durumunu_guncelle(atanan_id, teslimat_id)
+            
+            # Sonuçları ve tahmini varış zamanını kaydet
+            sonuc[atanan_id].append((teslimat_id, varis_zamani))
+            self.tahmini_varis_zamanlari[atanan_id][teslimat_id] = varis_zamani
+            
+            durum_degisti(atanan_sira, atanan_id)
+            if atanan_id != dron_id:
+                heapq.heappush(olay_kuyrugu, (musait_zaman, sira, dron_id, surum))
+        
+        self._acik_seferleri_kapat()
+    
+    def _pismanlik_ile_coz(self, k: int) -> Dict[int, List[Tuple[int, time]]]:
+        """
+        Pişmanlık-k ekleme sezgiseliyle boş plandan başlayarak tüm teslimatları yerleştirir.
+        
+        Her bekleyen teslimat için her drone'a en ucuz ekleme maliyeti (ek mesafe)
+        teslimat × drone matrisinde önbelleklenir. Her adımda en iyi k seçeneği
+        arasındaki farkların toplamı (pişmanlık) en büyük olan teslimat, yani ikinci
+        en iyi seçeneği en kötü olan, en iyi drone'una eklenir. Seçeneği k'dan az olan
+        teslimatlar önce gelir; eşitlikte yüksek öncelik kazanır. Bir ekleme yalnızca
+        o drone'un planını değiştirdiğinden matrisin yalnızca o sütunu ve en iyi k
+        değeri değişen satırlar yeniden hesaplanır.
+        
+        Karmaşıklık: ekleme, drone'un sonraki duraklarının zamanlamasını ve bolluğunu ve
+        seferin batarya payını değiştirdiğinden sütun, bekleyen her teslimat için drone'un
+        tüm yuvaları üzerinden yeniden değerlendirilir. Adım başına O(N × S) (N bekleyen
+        teslimat, S drone'un yuva sayısı), toplamda O(N² × S) yuva değerlendirmesi yapılır;
+        bölge denetimi yalnızca ilk k'ya girebilecek satırların en ucuz yuvalarına uygulanır.
+        
+        Args:
+            k (int): Pişmanlıkta hesaba katılan seçenek sayısı (en az 2)
+            
+        Returns:
+            Dict[int, List[Tuple[int, time]]]: Her drone için (teslimat ID, tahmini varış zamanı) çiftlerinin listesi
+        """
+        if k < 2:
+            raise ValueError("Pişmanlık derecesi en az 2 olmalıdır.")
+        
+        self._durumu_sifirla()
+        self._ekleme_onbellegini_olustur()
+        
+        teslimat_sayisi = len(self.teslimat_noktalari)
+        dron_sayisi = len(self.dronlar)
+        bekleyen = ~self.durum.teslim_edildi
+        oncelikler = np.array([nokta.oncelik for nokta in self.teslimat_noktalari], dtype=np.float64)
+        
+        # Teslimat × drone en ucuz ekleme maliyetleri ve satır başına en iyi k değer
+        maliyetler = np.full((teslimat_sayisi, dron_sayisi), np.inf)
+        for sira in range(dron_sayisi):
+            maliyetler[bekleyen, sira] = self._dron_ekleme_maliyetlerini_hesapla(sira, np.flatnonzero(bekleyen))
+        en_iyiler = self._en_iyi_k_degeri_al(maliyetler, k)
+        
+        while bekleyen.any():
+            secenek_sayilari = np.isfinite(en_iyiler).sum(axis=1)
+            farklar = np.subtract(
+                en_iyiler, en_iyiler[:, :1], out=np.zeros_like(en_iyiler), where=np.isfinite(en_iyiler)
+            )
+            pismanliklar = farklar.sum(axis=1)
+            
+            # Önce az seçenekli, sonra yüksek pişmanlıklı, sonra yüksek öncelikli teslimatlar
+            adaylar = np.flatnonzero(bekleyen & (secenek_sayilari > 0))
+            if len(adaylar) == 0:
+                break
+            secim = np.lexsort((-oncelikler[adaylar], -pismanliklar[adaylar], secenek_sayilari[adaylar]))[0]
+            teslimat_sirasi = int(adaylar[secim])
+            sira = int(np.argmin(maliyetler[teslimat_sirasi]))
+            
+            # Drone'un yuvaları üzerinde kesin doğrulama; başarısızsa bu seçenek elenir
+            dilim = self._yuva_dilimini_al(sira)
+            yuva_maliyetleri = self._ekleme_maliyetlerini_hesapla(
+                dilim, np.array([[teslimat_sirasi]]), yol_kontrolu=False
+            )[0]
+            if self._en_ucuz_eklemeyi_uygula(teslimat_sirasi, dilim, yuva_maliyetleri) is None:
+                maliyetler[teslimat_sirasi, sira] = np.inf
+                en_iyiler[teslimat_sirasi] = self._en_iyi_k_degeri_al(maliyetler[teslimat_sirasi:teslimat_sirasi + 1], k)
+                continue
+            
+            bekleyen[teslimat_sirasi] = False
+            maliyetler[teslimat_sirasi] = np.inf
+            en_iyiler[teslimat_sirasi] = np.inf
+            
+            # Yalnızca değişen drone'un sütunu ve en iyi k değeri etkilenen satırlar güncellenir
+            # İlk k'ya giremeyecek satırların bölge denetimi atlanır (maliyet alt sınır olarak kalır)
+            satirlar = np.flatnonzero(bekleyen)
+            eski_sutun = maliyetler[satirlar, sira]
+            esikler = en_iyiler[satirlar, -1]
+            denetim_esikleri = np.where(eski_sutun <= esikler, np.inf, esikler)
+            yeni_sutun = self._dron_ekleme_maliyetlerini_hesapla(sira, satirlar, denetim_esikleri)
+            maliyetler[satirlar, sira] = yeni_sutun
+            etkilenen = satirlar[(eski_sutun != yeni_sutun) & ((eski_sutun <= esikler) | (yeni_sutun <= esikler))]
+            if len(etkilenen):
+                en_iyiler[etkilenen] = self._en_iyi_k_degeri_al(maliyetler[etkilenen], k)
+        
+        return {
+            dron_id: [(teslimat_id, self.tahmini_varis_zamanlari[dron_id][teslimat_id]) for teslimat_id in teslimatlar]
+            for dron_id, teslimatlar in self.atamalar.items()
+        }
+    
+    def _dron_ekleme_maliyetlerini_hesapla(
+        self, 
+        sira: int, 
+        teslimat_siralari: np.ndarray, 
+        esikler: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Teslimatların bir drone'un planına en ucuz ekleme maliyetlerini hesaplar.
+        
+        Bölge geometrisi pahalı olduğundan önce bölgesiz maliyet matrisi hesaplanır; sonra
+        her teslimatın en ucuz yuvası bölgelerle birlikte denetlenir, geçemeyen yuva
+        elenip bir sonrakine geçilir. Bölge beklemesi yalnızca geciktirebildiğinden
+        sonuç, tam matristeki satır minimumlarıyla aynıdır. Bölgesiz en iyi maliyeti
+        eşiğinden büyük olan satırlar denetlenmez ve bu alt sınırla döner.
+        
+        Args:
+            sira (int): Drone'un yoğun indeksi
+            teslimat_siralari (np.ndarray): Teslimatların yoğun indeksleri
+            esikler (Optional[np.ndarray]): Teslimat başına denetim eşikleri (varsayılan: sınırsız)
+            
+        Returns:
+            np.ndarray: Teslimat başına en küçük ekleme maliyeti (uygun yuva yoksa inf)
+        """
+        dilim = self._yuva_dilimini_al(sira)
+        sonuc = np.full(len(teslimat_siralari), np.inf)
+        
+        # Bellek kullanımını sınırlamak için teslimatlar parçalar halinde işlenir
+        parca = max(1, (1 << 20) // max(len(dilim["dron_sirasi"]), 1))
+        for i in range(0, len(teslimat_siralari), parca):
+            siralar = teslimat_siralari[i:i + parca]
+            maliyetler = self._ekleme_maliyetlerini_hesapla(dilim, siralar[:, None], yol_kontrolu=False)
+            alt_sinirlar = maliyetler.min(axis=1) if maliyetler.shape[1] else np.full(len(siralar), np.inf)
+            denetlenecek = np.isfinite(alt_sinirlar)
+            if esikler is not None:
+                atlanan = denetlenecek & (alt_sinirlar > esikler[i:i + parca])
+                sonuc[i + np.flatnonzero(atlanan)] = alt_sinirlar[atlanan]
+                denetlenecek &= ~atlanan
+            satirlar = np.flatnonzero(denetlenecek)
+            
+            # Her turda satır başına en ucuz birkaç yuva birlikte denetlenir
+            tur_genisligi = min(8, maliyetler.shape[1])
+            while len(satirlar):
+                en_ucuzlar = np.argpartition(maliyetler[satirlar], tur_genisligi - 1, axis=1)[:, :tur_genisligi]
+                denetlenen = np.take_along_axis(maliyetler[satirlar], en_ucuzlar, axis=1)
+                denetlenen[np.isfinite(denetlenen)] = self._ekleme_maliyetlerini_hesapla(
+                    dilim,
+                    np.broadcast_to(siralar[satirlar][:, None], en_ucuzlar.shape)[np.isfinite(denetlenen)],
+                    en_ucuzlar[np.isfinite(denetlenen)]
+                )
+                en_iyi = denetlenen.min(axis=1)
+                bulundu = np.isfinite(en_iyi)
+                sonuc[i + satirlar[bulundu]] = en_iyi[bulundu]
+                
+                satirlar, en_ucuzlar = satirlar[~bulundu], en_ucuzlar[~bulundu]
+                maliyetler[satirlar[:, None], en_ucuzlar] = np.inf
+                satirlar = satirlar[np.isfinite(maliyetler[satirlar]).any(axis=1)]
+        
+        return sonuc
+    
+    def _en_iyi_k_degeri_al(self, maliyetler: np.ndarray, k: int) -> np.ndarray:
+        """
+        Maliyet matrisinin her satırındaki en küçük k değeri artan sırada döndürür.
+        
+        Args:
+            maliyetler (np.ndarray): (satır sayısı, drone sayısı) boyutlu maliyet matrisi
+            k (int): Değer sayısı
+            
+        Returns:
+            np.ndarray: (satır sayısı, k) boyutlu matris; drone sayısı k'dan azsa inf ile doldurulur
+        """
+        if maliyetler.shape[1] < k:
+            maliyetler = np.hstack([maliyetler, np.full((maliyetler.shape[0], k - maliyetler.shape[1]), np.inf)])
+        return np.sort(np.partition(maliyetler, k - 1, axis=1)[:, :k], axis=1)
+    
+    def _geri_izleme_ile_coz(
+        self, 
+        dugum_butcesi: int, 
+        zaman_butcesi: float
+    ) -> Dict[int, List[Tuple[int, time]]]:
+        """
+        Geri izlemeli arama ile atanan teslimat sayısını en büyükleyen planı arar.
+        
+        Değişkenler teslimatlar, değerler drone'lar ve "atanmadı" seçeneğidir.
+        - Değişken sıralaması MRV: alanı en küçük (eşitlikte önceliği en yüksek) teslimat
+        - Değer sıralaması: drone'lar teslimata artan mesafe sırasıyla, en son "atanmadı"
+        - İleri kontrol: bir atamadan sonra yalnızca durumu değişen drone'un, bekleyen
+          teslimatların alanlarındaki yeri yeniden hesaplanır
+        - Sınır: atanan sayısı + alanı boş olmayan bekleyen teslimat sayısı, bilinen en iyi
+          çözümü geçemiyorsa dal budanır
+        - Çatışma yönlendirmeli geri sıçrama: budamanın nedeni olan kararlar (atlanan
+          teslimatlar ve alanı boşalan teslimatları taşıyabilecek drone'lara yapılan
+          atamalar) toplanır ve en derin nedene geri sıçranır
+        
+        Bir drone'un uygunluğu tüm atama geçmişine bağlı olduğundan sınır ve geri
+        sıçrama kesin değil sezgiseldir; arama bütçe ile sınırlıdır ve her zaman
+        bulunan en iyi plan döndürülür. Arama her drone'un yalnızca ilk seferini kapsar
+        (depoya dönüş enerjisi uygunluğa dahildir); kalan teslimatlar ardından açgözlü
+        olay kuyruğuyla sonraki seferlere dağıtılır. İlk seferde en çok teslimatı yapan
+        seçim sonraki seferleri kötüleştirebildiğinden, birleşik plan açgözlü plandan
+        daha az (eşitlikte daha düşük öncelikli) teslimat yapıyorsa açgözlü plan
+        döndürülür.
+        
+        Args:
+            dugum_butcesi (int): Ziyaret edilecek en fazla düğüm sayısı
+            zaman_butcesi (float): Süre sınırı (saniye)
+            
+        Returns:
+            Dict[int, List[Tuple[int, time]]]: Her drone için (teslimat ID, tahmini varış zamanı) çiftlerinin listesi
+        """
+        baslangic_ani = zaman_modulu.perf_counter()
+        
+        def plan_degeri(plan: Dict[int, List[Tuple[int, time]]]) -> Tuple[int, int]:
+            atananlar = [teslimat_id for atamalar in plan.values() for teslimat_id, _ in atamalar]
+            return len(atananlar), sum(self.teslimat_kaydi[t].oncelik for t in atananlar)
+        
+        # Arama sonucunun kıyaslanacağı açgözlü plan
+        acgozlu_deger = plan_degeri(self.coz("acgozlu"))
+        self._durumu_sifirla()
+        
+        istatistikler = {
+            "dugum_sayisi": 0,
+            "budama_sayisi": 0,
+            "geri_sicrama_sayisi": 0,
+            "atlanan_seviye_sayisi": 0,
+            "ileri_kontrol_cikarma_sayisi": 0,
+            "bulunan_cozum_sayisi": 0
+        }
+        
+        # Karar verilmemiş teslimatlar ve her birinin uygun drone kümesi (alanı)
+        bekleyen = {teslimat.id for teslimat in self.teslimat_noktalari}
+        baslangic_matrisi = self.uygunluk_matrisi_hesapla()
+        alanlar: Dict[int, Set[int]] = {
+            teslimat_id: {
+                dron_id for sira, dron_id in enumerate(self.dron_kaydi.idler)
+                if self.durum.musait[sira] and baslangic_matrisi[self.dron_kaydi.indeks(dron_id), self.teslimat_kaydi.indeks(teslimat_id)]
+            }
+            for teslimat_id in bekleyen
+        }
+        
+        # Statik alanda kalan drone'lar: alan boşalmasının olası nedenleri
+        tasiyabilenler = {
+            teslimat_id: [
+                dron_id for dron_id, bit in self.dron_bitleri.items()
+                if self.statik_alanlar[teslimat_id] & bit
+            ]
+            for teslimat_id in bekleyen
+        }
+        
+        # Arama yığını: her çerçeve bir karar seviyesidir
+        cerceveler: List[Dict] = []
+        dron_seviyeleri: Dict[int, List[int]] = {dron.id: [] for dron in self.dronlar}
+        atanan_sayisi = 0
+        oncelik_toplami = 0
+        
+        en_iyi_kararlar: List[Tuple[int, Optional[int]]] = []
+        en_iyi_deger = (-1, -1)
+        
+        def degeri_uygula(cerceve: Dict):
+            nonlocal atanan_sayisi, oncelik_toplami
+            dron_id = cerceve["deger"]
+            if dron_id is None:
+                return
+            
+            teslimat = self.teslimat_kaydi[cerceve["teslimat"]]
+            dron = self.dron_kaydi[dron_id]
+            sira = self.dron_kaydi.indeks(dron_id)
+            cerceve["onceki_durum"] = (
+                self._dron_pozu(sira), int(self.durum.bataryalar[sira]), float(self.durum.zamanlar[sira])
+            )
+            
+            mesafe, _, varis = self._ucus_zamanlamasi_hesapla(dron_id, teslimat.id)
+            self.durum.bataryalar[sira] -= dron.enerji_tuketimi_hesapla(mesafe, teslimat.agirlik)
+            self.durum.pozlar[sira] = teslimat.poz
+            self.durum.zamanlar[sira] = varis
+            self.dron_izgarasi.guncelle(dron_id, teslimat.poz)
+            dron_seviyeleri[dron_id].append(len(cerceveler) - 1)
+            atanan_sayisi += 1
+            oncelik_toplami += teslimat.oncelik
+            
+            # İleri kontrol: yalnızca bu drone'un alanlardaki yeri değişebilir
+            degisiklikler = []
+            dron_biti = self.dron_bitleri[dron_id]
+            satir = self.uygunluk_matrisi_hesapla([dron_id])[0]
+            for diger_id in bekleyen:
+                if not self.statik_alanlar[diger_id] & dron_biti:
+                    continue
+                uygun = bool(satir[self.teslimat_kaydi.indeks(diger_id)])
+                if uygun != (dron_id in alanlar[diger_id]):
+                    degisiklikler.append((diger_id, uygun))
+                    if uygun:
+                        alanlar[diger_id].add(dron_id)
+                    else:
+                        alanlar[diger_id].discard(dron_id)
+                        istatistikler["ileri_kontrol_cikarma_sayisi"] += 1
+            cerceve["degisiklikler"] = degisiklikler
+        
+        def degeri_geri_al(cerceve: Dict):
+            nonlocal atanan_sayisi, oncelik_toplami
+            dron_id = cerceve["deger"]
+            if dron_id is None:
+                return
+            
+            for diger_id, uygun in cerceve["degisiklikler"]:
+                if uygun:
+                    alanlar[diger_id].discard(dron_id)
+                else:
+                    alanlar[diger_id].add(dron_id)
+            
+            sira = self.dron_kaydi.indeks(dron_id)
+            onceki_poz, self.durum.bataryalar[sira], self.durum.zamanlar[sira] = cerceve["onceki_durum"]
+            self.durum.pozlar[sira] = onceki_poz
+            self.dron_izgarasi.guncelle(dron_id, onceki_poz)
+            dron_seviyeleri[dron_id].pop()
+            atanan_sayisi -= 1
+            oncelik_toplami -= self.teslimat_kaydi[cerceve["teslimat"]].oncelik
+        
+        catisma: Optional[Set[int]] = None
+        genislet = True
+        butce_asildi = False
+        
+        while True:
+            if genislet:
+                istatistikler["dugum_sayisi"] += 1
+                if (istatistikler["dugum_sayisi"] > dugum_butcesi or
+                        zaman_modulu.perf_counter() - baslangic_ani > zaman_butcesi):
+                    butce_asildi = True
+                    break
+                
+                canli = [teslimat_id for teslimat_id in bekleyen if alanlar[teslimat_id]]
+                sinir = (
+                    atanan_sayisi + len(canli),
+                    oncelik_toplami + sum(self.teslimat_kaydi[t].oncelik for t in canli)
+                )
+                
+                if not canli:
+                    # Yaprak: yeni en iyi çözüm mü?
+                    if (atanan_sayisi, oncelik_toplami) > en_iyi_deger:
+                        en_iyi_deger = (atanan_sayisi, oncelik_toplami)
+                        en_iyi_kararlar = [(c["teslimat"], c["deger"]) for c in cerceveler]
+                        istatistikler["bulunan_cozum_sayisi"] += 1
+                    
+                    # Daha iyisini aramak için kronolojik geri izleme
+                    catisma = set(range(len(cerceveler)))
+                elif sinir <= en_iyi_deger:
+                    istatistikler["budama_sayisi"] += 1
+                    
+                    # Çatışma kümesi: atlanan teslimatlar ve alanı boşalan teslimatların
+                    # olası drone'larına atama yapan seviyeler
+                    catisma = {i for i, c in enumerate(cerceveler) if c["deger"] is None}
+                    for teslimat_id in bekleyen:
+                        if not alanlar[teslimat_id]:
+                            for dron_id in tasiyabilenler[teslimat_id]:
+                                catisma.update(dron_seviyeleri[dron_id])
+                else:
+                    # MRV: en küçük alanlı teslimatı seç (eşitlikte yüksek öncelik)
+                    teslimat_id = min(
+                        canli,
+                        key=lambda t: (len(alanlar[t]), -self.teslimat_kaydi[t].oncelik, t)
+                    )
+                    teslimat = self.teslimat_kaydi[teslimat_id]
+                    degerler = [
+                        dron_id for _, dron_id in self.dron_izgarasi.yakindan_uzaga(teslimat.poz)
+                        if dron_id in alanlar[teslimat_id]
+                    ] + [None]
+                    
+                    bekleyen.remove(teslimat_id)
+                    cerceveler.append({
+                        "teslimat": teslimat_id,
+                        "degerler": degerler,
+                        "indeks": -1,
+                        "deger": None,
+                        "catisma": set()
+                    })
+            
+            if catisma is not None:
+                # Çatışma kümesindeki en derin seviyeye geri sıçra
+                hedef = max(catisma) if catisma else -1
+                atlanan = len(cerceveler) - 1 - hedef
+                if atlanan > 0:
+                    istatistikler["geri_sicrama_sayisi"] += 1
+                    istatistikler["atlanan_seviye_sayisi"] += atlanan
+                
+                while len(cerceveler) - 1 > hedef:
+                    cerceve = cerceveler.pop()
+                    degeri_geri_al(cerceve)
+                    bekleyen.add(cerceve["teslimat"])
+                
+                if not cerceveler:
+                    break
+                
+                cerceveler[-1]["catisma"] |= catisma - {hedef}
+                catisma = None
+            
+            # En üstteki seviyede sıradaki değeri dene
+            cerceve = cerceveler[-1]
+            degeri_geri_al(cerceve)
+            cerceve["indeks"] += 1
+            
+            if cerceve["indeks"] >= len(cerceve["degerler"]):
+                # Değerler tükendi: bu seviyenin çatışma kümesiyle başarısız ol
+                cerceveler.pop()
+                bekleyen.add(cerceve["teslimat"])
+                catisma = cerceve["catisma"]
+                genislet = False
+                continue
+            
+            cerceve["deger"] = cerceve["degerler"][cerceve["indeks"]]
+            degeri_uygula(cerceve)
+            genislet = True
+        
+        # Bulunan en iyi planı temiz durum üzerinde yeniden uygula
+        self._durumu_sifirla()
+        sonuc: Dict[int, List[Tuple[int, time]]] = {dron.id: [] for dron in self.dronlar}
+        
+        for teslimat_id, dron_id in en_iyi_kararlar:
+            if dron_id is None:
+                continue
+            self.atamalar[dron_id].append(teslimat_id)
+            varis_zamani = self._dron_durumunu_guncelle(dron_id, teslimat_id)
+            sonuc[dron_id].append((teslimat_id, varis_zamani))
+            self.tahmini_varis_zamanlari[dron_id][teslimat_id] = varis_zamani
+        
+        # Arama her drone'un ilk seferini planlar; kalan teslimatlar sonraki seferlere dağıtılır
+        self._olay_kuyrugu_ile_planla(sonuc)
+        
+        istatistikler["acgozlu_plan_secildi_mi"] = plan_degeri(sonuc) < acgozlu_deger
+        if istatistikler["acgozlu_plan_secildi_mi"]:
+            sonuc = self.coz("acgozlu")
+        
+        istatistikler["budama_orani"] = (
+            istatistikler["budama_sayisi"] / istatistikler["dugum_sayisi"]
+            if istatistikler["dugum_sayisi"] else 0.0
+        )
+        istatistikler["butce_asildi_mi"] = butce_asildi
+        istatistikler["sure"] = zaman_modulu.perf_counter() - baslangic_ani
+        self.arama_istatistikleri = istatistikler
+        
+        return sonuc
+    
+    def ekle(self, teslimat: TeslimatNoktasi) -> Optional[Tuple[int, time]]:
+        """
+        Yeni bir teslimatı mevcut plana en ucuz ekleme yöntemiyle yerleştirir.
+        
+        Tüm problemi yeniden çözmek yerine teslimat, her drone'un her seferindeki iki
+        ardışık durak arasına (ya da drone'un sonuna yeni bir sefer olarak) eklenmeyi
+        dener. Adaylar önbellekteki plan dizileri üzerinde vektörel olarak elenir:
+        statik alan, teslimatın zaman aralığı, sonraki durağın gecikme payı (bolluk) ve
+        seferin batarya payı. Kalanlar ek mesafeye göre sıralanır ve ilk aday,
+        yalnızca ilgili drone'un zaman çizelgesi yeniden hesaplanarak (uçuşa yasak
+        bölgeler dahil) kesin olarak doğrulanır. Eklemeden etkilenen bacaklar, yolu
+        kesen bölge kapanana kadar bulundukları noktada bekleyebilir.
+        
+        Args:
+            teslimat (TeslimatNoktasi): Eklenecek teslimat noktası
+            
+        Returns:
+            Optional[Tuple[int, time]]: Teslimatı alan drone'un ID'si ve tahmini varış
+                                        zamanı; uygun yer yoksa None (teslimat atanmamış
+                                        olarak kayıtlı kalır)
+        """
+        if self._ekleme_onbellegi is None:
+            self._ekleme_onbellegini_olustur()
+        teslimat_sirasi = self._teslimati_kaydet(teslimat)
+        if not self.dronlar:
+            return None
+        
+        yuvalar = self._ekleme_onbellegi["yuvalar"]
+        maliyetler = self._ekleme_maliyetlerini_hesapla(yuvalar, np.array([[teslimat_sirasi]]), yol_kontrolu=False)[0]
+        sira = self._en_ucuz_eklemeyi_uygula(teslimat_sirasi, yuvalar, maliyetler)
+        if sira is None:
+            return None
+        
+        dron_id = self.dron_kaydi.idler[sira]
+        return dron_id, self.tahmini_varis_zamanlari[dron_id][teslimat.id]
+    
+    def _ekleme_maliyetlerini_hesapla(
+        self, 
+        yuvalar: Dict[str, np.ndarray], 
+        teslimat_siralari: np.ndarray, 
+        yuva_indeksleri: Optional[np.ndarray] = None,
+        yol_kontrolu: bool = True
+    ) -> np.ndarray:
+        """
+        Teslimatların yuvalara eklenme maliyetlerini (ek mesafe) vektörel olarak hesaplar.
+        
+        Teslimat ve yuva indeks dizileri birlikte yayınlanır: (m, 1) ve (1, s) boyutlu
+        diziler bir maliyet matrisi, aynı uzunluktaki iki dizi ise çift başına maliyet
+        verir. Yeni iki bacaktan biri aktif bir uçuşa yasak bölgeyi kesiyorsa kalkış,
+        kesin çizelgedeki gibi bölge kapandıktan sonraya ertelenir (bölgeler üzerinden
+        tek geçişle). Çift; statik alan, drone müsaitliği, teslimatın zaman aralığı,
+        sonraki durağın bolluğu ya da seferin batarya payı nedeniyle elenirse maliyeti
+        sonsuzdur. Geciken sonraki bacaklar burada denetlenmez; seçilen aday
+        _dron_cizelgesini_hesapla ile kesin olarak doğrulanır.
+        
+        Args:
+            yuvalar (Dict[str, np.ndarray]): Ekleme yuvaları (tümü ya da bir drone'un dilimi)
+            teslimat_siralari (np.ndarray): Teslimatların yoğun indeksleri
+            yuva_indeksleri (Optional[np.ndarray]): Yuva indeksleri (varsayılan: (1, s) boyutlu tüm yuvalar)
+            yol_kontrolu (bool): Uçuşa yasak bölge beklemesini hesaba kat (False ise maliyetler
+                                 gevşek bir alt sınırdır: elenmeyen her çift bölgesiz de uygundur)
+            
+        Returns:
+            np.ndarray: Yayınlanmış boyutta maliyetler
+        """
+        # Alanlar yayınlanmamış indekslerle toplanır; (m, 1) × (1, s) matrisinde her yuva
+        # alanı m × s yerine s kez okunur, yayınlama aritmetikte yapılır. Tüm yuvalar
+        # için alanlar kopyalanmadan (1, s) görünümleriyle okunur
+        t = np.asarray(teslimat_siralari)
+        if yuva_indeksleri is None:
+            y = (None, slice(None))
+            sekil = np.broadcast_shapes(t.shape, (1, len(yuvalar["dron_sirasi"])))
+        else:
+            y = np.asarray(yuva_indeksleri)
+            sekil = np.broadcast_shapes(t.shape, y.shape)
+        dron_siralari = yuvalar["dron_sirasi"][y]
+        hizlar = self._dron_hizlari[dron_siralari]
+        teslimat_pozlari = self._teslimat_pozlari[t]
+        onceki_pozlar = yuvalar["onceki_poz"][y]
+        sonraki_pozlar = yuvalar["sonraki_poz"][y]
+        
+        uygun = np.broadcast_to(self._statik_matris[dron_siralari, t] & self.durum.musait[dron_siralari], sekil).copy()
+        
+        # Batarya: yeni iki bacak eski bacağın yerini alır
+        d1 = np.hypot(onceki_pozlar[..., 0] - teslimat_pozlari[..., 0], onceki_pozlar[..., 1] - teslimat_pozlari[..., 1])
+        d2 = np.hypot(sonraki_pozlar[..., 0] - teslimat_pozlari[..., 0], sonraki_pozlar[..., 1] - teslimat_pozlari[..., 1])
+        ek_enerji = (
+            np.floor(d1 * (1 + self._teslimat_agirliklari[t] / 10) * 10) +
+            np.floor(d2 * (1 + yuvalar["sonraki_agirlik"][y] / 10) * 10) -
+            yuvalar["eski_enerji"][y]
+        )
+        uygun &= ek_enerji <= yuvalar["enerji_payi"][y]
+        
+        # Teslimat noktasına uçuş: pencere açılmadan varılacaksa kalkış ertelenir
+        sure1 = d1 / hizlar
+        kalkislar = np.maximum(yuvalar["onceki_hazir"][y], self._pencere_baslangiclari[t] - sure1)
+        if yol_kontrolu:
+            self._yasak_bolge_beklemesi_ekle(
+                uygun, kalkislar, sure1, np.broadcast_to(onceki_pozlar, sekil + (2,)),
+                np.broadcast_to(teslimat_pozlari, sekil + (2,))
+            )
+        varislar = kalkislar + sure1
+        uygun &= varislar <= self._pencere_bitisleri[t]
+        
+        # Teslimattan sonraki durağa uçuş ve o durağa varıştaki gecikme
+        sure2 = d2 / hizlar
+        kalkislar = np.maximum(varislar, yuvalar["sonraki_pencere_baslangici"][y] - sure2)
+        if yol_kontrolu:
+            self._yasak_bolge_beklemesi_ekle(
+                uygun, kalkislar, sure2, np.broadcast_to(teslimat_pozlari, sekil + (2,)),
+                np.broadcast_to(sonraki_pozlar, sekil + (2,))
+            )
+        uygun &= kalkislar + sure2 - yuvalar["sonraki_varis"][y] <= yuvalar["sonraki_bolluk"][y] + _ZAMAN_TOLERANSI
+        
+        return np.where(uygun, d1 + d2 - yuvalar["eski_mesafe"][y], np.inf)
+    
+    def _yasak_bolge_beklemesi_ekle(
+        self, 
+        uygun: np.ndarray, 
+        kalkislar: np.ndarray, 
+        sureler: np.ndarray, 
+        baslangiclar: np.ndarray, 
+        bitisler: np.ndarray
+    ):
+        """
+        Bacakların kalkışlarını, yolu kesen aktif bölgeler kapanana kadar yerinde erteler.
+        
+        Yalnızca hâlâ uygun olan ve uçuşu bölgenin aktif aralığına denk gelen bacaklar
+        geometrik olarak test edilir.
+        
+        Args:
+            uygun (np.ndarray): Uygunluk maskesi
+            kalkislar (np.ndarray): En erken kalkış zamanları (yerinde güncellenir)
+            sureler (np.ndarray): Uçuş süreleri
+            baslangiclar (np.ndarray): Bacak başlangıç noktaları (son eksen x, y)
+            bitisler (np.ndarray): Bacak bitiş noktaları (son eksen x, y)
+        """
+        for bolge, (aktif_baslangic, aktif_bitis) in zip(self.ucus_yasak_bolgeleri, self._bolge_araliklari):
+            adaylar = uygun & (aktif_baslangic <= kalkislar + sureler) & (kalkislar <= aktif_bitis)
+            if not adaylar.any():
+                continue
+            kesisiyor = np.zeros_like(adaylar)
+            kesisiyor[adaylar] = bolge.cizgiler_kesisiyor_mu(baslangiclar[adaylar], bitisler[adaylar])
+            # _engelsiz_kalkis_zamani_bul gibi bölge kapandıktan bir saniye sonra
+            kalkislar[kesisiyor] = aktif_bitis + 1.0
+    
+    def _en_ucuz_eklemeyi_uygula(
+        self, 
+        teslimat_sirasi: int, 
+        yuvalar: Dict[str, np.ndarray], 
+        maliyetler: np.ndarray
+    ) -> Optional[int]:
+        """
+        Sonlu maliyetli yuvaları ucuzdan pahalıya kesin olarak doğrular ve ilk geçerli eklemeyi uygular.
+        
+        Args:
+            teslimat_sirasi (int): Eklenecek teslimatın yoğun indeksi
+            yuvalar (Dict[str, np.ndarray]): Maliyetlerin hesaplandığı ekleme yuvaları
+            maliyetler (np.ndarray): Yuva başına ekleme maliyetleri
+            
+        Returns:
+            Optional[int]: Teslimatı alan drone'un yoğun indeksi, geçerli ekleme yoksa None
+        """
+        adaylar = np.flatnonzero(np.isfinite(maliyetler))
+        adaylar = adaylar[np.argsort(maliyetler[adaylar], kind='stable')]
+        
+        # En ucuz aday çoğunlukla geçerlidir; ön eleme yapılmadan doğrudan kesin doğrulanır
+        if len(adaylar):
+            sira = self._yuvaya_eklemeyi_dene(teslimat_sirasi, yuvalar, int(adaylar[0]))
+            if sira is not None:
+                return sira
+            adaylar = adaylar[1:]
+        
+        # Bölge beklemesi mesafeyi değiştirmez; kalan adaylar sırayla küçük gruplar halinde elenir
+        for i in range(0, len(adaylar), 8):
+            grup = adaylar[i:i + 8]
+            grup_maliyetleri = self._ekleme_maliyetlerini_hesapla(yuvalar, np.full(len(grup), teslimat_sirasi), grup)
+            for aday in grup[np.isfinite(grup_maliyetleri)]:
+                sira = self._yuvaya_eklemeyi_dene(teslimat_sirasi, yuvalar, int(aday))
+                if sira is not None:
+                    return sira
+        
+        return None
+    
+    def _yuvaya_eklemeyi_dene(self, teslimat_sirasi: int, yuvalar: Dict[str, np.ndarray], aday: int) -> Optional[int]:
+        """
+        Teslimatı tek bir yuvaya ekleyip drone'un çizelgesini kesin olarak doğrular; geçerliyse uygular.
+        
+        Args:
+            teslimat_sirasi (int): Eklenecek teslimatın yoğun indeksi
+            yuvalar (Dict[str, np.ndarray]): Ekleme yuvaları
+            aday (int): Yuva indeksi
+            
+        Returns:
+            Optional[int]: Eklemenin yapıldığı drone'un yoğun indeksi, çizelge geçersizse None
+        """
+        sira = int(yuvalar["dron_sirasi"][aday])
+        eski_cizelge = self._ekleme_onbellegi["cizelgeler"][sira]
+        sefer_duraklari = [list(sefer["duraklar"]) for sefer in eski_cizelge]
+        sefer_no = int(yuvalar["sefer_no"][aday])
+        if sefer_no == len(sefer_duraklari):
+            sefer_duraklari.append([teslimat_sirasi])
+        else:
+            sefer_duraklari[sefer_no].insert(int(yuvalar["konum"][aday]), teslimat_sirasi)
+        
+        yeni_cizelge = self._dron_cizelgesini_hesapla(sira, sefer_duraklari, eski_cizelge, sefer_no)
+        if yeni_cizelge is None:
+            return None
+        self._dron_cizelgesini_uygula(sira, yeni_cizelge)
+        return sira
+    
+    def _teslimati_kaydet(self, teslimat: TeslimatNoktasi) -> int:
+        """
+        Yeni bir teslimatı kayda, sabit teslimat dizilerine ve statik alanlara ekler.
+        
+        Args:
+            teslimat (TeslimatNoktasi): Eklenecek teslimat noktası
+            
+        Returns:
+            int: Teslimatın yoğun indeksi
+        """
+        teslimat_sirasi = self.teslimat_kaydi.ekle(teslimat)
+        
+        alanlar, istatistikler = statik_alanlari_hesapla(
+            self.dronlar, [teslimat], self.ucus_yasak_bolgeleri, self.baslangic_zamani
+        )
+        self.statik_alanlar[teslimat.id] = alanlar[teslimat.id]
+        for kural, sayi in istatistikler.items():
+            self.alan_daraltma_istatistikleri[kural] += sayi
+        
+        # Diziler kapasitesi ikiye katlanan tamponların görünümleridir; yeni satır/sütun
+        # yerinde yazılır ve D × N statik matris her eklemede kopyalanmaz
+        for ad, deger, eksen in (
+            ("_teslimat_pozlari", teslimat.poz, 0),
+            ("_teslimat_agirliklari", teslimat.agirlik, 0),
+            ("_pencere_baslangiclari", zamani_saniyeye_cevir(teslimat.zaman_araligi[0]), 0),
+            ("_pencere_bitisleri", zamani_saniyeye_cevir(teslimat.zaman_araligi[1]), 0),
+            ("_oncelik_faktorleri", (6 - teslimat.oncelik) * 100, 0),
+            ("_statik_matris", self._alan_bitlerini_ac(alanlar[teslimat.id]), 1),
+        ):
+            self._ekleme_tamponlari[ad], dizi = kapasiteli_ekle(
+                self._ekleme_tamponlari.get(ad), getattr(self, ad), deger, eksen
+            )
+            setattr(self, ad, dizi)
+        self._ekleme_tamponlari["teslim_edildi"], self.durum.teslim_edildi = kapasiteli_ekle(
+            self._ekleme_tamponlari.get("teslim_edildi"), self.durum.teslim_edildi, teslimat.teslim_edildi_mi
+        )
+        
+        return teslimat_sirasi
+    
+    def _ekleme_onbellegini_olustur(self):
+        """
+        Mevcut planı drone başına sefer çizelgelerine ve ekleme yuvası dizilerine çevirir.
+        
+        Her sefer çizelgesi, seferin duraklarını (teslimat sıraları) ve kaydedilmiş
+        kalkış/varış zamanlarını saniye cinsinden tutar. Yuvalar tüm drone'lar için
+        tek bir dizi kümesinde, her drone'a ayrılmış kapasiteli bölgelerde tutulur
+        (bkz. _yuva_duzenini_kur); bir ekleme yalnızca ilgili drone'un bölgesine yazar.
+        """
+        self._acik_seferleri_kapat()
+        
+        cizelgeler = []
+        for sira, dron in enumerate(self.dron_kaydi.nesneler):
+            cizelge = []
+            hazir = zamani_saniyeye_cevir(self.baslangic_zamani)
+            
+            for sefer in self.seferler[dron.id]:
+                baslangic_poz = dron.mevcut_poz if not cizelge else dron.baslangic_poz
+                batarya = dron.mevcut_batarya if not cizelge else dron.batarya
+                duraklar = [self.teslimat_kaydi.indeks(teslimat_id) for teslimat_id in sefer.teslimatlar]
+                
+                poz = baslangic_poz
+                enerji = 0
+                varislar, kalkislar = [], []
+                for teslimat_id, durak in zip(sefer.teslimatlar, duraklar):
+                    nokta = self.teslimat_kaydi.nesneler[durak]
+                    mesafe = self._mesafe_hesapla(poz, nokta.poz)
+                    varis = zamani_saniyeye_cevir(self.tahmini_varis_zamanlari[dron.id][teslimat_id])
+                    varislar.append(varis)
+                    kalkislar.append(varis - mesafe / dron.hiz)
+                    enerji += dron.enerji_tuketimi_hesapla(mesafe, nokta.agirlik)
+                    poz = nokta.poz
+                
+                mesafe = self._mesafe_hesapla(poz, dron.baslangic_poz)
+                donus_varisi = zamani_saniyeye_cevir(sefer.donus_zamani)
+                enerji += dron.enerji_tuketimi_hesapla(mesafe, 0)
+                
+                cizelge.append({
+                    "duraklar": duraklar,
+                    "baslangic_poz": baslangic_poz,
+                    "hazir": hazir,
+                    "batarya": batarya,
+                    "varislar": varislar,
+                    "kalkislar": kalkislar,
+                    "donus_kalkisi": donus_varisi - mesafe / dron.hiz,
+                    "donus_varisi": donus_varisi,
+                    "sarj_bitisi": zamani_saniyeye_cevir(sefer.sarj_bitis_zamani),
+                    "enerji": enerji
+                })
+                hazir = cizelge[-1]["sarj_bitisi"]
+            
+            cizelgeler.append(cizelge)
+        
+        self._ekleme_onbellegi = {"cizelgeler": cizelgeler}
+        self._yuva_duzenini_kur(
+            [self._dron_yuvalarini_olustur(sira, cizelge) for sira, cizelge in enumerate(cizelgeler)]
+        )
+    
+    def _yuva_duzenini_kur(self, dilimler: List[Dict[str, np.ndarray]]):
+        """
+        Drone başına yuva dilimlerini, her drone'a kapasiteli bir bölge ayrılmış tek dizi kümesine yerleştirir.
+        
+        Her bölgenin kapasitesi dilim uzunluğunun 1,5 katıdır; boş kalan yuvalar hiçbir
+        teslimat için uygun olmayan dolgu yuvalarıdır. Böylece filonun tüm yuvaları
+        üzerinde tek vektörel geçiş yapılabilir ve bir drone'un dilimi yalnızca kendi
+        bölgesine yazılarak O(drone'un yuva sayısı) sürede yenilenir. Bölge dolarsa
+        düzen kapasitesi artırılmış olarak yeniden kurulur.
+        
+        Args:
+            dilimler (List[Dict[str, np.ndarray]]): Drone sırasıyla yuva dilimleri
+        """
+        uzunluklar = np.array([len(dilim["dron_sirasi"]) for dilim in dilimler], dtype=np.int64)
+        kapasiteler = uzunluklar + np.maximum(uzunluklar // 2, 4)
+        baslangiclar = np.concatenate([[0], np.cumsum(kapasiteler)[:-1]]).astype(np.int64)
+        yuvalar = {}
+        if dilimler:
+            yuvalar = {
+                anahtar: np.concatenate([
+                    parca
+                    for sira, dilim in enumerate(dilimler)
+                    for parca in (dilim[anahtar], self._dolgu_yuvalari(sira, int(kapasiteler[sira] - uzunluklar[sira]))[anahtar])
+                ])
+                for anahtar in dilimler[0]
+            }
+        
+        self._ekleme_onbellegi.update({
+            "yuvalar": yuvalar,
+            "dilim_baslangiclari": baslangiclar,
+            "dilim_uzunluklari": uzunluklar,
+            "dilim_kapasiteleri": kapasiteler
+        })
+    
+    def _dolgu_yuvalari(self, sira: int, adet: int) -> Dict[str, np.ndarray]:
+        """
+        Bir drone'un bölgesindeki boş yerler için hiçbir teslimata uygun olmayan yuvalar oluşturur.
+        
+        Args:
+            sira (int): Drone'un yoğun indeksi
+            adet (int): Yuva sayısı
+            
+        Returns:
+            Dict[str, np.ndarray]: Yuva başına değerler (enerji payı -inf)
+        """
+        sifirlar = np.zeros(adet)
+        return {
+            "dron_sirasi": np.full(adet, sira, dtype=np.int64),
+            "onceki_poz": np.zeros((adet, 2)),
+            "onceki_hazir": sifirlar,
+            "sonraki_poz": np.zeros((adet, 2)),
+            "sonraki_pencere_baslangici": np.full(adet, -np.inf),
+            "sonraki_varis": sifirlar,
+            "sonraki_bolluk": sifirlar,
+            "sonraki_agirlik": sifirlar,
+            "eski_mesafe": sifirlar,
+            "eski_enerji": sifirlar,
+            "enerji_payi": np.full(adet, -np.inf),
+            "sefer_no": np.zeros(adet, dtype=np.int64),
+            "konum": np.zeros(adet, dtype=np.int64)
+        }
+    
+    def _yuva_dilimini_al(self, sira: int) -> Dict[str, np.ndarray]:
+        """
+        Bir drone'un dolgu hariç yuva dilimini (ortak dizilerin görünümleri) döndürür.
+        
+        Args:
+            sira (int): Drone'un yoğun indeksi
+            
+        Returns:
+            Dict[str, np.ndarray]: Drone'un yuva başına değerleri
+        """
+        onbellek = self._ekleme_onbellegi
+        bas = int(onbellek["dilim_baslangiclari"][sira])
+        bit = bas + int(onbellek["dilim_uzunluklari"][sira])
+        return {anahtar: dizi[bas:bit] for anahtar, dizi in onbellek["yuvalar"].items()}
+    
+    def _dron_yuvalarini_olustur(self, sira: int, cizelge: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Bir drone'un sefer çizelgesinden ekleme yuvası dizilerini oluşturur.
+        
+        Her seferde ardışık iki nokta (depo, duraklar, depoya dönüş) arasındaki her
+        boşluk bir yuvadır ve yuvanın sonraki noktası bir duraktır; ayrıca çizelgenin
+        sonuna yeni bir sefer açan bir yuva eklenir. Bir durağın bolluğu, o durağa
+        varış ne kadar gecikirse gecikilsin sonraki tüm zaman aralıklarının hâlâ
+        sağlandığı en büyük gecikmedir; gecikme sonraki kalkışlardan önceki
+        beklemelerle emilir:
+        bolluk[j] = min(pencere_bitisi[j] - varis[j], bekleme[j] + bolluk[j + 1]).
+        
+        Args:
+            sira (int): Drone'un yoğun indeksi
+            cizelge (List[Dict]): Drone'un sefer çizelgesi
+            
+        Returns:
+            Dict[str, np.ndarray]: Yuva başına değerler
+        """
+        dron = self.dron_kaydi.nesneler[sira]
+        depo = np.array(dron.baslangic_poz, dtype=np.float64)
+        
+        # Duraklar (teslimat sıraları, depoya dönüş için -1) ve durak başına kayıtlı zamanlar
+        duraklar = np.array([d for sefer in cizelge for d in sefer["duraklar"] + [-1]], dtype=np.int64)
+        oncekiler = np.array([d for sefer in cizelge for d in [-1] + sefer["duraklar"]], dtype=np.int64)
+        varislar = np.array(
+            [v for sefer in cizelge for v in sefer["varislar"] + [sefer["donus_varisi"]]], dtype=np.float64
+        )
+        hazirlar = np.array(
+            [v for sefer in cizelge for v in sefer["varislar"] + [sefer["sarj_bitisi"]]], dtype=np.float64
+        )
+        onceki_hazir = np.array(
+            [v for sefer in cizelge for v in [sefer["hazir"]] + sefer["varislar"]], dtype=np.float64
+        )
+        kalkislar = np.array(
+            [k for sefer in cizelge for k in sefer["kalkislar"] + [sefer["donus_kalkisi"]]], dtype=np.float64
+        )
+        sefer_uzunluklari = np.array([len(sefer["duraklar"]) + 1 for sefer in cizelge], dtype=np.int64)
+        teslimat_mi = duraklar >= 0
+        
+        pencere_bitisleri = np.full(len(duraklar), np.inf)
+        pencere_bitisleri[teslimat_mi] = self._pencere_bitisleri[duraklar[teslimat_mi]]
+        pencere_baslangiclari = np.full(len(duraklar), -np.inf)
+        pencere_baslangiclari[teslimat_mi] = self._pencere_baslangiclari[duraklar[teslimat_mi]]
+        agirliklar = np.zeros(len(duraklar))
+        agirliklar[teslimat_mi] = self._teslimat_agirliklari[duraklar[teslimat_mi]]
+        
+        # Bolluk, bekleme önek toplamları üzerinden ters kümülatif minimumla hesaplanır
+        bolluklar = np.empty(0)
+        if len(duraklar):
+            beklemeler = np.append(kalkislar[1:] - hazirlar[:-1], 0.0)
+            onek = np.concatenate([[0.0], np.cumsum(beklemeler)[:-1]])
+            bolluklar = np.minimum.accumulate((pencere_bitisleri - varislar + onek)[::-1])[::-1] - onek
+        
+        # Yuvaların önceki noktaları: sefer başında başlangıç pozisyonu, sonra duraklar
+        sonraki_poz = np.tile(depo, (len(duraklar), 1))
+        sonraki_poz[teslimat_mi] = self._teslimat_pozlari[duraklar[teslimat_mi]]
+        onceki_poz = np.tile(depo, (len(duraklar), 1))
+        onceki_teslimat_mi = oncekiler >= 0
+        onceki_poz[onceki_teslimat_mi] = self._teslimat_pozlari[oncekiler[onceki_teslimat_mi]]
+        if cizelge:
+            onceki_poz[0] = cizelge[0]["baslangic_poz"]
+        
+        eski_mesafe = np.sqrt(((sonraki_poz - onceki_poz) ** 2).sum(axis=1))
+        enerji_paylari = np.array([sefer["batarya"] - sefer["enerji"] for sefer in cizelge], dtype=np.float64)
+        
+        # Çizelgenin sonuna yeni sefer açan yuva
+        son_poz = depo if cizelge else np.array(dron.mevcut_poz, dtype=np.float64)
+        son_hazir = cizelge[-1]["sarj_bitisi"] if cizelge else zamani_saniyeye_cevir(self.baslangic_zamani)
+        son_pay = dron.batarya if cizelge else dron.mevcut_batarya
+        
+        return {
+            "dron_sirasi": np.full(len(duraklar) + 1, sira, dtype=np.int64),
+            "onceki_poz": np.vstack([onceki_poz, son_poz]),
+            "onceki_hazir": np.append(onceki_hazir, son_hazir),
+            "sonraki_poz": np.vstack([sonraki_poz, depo]),
+            "sonraki_pencere_baslangici": np.append(pencere_baslangiclari, -np.inf),
+            "sonraki_varis": np.append(varislar, 0.0),
+            "sonraki_bolluk": np.append(bolluklar, np.inf),
+            "sonraki_agirlik": np.append(agirliklar, 0.0),
+            "eski_mesafe": np.append(eski_mesafe, 0.0),
+            "eski_enerji": np.append(np.floor(eski_mesafe * (1 + agirliklar / 10) * 10), 0.0),
+            "enerji_payi": np.append(np.repeat(enerji_paylari, sefer_uzunluklari), son_pay),
+            "sefer_no": np.append(np.repeat(np.arange(len(cizelge)), sefer_uzunluklari), len(cizelge)),
+            "konum": np.append(
+                np.arange(len(duraklar)) - np.repeat(np.cumsum(sefer_uzunluklari) - sefer_uzunluklari, sefer_uzunluklari),
+                0
+            )
+        }
+    
+    def _dron_cizelgesini_hesapla(
+        self, 
+        sira: int, 
+        sefer_duraklari: List[List[int]], 
+        eski_cizelge: List[Dict],
+        ilk_sefer: int = 0
+    ) -> Optional[List[Dict]]:
+        """
+        Bir drone'un verilen sefer/durak sırasıyla zaman çizelgesini kesin olarak hesaplar.
+        
+        Önceki durağı değişmeyen bacaklar eski çizelgedeki kalkışlarından erken kalkmaz;
+        böylece değişmeyen bir çizelge aynen yeniden üretilir ve ekleme yalnızca gecikme
+        yaratabilir. Gecikmiş ya da yeni bacaklarda yol, kesen bölgeler kapanana kadar
+        beklenerek doğrulanır. Kapasite, her adımda depoya dönüş yedeğiyle batarya ve
+        zaman aralıkları _dron_teslimat_yapabilir_mi ile aynı kurallarla denetlenir.
+        ilk_sefer'den önceki seferler ve gecikmenin emildiği seferden sonrakiler eski
+        çizelgeden aynen alınır.
+        
+        Args:
+            sira (int): Drone'un yoğun indeksi
+            sefer_duraklari (List[List[int]]): Her sefer için teslimat sıraları
+            eski_cizelge (List[Dict]): Drone'un mevcut sefer çizelgesi
+            ilk_sefer (int): Değişen ilk seferin numarası
+            
+        Returns:
+            Optional[List[Dict]]: Yeni sefer çizelgesi, kısıtlardan biri ihlal edilirse None
+        """
+        dron = self.dron_kaydi.nesneler[sira]
+        depo = dron.baslangic_poz
+        cizelge = eski_cizelge[:ilk_sefer]
+        hazir = cizelge[-1]["sarj_bitisi"] if cizelge else zamani_saniyeye_cevir(self.baslangic_zamani)
+        
+        for s in range(ilk_sefer, len(sefer_duraklari)):
+            duraklar = sefer_duraklari[s]
+            eski = eski_cizelge[s] if s < len(eski_cizelge) else None
+            
+            # Değişmeyen bir sefere gecikmesiz gelindiyse kalan seferler de değişmez
+            if s > ilk_sefer and eski is not None and hazir <= eski["hazir"] + _ZAMAN_TOLERANSI:
+                cizelge.extend(eski_cizelge[s:])
+                return cizelge
+            
+            # Önceki durağı aynı kalan bacakların kaydedilmiş kalkışları: (önceki, sonraki) → kalkış
+            alt_sinirlar = {}
+            if eski is not None:
+                for onceki, sonraki, kalkis in zip(
+                    [-1] + eski["duraklar"], eski["duraklar"] + [-1], eski["kalkislar"] + [eski["donus_kalkisi"]]
+                ):
+                    alt_sinirlar[(onceki, sonraki)] = kalkis
+            
+            baslangic_poz = dron.mevcut_poz if s == 0 else depo
+            batarya = dron.mevcut_batarya if s == 0 else dron.batarya
+            sefer = {
+                "duraklar": duraklar, "baslangic_poz": baslangic_poz, "hazir": hazir,
+                "batarya": batarya, "varislar": [], "kalkislar": []
+            }
+            
+            poz = baslangic_poz
+            onceki = -1
+            for durak in duraklar + [-1]:
+                hedef = self.teslimat_kaydi.nesneler[durak] if durak >= 0 else None
+                hedef_poz = hedef.poz if hedef is not None else depo
+                agirlik = hedef.agirlik if hedef is not None else 0
+                mesafe = self._mesafe_hesapla(poz, hedef_poz)
+                seyahat_suresi = mesafe / dron.hiz
+                
+                alt_sinir = alt_sinirlar.get((onceki, durak))
+                if alt_sinir is not None and hazir <= alt_sinir + _ZAMAN_TOLERANSI:
+                    kalkis = alt_sinir
+                else:
+                    if alt_sinir is None:
+                        alt_sinir = (
+                            float(self._pencere_baslangiclari[durak]) - seyahat_suresi if hedef is not None else hazir
+                        )
+                    kalkis = self._engelsiz_kalkis_zamani_bul(poz, hedef_poz, max(hazir, alt_sinir), seyahat_suresi)
+                varis = kalkis + seyahat_suresi
+                enerji = dron.enerji_tuketimi_hesapla(mesafe, agirlik)
+                
+                if hedef is not None:
+                    donus_enerjisi = dron.enerji_tuketimi_hesapla(self._mesafe_hesapla(hedef_poz, depo), 0)
+                    if (not dron.tasiyabilir_mi(agirlik) or batarya < enerji + donus_enerjisi or
+                            varis > self._pencere_bitisleri[durak]):
+                        return None
+                    sefer["varislar"].append(varis)
+                    sefer["kalkislar"].append(kalkis)
+                else:
+                    sefer["donus_kalkisi"] = kalkis
+                    sefer["donus_varisi"] = varis
+                
+                batarya -= enerji
+                poz = hedef_poz
+                onceki = durak
+                hazir = varis
+            
+            sefer["enerji"] = sefer["batarya"] - batarya
+            sefer["sarj_bitisi"] = sefer["donus_varisi"] + dron.sarj_suresi_hesapla(batarya)
+            hazir = sefer["sarj_bitisi"]
+            cizelge.append(sefer)
+        
+        return cizelge
+    
+    def _dron_cizelgesini_uygula(self, sira: int, cizelge: List[Dict]):
+        """
+        Yeniden hesaplanan çizelgeyi drone'un planına, durumuna ve ekleme önbelleğine yazar.
+        
+        Eski çizelgeden aynen alınan seferlere dokunulmaz.
+        
+        Args:
+            sira (int): Drone'un yoğun indeksi
+            cizelge (List[Dict]): Drone'un yeni sefer çizelgesi
+        """
+        dron = self.dron_kaydi.nesneler[sira]
+        idler = self.teslimat_kaydi.idler
+        onbellek = self._ekleme_onbellegi
+        eski_cizelge = onbellek["cizelgeler"][sira]
+        seferler = self.seferler[dron.id]
+        varis_zamanlari = self.tahmini_varis_zamanlari[dron.id]
+        
+        for s, sefer in enumerate(cizelge):
+            if s < len(eski_cizelge) and sefer is eski_cizelge[s]:
+                continue
+            teslimatlar = [idler[durak] for durak in sefer["duraklar"]]
+            yeni_sefer = Sefer(
+                dron.id,
+                saniyeyi_zamana_cevir(sefer["kalkislar"][0]),
+                teslimatlar,
+                saniyeyi_zamana_cevir(sefer["donus_varisi"]),
+                saniyeyi_zamana_cevir(sefer["sarj_bitisi"])
+            )
+            if s < len(seferler):
+                seferler[s] = yeni_sefer
+            else:
+                seferler.append(yeni_sefer)
+            for teslimat_id, varis in zip(teslimatlar, sefer["varislar"]):
+                varis_zamanlari[teslimat_id] = saniyeyi_zamana_cevir(varis)
+            self.durum.teslim_edildi[sefer["duraklar"]] = True
+        
+        self.atamalar[dron.id] = [teslimat_id for sefer in seferler for teslimat_id in sefer.teslimatlar]
+        self.tuketilen_enerjiler[dron.id] = sum(sefer["enerji"] for sefer in cizelge)
+        
+        # Plan sonunda drone depoda ve tam şarjlı bekler
+        self.durum.pozlar[sira] = dron.baslangic_poz
+        self.durum.bataryalar[sira] = dron.batarya
+        self.durum.zamanlar[sira] = cizelge[-1]["sarj_bitisi"]
+        self.dron_izgarasi.guncelle(dron.id, dron.baslangic_poz)
+        
+        # Drone'un yuva dilimini kendi bölgesinde yenisiyle değiştir; bölge yetmezse düzeni yeniden kur
+        onbellek["cizelgeler"][sira] = cizelge
+        dilim = self._dron_yuvalarini_olustur(sira, cizelge)
+        uzunluk = len(dilim["dron_sirasi"])
+        if uzunluk > onbellek["dilim_kapasiteleri"][sira]:
+            dilimler = [
+                dilim if diger == sira else {anahtar: dizi.copy() for anahtar, dizi in self._yuva_dilimini_al(diger).items()}
+                for diger in range(len(self.dronlar))
+            ]
+            self._yuva_duzenini_kur(dilimler)
+            return
+        
+        bas = int(onbellek["dilim_baslangiclari"][sira])
+        eski_uzunluk = int(onbellek["dilim_uzunluklari"][sira])
+        dolgu = self._dolgu_yuvalari(sira, max(eski_uzunluk - uzunluk, 0))
+        for anahtar, dizi in onbellek["yuvalar"].items():
+            dizi[bas:bas + uzunluk] = dilim[anahtar]
+            dizi[bas + uzunluk:bas + eski_uzunluk] = dolgu[anahtar]
+        onbellek["dilim_uzunluklari"][sira] = uzunluk
+    
+    def farki_uygula(self, fark: "SenaryoFarki") -> Dict[str, int]:
+        """
+        Bir senaryo farkını çözücünün senaryosuna uygular.
+        
+        Türetilmiş önbellekler (sabit teslimat dizileri, bölge zaman aralıkları, statik
+        uygunluk matrisi ve alan bit kümeleri) baştan kurulmaz; yalnızca etkilenen
+        varlıklar yeniden hesaplanır:
+        - Eklenen ya da güncellenen teslimatların sütunları (tüm drone'lar için)
+        - Eklenen ya da güncellenen drone'ların satırları (kalan teslimatlar için)
+        - Bölge değişiklikleri yalnızca yasak bölge kuralını etkilediğinden, eski ya da
+          yeni poligonun içinde kalan teslimatların sütunları
+        Diğer hücreler eski matristen kopyalanır. Alan daraltma istatistikleri, değişen
+        hücrelerin eski katkısı çıkarılıp yenisi eklenerek güncellenir. Plan sıfırlanır;
+        yeni plan için coz yeniden çağrılmalıdır.
+        
+        Args:
+            fark (SenaryoFarki): Uygulanacak fark
+            
+        Returns:
+            Dict[str, int]: Yeniden hesaplanan drone satırı ve teslimat sütunu sayıları ile
+                            toplam drone ve teslimat sayıları
+        """
+        eski_dronlar, eski_teslimatlar, eski_bolgeler = self.dronlar, self.teslimat_noktalari, self.ucus_yasak_bolgeleri
+        yeni_dronlar, yeni_teslimatlar, yeni_bolgeler = fark.uygula(eski_dronlar, eski_teslimatlar, eski_bolgeler)
+        
+        # Değişen bölgelerin eski ya da yeni poligonundaki teslimatların yasak bölge kuralı değişebilir
+        degisen_bolge_idleri = fark.degisen_idler("UCUS_YASAK_BOLGELERI")
+        bolgede = np.zeros(len(eski_teslimatlar), dtype=bool)
+        for bolge in eski_bolgeler + yeni_bolgeler:
+            if bolge.id in degisen_bolge_idleri:
+                bolgede |= bolge.noktalar_iceriyor_mu(self._teslimat_pozlari)
+        
+        # Eski senaryoda aynen kalan (hücreleri kopyalanabilen) drone ve teslimatlar
+        degisen_teslimat_idleri = np.fromiter(fark.degisen_idler("TESLIMAT_NOKTALARI"), dtype=np.int64)
+        degisen_dron_idleri = np.fromiter(fark.degisen_idler("DRONLAR"), dtype=np.int64)
+        kalan_teslimat = ~bolgede & ~np.isin(self.teslimat_kaydi.id_dizisi, degisen_teslimat_idleri)
+        kalan_dron = ~np.isin(self.dron_kaydi.id_dizisi, degisen_dron_idleri)
+        
+        # Değişen hücrelerin eski katkısı istatistiklerden çıkarılır
+        istatistikler = self.alan_daraltma_istatistikleri
+        for dronlar, teslimatlar in [
+            (eski_dronlar, [nokta for nokta, kalan in zip(eski_teslimatlar, kalan_teslimat) if not kalan]),
+            ([dron for dron, kalan in zip(eski_dronlar, kalan_dron) if not kalan],
+             [nokta for nokta, kalan in zip(eski_teslimatlar, kalan_teslimat) if kalan])
+        ]:
+            _, eski_katki = statik_uygunluk_matrisi_hesapla(dronlar, teslimatlar, eski_bolgeler, self.baslangic_zamani)
+            for kural, sayi in eski_katki.items():
+                istatistikler[kural] -= sayi
+        
+        # Yeni senaryoda her varlığın eski indeksi (-1: yeniden hesaplanacak)
+        eski_teslimat_indeksleri = _kalan_indeksleri_eslestir(self.teslimat_kaydi, kalan_teslimat, yeni_teslimatlar)
+        eski_dron_indeksleri = _kalan_indeksleri_eslestir(self.dron_kaydi, kalan_dron, yeni_dronlar)
+        kalan_sutunlar = np.flatnonzero(eski_teslimat_indeksleri >= 0)
+        yeni_sutunlar = np.flatnonzero(eski_teslimat_indeksleri < 0)
+        kalan_satirlar = np.flatnonzero(eski_dron_indeksleri >= 0)
+        yeni_satirlar = np.flatnonzero(eski_dron_indeksleri < 0)
+        
+        # Statik matris: kalan hücreler kopyalanır, yeni sütunlar ve satırlar hesaplanır
+        matris = np.empty((len(yeni_dronlar), len(yeni_teslimatlar)), dtype=bool)
+        matris[np.ix_(kalan_satirlar, kalan_sutunlar)] = self._statik_matris[
+            np.ix_(eski_dron_indeksleri[kalan_satirlar], eski_teslimat_indeksleri[kalan_sutunlar])
+        ]
+        for satirlar, sutunlar in [(np.arange(len(yeni_dronlar)), yeni_sutunlar), (yeni_satirlar, kalan_sutunlar)]:
+            blok, yeni_katki = statik_uygunluk_matrisi_hesapla(
+                [yeni_dronlar[i] for i in satirlar], [yeni_teslimatlar[j] for j in sutunlar],
+                yeni_bolgeler, self.baslangic_zamani
+            )
+            matris[np.ix_(satirlar, sutunlar)] = blok
+            for kural, sayi in yeni_katki.items():
+                istatistikler[kural] += sayi
+        istatistikler["toplam_cift"] = len(yeni_dronlar) * len(yeni_teslimatlar)
+        
+        # Bit kümeleri drone sırasına bağlı; drone'lar değişmediyse yalnızca yeni sütunlar paketlenir
+        if len(yeni_satirlar) == 0 and len(yeni_dronlar) == len(eski_dronlar):
+            eski_alanlar = self.statik_alanlar
+            self.statik_alanlar = {nokta.id: eski_alanlar.get(nokta.id) for nokta in yeni_teslimatlar}
+            self.statik_alanlar.update(
+                _alanlari_paketle(matris[:, yeni_sutunlar], [yeni_teslimatlar[j] for j in yeni_sutunlar])
+            )
+        else:
+            self.statik_alanlar = _alanlari_paketle(matris, yeni_teslimatlar)
+        
+        # Kayıtlar ve diziler yeni senaryoya göre kurulur (kalan teslimatların dizileri kopyalanır)
+        self.dronlar = yeni_dronlar
+        self.ucus_yasak_bolgeleri = yeni_bolgeler
+        self.dron_kaydi = KimlikKaydi(yeni_dronlar)
+        self.teslimat_kaydi = KimlikKaydi(yeni_teslimatlar)
+        self.teslimat_noktalari = self.teslimat_kaydi.nesneler
+        self._teslimat_dizilerini_ayarla(eski_teslimat_indeksleri)
+        self._bolge_araliklari = [
+            (zamani_saniyeye_cevir(bolge.aktif_zaman[0]), zamani_saniyeye_cevir(bolge.aktif_zaman[1]))
+            for bolge in yeni_bolgeler
+        ]
+        self.dron_bitleri = {dron.id: 1 << sira for sira, dron in enumerate(yeni_dronlar)}
+        self._statik_matris = matris
+        self._dron_dizilerini_ayarla()
+        self._durumu_sifirla()
+        
+        return {
+            "yeniden_hesaplanan_dron": len(yeni_satirlar),
+            "yeniden_hesaplanan_teslimat": len(yeni_sutunlar),
+            "dron_sayisi": len(yeni_dronlar),
+            "teslimat_sayisi": len(yeni_teslimatlar)
+        }
+    
+    def arama_istatistiklerini_al(self) -> Dict[str, float]:
+        """
+        Son geri izlemeli aramanın istatistiklerini döndürür.
+        
+        Returns:
+            Dict[str, float]: Ziyaret edilen düğüm, budama, geri sıçrama ve ileri kontrol
+                              sayıları ile budama oranı ve süre
+        """
+        return dict(self.arama_istatistikleri)
+    
+    def atanmamis_teslimatlari_al(self) -> List[int]:
+        """
+        Atanmamış teslimatların ID'lerini döndürür.
+        
+        Returns:
+            List[int]: Atanmamış teslimat ID'lerinin listesi
+        """
+        atanmis_teslimatlar = set()
+        for dron_id, teslimatlar in self.atamalar.items():
+            atanmis_teslimatlar.update(teslimatlar)
+        
+        tum_teslimatlar = {teslimat.id for teslimat in self.teslimat_noktalari}
+        return list(tum_teslimatlar - atanmis_teslimatlar)
+    
+    def dron_rotalarini_al(self) -> Dict[int, List[Tuple[float, float]]]:
+        """
+        Her drone için depo dönüşleri dahil rota koordinatlarını döndürür.
+        
+        Returns:
+            Dict[int, List[Tuple[float, float]]]: Her drone için koordinat listesi
+        """
+        rotalar = {}
+        
+        for dron in self.dronlar:
+            dron_id = dron.id
+            rota = [dron.baslangic_poz]
+            
+            for sefer in self.seferler.get(dron_id, []):
+                rota.extend(self.teslimat_kaydi[teslimat_id].poz for teslimat_id in sefer.teslimatlar)
+                if sefer.tamamlandi_mi:
+                    rota.append(dron.baslangic_poz)
+            
+            rotalar[dron_id] = rota
+        
+        return rotalar
+    
+    def dron_seferlerini_al(self) -> Dict[int, List[Sefer]]:
+        """
+        Her drone'un sefer listesini döndürür.
+        
+        Returns:
+            Dict[int, List[Sefer]]: Her drone için kalkış/dönüş/şarj zamanlarıyla seferler
+        """
+        return {dron_id: list(seferler) for dron_id, seferler in self.seferler.items()}
     
     def teslimat_istatistiklerini_al(self) -> Dict[str, float]:
         """
@@ -317,14 +2435,13 @@ class KisitCozucu:
         atanmis_teslimatlar = sum(len(teslimatlar) for teslimatlar in self.atamalar.values())
         tamamlanma_orani = atanmis_teslimatlar / toplam_teslimatlar if toplam_teslimatlar > 0 else 0
         
-        # Toplam enerji tüketimini hesapla
-        toplam_enerji = 0
-        for dron_id, dron in self.dron_durumlari.items():
-            toplam_enerji += (self.dronlar[dron_id].batarya - dron.mevcut_batarya)
+        # Toplam enerji tüketimini hesapla (şarjlar arası tüm seferler dahil)
+        toplam_enerji = sum(self.tuketilen_enerjiler.values())
         
         ortalama_enerji = toplam_enerji / len(self.dronlar) if self.dronlar else 0
         
         return {
             "tamamlanma_orani": tamamlanma_orani * 100,  # Yüzde olarak
-            "ortalama_enerji_tuketimi": ortalama_enerji
+            "ortalama_enerji_tuketimi": ortalama_enerji,
+            "toplam_sefer_sayisi": sum(len(seferler) for seferler in self.seferler.values())
         }
@@ -3,13 +3,874 @@ Drone Filo Optimizasyonu: Veri Üreteci Modülü
 Bu modül, test senaryoları için örnek veri üretir.
 """
 
+import bz2
+import gzip
+import hashlib
+import itertools
+import json
+import lzma
+import mmap
+import os
 import random
 import math
-from typing import List, Tuple
+import struct
+import time as zaman_modulu
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import List, Tuple, Dict, Optional, Iterable, Iterator, Union, Set
+from dataclasses import dataclass, field
 from datetime import time
 
+import numpy as np
+
 from models import Drone, TeslimatNoktasi, UcusYasakBolgesi
 
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
+
+# Metin senaryo dosyasındaki bölümler, dosyadaki sırasıyla
+SENARYO_BOLUMLERI = ("DRONLAR", "TESLIMAT_NOKTALARI", "UCUS_YASAK_BOLGELERI")
+
+# Eski sürümler metin senaryolarını platformun varsayılan kodlamasıyla (ör. cp1254) yazdı;
+# ASCII dışı karakterler yalnızca yorumlarda geçtiğinden okunamayan baytlar değiştirilir
+METIN_KODLAMA_HATALARI = "replace"
+
+# Kolonlu senaryo dosyası: sihirli bayt + başlık uzunluğu + JSON başlık + hizalı ham diziler
+KOLONLU_UZANTI = ".dfk"
+KOLONLU_SIHIRLI_BAYT = b"DFKOLON1"
+KOLONLU_HIZALAMA = 64
+
+# Dosya uzantısından seçilen saydam sıkıştırma modülleri (standart kütüphane)
+SIKISTIRMA_MODULLERI = {".gz": gzip, ".bz2": bz2, ".xz": lzma}
+if zstd is not None:
+    SIKISTIRMA_MODULLERI[".zst"] = zstd
+
+# Yazarken kullanılan varsayılan seviyeler ve modül başına seviye parametresinin adı; büyük
+# senaryolarda yazma süresi öne alınır (xz'nin varsayılan 6 seviyesi 1'den ~15 kat yavaştır)
+SIKISTIRMA_SEVIYELERI = {".gz": ("compresslevel", 6), ".bz2": ("compresslevel", 9), ".xz": ("preset", 1),
+                         ".zst": ("level", 3)}
+
+
+def sikistirma_uzantisi(dosya_adi: str) -> Optional[str]:
+    """Dosya adının sıkıştırma uzantısını (SIKISTIRMA_MODULLERI) döndürür; sıkıştırılmamışsa None."""
+    for uzanti in SIKISTIRMA_MODULLERI:
+        if dosya_adi.endswith(uzanti):
+            return uzanti
+    return None
+
+
+def dosya_ac(
+    dosya_adi: str, 
+    kip: str = 'r', 
+    encoding: Optional[str] = 'utf-8', 
+    seviye: Optional[int] = None,
+    errors: Optional[str] = None
+):
+    """
+    Dosyayı uzantısına göre saydam olarak sıkıştırarak ya da açarak açar.
+    
+    .gz, .bz2, .xz (ve Python 3.14+ ile .zst) uzantılı dosyalar ilgili standart kütüphane
+    modülüyle akış halinde (sıkıştırılmış ya da açılmış içerik belleğe toplanmadan)
+    okunur ve yazılır; diğer dosyalar open ile açılır. Ekleme kipinde sıkıştırılmış
+    dosyalara yeni bir akış eklenir; okuyucular akışları art arda okur.
+    
+    Args:
+        dosya_adi (str): Dosya adı
+        kip (str): open kipleri ('r', 'w', 'a', 'rb', 'wb', 'ab')
+        encoding (Optional[str]): Metin kiplerinde karakter kodlaması
+        seviye (Optional[int]): Yazarken sıkıştırma seviyesi (None ise SIKISTIRMA_SEVIYELERI)
+        errors (Optional[str]): Metin kiplerinde kodlama hatalarının işlenişi (open'daki gibi)
+        
+    Returns:
+        Dosya nesnesi
+    """
+    if 'b' in kip:
+        encoding = errors = None
+    uzanti = sikistirma_uzantisi(dosya_adi)
+    if uzanti is None:
+        return open(dosya_adi, kip, encoding=encoding, errors=errors)
+    
+    secenekler = {}
+    if 'r' not in kip:
+        parametre, varsayilan = SIKISTIRMA_SEVIYELERI[uzanti]
+        secenekler[parametre] = varsayilan if seviye is None else seviye
+    if 'b' not in kip and 't' not in kip:
+        kip += 't'
+    return SIKISTIRMA_MODULLERI[uzanti].open(dosya_adi, kip, encoding=encoding, errors=errors, **secenekler)
+
+
+def _zamani_mikrosaniyeye_cevir(t: time) -> int:
+    """Gün başından itibaren geçen süreyi mikrosaniye olarak döndürür."""
+    return ((t.hour * 60 + t.minute) * 60 + t.second) * 1_000_000 + t.microsecond
+
+
+def _mikrosaniyeyi_zamana_cevir(mikrosaniye: int) -> time:
+    """Gün başından itibaren geçen mikrosaniyeyi zamana çevirir."""
+    saniye, mikro = divmod(int(mikrosaniye), 1_000_000)
+    return time(saniye // 3600, (saniye % 3600) // 60, saniye % 60, mikro)
+
+
+def _araliklar_kesisiyor_mu(aralik1: Tuple[time, time], aralik2: Tuple[time, time]) -> bool:
+    """İki zaman aralığının (uçlar dahil) kesişip kesişmediğini kontrol eder."""
+    return aralik1[0] <= aralik2[1] and aralik2[0] <= aralik1[1]
+
+
+def _yinelenen_degerler(dizi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Dizide birden fazla geçen değerleri ve tekrar sayılarını döndürür."""
+    dizi = np.asarray(dizi)
+    # Negatif olmayan yoğun ID'ler sıralama yerine doğrudan sayılır
+    if len(dizi) and dizi.min() >= 0 and dizi.max() < 4 * len(dizi) + 1024:
+        sayilar = np.bincount(dizi)
+        degerler = np.flatnonzero(sayilar > 1)
+        return degerler.astype(dizi.dtype), sayilar[degerler]
+    degerler, sayilar = np.unique(dizi, return_counts=True)
+    return degerler[sayilar > 1], sayilar[sayilar > 1]
+
+
+def _tekrarlanan_koseleri_at(kose_ofsetleri: np.ndarray, koordinatlar: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her poligonda (kapanış köşesi dahil) ardışık tekrarlanan köşeleri atar.
+    
+    Harita sınırına kırpılan bölgelerde köşeler üst üste düşebilir; atılan her köşe
+    sıfır uzunluklu bir kenarı ortadan kaldırır.
+    
+    Args:
+        kose_ofsetleri (np.ndarray): Poligon başına koordinat başlangıç ofsetleri (P + 1)
+        koordinatlar (np.ndarray): Tüm poligonların (K, 2) boyutlu köşe koordinatları
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Temizlenmiş köşe ofsetleri ve koordinatlar
+    """
+    kose_sayilari = np.diff(kose_ofsetleri)
+    # Her köşenin poligon içinde (döngüsel) bir sonraki köşesi
+    sonraki = np.arange(1, len(koordinatlar) + 1)
+    dolu = kose_sayilari > 0
+    sonraki[kose_ofsetleri[1:][dolu] - 1] = kose_ofsetleri[:-1][dolu]
+    tut = (koordinatlar != koordinatlar[sonraki % max(len(koordinatlar), 1)]).any(axis=1)
+    
+    poligon_indeksleri = np.repeat(np.arange(len(kose_sayilari)), kose_sayilari)
+    yeni_sayilar = np.bincount(poligon_indeksleri[tut], minlength=len(kose_sayilari))
+    yeni_ofsetler = np.concatenate(([0], np.cumsum(yeni_sayilar)))
+    return yeni_ofsetler, koordinatlar[tut]
+
+
+def _kendini_kesen_poligonlar(kose_ofsetleri: np.ndarray, koordinatlar: np.ndarray) -> np.ndarray:
+    """
+    Her poligonda komşu olmayan iki kenarın kesişip kesişmediğini vektörel olarak bulur.
+    
+    Ardışık tekrarlanan köşeler önce atılır. Aynı köşe sayısındaki poligonlar birlikte
+    işlenir; kenar çiftleri üzerinde yönelim testleri tek seferde hesaplanır. Yalnızca
+    kenarların birbirini gerçekten kesmesi sayılır; uç noktada değme ya da doğrusal
+    çakışma kesişme sayılmaz.
+    
+    Args:
+        kose_ofsetleri (np.ndarray): Poligon başına koordinat başlangıç ofsetleri (P + 1)
+        koordinatlar (np.ndarray): Tüm poligonların (K, 2) boyutlu köşe koordinatları
+        
+    Returns:
+        np.ndarray: Kendini kesen poligonlar için True olan (P,) boyutlu dizi
+    """
+    kose_ofsetleri, koordinatlar = _tekrarlanan_koseleri_at(
+        np.asarray(kose_ofsetleri), np.asarray(koordinatlar, dtype=float).reshape(-1, 2)
+    )
+    kose_sayilari = np.diff(kose_ofsetleri)
+    kesen = np.zeros(len(kose_sayilari), dtype=bool)
+    
+    def yonelim(a, b, c):
+        return np.sign(
+            (b[..., 0] - a[..., 0]) * (c[..., 1] - a[..., 1]) - (b[..., 1] - a[..., 1]) * (c[..., 0] - a[..., 0])
+        )
+    
+    # Üçgenlerin komşu olmayan kenar çifti yoktur
+    for k in np.unique(kose_sayilari[kose_sayilari >= 4]):
+        poligonlar = np.flatnonzero(kose_sayilari == k)
+        i, j = np.triu_indices(k, 2)
+        komsu_degil = ~((i == 0) & (j == k - 1))
+        i, j = i[komsu_degil], j[komsu_degil]
+        
+        taban = kose_ofsetleri[poligonlar][:, None]
+        p1, p2 = koordinatlar[taban + i], koordinatlar[taban + (i + 1) % k]
+        q1, q2 = koordinatlar[taban + j], koordinatlar[taban + (j + 1) % k]
+        o1, o2 = yonelim(p1, p2, q1), yonelim(p1, p2, q2)
+        o3, o4 = yonelim(q1, q2, p1), yonelim(q1, q2, p2)
+        
+        kesen[poligonlar] = ((o1 * o2 < 0) & (o3 * o4 < 0)).any(axis=1)
+    
+    return kesen
+
+
+def _dron_satiri(dron: Drone) -> str:
+    return f"{dron.id},{dron.maksimum_agirlik},{dron.batarya},{dron.hiz},{dron.baslangic_poz[0]},{dron.baslangic_poz[1]}"
+
+
+def _teslimat_satiri(nokta: TeslimatNoktasi) -> str:
+    return (f"{nokta.id},{nokta.poz[0]},{nokta.poz[1]},{nokta.agirlik},{nokta.oncelik},"
+            f"{nokta.zaman_araligi[0]},{nokta.zaman_araligi[1]}")
+
+
+def _bolge_satiri(bolge: UcusYasakBolgesi) -> str:
+    koordinat_str = ";".join([f"{x},{y}" for x, y in bolge.koordinatlar])
+    return f"{bolge.id},{bolge.aktif_zaman[0]},{bolge.aktif_zaman[1]},{len(bolge.koordinatlar)},{koordinat_str}"
+
+
+def _dron_satirini_coz(parcalar: List[str]) -> Drone:
+    return Drone(
+        id=int(parcalar[0]),
+        maksimum_agirlik=float(parcalar[1]),
+        batarya=int(parcalar[2]),
+        hiz=float(parcalar[3]),
+        baslangic_poz=(float(parcalar[4]), float(parcalar[5]))
+    )
+
+
+def _teslimat_satirini_coz(parcalar: List[str]) -> TeslimatNoktasi:
+    return TeslimatNoktasi(
+        id=int(parcalar[0]),
+        poz=(float(parcalar[1]), float(parcalar[2])),
+        agirlik=float(parcalar[3]),
+        oncelik=int(parcalar[4]),
+        zaman_araligi=(time.fromisoformat(parcalar[5]), time.fromisoformat(parcalar[6]))
+    )
+
+
+def _bolge_satirini_coz(parcalar: List[str]) -> UcusYasakBolgesi:
+    # Koordinatlar "x,y;x,y;..." biçiminde virgüllerle bölünmüş durumda
+    kose_sayisi = int(parcalar[3])
+    koordinat_parcalari = ','.join(parcalar[4:]).split(';')
+    koordinatlar = []
+    for i in range(kose_sayisi):
+        x, y = koordinat_parcalari[i].split(',')
+        koordinatlar.append((float(x), float(y)))
+    
+    return UcusYasakBolgesi(
+        id=int(parcalar[0]),
+        koordinatlar=koordinatlar,
+        aktif_zaman=(time.fromisoformat(parcalar[1]), time.fromisoformat(parcalar[2]))
+    )
+
+
+# Bölüm başına satır biçimi, yazıcısı ve çözücüsü
+SATIR_BASLIKLARI = {
+    "DRONLAR": "id,maksimum_agirlik,batarya,hiz,baslangic_poz_x,baslangic_poz_y",
+    "TESLIMAT_NOKTALARI": "id,poz_x,poz_y,agirlik,oncelik,zaman_araligi_baslangic,zaman_araligi_bitis",
+    "UCUS_YASAK_BOLGELERI": "id,aktif_zaman_baslangic,aktif_zaman_bitis,kose_sayisi,koordinatlar"
+}
+SATIR_YAZICILARI = {
+    "DRONLAR": _dron_satiri,
+    "TESLIMAT_NOKTALARI": _teslimat_satiri,
+    "UCUS_YASAK_BOLGELERI": _bolge_satiri
+}
+SATIR_COZUCULERI = {
+    "DRONLAR": _dron_satirini_coz,
+    "TESLIMAT_NOKTALARI": _teslimat_satirini_coz,
+    "UCUS_YASAK_BOLGELERI": _bolge_satirini_coz
+}
+
+
+def _bolum_bayt_araliklari(veri: Union[bytes, mmap.mmap]) -> Dict[str, Tuple[int, int]]:
+    """
+    Senaryo dosyasındaki her bölümün, başlık satırından sonraki bayt aralığını bulur.
+    
+    Args:
+        veri (Union[bytes, mmap.mmap]): Dosya içeriği
+        
+    Returns:
+        Dict[str, Tuple[int, int]]: Bölüm adından [başlangıç, bitiş) bayt aralığına eşleme
+    """
+    basliklar = []
+    konum = 0
+    while True:
+        konum = veri.find(b"## ", konum)
+        if konum < 0:
+            break
+        # Yalnızca satır başındaki "## " bölüm başlığıdır
+        if konum == 0 or veri[konum - 1:konum] == b"\n":
+            satir_sonu = veri.find(b"\n", konum)
+            satir_sonu = len(veri) if satir_sonu < 0 else satir_sonu + 1
+            basliklar.append((veri[konum + 3:satir_sonu].decode("utf-8", METIN_KODLAMA_HATALARI).strip(), konum, satir_sonu))
+            konum = satir_sonu
+        else:
+            konum += 3
+    
+    return {
+        ad: (icerik_baslangici, basliklar[i + 1][1] if i + 1 < len(basliklar) else len(veri))
+        for i, (ad, _, icerik_baslangici) in enumerate(basliklar)
+    }
+
+
+def _teslimat_parcasini_coz(dosya_adi: str, baslangic: int, bitis: int) -> Dict[str, np.ndarray]:
+    """
+    Senaryo dosyasının teslimat bölümünden bir bayt aralığını kolon dizilerine ayrıştırır.
+    
+    Aralık satır sınırlarında başlayıp bitmelidir. Zamanlardaki ':' ayraçları virgüle
+    çevrilir; böylece her satır 11 sayısal alandan oluşur ve tüm aralık NumPy ile tek
+    seferde okunur. Paralel yüklemede işçi süreçlerde çalıştırılır.
+    
+    Args:
+        dosya_adi (str): Dosya adı
+        baslangic (int): Aralığın ilk baytı
+        bitis (int): Aralığın son baytından bir sonrası
+        
+    Returns:
+        Dict[str, np.ndarray]: teslimat_* kolonları (bkz. KolonluSenaryo.KOLONLAR)
+    """
+    with open(dosya_adi, 'rb') as f:
+        f.seek(baslangic)
+        veri = f.read(bitis - baslangic)
+    
+    try:
+        alanlar = np.loadtxt(
+            veri.replace(b":", b",").decode("utf-8", METIN_KODLAMA_HATALARI).splitlines(),
+            delimiter=",", comments="#", ndmin=2, dtype=np.float64
+        )
+    except ValueError as hata:
+        raise ValueError(f"{dosya_adi}: {baslangic}-{bitis} bayt aralığında geçersiz teslimat satırı: {hata}")
+    if alanlar.size == 0:
+        alanlar = np.empty((0, 11), dtype=np.float64)
+    elif alanlar.shape[1] != 11:
+        raise ValueError(
+            f"{dosya_adi}: {baslangic}-{bitis} bayt aralığında teslimat satırları 7 alan içermeli "
+            f"(':' ile ayrılan saatler açıldıktan sonra 11 sayısal kolon; bulunan kolon sayısı: {alanlar.shape[1]})"
+        )
+    
+    # Saat, dakika ve (kesirli) saniye alanlarından mikrosaniye
+    zaman_araligi = np.rint(
+        (alanlar[:, [5, 8]] * 3600 + alanlar[:, [6, 9]] * 60 + alanlar[:, [7, 10]]) * 1_000_000
+    ).astype(np.int64)
+    
+    return {
+        "teslimat_id": alanlar[:, 0].astype(np.int64),
+        "teslimat_poz": np.ascontiguousarray(alanlar[:, 1:3]),
+        "teslimat_agirlik": np.ascontiguousarray(alanlar[:, 3]),
+        "teslimat_oncelik": alanlar[:, 4].astype(np.int64),
+        "teslimat_zaman_araligi": zaman_araligi
+    }
+
+
+@dataclass
+class SenaryoFarki:
+    """
+    Bir senaryoya ID ile uygulanan ekleme, güncelleme ve silme işlemleri.
+    
+    Her sözlük bölüm adına (SENARYO_BOLUMLERI) göre tutulur.
+    
+    Attributes:
+        eklenenler (Dict[str, list]): Eklenecek yeni nesneler
+        guncellenenler (Dict[str, list]): Aynı ID'li nesnenin yerine geçecek nesneler
+        silinenler (Dict[str, List[int]]): Silinecek nesnelerin ID'leri
+    """
+    eklenenler: Dict[str, list] = field(default_factory=lambda: {bolum: [] for bolum in SENARYO_BOLUMLERI})
+    guncellenenler: Dict[str, list] = field(default_factory=lambda: {bolum: [] for bolum in SENARYO_BOLUMLERI})
+    silinenler: Dict[str, List[int]] = field(default_factory=lambda: {bolum: [] for bolum in SENARYO_BOLUMLERI})
+    
+    def bos_mu(self) -> bool:
+        """Farkın hiçbir işlem içermediğini kontrol eder."""
+        return not any(
+            islemler[bolum] for islemler in (self.eklenenler, self.guncellenenler, self.silinenler)
+            for bolum in SENARYO_BOLUMLERI
+        )
+    
+    def degisen_idler(self, bolum: str) -> Set[int]:
+        """Bir bölümde eklenen, güncellenen ya da silinen tüm ID'leri döndürür."""
+        return (
+            {nesne.id for nesne in self.eklenenler[bolum]} |
+            {nesne.id for nesne in self.guncellenenler[bolum]} |
+            set(self.silinenler[bolum])
+        )
+    
+    @classmethod
+    def hesapla(
+        cls, 
+        eski_senaryo: Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]], 
+        yeni_senaryo: Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]
+    ) -> "SenaryoFarki":
+        """
+        İki senaryo arasındaki farkı ID'lere göre hesaplar.
+        
+        Args:
+            eski_senaryo (Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]): Eski senaryo
+            yeni_senaryo (Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]): Yeni senaryo
+            
+        Returns:
+            SenaryoFarki: Eski senaryoya uygulandığında yeni senaryoyu veren fark
+        """
+        fark = cls()
+        for bolum, eski_nesneler, yeni_nesneler in zip(SENARYO_BOLUMLERI, eski_senaryo, yeni_senaryo):
+            eski = {nesne.id: nesne for nesne in eski_nesneler}
+            yeni = {nesne.id: nesne for nesne in yeni_nesneler}
+            fark.eklenenler[bolum] = [nesne for nesne_id, nesne in yeni.items() if nesne_id not in eski]
+            fark.guncellenenler[bolum] = [
+                nesne for nesne_id, nesne in yeni.items() if nesne_id in eski and eski[nesne_id] != nesne
+            ]
+            fark.silinenler[bolum] = [nesne_id for nesne_id in eski if nesne_id not in yeni]
+        return fark
+    
+    def uygula(
+        self, 
+        dronlar: List[Drone], 
+        teslimat_noktalari: List[TeslimatNoktasi], 
+        ucus_yasak_bolgeleri: List[UcusYasakBolgesi]
+    ) -> Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]:
+        """
+        Farkı bir senaryoya uygular; verilen listeler değiştirilmez.
+        
+        Kalan nesneler sıralarını korur (güncellenenler yerinde değiştirilir), eklenenler
+        bölümün sonuna eklenir.
+        
+        Args:
+            dronlar (List[Drone]): Drone'ların listesi
+            teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+            ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+            
+        Returns:
+            Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]: Yeni senaryo
+        """
+        sonuc = []
+        for bolum, nesneler in zip(SENARYO_BOLUMLERI, (dronlar, teslimat_noktalari, ucus_yasak_bolgeleri)):
+            mevcut_idler = {nesne.id for nesne in nesneler}
+            silinenler = set(self.silinenler[bolum])
+            guncellenenler = {nesne.id: nesne for nesne in self.guncellenenler[bolum]}
+            
+            eksik = (silinenler | set(guncellenenler)) - mevcut_idler
+            if eksik:
+                raise ValueError(f"{bolum} bölümünde bulunmayan ID'ler: {sorted(eksik)}")
+            yinelenen = [nesne.id for nesne in self.eklenenler[bolum] if nesne.id in mevcut_idler - silinenler]
+            if yinelenen:
+                raise ValueError(f"{bolum} bölümünde zaten var olan ID'ler eklenemez: {sorted(yinelenen)}")
+            
+            sonuc.append([
+                guncellenenler.get(nesne.id, nesne) for nesne in nesneler if nesne.id not in silinenler
+            ] + list(self.eklenenler[bolum]))
+        
+        return tuple(sonuc)
+
+
+@dataclass
+class DogrulamaSorunu:
+    """
+    Senaryo doğrulamasında bulunan tek bir sorun.
+    
+    Attributes:
+        bolum (str): Sorunlu nesnenin bölümü (SENARYO_BOLUMLERI)
+        id (int): Sorunlu nesnenin ID'si
+        kod (str): Sorun türü (ör. "yinelenen_id", "ters_zaman_araligi")
+        seviye (str): "hata" (senaryo geçersiz) ya da "uyari" (senaryo geçerli ama
+                      nesne hiçbir planda kullanılamaz)
+        mesaj (str): Okunabilir açıklama
+    """
+    bolum: str
+    id: int
+    kod: str
+    seviye: str
+    mesaj: str
+
+
+class KolonluSenaryo:
+    """
+    Senaryonun kolon dizileri halinde tutulan hali.
+    
+    Drone, teslimat noktası ve uçuşa yasak bölge alanları ayrı NumPy dizilerinde
+    saklanır; dosyadan bellek eşlemeli yüklendiğinde diziler diskten ihtiyaç
+    duyuldukça okunur. Model nesneleri yalnızca istendiğinde (ve istenen aralık
+    için) oluşturulur.
+    
+    Attributes:
+        diziler (Dict[str, np.ndarray]): Kolon adından diziye eşleme. Zamanlar gün
+                                         başından itibaren mikrosaniye, bölge köşeleri
+                                         tek bir koordinat dizisinde ve bölge başına
+                                         başlangıç ofsetleriyle tutulur.
+    """
+    
+    KOLONLAR = (
+        "dron_id", "dron_maksimum_agirlik", "dron_batarya", "dron_hiz", "dron_baslangic_poz",
+        "teslimat_id", "teslimat_poz", "teslimat_agirlik", "teslimat_oncelik", "teslimat_zaman_araligi",
+        "bolge_id", "bolge_aktif_zaman", "bolge_kose_ofsetleri", "bolge_koordinatlar"
+    )
+    
+    def __init__(self, diziler: Dict[str, np.ndarray]):
+        """
+        Args:
+            diziler (Dict[str, np.ndarray]): KOLONLAR'daki her ad için bir dizi
+        """
+        eksik = [ad for ad in self.KOLONLAR if ad not in diziler]
+        if eksik:
+            raise ValueError(f"Eksik senaryo kolonları: {', '.join(eksik)}")
+        self.diziler = diziler
+    
+    @classmethod
+    def nesnelerden_olustur(
+        cls, 
+        dronlar: List[Drone], 
+        teslimat_noktalari: List[TeslimatNoktasi], 
+        ucus_yasak_bolgeleri: List[UcusYasakBolgesi]
+    ) -> "KolonluSenaryo":
+        """
+        Model nesnelerinden kolonlu senaryo oluşturur.
+        
+        Args:
+            dronlar (List[Drone]): Drone'ların listesi
+            teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+            ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+            
+        Returns:
+            KolonluSenaryo: Kolonlu senaryo
+        """
+        kose_sayilari = [len(bolge.koordinatlar) for bolge in ucus_yasak_bolgeleri]
+        return cls({
+            "dron_id": np.array([dron.id for dron in dronlar], dtype=np.int64),
+            "dron_maksimum_agirlik": np.array([dron.maksimum_agirlik for dron in dronlar], dtype=np.float64),
+            "dron_batarya": np.array([dron.batarya for dron in dronlar], dtype=np.int64),
+            "dron_hiz": np.array([dron.hiz for dron in dronlar], dtype=np.float64),
+            "dron_baslangic_poz": np.array([dron.baslangic_poz for dron in dronlar], dtype=np.float64).reshape(-1, 2),
+            "teslimat_id": np.array([nokta.id for nokta in teslimat_noktalari], dtype=np.int64),
+            "teslimat_poz": np.array([nokta.poz for nokta in teslimat_noktalari], dtype=np.float64).reshape(-1, 2),
+            "teslimat_agirlik": np.array([nokta.agirlik for nokta in teslimat_noktalari], dtype=np.float64),
+            "teslimat_oncelik": np.array([nokta.oncelik for nokta in teslimat_noktalari], dtype=np.int64),
+            "teslimat_zaman_araligi": np.array(
+                [[_zamani_mikrosaniyeye_cevir(t) for t in nokta.zaman_araligi] for nokta in teslimat_noktalari],
+                dtype=np.int64
+            ).reshape(-1, 2),
+            "bolge_id": np.array([bolge.id for bolge in ucus_yasak_bolgeleri], dtype=np.int64),
+            "bolge_aktif_zaman": np.array(
+                [[_zamani_mikrosaniyeye_cevir(t) for t in bolge.aktif_zaman] for bolge in ucus_yasak_bolgeleri],
+                dtype=np.int64
+            ).reshape(-1, 2),
+            "bolge_kose_ofsetleri": np.concatenate([[0], np.cumsum(kose_sayilari, dtype=np.int64)]).astype(np.int64),
+            "bolge_koordinatlar": np.array(
+                [koordinat for bolge in ucus_yasak_bolgeleri for koordinat in bolge.koordinatlar], dtype=np.float64
+            ).reshape(-1, 2)
+        })
+    
+    @property
+    def dron_sayisi(self) -> int:
+        return len(self.diziler["dron_id"])
+    
+    @property
+    def teslimat_sayisi(self) -> int:
+        return len(self.diziler["teslimat_id"])
+    
+    @property
+    def ucus_yasak_bolge_sayisi(self) -> int:
+        return len(self.diziler["bolge_id"])
+    
+    def dronlari_al(self) -> List[Drone]:
+        """
+        Drone nesnelerini oluşturur.
+        
+        Returns:
+            List[Drone]: Drone'ların listesi
+        """
+        d = self.diziler
+        return [
+            Drone(
+                id=dron_id,
+                maksimum_agirlik=maksimum_agirlik,
+                batarya=batarya,
+                hiz=hiz,
+                baslangic_poz=tuple(poz)
+            )
+            for dron_id, maksimum_agirlik, batarya, hiz, poz in zip(
+                d["dron_id"].tolist(), d["dron_maksimum_agirlik"].tolist(), d["dron_batarya"].tolist(),
+                d["dron_hiz"].tolist(), d["dron_baslangic_poz"].tolist()
+            )
+        ]
+    
+    def teslimat_noktalarini_al(self, indeksler: Optional[np.ndarray] = None) -> List[TeslimatNoktasi]:
+        """
+        Teslimat noktası nesnelerini oluşturur; yalnızca istenen satırlar diskten okunur.
+        
+        Args:
+            indeksler (Optional[np.ndarray]): Satır indeksleri, dilim ya da maske (None ise tümü)
+            
+        Returns:
+            List[TeslimatNoktasi]: Teslimat noktalarının listesi
+        """
+        secim = slice(None) if indeksler is None else indeksler
+        d = self.diziler
+        
+        # Zaman aralıkları az sayıda farklı değer aldığından her değer için tek nesne üretilir
+        zaman_araliklari = np.asarray(d["teslimat_zaman_araligi"][secim])
+        benzersiz, ters = np.unique(zaman_araliklari, return_inverse=True)
+        zamanlar = [_mikrosaniyeyi_zamana_cevir(mikrosaniye) for mikrosaniye in benzersiz.tolist()]
+        
+        return [
+            TeslimatNoktasi(
+                id=teslimat_id,
+                poz=tuple(poz),
+                agirlik=agirlik,
+                oncelik=oncelik,
+                zaman_araligi=(zamanlar[baslangic], zamanlar[bitis])
+            )
+            for teslimat_id, poz, agirlik, oncelik, (baslangic, bitis) in zip(
+                d["teslimat_id"][secim].tolist(), d["teslimat_poz"][secim].tolist(),
+                d["teslimat_agirlik"][secim].tolist(), d["teslimat_oncelik"][secim].tolist(),
+                ters.reshape(zaman_araliklari.shape).tolist()
+            )
+        ]
+    
+    def ucus_yasak_bolgelerini_al(self) -> List[UcusYasakBolgesi]:
+        """
+        Uçuşa yasak bölge nesnelerini oluşturur.
+        
+        Returns:
+            List[UcusYasakBolgesi]: Uçuşa yasak bölgelerin listesi
+        """
+        d = self.diziler
+        ofsetler = d["bolge_kose_ofsetleri"].tolist()
+        koordinatlar = [tuple(koordinat) for koordinat in d["bolge_koordinatlar"].tolist()]
+        return [
+            UcusYasakBolgesi(
+                id=bolge_id,
+                koordinatlar=koordinatlar[ofsetler[i]:ofsetler[i + 1]],
+                aktif_zaman=(_mikrosaniyeyi_zamana_cevir(baslangic), _mikrosaniyeyi_zamana_cevir(bitis))
+            )
+            for i, (bolge_id, (baslangic, bitis)) in enumerate(zip(
+                d["bolge_id"].tolist(), d["bolge_aktif_zaman"].tolist()
+            ))
+        ]
+    
+    def nesneleri_al(self) -> Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]:
+        """
+        Senaryonun tüm model nesnelerini oluşturur.
+        
+        Returns:
+            Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]: Senaryo
+        """
+        return self.dronlari_al(), self.teslimat_noktalarini_al(), self.ucus_yasak_bolgelerini_al()
+    
+    def ozet(self) -> str:
+        """
+        Senaryo içeriğinin kararlı SHA-256 özetini hesaplar.
+        
+        Özet yalnızca kolonların adı, türü, boyutu ve little-endian baytlarından
+        oluşur; aynı senaryo metin ya da kolonlu dosyadan yüklense de, farklı bir
+        süreçte hesaplansa da aynı özeti verir.
+        
+        Returns:
+            str: Onaltılık SHA-256 özeti
+        """
+        ozet = hashlib.sha256()
+        for ad in self.KOLONLAR:
+            dizi = np.ascontiguousarray(self.diziler[ad])
+            dizi = dizi.astype(dizi.dtype.newbyteorder('<'), copy=False)
+            ozet.update(f"{ad}:{dizi.dtype.str}:{dizi.shape};".encode("utf-8"))
+            ozet.update(dizi.tobytes())
+        return ozet.hexdigest()
+    
+    def dogrula(self) -> List[DogrulamaSorunu]:
+        """
+        Senaryoyu kolonlar üzerinde vektörel olarak doğrular.
+        
+        Hata olarak raporlananlar:
+        - Bölüm içinde yinelenen ID'ler
+        - Pozitif olmayan drone kapasitesi, bataryası ya da hızı; pozitif olmayan teslimat
+          ağırlığı; 1-5 aralığı dışındaki öncelik
+        - Bitişi başlangıcından önce olan teslimat zaman aralıkları ve bölge aktif zamanları
+        - Üçten az köşeli ya da kendini kesen bölge poligonları
+        Uyarı olarak raporlananlar:
+        - Zaman aralığı boyunca sürekli aktif olan bir bölgenin içinde kalan teslimatlar
+          (hiçbir drone ulaşamaz)
+        
+        Returns:
+            List[DogrulamaSorunu]: Bulunan sorunlar (sorun yoksa boş liste)
+        """
+        d = self.diziler
+        sorunlar: List[DogrulamaSorunu] = []
+        
+        def ekle(bolum: str, idler: np.ndarray, kod: str, seviye: str, mesajlar: Iterable[str]):
+            sorunlar.extend(
+                DogrulamaSorunu(bolum, nesne_id, kod, seviye, mesaj)
+                for nesne_id, mesaj in zip(np.asarray(idler).tolist(), mesajlar)
+            )
+        
+        # Yinelenen ID'ler
+        for bolum, kolon in zip(SENARYO_BOLUMLERI, ("dron_id", "teslimat_id", "bolge_id")):
+            idler, sayilar = _yinelenen_degerler(d[kolon])
+            ekle(bolum, idler, "yinelenen_id", "hata",
+                 (f"ID {nesne_id} {sayi} kez tekrarlanıyor" for nesne_id, sayi in zip(idler.tolist(), sayilar.tolist())))
+        
+        # Geçersiz değerler
+        for bolum, kolon, gecersiz, aciklama in [
+            ("DRONLAR", "dron_maksimum_agirlik", np.asarray(d["dron_maksimum_agirlik"]) <= 0, "maksimum_agirlik pozitif olmalı"),
+            ("DRONLAR", "dron_batarya", np.asarray(d["dron_batarya"]) <= 0, "batarya pozitif olmalı"),
+            ("DRONLAR", "dron_hiz", np.asarray(d["dron_hiz"]) <= 0, "hiz pozitif olmalı"),
+            ("TESLIMAT_NOKTALARI", "teslimat_agirlik", np.asarray(d["teslimat_agirlik"]) <= 0, "agirlik pozitif olmalı"),
+            ("TESLIMAT_NOKTALARI", "teslimat_oncelik",
+             (np.asarray(d["teslimat_oncelik"]) < 1) | (np.asarray(d["teslimat_oncelik"]) > 5), "oncelik 1 ile 5 arasında olmalı"),
+        ]:
+            satirlar = np.flatnonzero(gecersiz)
+            id_kolonu = "dron_id" if bolum == "DRONLAR" else "teslimat_id"
+            degerler = np.asarray(d[kolon])[satirlar].tolist()
+            ekle(bolum, np.asarray(d[id_kolonu])[satirlar], "gecersiz_deger", "hata",
+                 (f"{aciklama} (değer: {deger})" for deger in degerler))
+        
+        # Ters zaman aralıkları
+        pencereler = np.asarray(d["teslimat_zaman_araligi"])
+        aktif_zamanlar = np.asarray(d["bolge_aktif_zaman"])
+        for bolum, kolon, araliklar in [
+            ("TESLIMAT_NOKTALARI", "teslimat_id", pencereler),
+            ("UCUS_YASAK_BOLGELERI", "bolge_id", aktif_zamanlar)
+        ]:
+            satirlar = np.flatnonzero(araliklar[:, 1] < araliklar[:, 0])
+            ekle(bolum, np.asarray(d[kolon])[satirlar], "ters_zaman_araligi", "hata", (
+                f"zaman aralığının bitişi ({_mikrosaniyeyi_zamana_cevir(bitis)}) başlangıcından "
+                f"({_mikrosaniyeyi_zamana_cevir(baslangic)}) önce"
+                for baslangic, bitis in araliklar[satirlar].tolist()
+            ))
+        
+        # Bölge poligonları
+        bolge_idleri = np.asarray(d["bolge_id"])
+        ofsetler = np.asarray(d["bolge_kose_ofsetleri"])
+        koordinatlar = np.asarray(d["bolge_koordinatlar"])
+        kose_sayilari = np.diff(ofsetler)
+        satirlar = np.flatnonzero(kose_sayilari < 3)
+        ekle("UCUS_YASAK_BOLGELERI", bolge_idleri[satirlar], "yetersiz_kose", "hata",
+             (f"poligonun {sayi} köşesi var (en az 3 olmalı)" for sayi in kose_sayilari[satirlar].tolist()))
+        kendini_kesen = _kendini_kesen_poligonlar(ofsetler, koordinatlar)
+        ekle("UCUS_YASAK_BOLGELERI", bolge_idleri[kendini_kesen], "kendini_kesen_poligon", "hata",
+             itertools.repeat("poligonun komşu olmayan kenarları kesişiyor", int(kendini_kesen.sum())))
+        
+        # Zaman aralığı boyunca aktif bir bölgenin içindeki teslimatlar
+        gecerli_bolgeler = np.flatnonzero(
+            (kose_sayilari >= 3) & ~kendini_kesen & (aktif_zamanlar[:, 1] >= aktif_zamanlar[:, 0])
+        )
+        if len(gecerli_bolgeler) and self.teslimat_sayisi:
+            pozlar = np.asarray(d["teslimat_poz"])
+            teslimat_idleri = np.asarray(d["teslimat_id"])
+            
+            # Teslimatlar x'e göre kovalara ayrılıp bir kez sıralanır (int16 kovalarda kararlı sıralama
+            # taban sıralamasıdır); her bölgenin adayları, x aralığını kapsayan kovaların ardışık dilimidir
+            kova_sayisi = 1024
+            x = pozlar[:, 0]
+            x_min, x_genislik = float(x.min()), float(x.max() - x.min()) or 1.0
+            kovalar = np.clip(((x - x_min) * (kova_sayisi / x_genislik)).astype(np.int64), 0, kova_sayisi - 1)
+            sira = np.argsort(kovalar.astype(np.int16), kind="stable")
+            kova_sinirlari = np.concatenate([[0], np.cumsum(np.bincount(kovalar, minlength=kova_sayisi))])
+            sirali_x, sirali_y = x[sira], pozlar[sira, 1]
+            sirali_baslangic, sirali_bitis = pencereler[sira, 0], pencereler[sira, 1]
+            
+            for b in gecerli_bolgeler.tolist():
+                koseler = koordinatlar[ofsetler[b]:ofsetler[b + 1]]
+                (min_x, min_y), (max_x, max_y) = koseler.min(axis=0), koseler.max(axis=0)
+                ilk_kova, son_kova = np.clip(
+                    ((np.array([min_x, max_x]) - x_min) * (kova_sayisi / x_genislik)).astype(np.int64), 0, kova_sayisi - 1
+                )
+                dilim = slice(kova_sinirlari[ilk_kova], kova_sinirlari[son_kova + 1])
+                aday = (
+                    (sirali_x[dilim] >= min_x) & (sirali_x[dilim] <= max_x) &
+                    (sirali_y[dilim] >= min_y) & (sirali_y[dilim] <= max_y) &
+                    (sirali_baslangic[dilim] >= aktif_zamanlar[b, 0]) & (sirali_bitis[dilim] <= aktif_zamanlar[b, 1])
+                )
+                adaylar = sira[dilim][aday]
+                if len(adaylar) == 0:
+                    continue
+                
+                bolge = UcusYasakBolgesi(
+                    id=int(bolge_idleri[b]),
+                    koordinatlar=[tuple(kose) for kose in koseler.tolist()],
+                    aktif_zaman=tuple(_mikrosaniyeyi_zamana_cevir(t) for t in aktif_zamanlar[b].tolist())
+                )
+                icerdekiler = np.sort(adaylar[bolge.noktalar_iceriyor_mu(pozlar[adaylar])])
+                mesaj = f"zaman aralığı boyunca aktif olan {bolge.id} numaralı bölgenin içinde"
+                ekle("TESLIMAT_NOKTALARI", teslimat_idleri[icerdekiler], "kalici_yasak_bolgede", "uyari",
+                     itertools.repeat(mesaj, len(icerdekiler)))
+        
+        return sorunlar
+    
+    def kaydet(self, dosya_adi: str):
+        """
+        Kolonları tek bir ikili dosyaya yazar.
+        
+        Dosya; sihirli bayt, 8 baytlık başlık uzunluğu, kolonların tür, boyut ve
+        ofsetlerini içeren JSON başlık ve KOLONLU_HIZALAMA baytına hizalanmış ham
+        (little-endian) dizilerden oluşur.
+        
+        Args:
+            dosya_adi (str): Dosya adı
+        """
+        diziler = {ad: np.ascontiguousarray(self.diziler[ad]) for ad in self.KOLONLAR}
+        diziler = {ad: dizi.astype(dizi.dtype.newbyteorder('<')) for ad, dizi in diziler.items()}
+        
+        # Ofsetler başlık uzunluğuna bağlı olduğundan veri bölümüne göre tutulur
+        basliklar = {}
+        ofset = 0
+        for ad, dizi in diziler.items():
+            basliklar[ad] = {"tur": dizi.dtype.str, "boyut": list(dizi.shape), "ofset": ofset}
+            ofset += -(-dizi.nbytes // KOLONLU_HIZALAMA) * KOLONLU_HIZALAMA
+        
+        baslik = json.dumps({"surum": 1, "kolonlar": basliklar}).encode("utf-8")
+        veri_baslangici = -(-(len(KOLONLU_SIHIRLI_BAYT) + 8 + len(baslik)) // KOLONLU_HIZALAMA) * KOLONLU_HIZALAMA
+        baslik = baslik.ljust(veri_baslangici - len(KOLONLU_SIHIRLI_BAYT) - 8)
+        
+        with open(dosya_adi, 'wb') as f:
+            f.write(KOLONLU_SIHIRLI_BAYT)
+            f.write(struct.pack('<Q', len(baslik)))
+            f.write(baslik)
+            for ad, dizi in diziler.items():
+                f.seek(veri_baslangici + basliklar[ad]["ofset"])
+                f.write(dizi.tobytes())
+            f.truncate(veri_baslangici + ofset)
+    
+    @classmethod
+    def yukle(cls, dosya_adi: str, bellek_esleme: bool = True) -> "KolonluSenaryo":
+        """
+        Kolonlu senaryo dosyasını okur.
+        
+        Args:
+            dosya_adi (str): Dosya adı
+            bellek_esleme (bool): Dizileri belleğe okumak yerine salt okunur olarak eşle
+            
+        Returns:
+            KolonluSenaryo: Kolonlu senaryo
+        """
+        with open(dosya_adi, 'rb') as f:
+            if f.read(len(KOLONLU_SIHIRLI_BAYT)) != KOLONLU_SIHIRLI_BAYT:
+                raise ValueError(f"Kolonlu senaryo dosyası değil: {dosya_adi}")
+            baslik_uzunlugu, = struct.unpack('<Q', f.read(8))
+            baslik = json.loads(f.read(baslik_uzunlugu).decode("utf-8"))
+            veri_baslangici = f.tell()
+            
+            if baslik.get("surum") != 1:
+                raise ValueError(f"Desteklenmeyen kolonlu senaryo sürümü: {baslik.get('surum')}")
+            
+            diziler = {}
+            for ad, bilgi in baslik["kolonlar"].items():
+                tur, boyut = np.dtype(bilgi["tur"]), tuple(bilgi["boyut"])
+                eleman_sayisi = int(np.prod(boyut))
+                if eleman_sayisi == 0:
+                    diziler[ad] = np.empty(boyut, dtype=tur)
+                elif bellek_esleme:
+                    diziler[ad] = np.memmap(
+                        dosya_adi, dtype=tur, mode='r', offset=veri_baslangici + bilgi["ofset"], shape=boyut
+                    )
+                else:
+                    f.seek(veri_baslangici + bilgi["ofset"])
+                    diziler[ad] = np.fromfile(f, dtype=tur, count=eleman_sayisi).reshape(boyut)
+        
+        return cls(diziler)
+
+
+def senaryoyu_dogrula(
+    dronlar: List[Drone], 
+    teslimat_noktalari: List[TeslimatNoktasi], 
+    ucus_yasak_bolgeleri: List[UcusYasakBolgesi]
+) -> List[DogrulamaSorunu]:
+    """
+    Model nesneleriyle verilen senaryoyu doğrular (bkz. KolonluSenaryo.dogrula).
+    
+    Args:
+        dronlar (List[Drone]): Drone'ların listesi
+        teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+        ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+        
+    Returns:
+        List[DogrulamaSorunu]: Bulunan sorunlar
+    """
+    return KolonluSenaryo.nesnelerden_olustur(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri).dogrula()
+
 
 class VeriUreteci:
     """
@@ -32,6 +893,12 @@ class VeriUreteci:
         
         if tohum is not None:
             random.seed(tohum)
+        
+        # Toplu (vektörel) üretim için NumPy rastgele sayı üreteci
+        self.rng = np.random.default_rng(tohum)
+        
+        # Son paralel yüklemenin istatistikleri (bkz. senaryoyu_paralel_yukle)
+        self.yukleme_istatistikleri: Dict[str, float] = {}
     
     def dronlari_uret(
         self, 
@@ -221,138 +1088,542 @@ class VeriUreteci:
         
         return dronlar, teslimat_noktalari, ucus_yasak_bolgeleri
     
+    def dron_kolonlari_uret(
+        self, 
+        adet: int, 
+        baslangic_poz: Tuple[float, float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        dronlari_uret ile aynı dağılımlardan drone kolonlarını toplu olarak üretir.
+        
+        Args:
+            adet (int): Üretilecek drone sayısı
+            baslangic_poz (Tuple[float, float]): Tüm drone'ların başlangıç pozisyonu
+                                               (None ise rastgele üretilir)
+            
+        Returns:
+            Dict[str, np.ndarray]: KolonluSenaryo drone kolonları
+        """
+        if baslangic_poz is None:
+            pozlar = self.rng.uniform((0, 0), (self.alan_genisligi, self.alan_yuksekligi), size=(adet, 2))
+        else:
+            pozlar = np.tile(np.asarray(baslangic_poz, dtype=np.float64), (adet, 1))
+        
+        return {
+            "dron_id": np.arange(adet, dtype=np.int64),
+            "dron_maksimum_agirlik": self.rng.uniform(1.0, 5.0, adet),  # 1-5 kg
+            "dron_batarya": self.rng.integers(5000, 10000, adet, endpoint=True),  # 5000-10000 mAh
+            "dron_hiz": self.rng.uniform(5.0, 15.0, adet),  # 5-15 m/s
+            "dron_baslangic_poz": pozlar
+        }
+    
+    def teslimat_kolonlari_uret(self, adet: int) -> Dict[str, np.ndarray]:
+        """
+        teslimat_noktalari_uret ile aynı dağılımlardan teslimat kolonlarını toplu olarak üretir.
+        
+        Args:
+            adet (int): Üretilecek teslimat noktası sayısı
+            
+        Returns:
+            Dict[str, np.ndarray]: KolonluSenaryo teslimat kolonları
+        """
+        dakikalar = np.array([0, 15, 30, 45])
+        baslangic_saatleri = self.rng.integers(8, 16, adet, endpoint=True)
+        bitis_saatleri = np.minimum(baslangic_saatleri + self.rng.integers(1, 3, adet, endpoint=True), 18)
+        zaman_araligi = np.stack([
+            baslangic_saatleri * 60 + self.rng.choice(dakikalar, adet),
+            bitis_saatleri * 60 + self.rng.choice(dakikalar, adet)
+        ], axis=1)
+        
+        return {
+            "teslimat_id": np.arange(adet, dtype=np.int64),
+            "teslimat_poz": self.rng.uniform((0, 0), (self.alan_genisligi, self.alan_yuksekligi), size=(adet, 2)),
+            "teslimat_agirlik": self.rng.uniform(0.5, 4.0, adet),  # 0.5-4 kg
+            "teslimat_oncelik": self.rng.integers(1, 5, adet, endpoint=True),  # 1-5
+            "teslimat_zaman_araligi": zaman_araligi.astype(np.int64) * 60_000_000
+        }
+    
+    def ucus_yasak_bolge_kolonlari_uret(
+        self, 
+        adet: int, 
+        yaricap_araligi: Tuple[float, float] = (5.0, 15.0)
+    ) -> Dict[str, np.ndarray]:
+        """
+        ucus_yasak_bolgeleri_uret ile aynı dağılımlardan bölge kolonlarını toplu olarak üretir.
+        
+        Args:
+            adet (int): Üretilecek uçuşa yasak bölge sayısı
+            yaricap_araligi (Tuple[float, float]): Bölge yarıçapının alt ve üst sınırı
+            
+        Returns:
+            Dict[str, np.ndarray]: KolonluSenaryo bölge kolonları
+        """
+        merkezler = self.rng.uniform((0, 0), (self.alan_genisligi, self.alan_yuksekligi), size=(adet, 2))
+        yaricaplar = self.rng.uniform(yaricap_araligi[0], yaricap_araligi[1], adet)
+        kose_sayilari = self.rng.integers(3, 6, adet, endpoint=True)
+        kose_ofsetleri = np.concatenate([[0], np.cumsum(kose_sayilari)]).astype(np.int64)
+        
+        # Tüm bölgelerin köşeleri tek dizide; j, köşenin kendi bölgesindeki sırası
+        bolge_indeksleri = np.repeat(np.arange(adet), kose_sayilari)
+        j = np.arange(kose_ofsetleri[-1]) - kose_ofsetleri[bolge_indeksleri]
+        acilar = 2 * np.pi * j / kose_sayilari[bolge_indeksleri] + self.rng.uniform(-0.2, 0.2, len(j))
+        r = yaricaplar[bolge_indeksleri] * self.rng.uniform(0.8, 1.2, len(j))
+        koordinatlar = merkezler[bolge_indeksleri] + r[:, None] * np.stack([np.cos(acilar), np.sin(acilar)], axis=1)
+        koordinatlar = np.clip(koordinatlar, 0, (self.alan_genisligi, self.alan_yuksekligi))
+        
+        dakikalar = np.array([0, 15, 30, 45])
+        baslangic_saatleri = self.rng.integers(8, 14, adet, endpoint=True)
+        bitis_saatleri = np.minimum(baslangic_saatleri + self.rng.integers(2, 6, adet, endpoint=True), 18)
+        aktif_zaman = np.stack([
+            baslangic_saatleri * 60 + self.rng.choice(dakikalar, adet),
+            bitis_saatleri * 60 + self.rng.choice(dakikalar, adet)
+        ], axis=1)
+        
+        return {
+            "bolge_id": np.arange(adet, dtype=np.int64),
+            "bolge_aktif_zaman": aktif_zaman.astype(np.int64) * 60_000_000,
+            "bolge_kose_ofsetleri": kose_ofsetleri,
+            "bolge_koordinatlar": koordinatlar.reshape(-1, 2)
+        }
+    
+    def kolonlu_senaryo_uret(
+        self, 
+        dron_sayisi: int, 
+        teslimat_sayisi: int, 
+        ucus_yasak_bolge_sayisi: int,
+        dron_baslangic_poz: Tuple[float, float] = None
+    ) -> KolonluSenaryo:
+        """
+        senaryo_uret'in NumPy ile toplu üreten karşılığı.
+        
+        Tüm alanlar self.rng üzerinden diziler halinde üretilir; aynı tohumla aynı
+        senaryo elde edilir. Model nesneleri, dönen senaryodan istendiğinde oluşturulur.
+        
+        Args:
+            dron_sayisi (int): Drone sayısı
+            teslimat_sayisi (int): Teslimat noktası sayısı
+            ucus_yasak_bolge_sayisi (int): Uçuşa yasak bölge sayısı
+            dron_baslangic_poz (Tuple[float, float]): Tüm drone'ların başlangıç pozisyonu
+                                                   (None ise rastgele üretilir)
+            
+        Returns:
+            KolonluSenaryo: Üretilen senaryo
+        """
+        return KolonluSenaryo({
+            **self.dron_kolonlari_uret(dron_sayisi, dron_baslangic_poz),
+            **self.teslimat_kolonlari_uret(teslimat_sayisi),
+            **self.ucus_yasak_bolge_kolonlari_uret(ucus_yasak_bolge_sayisi)
+        })
+    
+    def sehir_senaryosu_uret(
+        self, 
+        teslimat_sayisi: int, 
+        dron_sayisi: Optional[int] = None,
+        merkez_sayisi: Optional[int] = None,
+        kume_orani: float = 0.8,
+        depo_sayisi: int = 1,
+        ucus_yasak_bolge_sayisi: Optional[int] = None,
+        yogun_saat_orani: float = 0.6,
+        yogun_saatler: Tuple[float, ...] = (9.0, 17.0)
+    ) -> KolonluSenaryo:
+        """
+        Şehir ölçeğinde, kümelenmiş talepli bir senaryoyu NumPy ile toplu üretir.
+        
+        Düzgün dağılımlı senaryodan farkları:
+        - Talep, rastgele yerleştirilen dağıtım merkezleri etrafında Gauss karışımıdır;
+          merkezlerin ağırlıkları ve yayılımları farklıdır, kalan teslimatlar alana
+          düzgün dağılır.
+        - Drone'lar birden fazla depoya sırayla dağıtılır; depolar en yoğun merkezlere
+          yerleştirilir.
+        - Uçuşa yasak bölgeler alanla orantılı boyutlarda ve (varsayılan olarak)
+          merkez sayısı kadar sık üretilir.
+        - Teslimatların bir kısmının zaman aralığı yoğun saatlerin etrafında toplanır
+          ve daha dardır (30-90 dakika).
+        Varsayılan drone ve merkez sayıları teslimat sayısıyla ölçeklenir; böylece aynı
+        çağrı 10'dan 10^6 teslimata kadar benzer yapıda senaryolar üretir.
+        
+        Args:
+            teslimat_sayisi (int): Teslimat noktası sayısı
+            dron_sayisi (Optional[int]): Drone sayısı (varsayılan: her 50 teslimata bir)
+            merkez_sayisi (Optional[int]): Talep merkezi sayısı (varsayılan: √teslimat_sayisi / 4)
+            kume_orani (float): Merkezler etrafında kümelenen teslimatların oranı (0-1)
+            depo_sayisi (int): Depo sayısı
+            ucus_yasak_bolge_sayisi (Optional[int]): Uçuşa yasak bölge sayısı (varsayılan: merkez sayısı)
+            yogun_saat_orani (float): Zaman aralığı yoğun saatlerde olan teslimatların oranı (0-1)
+            yogun_saatler (Tuple[float, ...]): Yoğun saatlerin tepe noktaları (saat, ondalıklı)
+            
+        Returns:
+            KolonluSenaryo: Üretilen senaryo
+        """
+        if not 0 <= kume_orani <= 1 or not 0 <= yogun_saat_orani <= 1:
+            raise ValueError("Küme ve yoğun saat oranları 0 ile 1 arasında olmalıdır.")
+        if depo_sayisi < 1:
+            raise ValueError("Depo sayısı en az 1 olmalıdır.")
+        
+        if dron_sayisi is None:
+            dron_sayisi = max(1, teslimat_sayisi // 50)
+        if merkez_sayisi is None:
+            merkez_sayisi = max(1, int(round(math.sqrt(teslimat_sayisi) / 4)))
+        if ucus_yasak_bolge_sayisi is None:
+            ucus_yasak_bolge_sayisi = merkez_sayisi
+        alan = np.array([self.alan_genisligi, self.alan_yuksekligi])
+        olcek = min(self.alan_genisligi, self.alan_yuksekligi)
+        
+        # Merkezler kenarlardan uzak; ağırlıklar log-normal, yayılımlar alanın %2-8'i
+        merkezler = self.rng.uniform(0.1 * alan, 0.9 * alan, size=(merkez_sayisi, 2))
+        agirliklar = self.rng.lognormal(0.0, 1.0, merkez_sayisi)
+        agirliklar /= agirliklar.sum()
+        yayilimlar = self.rng.uniform(0.02, 0.08, merkez_sayisi) * olcek
+        
+        kolonlar = self.teslimat_kolonlari_uret(teslimat_sayisi)
+        kumeli = self.rng.random(teslimat_sayisi) < kume_orani
+        kume_sayisi = int(kumeli.sum())
+        secilen_merkezler = self.rng.choice(merkez_sayisi, kume_sayisi, p=agirliklar)
+        kolonlar["teslimat_poz"][kumeli] = np.clip(
+            merkezler[secilen_merkezler] +
+            self.rng.normal(0.0, 1.0, (kume_sayisi, 2)) * yayilimlar[secilen_merkezler, None],
+            0, alan
+        )
+        
+        # Yoğun saat teslimatları: tepe etrafında ±45 dk başlangıç, 30-90 dk süre, 08:00-18:00 içinde
+        yogun = self.rng.random(teslimat_sayisi) < yogun_saat_orani
+        yogun_sayisi = int(yogun.sum())
+        tepeler = np.asarray(yogun_saatler, dtype=np.float64)[self.rng.integers(0, len(yogun_saatler), yogun_sayisi)]
+        baslangiclar = np.clip(np.round(tepeler * 60 + self.rng.normal(0.0, 45.0, yogun_sayisi)), 8 * 60, 17 * 60 + 30)
+        bitisler = np.minimum(baslangiclar + self.rng.integers(30, 90, yogun_sayisi, endpoint=True), 18 * 60)
+        kolonlar["teslimat_zaman_araligi"][yogun] = np.stack([baslangiclar, bitisler], axis=1).astype(np.int64) * 60_000_000
+        
+        # Depolar en ağır merkezlerde (merkezlerden fazlaysa kalanlar rastgele); drone'lar sırayla dağıtılır
+        depolar = merkezler[np.argsort(-agirliklar)[:depo_sayisi]]
+        if len(depolar) < depo_sayisi:
+            depolar = np.vstack([depolar, self.rng.uniform(0.1 * alan, 0.9 * alan, size=(depo_sayisi - len(depolar), 2))])
+        dron_kolonlari = self.dron_kolonlari_uret(dron_sayisi, baslangic_poz=(0.0, 0.0))
+        dron_kolonlari["dron_baslangic_poz"] = depolar[np.arange(dron_sayisi) % depo_sayisi]
+        
+        return KolonluSenaryo({
+            **dron_kolonlari,
+            **kolonlar,
+            **self.ucus_yasak_bolge_kolonlari_uret(
+                ucus_yasak_bolge_sayisi, yaricap_araligi=(0.01 * olcek, 0.04 * olcek)
+            )
+        })
+    
     def senaryoyu_dosyaya_kaydet(
         self, 
         dosya_adi: str, 
         dronlar: List[Drone], 
         teslimat_noktalari: List[TeslimatNoktasi], 
-        ucus_yasak_bolgeleri: List[UcusYasakBolgesi]
+        ucus_yasak_bolgeleri: List[UcusYasakBolgesi],
+        sikistirma_seviyesi: Optional[int] = None
     ):
         """
         Senaryoyu dosyaya kaydeder.
         
+        Dosya adı .gz, .bz2 ya da .xz ile bitiyorsa dosya akış halinde sıkıştırılarak
+        yazılır (bkz. dosya_ac); okuyan metotlar bu dosyaları saydam olarak açar.
+        
         Args:
             dosya_adi (str): Dosya adı
             dronlar (List[Drone]): Drone'ların listesi
             teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
             ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+            sikistirma_seviyesi (Optional[int]): Sıkıştırma seviyesi (None ise varsayılan)
         """
-        with open(dosya_adi, 'w') as f:
+        with dosya_ac(dosya_adi, 'w', seviye=sikistirma_seviyesi) as f:
             # Başlık
             f.write("# Drone Filo Optimizasyonu Senaryo Dosyası\n\n")
             
-            # Drone'lar
-            f.write("## DRONLAR\n")
-            f.write("# id,maksimum_agirlik,batarya,hiz,baslangic_poz_x,baslangic_poz_y\n")
-            for dron in dronlar:
-                f.write(f"{dron.id},{dron.maksimum_agirlik},{dron.batarya},{dron.hiz},{dron.baslangic_poz[0]},{dron.baslangic_poz[1]}\n")
-            
-            f.write("\n")
+            # Drone'lar, teslimat noktaları ve uçuşa yasak bölgeler
+            for bolum, nesneler in zip(SENARYO_BOLUMLERI, (dronlar, teslimat_noktalari, ucus_yasak_bolgeleri)):
+                f.write(f"## {bolum}\n")
+                f.write(f"# {SATIR_BASLIKLARI[bolum]}\n")
+                for nesne in nesneler:
+                    f.write(SATIR_YAZICILARI[bolum](nesne) + "\n")
+                f.write("\n")
+    
+    def farki_dosyaya_kaydet(self, dosya_adi: str, fark: SenaryoFarki):
+        """
+        Senaryo farkını metin dosyasına kaydeder.
+        
+        Dosya senaryo dosyasıyla aynı bölümlere ve satır biçimine sahiptir; her satırın
+        başında işlem işareti bulunur: '+' ekleme, '~' güncelleme (tam satır), '-'
+        silme (yalnızca ID).
+        
+        Args:
+            dosya_adi (str): Dosya adı
+            fark (SenaryoFarki): Kaydedilecek fark
+        """
+        with dosya_ac(dosya_adi, 'w') as f:
+            f.write("# Drone Filo Optimizasyonu Senaryo Farkı Dosyası\n\n")
             
-            # Teslimat noktaları
-            f.write("## TESLIMAT_NOKTALARI\n")
-            f.write("# id,poz_x,poz_y,agirlik,oncelik,zaman_araligi_baslangic,zaman_araligi_bitis\n")
-            for nokta in teslimat_noktalari:
-                f.write(f"{nokta.id},{nokta.poz[0]},{nokta.poz[1]},{nokta.agirlik},{nokta.oncelik},{nokta.zaman_araligi[0]},{nokta.zaman_araligi[1]}\n")
+            for bolum in SENARYO_BOLUMLERI:
+                f.write(f"## {bolum}\n")
+                f.write(f"# +|~,{SATIR_BASLIKLARI[bolum]}  veya  -,id\n")
+                for nesne in fark.eklenenler[bolum]:
+                    f.write("+," + SATIR_YAZICILARI[bolum](nesne) + "\n")
+                for nesne in fark.guncellenenler[bolum]:
+                    f.write("~," + SATIR_YAZICILARI[bolum](nesne) + "\n")
+                for nesne_id in fark.silinenler[bolum]:
+                    f.write(f"-,{nesne_id}\n")
+                f.write("\n")
+    
+    def farki_dosyadan_yukle(self, dosya_adi: str) -> SenaryoFarki:
+        """
+        Senaryo farkını dosyadan yükler (biçim için bkz. farki_dosyaya_kaydet).
+        
+        Args:
+            dosya_adi (str): Dosya adı
             
-            f.write("\n")
+        Returns:
+            SenaryoFarki: Yüklenen fark
+        """
+        fark = SenaryoFarki()
+        mevcut_bolum = None
+        
+        with dosya_ac(dosya_adi, 'r', errors=METIN_KODLAMA_HATALARI) as f:
+            for satir_no, satir in enumerate(f, start=1):
+                satir = satir.strip()
+                
+                if satir.startswith('## '):
+                    mevcut_bolum = satir[3:].strip()
+                    if mevcut_bolum not in SENARYO_BOLUMLERI:
+                        raise ValueError(f"{dosya_adi}:{satir_no}: bilinmeyen bölüm {mevcut_bolum}")
+                    continue
+                
+                if not satir or satir.startswith('#'):
+                    continue
+                if mevcut_bolum is None:
+                    raise ValueError(f"{dosya_adi}:{satir_no}: bölüm başlığından önce satır")
+                
+                islem, _, veri = satir.partition(',')
+                if islem == '+':
+                    fark.eklenenler[mevcut_bolum].append(SATIR_COZUCULERI[mevcut_bolum](veri.split(',')))
+                elif islem == '~':
+                    fark.guncellenenler[mevcut_bolum].append(SATIR_COZUCULERI[mevcut_bolum](veri.split(',')))
+                elif islem == '-':
+                    fark.silinenler[mevcut_bolum].append(int(veri))
+                else:
+                    raise ValueError(f"{dosya_adi}:{satir_no}: bilinmeyen işlem '{islem}' (+, ~ ya da - olmalı)")
+        
+        return fark
+    
+    def senaryoyu_kolonlu_kaydet(
+        self, 
+        dosya_adi: str, 
+        dronlar: List[Drone], 
+        teslimat_noktalari: List[TeslimatNoktasi], 
+        ucus_yasak_bolgeleri: List[UcusYasakBolgesi]
+    ):
+        """
+        Senaryoyu bellek eşlemeli okunabilen ikili kolonlu biçimde kaydeder.
+        
+        Args:
+            dosya_adi (str): Dosya adı
+            dronlar (List[Drone]): Drone'ların listesi
+            teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+            ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+        """
+        KolonluSenaryo.nesnelerden_olustur(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri).kaydet(dosya_adi)
+    
+    def senaryoyu_kolonlu_yukle(self, dosya_adi: str, bellek_esleme: bool = True) -> KolonluSenaryo:
+        """
+        Kolonlu senaryo dosyasını model nesnelerine çevirmeden yükler.
+        
+        Args:
+            dosya_adi (str): Dosya adı
+            bellek_esleme (bool): Dizileri belleğe okumak yerine salt okunur olarak eşle
             
-            # Uçuşa yasak bölgeler
-            f.write("## UCUS_YASAK_BOLGELERI\n")
-            f.write("# id,aktif_zaman_baslangic,aktif_zaman_bitis,kose_sayisi,koordinatlar\n")
-            for bolge in ucus_yasak_bolgeleri:
-                koordinat_str = ";".join([f"{x},{y}" for x, y in bolge.koordinatlar])
-                f.write(f"{bolge.id},{bolge.aktif_zaman[0]},{bolge.aktif_zaman[1]},{len(bolge.koordinatlar)},{koordinat_str}\n")
+        Returns:
+            KolonluSenaryo: Nesneleri istendiğinde oluşturan kolonlu senaryo
+        """
+        return KolonluSenaryo.yukle(dosya_adi, bellek_esleme)
     
-    def senaryoyu_dosyadan_yukle(self, dosya_adi: str) -> Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]:
+    def senaryoyu_akis_ile_oku(
+        self, 
+        dosya_adi: str, 
+        bolumler: Optional[Iterable[str]] = None,
+        zaman_araligi: Optional[Tuple[time, time]] = None,
+        sinir_kutusu: Optional[Tuple[float, float, float, float]] = None
+    ) -> Iterator[Tuple[str, Union[Drone, TeslimatNoktasi, UcusYasakBolgesi]]]:
         """
-        Senaryoyu dosyadan yükler.
+        Senaryo dosyasını satır satır okuyup nesneleri bölüm sırasıyla tek tek üretir.
+        
+        Dosyanın tamamı belleğe alınmaz; tüketici ilk nesneleri dosyanın geri kalanı
+        okunmadan işlemeye başlayabilir. İstenmeyen bölümlerin satırları ayrıştırılmaz.
+        Filtreler teslimat noktalarına ve uçuşa yasak bölgelere uygulanır; drone'lar
+        filtrelenmez.
         
         Args:
             dosya_adi (str): Dosya adı
+            bolumler (Optional[Iterable[str]]): Okunacak bölümler (DRONLAR, TESLIMAT_NOKTALARI,
+                                                UCUS_YASAK_BOLGELERI; None ise tümü)
+            zaman_araligi (Optional[Tuple[time, time]]): Yalnızca zaman aralığı ya da aktif
+                                                         zamanı bu aralıkla kesişenler
+            sinir_kutusu (Optional[Tuple[float, float, float, float]]): (x_min, y_min, x_max, y_max);
+                                                                       yalnızca konumu (bölgelerde
+                                                                       köşelerin sınır kutusu) bu
+                                                                       kutuyla kesişenler
             
         Returns:
-            Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]: Yüklenen senaryo
+            Iterator[Tuple[str, Union[Drone, TeslimatNoktasi, UcusYasakBolgesi]]]: (bölüm adı, nesne) çiftleri
         """
-        dronlar = []
-        teslimat_noktalari = []
-        ucus_yasak_bolgeleri = []
+        istenen_bolumler = set(SENARYO_BOLUMLERI if bolumler is None else bolumler)
+        bilinmeyen = istenen_bolumler - set(SENARYO_BOLUMLERI)
+        if bilinmeyen:
+            raise ValueError(f"Bilinmeyen senaryo bölümleri: {', '.join(sorted(bilinmeyen))}")
         
         mevcut_bolum = None
         
-        with open(dosya_adi, 'r') as f:
+        with dosya_ac(dosya_adi, 'r', errors=METIN_KODLAMA_HATALARI) as f:
             for satir in f:
                 satir = satir.strip()
                 
-                # Boş satırları ve yorumları atla
-                if not satir or satir.startswith('#'):
+                # Bölüm başlıkları da '#' ile başladığından yorumlardan önce kontrol edilir
+                if satir.startswith('## '):
+                    mevcut_bolum = satir[3:].strip()
                     continue
                 
-                # Bölüm başlıklarını kontrol et
-                if satir.startswith('## '):
-                    mevcut_bolum = satir[3:]
+                # Boş satırları, yorumları ve istenmeyen bölümleri atla
+                if not satir or satir.startswith('#') or mevcut_bolum not in istenen_bolumler:
                     continue
                 
-                # Bölüme göre veri işle
-                if mevcut_bolum == 'DRONLAR':
-                    parcalar = satir.split(',')
-                    dron = Drone(
-                        id=int(parcalar[0]),
-                        maksimum_agirlik=float(parcalar[1]),
-                        batarya=int(parcalar[2]),
-                        hiz=float(parcalar[3]),
-                        baslangic_poz=(float(parcalar[4]), float(parcalar[5]))
-                    )
-                    dronlar.append(dron)
+                nesne = SATIR_COZUCULERI[mevcut_bolum](satir.split(','))
                 
-                elif mevcut_bolum == 'TESLIMAT_NOKTALARI':
-                    parcalar = satir.split(',')
-                    
-                    # Zaman aralığını parse et
-                    baslangic_zaman_parcalari = parcalar[5].split(':')
-                    bitis_zaman_parcalari = parcalar[6].split(':')
-                    
-                    zaman_araligi = (
-                        time(int(baslangic_zaman_parcalari[0]), int(baslangic_zaman_parcalari[1])),
-                        time(int(bitis_zaman_parcalari[0]), int(bitis_zaman_parcalari[1]))
-                    )
-                    
-                    nokta = TeslimatNoktasi(
-                        id=int(parcalar[0]),
-                        poz=(float(parcalar[1]), float(parcalar[2])),
-                        agirlik=float(parcalar[3]),
-                        oncelik=int(parcalar[4]),
-                        zaman_araligi=zaman_araligi
-                    )
-                    teslimat_noktalari.append(nokta)
+                if mevcut_bolum == 'TESLIMAT_NOKTALARI':
+                    if sinir_kutusu is not None and not (
+                        sinir_kutusu[0] <= nesne.poz[0] <= sinir_kutusu[2] and
+                        sinir_kutusu[1] <= nesne.poz[1] <= sinir_kutusu[3]
+                    ):
+                        continue
+                    if zaman_araligi is not None and not _araliklar_kesisiyor_mu(nesne.zaman_araligi, zaman_araligi):
+                        continue
                 
                 elif mevcut_bolum == 'UCUS_YASAK_BOLGELERI':
-                    parcalar = satir.split(',')
-                    
-                    # Zaman aralığını parse et
-                    baslangic_zaman_parcalari = parcalar[1].split(':')
-                    bitis_zaman_parcalari = parcalar[2].split(':')
-                    
-                    aktif_zaman = (
-                        time(int(baslangic_zaman_parcalari[0]), int(baslangic_zaman_parcalari[1])),
-                        time(int(bitis_zaman_parcalari[0]), int(bitis_zaman_parcalari[1]))
-                    )
-                    
-                    # Koordinatları parse et
-                    kose_sayisi = int(parcalar[3])
-                    koordinat_str = ','.join(parcalar[4:])
-                    koordinat_parcalari = koordinat_str.split(';')
-                    
-                    koordinatlar = []
-                    for i in range(kose_sayisi):
-                        koordinat_parcalari_i = koordinat_parcalari[i].split(',')
-                        koordinatlar.append((float(koordinat_parcalari_i[0]), float(koordinat_parcalari_i[1])))
-                    
-                    bolge = UcusYasakBolgesi(
-                        id=int(parcalar[0]),
-                        koordinatlar=koordinatlar,
-                        aktif_zaman=aktif_zaman
-                    )
-                    ucus_yasak_bolgeleri.append(bolge)
+                    if zaman_araligi is not None and not _araliklar_kesisiyor_mu(nesne.aktif_zaman, zaman_araligi):
+                        continue
+                    if sinir_kutusu is not None:
+                        xler = [x for x, _ in nesne.koordinatlar]
+                        yler = [y for _, y in nesne.koordinatlar]
+                        if (max(xler) < sinir_kutusu[0] or min(xler) > sinir_kutusu[2] or
+                                max(yler) < sinir_kutusu[1] or min(yler) > sinir_kutusu[3]):
+                            continue
+                
+                yield mevcut_bolum, nesne
+    
+    def senaryoyu_dosyadan_yukle(
+        self, 
+        dosya_adi: str,
+        zaman_araligi: Optional[Tuple[time, time]] = None,
+        sinir_kutusu: Optional[Tuple[float, float, float, float]] = None
+    ) -> Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]:
+        """
+        Senaryoyu dosyadan yükler.
         
-        return dronlar, teslimat_noktalari, ucus_yasak_bolgeleri
+        Args:
+            dosya_adi (str): Dosya adı
+            zaman_araligi (Optional[Tuple[time, time]]): Teslimat ve bölge zaman filtresi
+                                                         (bkz. senaryoyu_akis_ile_oku)
+            sinir_kutusu (Optional[Tuple[float, float, float, float]]): Teslimat ve bölge konum filtresi
+            
+        Returns:
+            Tuple[List[Drone], List[TeslimatNoktasi], List[UcusYasakBolgesi]]: Yüklenen senaryo
+        """
+        senaryo = {bolum: [] for bolum in SENARYO_BOLUMLERI}
+        for bolum, nesne in self.senaryoyu_akis_ile_oku(
+            dosya_adi, zaman_araligi=zaman_araligi, sinir_kutusu=sinir_kutusu
+        ):
+            senaryo[bolum].append(nesne)
+        
+        return tuple(senaryo[bolum] for bolum in SENARYO_BOLUMLERI)
+    
+    def senaryoyu_paralel_yukle(
+        self, 
+        dosya_adi: str, 
+        isci_sayisi: Optional[int] = None,
+        parca_boyutu: int = 64 * 2**20
+    ) -> KolonluSenaryo:
+        """
+        Metin senaryo dosyasını, teslimat bölümünü parçalara bölüp paralel ayrıştırarak yükler.
+        
+        Bölüm sınırları dosya bellek eşlenerek bulunur. TESLIMAT_NOKTALARI bölümü satır
+        sınırlarına hizalanmış yaklaşık parca_boyutu baytlık aralıklara bölünür; her
+        aralık bir işçi süreçte doğrudan kolon dizilerine ayrıştırılır ve diziler dosya
+        sırasıyla birleştirilir. Küçük DRONLAR ve UCUS_YASAK_BOLGELERI bölümleri ana
+        süreçte okunur. Model nesneleri oluşturulmaz; sonuç senaryoyu_akis_ile_oku ile
+        okunan senaryoyla aynı kolonları verir. Satır ve bayt hızı self.yukleme_istatistikleri
+        içine yazılır. Sıkıştırılmış dosyalar bayt aralıklarına bölünemediğinden desteklenmez.
+        
+        Args:
+            dosya_adi (str): Dosya adı
+            isci_sayisi (Optional[int]): İşçi süreç sayısı (None ise işlemci sayısı; 1 ise
+                                         ayrıştırma ana süreçte yapılır)
+            parca_boyutu (int): Hedef parça boyutu (bayt)
+            
+        Returns:
+            KolonluSenaryo: Yüklenen senaryo
+        """
+        if parca_boyutu <= 0:
+            raise ValueError("Parça boyutu pozitif olmalıdır.")
+        if sikistirma_uzantisi(dosya_adi) is not None:
+            raise ValueError(f"Sıkıştırılmış dosyalar bayt aralıklarına bölünemez: {dosya_adi}")
+        isci_sayisi = isci_sayisi or os.cpu_count() or 1
+        baslangic_zamani = zaman_modulu.perf_counter()
+        
+        # Bölüm aralıklarını bul; teslimat bölümünü satır sınırlarında parçala
+        with open(dosya_adi, 'rb') as f:
+            dosya_boyutu = os.fstat(f.fileno()).st_size
+            # Boş dosya bellek eşlenemez
+            with (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if dosya_boyutu else nullcontext(b"")) as veri:
+                araliklar = _bolum_bayt_araliklari(veri)
+                kucuk_bolumler = {
+                    bolum: veri[araliklar[bolum][0]:araliklar[bolum][1]].decode("utf-8", METIN_KODLAMA_HATALARI) if bolum in araliklar else ""
+                    for bolum in ("DRONLAR", "UCUS_YASAK_BOLGELERI")
+                }
+                
+                parcalar = []
+                if "TESLIMAT_NOKTALARI" in araliklar:
+                    konum, bolum_sonu = araliklar["TESLIMAT_NOKTALARI"]
+                    while konum < bolum_sonu:
+                        parca_sonu = min(konum + parca_boyutu, bolum_sonu)
+                        if parca_sonu < bolum_sonu:
+                            satir_sonu = veri.find(b"\n", parca_sonu - 1, bolum_sonu)
+                            parca_sonu = bolum_sonu if satir_sonu < 0 else satir_sonu + 1
+                        parcalar.append((konum, parca_sonu))
+                        konum = parca_sonu
+        
+        nesneler = {}
+        for bolum, metin in kucuk_bolumler.items():
+            nesneler[bolum] = [
+                SATIR_COZUCULERI[bolum](satir.split(','))
+                for satir in (satir.strip() for satir in metin.splitlines())
+                if satir and not satir.startswith('#')
+            ]
+        
+        # Teslimat parçalarını ayrıştır (tek işçide süreç havuzu kurulmaz)
+        if isci_sayisi == 1 or len(parcalar) <= 1:
+            teslimat_parcalari = [_teslimat_parcasini_coz(dosya_adi, *parca) for parca in parcalar]
+        else:
+            with ProcessPoolExecutor(max_workers=min(isci_sayisi, len(parcalar))) as havuz:
+                teslimat_parcalari = list(havuz.map(
+                    _teslimat_parcasini_coz, itertools.repeat(dosya_adi), *zip(*parcalar)
+                ))
+        
+        diziler = KolonluSenaryo.nesnelerden_olustur(
+            nesneler["DRONLAR"], [], nesneler["UCUS_YASAK_BOLGELERI"]
+        ).diziler
+        if teslimat_parcalari:
+            for kolon in teslimat_parcalari[0]:
+                diziler[kolon] = np.concatenate([parca[kolon] for parca in teslimat_parcalari])
+        kolonlu_senaryo = KolonluSenaryo(diziler)
+        
+        sure = zaman_modulu.perf_counter() - baslangic_zamani
+        self.yukleme_istatistikleri = {
+            "teslimat_sayisi": kolonlu_senaryo.teslimat_sayisi,
+            "parca_sayisi": len(parcalar),
+            "isci_sayisi": isci_sayisi,
+            "sure": sure,
+            "satir_hizi": kolonlu_senaryo.teslimat_sayisi / sure if sure > 0 else float("inf"),
+            "bayt_hizi": dosya_boyutu / sure if sure > 0 else float("inf")
+        }
+        
+        return kolonlu_senaryo
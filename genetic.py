@@ -3,12 +3,19 @@ Drone Filo Optimizasyonu: Genetik Algoritma Modülü
 Bu modül, drone teslimat rotalarının optimizasyonu için Genetik Algoritma uygular.
 """
 
+import os
+import json
 import random
 import copy
-from typing import List, Dict, Tuple, Set, Optional, Callable
+import time as zaman_modulu
+from typing import List, Dict, Tuple, Set, Optional, Callable, Iterator
 from datetime import time
 
-from models import Drone, TeslimatNoktasi, UcusYasakBolgesi
+import numpy as np
+
+from models import Drone, TeslimatNoktasi, UcusYasakBolgesi, KimlikKaydi
+from csp import KisitCozucu
+from data_generator import dosya_ac
 
 
 class Birey:
@@ -28,12 +35,53 @@ class Birey:
         return self.uygunluk > other.uygunluk  # Yüksek uygunluk değeri daha iyidir
 
 
+class JsonlTelemetriYazici:
+    """
+    Nesil telemetri kayıtlarını JSONL dosyasına satır satır yazan geri çağırma sınıfı.
+    
+    Her kayıt yazıldıktan sonra dosya boşaltılır; böylece izleme araçları çalışma
+    sürerken dosyayı okuyabilir.
+    """
+    def __init__(self, dosya_adi: str):
+        """
+        Args:
+            dosya_adi (str): Kayıtların ekleneceği JSONL dosyası (.gz/.bz2/.xz ile sıkıştırılır)
+        """
+        self.dosya = dosya_ac(dosya_adi, 'a')
+    
+    def __call__(self, kayit: Dict[str, float]):
+        """Bir telemetri kaydını dosyaya yazar."""
+        self.dosya.write(json.dumps(kayit) + "\n")
+        self.dosya.flush()
+    
+    def kapat(self):
+        """Dosyayı kapatır."""
+        self.dosya.close()
+    
+    def __enter__(self) -> 'JsonlTelemetriYazici':
+        return self
+    
+    def __exit__(self, *args):
+        self.kapat()
+
+
 class GenetikAlgoritma:
     """
     Genetik Algoritma sınıfı.
     
     Bu sınıf, drone teslimat rotalarının optimizasyonu için Genetik Algoritma uygular.
     """
+    # Uygunluk önbelleği bu boyuta ulaşınca temizlenir
+    UYGUNLUK_ONBELLEGI_SINIRI = 100000
+    
+    # Uyarlanabilir operatör seçimi parametreleri
+    OPERATOR_GRUPLARI = {
+        "caprazlama": ["tek_nokta", "rota_degisimi"],
+        "mutasyon": ["tasima", "takas", "yerel_arama"]
+    }
+    OPERATOR_MIN_OLASILIGI = 0.1
+    OPERATOR_OGRENME_ORANI = 0.2
+    
     def __init__(
         self, 
         dronlar: List[Drone], 
@@ -43,7 +91,13 @@ class GenetikAlgoritma:
         populasyon_boyutu: int = 50,
         nesil_sayisi: int = 100,
         caprazlama_orani: float = 0.8,
-        mutasyon_orani: float = 0.2
+        mutasyon_orani: float = 0.2,
+        tohum: Optional[int] = None,
+        sicak_baslangic: bool = False,
+        sicak_baslangic_orani: float = 0.5,
+        kontrol_noktasi_dosyasi: Optional[str] = None,
+        kontrol_noktasi_araligi: int = 10,
+        uyarlanabilir_operatorler: bool = False
     ):
         """
         Args:
@@ -55,6 +109,19 @@ class GenetikAlgoritma:
             nesil_sayisi (int): Maksimum nesil sayısı
             caprazlama_orani (float): Çaprazlama oranı
             mutasyon_orani (float): Mutasyon oranı
+            tohum (Optional[int]): Rastgele sayı üreteçleri için tohum değeri (None ise
+                                   Python üreteci küresel random modülünden tohumlanır)
+            sicak_baslangic (bool): Başlangıç popülasyonunu CSP ve en yakın komşu
+                                    çözümleriyle tohumla
+            sicak_baslangic_orani (float): Sıcak başlangıçta tohumlanan bireylerin
+                                           popülasyona oranı (kalanı rastgele üretilir)
+            kontrol_noktasi_dosyasi (Optional[str]): Algoritma durumunun periyodik olarak
+                                                     kaydedileceği dosya (None ise kaydedilmez)
+            kontrol_noktasi_araligi (int): Kaç nesilde bir kontrol noktası kaydedileceği
+            uyarlanabilir_operatorler (bool): Çaprazlama ve mutasyon operatörlerini CPU saniyesi
+                                              başına sağladıkları iyileşmeye göre seç (seçim
+                                              ölçülen sürelere bağlı olduğundan aynı tohumla
+                                              sonuçlar birebir tekrarlanmayabilir)
         """
         self.dronlar = dronlar
         self.teslimat_noktalari = teslimat_noktalari
@@ -65,22 +132,51 @@ class GenetikAlgoritma:
         self.nesil_sayisi = nesil_sayisi
         self.caprazlama_orani = caprazlama_orani
         self.mutasyon_orani = mutasyon_orani
+        self.sicak_baslangic = sicak_baslangic
+        self.sicak_baslangic_orani = sicak_baslangic_orani
+        self.kontrol_noktasi_dosyasi = kontrol_noktasi_dosyasi
+        self.kontrol_noktasi_araligi = max(1, kontrol_noktasi_araligi)
+        self.uyarlanabilir_operatorler = uyarlanabilir_operatorler
+        
+        # Toplu seçim işlemleri için NumPy, başlatma/çaprazlama/mutasyon için Python rastgele
+        # sayı üreteci; aynı tohumla çalıştırmalar küresel random durumundan bağımsız tekrarlanır
+        self.rng = np.random.default_rng(tohum)
+        self.rastgele = random.Random(tohum if tohum is not None else random.getrandbits(64))
         
         # Aktif uçuşa yasak bölgeleri filtrele
         self.aktif_ucus_yasak_bolgeleri = [
             bolge for bolge in ucus_yasak_bolgeleri if bolge.aktif_mi(mevcut_zaman)
         ]
         
-        # Drone ve teslimat noktalarının ID'lerini al
-        self.dron_idleri = [dron.id for dron in dronlar]
-        self.teslimat_idleri = [nokta.id for nokta in teslimat_noktalari]
+        # Drone ve teslimat noktalarını ID'lerine göre eşle; teslimatların yoğun
+        # indeksleri kromozom matrisindeki sütun indeksleridir
+        self.dron_kaydi = KimlikKaydi(dronlar)
+        self.teslimat_kaydi = KimlikKaydi(teslimat_noktalari)
+        self.dron_idleri = self.dron_kaydi.idler
+        self.teslimat_idleri = self.teslimat_kaydi.idler
+        self.teslimat_indeksleri = self.teslimat_kaydi.indeksler
         
-        # Drone ve teslimat noktalarını ID'lerine göre eşle
-        self.dron_sozlugu = {dron.id: dron for dron in dronlar}
-        self.teslimat_sozlugu = {nokta.id: nokta for nokta in teslimat_noktalari}
+        # Popülasyon NumPy dizileri olarak saklanır:
+        # kromozom_matrisi (populasyon_boyutu × teslimat sayısı) ve uygunluklar vektörü.
+        # Operatörler satırları sözlük kromozomlara çözerek uygular (bkz. _nesil_olustur)
+        self.kromozom_matrisi: Optional[np.ndarray] = None
+        self.uygunluklar: Optional[np.ndarray] = None
         
         # En iyi bireyi sakla
         self.en_iyi_birey: Optional[Birey] = None
+        self.en_iyi_satir: Optional[np.ndarray] = None
+        
+        # Tamamlanan nesil sayısı
+        self.nesil = 0
+        
+        # Uygunluk önbelleği ve telemetri sayaçları
+        self._uygunluk_onbellegi: Dict[Tuple[Tuple[int, ...], ...], float] = {}
+        self.degerlendirme_sayisi = 0
+        self.onbellek_isabeti = 0
+        self._baslangic_ani = 0.0
+        
+        # Operatör bazlı profil ve kredi tablosu
+        self._operator_istatistiklerini_sifirla()
     
     def _mesafe_hesapla(self, poz1: Tuple[float, float], poz2: Tuple[float, float]) -> float:
         """İki nokta arasındaki Öklid mesafesini hesaplar."""
@@ -129,7 +225,7 @@ class GenetikAlgoritma:
         mevcut_poz = dron.baslangic_poz
         
         for teslimat_id in rota:
-            teslimat = self.teslimat_sozlugu[teslimat_id]
+            teslimat = self.teslimat_kaydi[teslimat_id]
             mesafe = self._mesafe_hesapla(mevcut_poz, teslimat.poz)
             enerji = dron.enerji_tuketimi_hesapla(mesafe, teslimat.agirlik)
             toplam_enerji += enerji
@@ -160,7 +256,7 @@ class GenetikAlgoritma:
         mevcut_batarya = dron.batarya
         
         for teslimat_id in rota:
-            teslimat = self.teslimat_sozlugu[teslimat_id]
+            teslimat = self.teslimat_kaydi[teslimat_id]
             
             # Taşıma kapasitesi kontrolü
             if teslimat.agirlik > dron.maksimum_agirlik:
@@ -194,73 +290,319 @@ class GenetikAlgoritma:
         Returns:
             float: Uygunluk değeri
         """
+        # Aynı kromozom daha önce değerlendirildiyse önbellekten döndür
+        anahtar = tuple(tuple(birey.kromozom[dron_id]) for dron_id in self.dron_idleri)
+        if anahtar in self._uygunluk_onbellegi:
+            self.onbellek_isabeti += 1
+            return self._uygunluk_onbellegi[anahtar]
+        
         toplam_teslimatlar = 0
         toplam_enerji = 0.0
         toplam_ihlaller = 0
         
         for dron_id, rota in birey.kromozom.items():
-            dron = self.dron_sozlugu[dron_id]
+            dron = self.dron_kaydi[dron_id]
             toplam_teslimatlar += len(rota)
             toplam_enerji += self._rota_enerji_hesapla(dron, rota)
             toplam_ihlaller += self._kural_ihlallerini_say(dron, rota)
         
         uygunluk = (toplam_teslimatlar * 100) - (toplam_enerji * 0.5) - (toplam_ihlaller * 2000)
+        
+        self.degerlendirme_sayisi += 1
+        if len(self._uygunluk_onbellegi) >= self.UYGUNLUK_ONBELLEGI_SINIRI:
+            self._uygunluk_onbellegi.clear()
+        self._uygunluk_onbellegi[anahtar] = uygunluk
+        
         return uygunluk
     
-    def _populasyonu_baslat(self) -> List[Birey]:
+    def _kromozomu_kodla(self, kromozom: Dict[int, List[int]]) -> np.ndarray:
+        """
+        Sözlük biçimindeki kromozomu matris satırına dönüştürür.
+        
+        Satırın j. sütunu j. teslimatın değerini tutar:
+        değer = drone indeksi × teslimat sayısı + rota içindeki sıra
+        
+        Args:
+            kromozom (Dict[int, List[int]]): Her drone için teslimat ID'lerinin sıralı listesi
+            
+        Returns:
+            np.ndarray: Kodlanmış kromozom satırı
+        """
+        n = max(len(self.teslimat_idleri), 1)
+        satir = np.zeros(len(self.teslimat_idleri), dtype=np.int64)
+        
+        for dron_indeksi, dron_id in enumerate(self.dron_idleri):
+            for sira, teslimat_id in enumerate(kromozom[dron_id]):
+                satir[self.teslimat_indeksleri[teslimat_id]] = dron_indeksi * n + sira
+        
+        return satir
+    
+    def _kromozomu_coz(self, satir: np.ndarray) -> Dict[int, List[int]]:
+        """
+        Matris satırını sözlük biçimindeki kromozoma dönüştürür.
+        
+        Args:
+            satir (np.ndarray): Kodlanmış kromozom satırı
+            
+        Returns:
+            Dict[int, List[int]]: Her drone için teslimat ID'lerinin sıralı listesi
+        """
+        n = max(len(self.teslimat_idleri), 1)
+        kromozom = {dron_id: [] for dron_id in self.dron_idleri}
+        
+        # Değere göre sıralama hem drone gruplamasını hem rota sırasını verir
+        for sutun in np.argsort(satir, kind='stable'):
+            kromozom[self.dron_idleri[satir[sutun] // n]].append(self.teslimat_idleri[sutun])
+        
+        return kromozom
+    
+    def _populasyonu_baslat(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Başlangıç popülasyonunu oluşturur.
         
         Returns:
-            List[Birey]: Başlangıç popülasyonu
+            Tuple[np.ndarray, np.ndarray]: Kromozom matrisi ve uygunluk vektörü
+        """
+        kromozom_matrisi = np.zeros(
+            (self.populasyon_boyutu, len(self.teslimat_idleri)), dtype=np.int64
+        )
+        uygunluklar = np.zeros(self.populasyon_boyutu, dtype=np.float64)
+        
+        # Sıcak başlangıç: CSP ve en yakın komşu çözümleri ile bunların tedirginleştirilmiş kopyaları
+        tohum_kromozomlari = self._tohum_kromozomlarini_olustur() if self.sicak_baslangic else []
+        tohumlu_birey_sayisi = (
+            int(round(self.populasyon_boyutu * self.sicak_baslangic_orani)) if tohum_kromozomlari else 0
+        )
+        
+        for i in range(self.populasyon_boyutu):
+            if i < tohumlu_birey_sayisi:
+                temel = tohum_kromozomlari[i % len(tohum_kromozomlari)]
+                kromozom = {dron_id: rota.copy() for dron_id, rota in temel.items()}
+                
+                # Tohumların kendisi bir kez aynen, sonraki kopyaları tedirginleştirilerek eklenir
+                if i >= len(tohum_kromozomlari):
+                    for _ in range(self.rastgele.randint(1, max(1, len(self.teslimat_idleri) // 10))):
+                        self._mutasyon_uygula(kromozom)
+            else:
+                kromozom = self._rastgele_kromozom_olustur()
+            
+            kromozom_matrisi[i] = self._kromozomu_kodla(kromozom)
+            uygunluklar[i] = self._uygunluk_hesapla(Birey(kromozom))
+        
+        return kromozom_matrisi, uygunluklar
+    
+    def _rastgele_kromozom_olustur(self) -> Dict[int, List[int]]:
+        """
+        Teslimatları rastgele drone'lara ve rastgele sırayla atayan bir kromozom oluşturur.
+        
+        Returns:
+            Dict[int, List[int]]: Rastgele kromozom
+        """
+        kromozom = {dron_id: [] for dron_id in self.dron_idleri}
+        
+        # Teslimat noktalarını rastgele drone'lara ata
+        teslimat_idleri = self.teslimat_idleri.copy()
+        self.rastgele.shuffle(teslimat_idleri)
+        
+        for teslimat_id in teslimat_idleri:
+            # Rastgele bir drone seç
+            dron_id = self.rastgele.choice(self.dron_idleri)
+            kromozom[dron_id].append(teslimat_id)
+        
+        # Her drone için teslimat sırasını rastgele karıştır
+        for dron_id in self.dron_idleri:
+            self.rastgele.shuffle(kromozom[dron_id])
+        
+        return kromozom
+    
+    def _tohum_kromozomlarini_olustur(self) -> List[Dict[int, List[int]]]:
+        """
+        Sıcak başlangıç için tohum kromozomlarını oluşturur.
+        
+        CSP çözücünün ataması (atanamayan teslimatlar en yakın komşu ile tamamlanarak)
+        ve saf en yakın komşu çözümü üretilir.
+        
+        CSP rotaları depoya dönüş ve şarj içeren seferlerden oluşur; GA ise her drone
+        için dönüşsüz tek bir rota modeller. Bu yüzden CSP'den yalnızca her drone'un ilk
+        seferi, 2-opt ile kısaltılıp GA modelinde ihlal üretmeyen en uzun baş kısmıyla
+        alınır. Tamamlanan tohum saf en yakın komşu çözümünden fazla ihlal içeriyorsa
+        (örn. ağır teslimatları taşıyabilen tek drone'un bataryası ilk seferde
+        tükeniyorsa) CSP baş kısımları yarıya indirilerek yeniden tamamlanır.
+        
+        Returns:
+            List[Dict[int, List[int]]]: Tohum kromozomlarının listesi
         """
-        populasyon = []
+        kisit_cozucu = KisitCozucu(
+            self.dronlar, self.teslimat_noktalari, self.ucus_yasak_bolgeleri, self.mevcut_zaman
+        )
+        kisit_cozucu.coz()
+        
+        kisit_kromozomu = {}
+        for dron_id in self.dron_idleri:
+            seferler = kisit_cozucu.seferler.get(dron_id, [])
+            rota = list(seferler[0].teslimatlar) if seferler else []
+            self._rotayi_kisalt(dron_id, rota)
+            
+            # Zaman penceresine göre açılan bölgeler gibi GA'nın modellemediği durumlar
+            # ihlal sayılabilir; ilk ihlalden itibaren rota en yakın komşu ile tamamlanır
+            dron = self.dron_kaydi[dron_id]
+            uzunluk = 0
+            while uzunluk < len(rota) and self._kural_ihlallerini_say(dron, rota[:uzunluk + 1]) == 0:
+                uzunluk += 1
+            kisit_kromozomu[dron_id] = rota[:uzunluk]
         
-        for _ in range(self.populasyon_boyutu):
-            # Rastgele bir birey oluştur
+        en_yakin_komsu_kromozomu = self._en_yakin_komsu_kromozomu_olustur()
+        hedef_ihlal = self._kromozom_ihlallerini_say(en_yakin_komsu_kromozomu)
+        
+        while True:
+            kisit_tohumu = self._en_yakin_komsu_kromozomu_olustur(
+                {dron_id: rota.copy() for dron_id, rota in kisit_kromozomu.items()}
+            )
+            if (self._kromozom_ihlallerini_say(kisit_tohumu) <= hedef_ihlal or
+                    not any(kisit_kromozomu.values())):
+                break
+            kisit_kromozomu = {
+                dron_id: rota[:len(rota) // 2] for dron_id, rota in kisit_kromozomu.items()
+            }
+        
+        return [kisit_tohumu, en_yakin_komsu_kromozomu]
+    
+    def _kromozom_ihlallerini_say(self, kromozom: Dict[int, List[int]]) -> int:
+        """
+        Bir kromozomdaki tüm drone rotalarının kural ihlali sayısını toplar.
+        
+        Args:
+            kromozom (Dict[int, List[int]]): Her drone için teslimat ID'lerinin sıralı listesi
+            
+        Returns:
+            int: Toplam kural ihlali sayısı
+        """
+        return sum(
+            self._kural_ihlallerini_say(self.dron_kaydi[dron_id], rota)
+            for dron_id, rota in kromozom.items()
+        )
+    
+    def _en_yakin_komsu_kromozomu_olustur(
+        self, 
+        kromozom: Optional[Dict[int, List[int]]] = None
+    ) -> Dict[int, List[int]]:
+        """
+        En yakın komşu sezgiseli ile kromozom oluşturur.
+        
+        Her adımda, taşıma kapasitesi, batarya ve uçuş yasağı kısıtlarını sağlayan en
+        kısa (drone, teslimat) ataması yapılır. Kısmi bir kromozom verilirse, mevcut
+        rotaların sonundan devam edilerek atanmamış teslimatlarla tamamlanır.
+        
+        Args:
+            kromozom (Optional[Dict[int, List[int]]]): Tamamlanacak kısmi kromozom
+            
+        Returns:
+            Dict[int, List[int]]: Tüm teslimatları içeren kromozom
+        """
+        if kromozom is None:
             kromozom = {dron_id: [] for dron_id in self.dron_idleri}
+        
+        # Her drone'un rota sonundaki pozisyonunu ve kalan bataryasını hesapla
+        pozisyonlar = {}
+        bataryalar = {}
+        for dron_id in self.dron_idleri:
+            dron = self.dron_kaydi[dron_id]
+            pozisyonlar[dron_id] = dron.baslangic_poz
+            bataryalar[dron_id] = dron.batarya - self._rota_enerji_hesapla(dron, kromozom[dron_id])
+            if kromozom[dron_id]:
+                pozisyonlar[dron_id] = self.teslimat_kaydi[kromozom[dron_id][-1]].poz
+        
+        atanmis = {teslimat_id for rota in kromozom.values() for teslimat_id in rota}
+        kalan = [teslimat_id for teslimat_id in self.teslimat_idleri if teslimat_id not in atanmis]
+        
+        while kalan:
+            en_iyi_atama = None
+            en_iyi_mesafe = float('inf')
             
-            # Teslimat noktalarını rastgele drone'lara ata
-            teslimat_idleri = self.teslimat_idleri.copy()
-            random.shuffle(teslimat_idleri)
+            for dron_id in self.dron_idleri:
+                dron = self.dron_kaydi[dron_id]
+                
+                for teslimat_id in kalan:
+                    teslimat = self.teslimat_kaydi[teslimat_id]
+                    
+                    if teslimat.agirlik > dron.maksimum_agirlik:
+                        continue
+                    
+                    mesafe = self._mesafe_hesapla(pozisyonlar[dron_id], teslimat.poz)
+                    if mesafe >= en_iyi_mesafe:
+                        continue
+                    
+                    if dron.enerji_tuketimi_hesapla(mesafe, teslimat.agirlik) > bataryalar[dron_id]:
+                        continue
+                    
+                    if not self._yol_gecerli_mi(pozisyonlar[dron_id], teslimat.poz):
+                        continue
+                    
+                    en_iyi_atama = (dron_id, teslimat_id)
+                    en_iyi_mesafe = mesafe
             
-            for teslimat_id in teslimat_idleri:
-                # Rastgele bir drone seç
-                dron_id = random.choice(self.dron_idleri)
-                kromozom[dron_id].append(teslimat_id)
+            if en_iyi_atama is None:
+                break
             
-            # Her drone için teslimat sırasını rastgele karıştır
+            dron_id, teslimat_id = en_iyi_atama
+            dron = self.dron_kaydi[dron_id]
+            teslimat = self.teslimat_kaydi[teslimat_id]
+            
+            kromozom[dron_id].append(teslimat_id)
+            bataryalar[dron_id] -= dron.enerji_tuketimi_hesapla(en_iyi_mesafe, teslimat.agirlik)
+            pozisyonlar[dron_id] = teslimat.poz
+            kalan.remove(teslimat_id)
+        
+        # Hiçbir drone'un uygun şekilde yapamadığı teslimatlar da kromozomda yer almalıdır;
+        # her biri en az ihlal ekleyeceği drone'lardan rastgele birine eklenir
+        for teslimat_id in kalan:
+            teslimat = self.teslimat_kaydi[teslimat_id]
+            ek_ihlaller = {}
             for dron_id in self.dron_idleri:
-                random.shuffle(kromozom[dron_id])
+                dron = self.dron_kaydi[dron_id]
+                mesafe = self._mesafe_hesapla(pozisyonlar[dron_id], teslimat.poz)
+                ek_ihlaller[dron_id] = (
+                    (teslimat.agirlik > dron.maksimum_agirlik)
+                    + (not self._yol_gecerli_mi(pozisyonlar[dron_id], teslimat.poz))
+                    + (dron.enerji_tuketimi_hesapla(mesafe, teslimat.agirlik) > bataryalar[dron_id])
+                )
+            en_az = min(ek_ihlaller.values())
+            dron_id = self.rastgele.choice([
+                dron_id for dron_id in self.dron_idleri if ek_ihlaller[dron_id] == en_az
+            ])
             
-            birey = Birey(kromozom)
-            birey.uygunluk = self._uygunluk_hesapla(birey)
-            populasyon.append(birey)
+            dron = self.dron_kaydi[dron_id]
+            mesafe = self._mesafe_hesapla(pozisyonlar[dron_id], teslimat.poz)
+            kromozom[dron_id].append(teslimat_id)
+            bataryalar[dron_id] -= dron.enerji_tuketimi_hesapla(mesafe, teslimat.agirlik)
+            pozisyonlar[dron_id] = teslimat.poz
         
-        return populasyon
+        return kromozom
     
-    def _ebeveynleri_sec(self, populasyon: List[Birey]) -> Tuple[Birey, Birey]:
+    def _ebeveynleri_sec(self, uygunluklar: np.ndarray, cift_sayisi: int) -> np.ndarray:
         """
-        Turnuva seçimi ile ebeveynleri seçer.
+        Turnuva seçimi ile bir nesildeki tüm ebeveyn çiftlerini tek seferde seçer.
         
         Args:
-            populasyon (List[Birey]): Popülasyon
+            uygunluklar (np.ndarray): Popülasyonun uygunluk vektörü
+            cift_sayisi (int): Seçilecek ebeveyn çifti sayısı
             
         Returns:
-            Tuple[Birey, Birey]: Seçilen ebeveynler
+            np.ndarray: (cift_sayisi, 2) boyutunda ebeveyn indeksleri matrisi
         """
+        populasyon_boyutu = len(uygunluklar)
+        
         # Turnuva büyüklüğü
-        turnuva_boyutu = max(2, len(populasyon) // 5)
+        turnuva_boyutu = min(max(2, populasyon_boyutu // 5), populasyon_boyutu)
         
-        # İlk ebeveyn için turnuva
-        turnuva1 = random.sample(populasyon, turnuva_boyutu)
-        ebeveyn1 = max(turnuva1, key=lambda ind: ind.uygunluk)
+        # Her turnuva için katılımcılar (yerine koyarak); nesil başına O(P·k) rastgele sayı
+        katilimcilar = self.rng.integers(0, populasyon_boyutu, size=(cift_sayisi * 2, turnuva_boyutu))
         
-        # İkinci ebeveyn için turnuva
-        turnuva2 = random.sample(populasyon, turnuva_boyutu)
-        ebeveyn2 = max(turnuva2, key=lambda ind: ind.uygunluk)
+        # Her turnuvanın kazananı: katılımcılar arasında en yüksek uygunluk
+        kazanan_sutunlari = np.argmax(uygunluklar[katilimcilar], axis=1)
+        kazananlar = katilimcilar[np.arange(cift_sayisi * 2), kazanan_sutunlari]
         
-        return ebeveyn1, ebeveyn2
+        return kazananlar.reshape(cift_sayisi, 2)
     
     def _caprazla(
         self, 
@@ -277,9 +619,50 @@ class GenetikAlgoritma:
         Returns:
             Tuple[Birey, Birey]: Oluşan çocuklar
         """
-        if random.random() > self.caprazlama_orani:
+        if self.rastgele.random() > self.caprazlama_orani:
             return copy.deepcopy(ebeveyn1), copy.deepcopy(ebeveyn2)
         
+        operator = self._operator_sec("caprazlama")
+        baslangic = zaman_modulu.process_time()
+        
+        if operator == "rota_degisimi":
+            cocuk1_kromozom, cocuk2_kromozom = self._rota_degisimi_caprazlamasi(ebeveyn1, ebeveyn2)
+        else:
+            cocuk1_kromozom, cocuk2_kromozom = self._tek_nokta_caprazlamasi(ebeveyn1, ebeveyn2)
+        
+        # Teslimat noktalarının tekrarlanmadığından emin ol
+        self._kromozomu_duzelt(cocuk1_kromozom)
+        self._kromozomu_duzelt(cocuk2_kromozom)
+        
+        cocuk1 = Birey(cocuk1_kromozom)
+        cocuk2 = Birey(cocuk2_kromozom)
+        
+        cocuk1.uygunluk = self._uygunluk_hesapla(cocuk1)
+        cocuk2.uygunluk = self._uygunluk_hesapla(cocuk2)
+        
+        self._operator_kredisini_guncelle(
+            operator,
+            max(cocuk1.uygunluk, cocuk2.uygunluk) - max(ebeveyn1.uygunluk, ebeveyn2.uygunluk),
+            zaman_modulu.process_time() - baslangic
+        )
+        
+        return cocuk1, cocuk2
+    
+    def _tek_nokta_caprazlamasi(
+        self, 
+        ebeveyn1: Birey, 
+        ebeveyn2: Birey
+    ) -> Tuple[Dict[int, List[int]], Dict[int, List[int]]]:
+        """
+        Her drone'un rotası için tek noktalı sıralı çaprazlama yapar.
+        
+        Args:
+            ebeveyn1 (Birey): Birinci ebeveyn
+            ebeveyn2 (Birey): İkinci ebeveyn
+            
+        Returns:
+            Tuple[Dict[int, List[int]], Dict[int, List[int]]]: Düzeltilmemiş çocuk kromozomları
+        """
         cocuk1_kromozom = {dron_id: [] for dron_id in self.dron_idleri}
         cocuk2_kromozom = {dron_id: [] for dron_id in self.dron_idleri}
         
@@ -294,7 +677,7 @@ class GenetikAlgoritma:
                 continue
             
             # Çaprazlama noktası seç
-            caprazlama_noktasi = random.randint(1, min(len(rota1), len(rota2)))
+            caprazlama_noktasi = self.rastgele.randint(1, min(len(rota1), len(rota2)))
             
             # Çocukları oluştur
             cocuk1_kromozom[dron_id] = rota1[:caprazlama_noktasi] + [
@@ -305,17 +688,39 @@ class GenetikAlgoritma:
                 gen for gen in rota1 if gen not in rota2[:caprazlama_noktasi]
             ]
         
-        # Teslimat noktalarının tekrarlanmadığından emin ol
-        self._kromozomu_duzelt(cocuk1_kromozom)
-        self._kromozomu_duzelt(cocuk2_kromozom)
+        return cocuk1_kromozom, cocuk2_kromozom
+    
+    def _rota_degisimi_caprazlamasi(
+        self, 
+        ebeveyn1: Birey, 
+        ebeveyn2: Birey
+    ) -> Tuple[Dict[int, List[int]], Dict[int, List[int]]]:
+        """
+        Drone rotalarını bütün olarak değiştiren tekdüze çaprazlama yapar.
         
-        cocuk1 = Birey(cocuk1_kromozom)
-        cocuk2 = Birey(cocuk2_kromozom)
+        Her drone için çocuklardan biri rotayı birinci, diğeri ikinci ebeveynden alır.
         
-        cocuk1.uygunluk = self._uygunluk_hesapla(cocuk1)
-        cocuk2.uygunluk = self._uygunluk_hesapla(cocuk2)
+        Args:
+            ebeveyn1 (Birey): Birinci ebeveyn
+            ebeveyn2 (Birey): İkinci ebeveyn
+            
+        Returns:
+            Tuple[Dict[int, List[int]], Dict[int, List[int]]]: Düzeltilmemiş çocuk kromozomları
+        """
+        cocuk1_kromozom = {}
+        cocuk2_kromozom = {}
         
-        return cocuk1, cocuk2
+        for dron_id in self.dron_idleri:
+            rota1 = ebeveyn1.kromozom[dron_id]
+            rota2 = ebeveyn2.kromozom[dron_id]
+            
+            if self.rastgele.random() < 0.5:
+                rota1, rota2 = rota2, rota1
+            
+            cocuk1_kromozom[dron_id] = rota1.copy()
+            cocuk2_kromozom[dron_id] = rota2.copy()
+        
+        return cocuk1_kromozom, cocuk2_kromozom
     
     def _kromozomu_duzelt(self, kromozom: Dict[int, List[int]]):
         """
@@ -358,7 +763,7 @@ class GenetikAlgoritma:
         
         # Eksik teslimat noktalarını rastgele drone'lara ekle
         for teslimat_id in eksikler:
-            dron_id = random.choice(self.dron_idleri)
+            dron_id = self.rastgele.choice(self.dron_idleri)
             kromozom[dron_id].append(teslimat_id)
     
     def _mutasyon_yap(self, birey: Birey) -> Birey:
@@ -371,95 +776,493 @@ class GenetikAlgoritma:
         Returns:
             Birey: Mutasyon yapılmış birey
         """
-        if random.random() > self.mutasyon_orani:
+        if self.rastgele.random() > self.mutasyon_orani:
             return birey
         
-        mutasyonlu = copy.deepcopy(birey)
-        
-        # Mutasyon tipi: Teslimat noktasını başka bir drone'a taşı
-        if random.random() < 0.5 and len(self.dron_idleri) > 1:
-            # Rastgele bir kaynak drone seç
-            kaynak_dron_id = random.choice(self.dron_idleri)
-            
-            # Kaynak drone'da teslimat varsa
-            if mutasyonlu.kromozom[kaynak_dron_id]:
-                # Rastgele bir teslimat noktası seç
-                teslimat_indeksi = random.randint(0, len(mutasyonlu.kromozom[kaynak_dron_id]) - 1)
-                teslimat_id = mutasyonlu.kromozom[kaynak_dron_id][teslimat_indeksi]
-                
-                # Rastgele bir hedef drone seç (kaynak drone'dan farklı)
-                hedef_dron_id = random.choice([
-                    dron_id for dron_id in self.dron_idleri if dron_id != kaynak_dron_id
-                ])
-                
-                # Teslimat noktasını taşı
-                mutasyonlu.kromozom[kaynak_dron_id].pop(teslimat_indeksi)
-                mutasyonlu.kromozom[hedef_dron_id].append(teslimat_id)
+        operator = self._operator_sec("mutasyon")
+        baslangic = zaman_modulu.process_time()
         
-        # Mutasyon tipi: Teslimat sırasını değiştir
+        mutasyonlu = copy.deepcopy(birey)
+        if operator == "tasima":
+            self._tasima_mutasyonu(mutasyonlu.kromozom)
+        elif operator == "takas":
+            self._takas_mutasyonu(mutasyonlu.kromozom)
         else:
-            # Rastgele bir drone seç
-            dron_id = random.choice(self.dron_idleri)
-            
-            # Drone'da en az 2 teslimat varsa
-            if len(mutasyonlu.kromozom[dron_id]) >= 2:
-                # Rastgele iki indeks seç
-                idx1, idx2 = random.sample(range(len(mutasyonlu.kromozom[dron_id])), 2)
-                
-                # Teslimat noktalarını değiştir
-                mutasyonlu.kromozom[dron_id][idx1], mutasyonlu.kromozom[dron_id][idx2] = (
-                    mutasyonlu.kromozom[dron_id][idx2], mutasyonlu.kromozom[dron_id][idx1]
-                )
+            self._yerel_arama(mutasyonlu.kromozom)
         
         # Uygunluk değerini güncelle
         mutasyonlu.uygunluk = self._uygunluk_hesapla(mutasyonlu)
         
+        self._operator_kredisini_guncelle(
+            operator, mutasyonlu.uygunluk - birey.uygunluk, zaman_modulu.process_time() - baslangic
+        )
+        
         return mutasyonlu
     
-    def evrimles(self) -> Dict[int, List[int]]:
+    def _mutasyon_uygula(self, kromozom: Dict[int, List[int]]):
+        """
+        Kromozom üzerinde yerinde tek bir rastgele taşıma veya takas mutasyonu uygular.
+        
+        Args:
+            kromozom (Dict[int, List[int]]): Mutasyon uygulanacak kromozom
+        """
+        if self.rastgele.random() < 0.5 and len(self.dron_idleri) > 1:
+            self._tasima_mutasyonu(kromozom)
+        else:
+            self._takas_mutasyonu(kromozom)
+    
+    def _tasima_mutasyonu(self, kromozom: Dict[int, List[int]]):
+        """
+        Rastgele bir teslimat noktasını başka bir drone'a taşır.
+        
+        Args:
+            kromozom (Dict[int, List[int]]): Mutasyon uygulanacak kromozom
+        """
+        if len(self.dron_idleri) < 2:
+            return
+        
+        # Rastgele bir kaynak drone seç
+        kaynak_dron_id = self.rastgele.choice(self.dron_idleri)
+        
+        # Kaynak drone'da teslimat varsa
+        if kromozom[kaynak_dron_id]:
+            # Rastgele bir teslimat noktası seç
+            teslimat_indeksi = self.rastgele.randint(0, len(kromozom[kaynak_dron_id]) - 1)
+            teslimat_id = kromozom[kaynak_dron_id][teslimat_indeksi]
+            
+            # Rastgele bir hedef drone seç (kaynak drone'dan farklı)
+            hedef_dron_id = self.rastgele.choice([
+                dron_id for dron_id in self.dron_idleri if dron_id != kaynak_dron_id
+            ])
+            
+            # Teslimat noktasını taşı
+            kromozom[kaynak_dron_id].pop(teslimat_indeksi)
+            kromozom[hedef_dron_id].append(teslimat_id)
+    
+    def _takas_mutasyonu(self, kromozom: Dict[int, List[int]]):
+        """
+        Rastgele bir drone'un rotasındaki iki teslimatın sırasını değiştirir.
+        
+        Args:
+            kromozom (Dict[int, List[int]]): Mutasyon uygulanacak kromozom
+        """
+        # Rastgele bir drone seç
+        dron_id = self.rastgele.choice(self.dron_idleri)
+        
+        # Drone'da en az 2 teslimat varsa
+        if len(kromozom[dron_id]) >= 2:
+            # Rastgele iki indeks seç
+            idx1, idx2 = self.rastgele.sample(range(len(kromozom[dron_id])), 2)
+            
+            # Teslimat noktalarını değiştir
+            kromozom[dron_id][idx1], kromozom[dron_id][idx2] = (
+                kromozom[dron_id][idx2], kromozom[dron_id][idx1]
+            )
+    
+    def _yerel_arama(self, kromozom: Dict[int, List[int]]):
+        """
+        Rastgele bir drone'un rotasına 2-opt yerel araması uygular.
+        
+        Rotanın bir bölümünü ters çevirmek toplam uçuş mesafesini kısalttığı sürece
+        ters çevirme işlemine devam edilir.
+        
+        Args:
+            kromozom (Dict[int, List[int]]): Yerel arama uygulanacak kromozom
+        """
+        adaylar = [dron_id for dron_id in self.dron_idleri if len(kromozom[dron_id]) >= 3]
+        if not adaylar:
+            return
+        
+        dron_id = self.rastgele.choice(adaylar)
+        self._rotayi_kisalt(dron_id, kromozom[dron_id])
+    
+    def _rotayi_kisalt(self, dron_id: int, rota: List[int]):
+        """
+        Bir drone'un rotasını 2-opt ile yerinde kısaltır.
+        
+        Args:
+            dron_id (int): Rotanın ait olduğu drone'un ID'si
+            rota (List[int]): Yerinde yeniden sıralanacak teslimat ID'leri
+        """
+        noktalar = [self.dron_kaydi[dron_id].baslangic_poz] + [
+            self.teslimat_kaydi[teslimat_id].poz for teslimat_id in rota
+        ]
+        
+        iyilesti = True
+        while iyilesti:
+            iyilesti = False
+            for i in range(1, len(noktalar) - 1):
+                for j in range(i + 1, len(noktalar)):
+                    # noktalar[i..j] ters çevrilirse değişen kenarlar: (i-1, i) ve (j, j+1)
+                    eski = self._mesafe_hesapla(noktalar[i - 1], noktalar[i])
+                    yeni = self._mesafe_hesapla(noktalar[i - 1], noktalar[j])
+                    if j + 1 < len(noktalar):
+                        eski += self._mesafe_hesapla(noktalar[j], noktalar[j + 1])
+                        yeni += self._mesafe_hesapla(noktalar[i], noktalar[j + 1])
+                    
+                    if yeni < eski - 1e-9:
+                        noktalar[i:j + 1] = noktalar[i:j + 1][::-1]
+                        rota[i - 1:j] = rota[i - 1:j][::-1]
+                        iyilesti = True
+    
+    def _operator_istatistiklerini_sifirla(self):
+        """Operatör profilini ve uyarlanabilir seçim kalitelerini sıfırlar."""
+        self.operator_istatistikleri: Dict[str, Dict[str, float]] = {}
+        self.operator_kaliteleri: Dict[str, float] = {}
+        
+        for operatorler in self.OPERATOR_GRUPLARI.values():
+            for operator in operatorler:
+                self.operator_istatistikleri[operator] = {
+                    "kullanim": 0,
+                    "iyilesme_sayisi": 0,
+                    "toplam_kazanc": 0.0,
+                    "cpu_suresi": 0.0
+                }
+                self.operator_kaliteleri[operator] = 0.0
+    
+    def _operator_olasiliklari(self, grup: str) -> List[float]:
+        """
+        Bir operatör grubundaki operatörlerin seçilme olasılıklarını hesaplar.
+        
+        Olasılık eşleştirme: her operatör en az OPERATOR_MIN_OLASILIGI alır, kalan
+        olasılık kütlesi kalite değerleriyle orantılı dağıtılır.
+        
+        Args:
+            grup (str): Operatör grubu ("caprazlama" veya "mutasyon")
+            
+        Returns:
+            List[float]: OPERATOR_GRUPLARI[grup] sırasıyla seçilme olasılıkları
+        """
+        operatorler = self.OPERATOR_GRUPLARI[grup]
+        kaliteler = [self.operator_kaliteleri[operator] for operator in operatorler]
+        toplam_kalite = sum(kaliteler)
+        
+        if toplam_kalite <= 0:
+            return [1.0 / len(operatorler)] * len(operatorler)
+        
+        serbest_kutle = 1.0 - len(operatorler) * self.OPERATOR_MIN_OLASILIGI
+        return [
+            self.OPERATOR_MIN_OLASILIGI + serbest_kutle * kalite / toplam_kalite
+            for kalite in kaliteler
+        ]
+    
+    def _operator_sec(self, grup: str) -> str:
+        """
+        Bir operatör grubundan uygulanacak operatörü seçer.
+        
+        Uyarlanabilir seçim kapalıyken klasik davranış korunur: tek noktalı çaprazlama
+        ve eşit olasılıklı taşıma/takas mutasyonu.
+        
+        Args:
+            grup (str): Operatör grubu ("caprazlama" veya "mutasyon")
+            
+        Returns:
+            str: Seçilen operatörün adı
+        """
+        if not self.uyarlanabilir_operatorler:
+            if grup == "caprazlama":
+                return "tek_nokta"
+            return "tasima" if self.rastgele.random() < 0.5 and len(self.dron_idleri) > 1 else "takas"
+        
+        return self.rastgele.choices(
+            self.OPERATOR_GRUPLARI[grup], weights=self._operator_olasiliklari(grup)
+        )[0]
+    
+    def _operator_kredisini_guncelle(self, operator: str, kazanc: float, cpu_suresi: float):
+        """
+        Bir operatör uygulamasının sonucunu profile ve kalite değerine işler.
+        
+        Ödül, CPU saniyesi başına uygunluk iyileşmesidir; kalite değeri bu ödülün
+        üstel hareketli ortalamasıdır.
+        
+        Args:
+            operator (str): Operatör adı
+            kazanc (float): Çocuğun ebeveyne göre uygunluk farkı
+            cpu_suresi (float): Operatörün ve değerlendirmenin harcadığı CPU süresi (saniye)
+        """
+        istatistik = self.operator_istatistikleri[operator]
+        istatistik["kullanim"] += 1
+        istatistik["cpu_suresi"] += cpu_suresi
+        
+        kazanc = max(0.0, kazanc)
+        if kazanc > 0:
+            istatistik["iyilesme_sayisi"] += 1
+            istatistik["toplam_kazanc"] += kazanc
+        
+        odul = kazanc / max(cpu_suresi, 1e-6)
+        self.operator_kaliteleri[operator] += self.OPERATOR_OGRENME_ORANI * (
+            odul - self.operator_kaliteleri[operator]
+        )
+    
+    def operator_kredi_tablosu_al(self) -> Dict[str, Dict[str, float]]:
+        """
+        Son çalıştırmanın operatör bazlı kredi tablosunu döndürür.
+        
+        Returns:
+            Dict[str, Dict[str, float]]: Her operatör için kullanım sayısı, iyileşme sayısı,
+                                         toplam kazanç, CPU süresi, CPU saniyesi başına kazanç
+                                         ve güncel seçilme olasılığı
+        """
+        tablo = {}
+        
+        for grup, operatorler in self.OPERATOR_GRUPLARI.items():
+            olasiliklar = self._operator_olasiliklari(grup)
+            for operator, olasilik in zip(operatorler, olasiliklar):
+                istatistik = self.operator_istatistikleri[operator]
+                tablo[operator] = {
+                    "grup": grup,
+                    **istatistik,
+                    "saniye_basina_kazanc": (
+                        istatistik["toplam_kazanc"] / istatistik["cpu_suresi"]
+                        if istatistik["cpu_suresi"] > 0 else 0.0
+                    ),
+                    "olasilik": olasilik if self.uyarlanabilir_operatorler else None
+                }
+        
+        return tablo
+    
+    def evrimles(
+        self, 
+        geri_cagirma: Optional[Callable[[Dict[str, float]], None]] = None
+    ) -> Dict[int, List[int]]:
         """
         Genetik Algoritma'yı çalıştırır ve en iyi çözümü döndürür.
         
+        Args:
+            geri_cagirma (Optional[Callable[[Dict[str, float]], None]]): Her nesilden sonra
+                telemetri kaydıyla çağrılacak fonksiyon (örn. JsonlTelemetriYazici)
+        
         Returns:
             Dict[int, List[int]]: Her drone için en iyi teslimat rotası
         """
+        for kayit in self.evrimles_adim_adim():
+            if geri_cagirma is not None:
+                geri_cagirma(kayit)
+        
+        return self.en_iyi_birey.kromozom
+    
+    def evrimles_adim_adim(self) -> Iterator[Dict[str, float]]:
+        """
+        Genetik Algoritma'yı çalıştırır ve her nesil için telemetri kaydı üretir.
+        
+        İlk kayıt başlangıç popülasyonuna (nesil 0) aittir. Üretecin tüketilmesi
+        bittiğinde en iyi çözüm en_iyi_birey üzerinden alınabilir.
+        
+        Yields:
+            Dict[str, float]: Nesil telemetri kaydı
+        """
+        self._baslangic_ani = zaman_modulu.perf_counter()
+        self.degerlendirme_sayisi = 0
+        self.onbellek_isabeti = 0
+        self._operator_istatistiklerini_sifirla()
+        
         # Başlangıç popülasyonunu oluştur
-        populasyon = self._populasyonu_baslat()
+        self.kromozom_matrisi, self.uygunluklar = self._populasyonu_baslat()
         
         # En iyi bireyi bul
-        self.en_iyi_birey = max(populasyon, key=lambda ind: ind.uygunluk)
+        self.en_iyi_birey = None
+        self._en_iyi_bireyi_guncelle()
+        
+        self.nesil = 0
+        yield self._telemetri_kaydi_olustur()
+        yield from self._evrimi_surdur()
+    
+    def kontrol_noktasindan_devam_et(
+        self, 
+        dosya_adi: str, 
+        geri_cagirma: Optional[Callable[[Dict[str, float]], None]] = None
+    ) -> Dict[int, List[int]]:
+        """
+        Kaydedilmiş bir kontrol noktasını yükler ve evrime kaldığı nesilden devam eder.
+        
+        Args:
+            dosya_adi (str): Kontrol noktası dosyası
+            geri_cagirma (Optional[Callable[[Dict[str, float]], None]]): Her nesilden sonra
+                telemetri kaydıyla çağrılacak fonksiyon
+            
+        Returns:
+            Dict[int, List[int]]: Her drone için en iyi teslimat rotası
+        """
+        self.kontrol_noktasini_yukle(dosya_adi)
+        self._baslangic_ani = zaman_modulu.perf_counter()
         
+        for kayit in self._evrimi_surdur():
+            if geri_cagirma is not None:
+                geri_cagirma(kayit)
+        
+        return self.en_iyi_birey.kromozom
+    
+    def _evrimi_surdur(self) -> Iterator[Dict[str, float]]:
+        """
+        Mevcut popülasyonu nesil_sayisi'na ulaşana kadar evrimleştirir.
+        
+        Yields:
+            Dict[str, float]: Her nesil için telemetri kaydı
+        """
         # Nesiller boyunca evrimleş
-        for nesil in range(self.nesil_sayisi):
-            yeni_populasyon = []
+        while self.nesil < self.nesil_sayisi:
+            self._nesil_olustur()
+            self.nesil += 1
             
-            # Elitizm: En iyi bireyi doğrudan yeni nesle aktar
-            yeni_populasyon.append(copy.deepcopy(self.en_iyi_birey))
+            # Periyodik kontrol noktası
+            if self.kontrol_noktasi_dosyasi and self.nesil % self.kontrol_noktasi_araligi == 0:
+                self.kontrol_noktasi_kaydet(self.kontrol_noktasi_dosyasi)
             
-            # Yeni nesli oluştur
-            while len(yeni_populasyon) < self.populasyon_boyutu:
-                # Ebeveynleri seç
-                ebeveyn1, ebeveyn2 = self._ebeveynleri_sec(populasyon)
-                
-                # Çaprazlama
-                cocuk1, cocuk2 = self._caprazla(ebeveyn1, ebeveyn2)
-                
-                # Mutasyon
-                cocuk1 = self._mutasyon_yap(cocuk1)
-                cocuk2 = self._mutasyon_yap(cocuk2)
-                
-                yeni_populasyon.append(cocuk1)
-                yeni_populasyon.append(cocuk2)
+            yield self._telemetri_kaydi_olustur()
+    
+    def _telemetri_kaydi_olustur(self) -> Dict[str, float]:
+        """
+        Mevcut nesil için telemetri kaydı oluşturur.
+        
+        Returns:
+            Dict[str, float]: Nesil numarası, en iyi/ortalama uygunluk, çeşitlilik ölçüleri,
+                              değerlendirme ve önbellek sayaçları ile geçen süre
+        """
+        benzersiz_birey_sayisi = len(np.unique(self.kromozom_matrisi, axis=0))
+        
+        return {
+            "nesil": self.nesil,
+            "en_iyi_uygunluk": self.en_iyi_birey.uygunluk,
+            "nesil_en_iyi_uygunluk": float(np.max(self.uygunluklar)),
+            "ortalama_uygunluk": float(np.mean(self.uygunluklar)),
+            "uygunluk_standart_sapma": float(np.std(self.uygunluklar)),
+            "genotip_cesitliligi": benzersiz_birey_sayisi / len(self.uygunluklar),
+            "degerlendirme_sayisi": self.degerlendirme_sayisi,
+            "onbellek_isabeti": self.onbellek_isabeti,
+            "gecen_sure": zaman_modulu.perf_counter() - self._baslangic_ani
+        }
+    
+    def kontrol_noktasi_kaydet(self, dosya_adi: str):
+        """
+        Algoritma durumunu (popülasyon, en iyi birey, rastgele sayı üreteci durumları,
+        nesil sayacı) ikili .npz dosyasına kaydeder.
+        
+        Dosya önce geçici bir dosyaya yazılır ve ardından yerine taşınır; böylece
+        kayıt sırasında kesilen bir çalışma önceki kontrol noktasını bozmaz.
+        
+        Args:
+            dosya_adi (str): Kontrol noktası dosyası
+        """
+        surum, ic_durum, gauss = self.rastgele.getstate()
+        meta = {
+            "nesil": self.nesil,
+            "en_iyi_uygunluk": self.en_iyi_birey.uygunluk,
+            "degerlendirme_sayisi": self.degerlendirme_sayisi,
+            "onbellek_isabeti": self.onbellek_isabeti,
+            "operator_istatistikleri": self.operator_istatistikleri,
+            "operator_kaliteleri": self.operator_kaliteleri,
+            "numpy_rng_durumu": self.rng.bit_generator.state,
+            "random_durumu": [surum, list(ic_durum), gauss]
+        }
+        
+        gecici_dosya = dosya_adi + ".tmp"
+        with open(gecici_dosya, 'wb') as f:
+            np.savez(
+                f,
+                kromozom_matrisi=self.kromozom_matrisi,
+                uygunluklar=self.uygunluklar,
+                en_iyi_satir=self.en_iyi_satir,
+                dron_idleri=np.asarray(self.dron_idleri, dtype=np.int64),
+                teslimat_idleri=np.asarray(self.teslimat_idleri, dtype=np.int64),
+                meta=np.array(json.dumps(meta))
+            )
+        os.replace(gecici_dosya, dosya_adi)
+    
+    def kontrol_noktasini_yukle(self, dosya_adi: str) -> int:
+        """
+        Kontrol noktası dosyasından algoritma durumunu yükler.
+        
+        Args:
+            dosya_adi (str): Kontrol noktası dosyası
+            
+        Returns:
+            int: Kontrol noktasında tamamlanmış nesil sayısı
+        """
+        with np.load(dosya_adi, allow_pickle=False) as veri:
+            if (veri["dron_idleri"].tolist() != self.dron_idleri or
+                    veri["teslimat_idleri"].tolist() != self.teslimat_idleri):
+                raise ValueError("Kontrol noktası bu senaryonun drone ve teslimatlarıyla uyuşmuyor.")
             
-            # Popülasyon boyutunu ayarla
-            populasyon = yeni_populasyon[:self.populasyon_boyutu]
+            self.kromozom_matrisi = veri["kromozom_matrisi"]
+            self.uygunluklar = veri["uygunluklar"]
+            self.en_iyi_satir = veri["en_iyi_satir"]
+            meta = json.loads(str(veri["meta"]))
+        
+        self.populasyon_boyutu = len(self.uygunluklar)
+        self.nesil = meta["nesil"]
+        self.degerlendirme_sayisi = meta["degerlendirme_sayisi"]
+        self.onbellek_isabeti = meta["onbellek_isabeti"]
+        self.operator_istatistikleri = meta["operator_istatistikleri"]
+        self.operator_kaliteleri = meta["operator_kaliteleri"]
+        self.en_iyi_birey = Birey(self._kromozomu_coz(self.en_iyi_satir), meta["en_iyi_uygunluk"])
+        
+        self.rng.bit_generator.state = meta["numpy_rng_durumu"]
+        surum, ic_durum, gauss = meta["random_durumu"]
+        self.rastgele.setstate((surum, tuple(ic_durum), gauss))
+        
+        return self.nesil
+    
+    def _en_iyi_bireyi_guncelle(self):
+        """Popülasyondaki en iyi birey öncekinden iyiyse en iyi bireyi günceller."""
+        en_iyi_indeks = int(np.argmax(self.uygunluklar))
+        en_iyi_uygunluk = float(self.uygunluklar[en_iyi_indeks])
+        
+        if self.en_iyi_birey is None or en_iyi_uygunluk > self.en_iyi_birey.uygunluk:
+            self.en_iyi_satir = self.kromozom_matrisi[en_iyi_indeks].copy()
+            self.en_iyi_birey = Birey(self._kromozomu_coz(self.en_iyi_satir), en_iyi_uygunluk)
+    
+    def _nesil_olustur(self):
+        """
+        Mevcut popülasyondan yeni bir nesil oluşturur.
+        
+        Ebeveyn seçimi uygunluk vektörü üzerinde toplu yapılır; çaprazlama ve mutasyon
+        operatörleri ise sözlük kromozomlar üzerinde çalışır. Seçilen ebeveyn satırları
+        çözülür, çocuklar yeniden kodlanarak matrise yazılır; matris yalnızca saklama
+        biçimidir.
+        """
+        yeni_matris = np.empty_like(self.kromozom_matrisi)
+        yeni_uygunluklar = np.empty_like(self.uygunluklar)
+        
+        # Elitizm: En iyi bireyi doğrudan yeni nesle aktar
+        yeni_matris[0] = self.en_iyi_satir
+        yeni_uygunluklar[0] = self.en_iyi_birey.uygunluk
+        
+        # Nesil için tüm ebeveyn çiftlerini tek seferde seç
+        cift_sayisi = self.populasyon_boyutu // 2
+        ebeveyn_ciftleri = self._ebeveynleri_sec(self.uygunluklar, cift_sayisi)
+        
+        # Yeni nesli oluştur
+        doluluk = 1
+        for indeks1, indeks2 in ebeveyn_ciftleri:
+            if doluluk >= self.populasyon_boyutu:
+                break
+            
+            ebeveyn1 = Birey(
+                self._kromozomu_coz(self.kromozom_matrisi[indeks1]), float(self.uygunluklar[indeks1])
+            )
+            ebeveyn2 = Birey(
+                self._kromozomu_coz(self.kromozom_matrisi[indeks2]), float(self.uygunluklar[indeks2])
+            )
             
-            # En iyi bireyi güncelle
-            mevcut_en_iyi = max(populasyon, key=lambda ind: ind.uygunluk)
-            if mevcut_en_iyi.uygunluk > self.en_iyi_birey.uygunluk:
-                self.en_iyi_birey = copy.deepcopy(mevcut_en_iyi)
+            # Çaprazlama
+            cocuk1, cocuk2 = self._caprazla(ebeveyn1, ebeveyn2)
+            
+            # Mutasyon
+            cocuk1 = self._mutasyon_yap(cocuk1)
+            cocuk2 = self._mutasyon_yap(cocuk2)
+            
+            # Popülasyon boyutunu aşmadan çocukları yerleştir
+            for cocuk in (cocuk1, cocuk2):
+                if doluluk < self.populasyon_boyutu:
+                    yeni_matris[doluluk] = self._kromozomu_kodla(cocuk.kromozom)
+                    yeni_uygunluklar[doluluk] = cocuk.uygunluk
+                    doluluk += 1
         
-        return self.en_iyi_birey.kromozom
+        self.kromozom_matrisi = yeni_matris
+        self.uygunluklar = yeni_uygunluklar
+        
+        # En iyi bireyi güncelle
+        self._en_iyi_bireyi_guncelle()
     
     def en_iyi_uygunluk_al(self) -> float:
         """
@@ -490,7 +1293,7 @@ class GenetikAlgoritma:
         toplam_ihlaller = 0
         
         for dron_id, rota in self.en_iyi_birey.kromozom.items():
-            dron = self.dron_sozlugu[dron_id]
+            dron = self.dron_kaydi[dron_id]
             toplam_teslimatlar += len(rota)
             toplam_enerji += self._rota_enerji_hesapla(dron, rota)
             toplam_ihlaller += self._kural_ihlallerini_say(dron, rota)
@@ -510,15 +1313,15 @@ class GenetikAlgoritma:
             Dict[int, List[Tuple[float, float]]]: Her drone için koordinat listesi
         """
         if not self.en_iyi_birey:
-            return {dron_id: [dron.baslangic_poz] for dron_id, dron in self.dron_sozlugu.items()}
+            return {dron_id: [dron.baslangic_poz] for dron_id, dron in self.dron_kaydi.items()}
         
         rotalar = {}
         
-        for dron_id, dron in self.dron_sozlugu.items():
+        for dron_id, dron in self.dron_kaydi.items():
             rota = [dron.baslangic_poz]
             
             for teslimat_id in self.en_iyi_birey.kromozom.get(dron_id, []):
-                teslimat = self.teslimat_sozlugu[teslimat_id]
+                teslimat = self.teslimat_kaydi[teslimat_id]
                 rota.append(teslimat.poz)
             
             rotalar[dron_id] = rota
@@ -4,17 +4,156 @@ Bu modül, drone filo optimizasyonu projesinin ana giriş noktasıdır.
 """
 
 import os
+import json
 import argparse
 import time as zaman_modulu
+from dataclasses import asdict
+from functools import partial
 from datetime import time
+from typing import Dict, List, Tuple, Optional, Callable
 
 from models import Drone, TeslimatNoktasi, UcusYasakBolgesi
-from data_generator import VeriUreteci
+from data_generator import VeriUreteci, senaryoyu_dogrula, dosya_ac, sikistirma_uzantisi, KOLONLU_UZANTI, SIKISTIRMA_MODULLERI
 from astar import AStar
 from csp import KisitCozucu
-from genetic import GenetikAlgoritma
+from genetic import GenetikAlgoritma, JsonlTelemetriYazici
 from visualization import Gorselleştirici
 from test_scenarios import testleri_calistir
+from onbellek import SonucOnbellegi, senaryo_ozeti_hesapla, sonuc_anahtari_hesapla
+from plan import PlanSonucu, PLAN_UZANTILARI
+
+
+def _rotalari_coz(rotalar: Dict[str, List[List[float]]]) -> Dict[int, List[Tuple[float, float]]]:
+    """Önbelleğe yazılabilir (JSON) rota sözlüğünü drone ID'si → nokta listesi biçimine çevirir."""
+    return {int(dron_id): [tuple(nokta) for nokta in rota] for dron_id, rota in rotalar.items()}
+
+
+def _plani_disa_aktar(sonuc: Dict, algoritma: str, cikti_dizini: str, bicim: str, sikistirma: Optional[str]):
+    """Çözücü sonucundaki planı <cikti_dizini>/plan_<algoritma>.<bicim>[.<sikistirma>] dosyasına yazar."""
+    plan = PlanSonucu.sozlukten_olustur(sonuc["plan"])
+    dosya_adi = os.path.join(cikti_dizini, f"plan_{algoritma}.{bicim}" + (f".{sikistirma}" if sikistirma else ""))
+    plan.kaydet(dosya_adi)
+    
+    ihlaller = plan.ozet_al()["ihlaller"]
+    ihlal_metni = ", ".join(f"{ad}={sayi}" for ad, sayi in ihlaller.items())
+    print(f"Plan kaydedildi: {dosya_adi} ({len(plan)} ayak; ihlalli ayaklar: {ihlal_metni})")
+
+
+def a_yildiz_calistir(
+    dronlar: List[Drone], 
+    teslimat_noktalari: List[TeslimatNoktasi], 
+    ucus_yasak_bolgeleri: List[UcusYasakBolgesi], 
+    mevcut_zaman: time
+) -> Dict:
+    """
+    A* algoritmasını ilk drone için çalıştırır.
+    
+    Returns:
+        Dict: Çalışma süresi, rota sayısı, rotalar ve plan (JSON'a çevrilebilir)
+    """
+    baslangic_zamani = zaman_modulu.time()
+    
+    a_yildiz = AStar(dronlar[0], teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
+    optimal_rota = a_yildiz.tum_teslimatlar_icin_optimal_rotalar_bul()
+    
+    bitis_zamani = zaman_modulu.time()
+    
+    rotalar = {}
+    for rota in optimal_rota:
+        rotalar[dronlar[0].id] = [dronlar[0].baslangic_poz] + [nokta.poz for nokta in rota]
+    
+    return {
+        "sure": bitis_zamani - baslangic_zamani,
+        "rota_sayisi": len(optimal_rota),
+        "rotalar": rotalar,
+        "plan": PlanSonucu.a_yildizdan(a_yildiz, optimal_rota).sozluge_cevir()
+    }
+
+
+def kisit_calistir(
+    dronlar: List[Drone], 
+    teslimat_noktalari: List[TeslimatNoktasi], 
+    ucus_yasak_bolgeleri: List[UcusYasakBolgesi], 
+    mevcut_zaman: time,
+    yontem: str,
+    pismanlik_k: int,
+    kisit_cozucu: Optional[KisitCozucu] = None
+) -> Dict:
+    """
+    CSP çözücüyü çalıştırır.
+    
+    Args:
+        kisit_cozucu (Optional[KisitCozucu]): Önceden kurulmuş (ör. senaryo farkları uygulanmış)
+                                              çözücü; verilirse kurulum süresi ölçüme katılmaz
+    
+    Returns:
+        Dict: Çalışma süresi, teslimat istatistikleri, alan daraltma sayıları, (geri
+              izlemede) arama istatistikleri, rotalar ve plan (JSON'a çevrilebilir)
+    """
+    baslangic_zamani = zaman_modulu.time()
+    
+    if kisit_cozucu is None:
+        kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
+    kisit_cozucu.coz(yontem=yontem, pismanlik_k=pismanlik_k)
+    
+    bitis_zamani = zaman_modulu.time()
+    
+    daraltma = kisit_cozucu.alan_daraltma_istatistikleri
+    sonuc = {
+        "sure": bitis_zamani - baslangic_zamani,
+        "istatistikler": kisit_cozucu.teslimat_istatistiklerini_al(),
+        "elenen_cift": sum(v for k, v in daraltma.items() if k != "toplam_cift"),
+        "toplam_cift": daraltma["toplam_cift"],
+        "rotalar": kisit_cozucu.dron_rotalarini_al(),
+        "plan": PlanSonucu.kisit_cozucuden(kisit_cozucu).sozluge_cevir()
+    }
+    if yontem == 'geri_izleme':
+        sonuc["arama_istatistikleri"] = kisit_cozucu.arama_istatistiklerini_al()
+    return sonuc
+
+
+def genetik_calistir(
+    dronlar: List[Drone], 
+    teslimat_noktalari: List[TeslimatNoktasi], 
+    ucus_yasak_bolgeleri: List[UcusYasakBolgesi], 
+    mevcut_zaman: time,
+    uyarlanabilir_operatorler: bool,
+    telemetri: Optional[str],
+    tohum: Optional[int] = None
+) -> Dict:
+    """
+    Genetik algoritmayı çalıştırır.
+    
+    Returns:
+        Dict: Çalışma süresi, istatistikler, operatör kredi tablosu, rotalar ve plan (JSON'a çevrilebilir)
+    """
+    baslangic_zamani = zaman_modulu.time()
+    
+    genetik_algoritma = GenetikAlgoritma(
+        dronlar, 
+        teslimat_noktalari, 
+        ucus_yasak_bolgeleri, 
+        mevcut_zaman,
+        populasyon_boyutu=50,
+        nesil_sayisi=50,
+        tohum=tohum,
+        uyarlanabilir_operatorler=uyarlanabilir_operatorler
+    )
+    if telemetri:
+        with JsonlTelemetriYazici(telemetri) as telemetri_yazici:
+            genetik_algoritma.evrimles(geri_cagirma=telemetri_yazici)
+    else:
+        genetik_algoritma.evrimles()
+    
+    bitis_zamani = zaman_modulu.time()
+    
+    return {
+        "sure": bitis_zamani - baslangic_zamani,
+        "istatistikler": genetik_algoritma.istatistikleri_al(),
+        "operator_kredi_tablosu": genetik_algoritma.operator_kredi_tablosu_al(),
+        "rotalar": genetik_algoritma.dron_rotalarini_al(),
+        "plan": PlanSonucu.genetik_algoritmadan(genetik_algoritma).sozluge_cevir()
+    }
 
 
 def main():
@@ -29,18 +168,54 @@ def main():
     
     # Veri üretimi
     parser.add_argument('--uret', action='store_true', help='Rastgele senaryo üret')
-    parser.add_argument('--dron_sayisi', type=int, default=5, help='Drone sayısı')
+    parser.add_argument('--dron_sayisi', type=int, default=None,
+                        help='Drone sayısı (varsayılan: 5; --sehir ile teslimat sayısıyla ölçeklenir)')
     parser.add_argument('--teslimat_sayisi', type=int, default=20, help='Teslimat noktası sayısı')
-    parser.add_argument('--ucus_yasak_bolge_sayisi', type=int, default=2, help='Uçuşa yasak bölge sayısı')
+    parser.add_argument('--ucus_yasak_bolge_sayisi', type=int, default=None,
+                        help='Uçuşa yasak bölge sayısı (varsayılan: 2; --sehir ile talep merkezi sayısı kadar)')
+    parser.add_argument('--sehir', action='store_true',
+                        help='Kümelenmiş talepli, çok depolu ve yoğun saatli şehir senaryosu üret')
+    parser.add_argument('--depo_sayisi', type=int, default=1, help='Şehir senaryosundaki depo sayısı')
+    parser.add_argument('--sikistirma', type=str, choices=sorted(uzanti[1:] for uzanti in SIKISTIRMA_MODULLERI),
+                        help='Üretilen metin senaryoyu, önbellek kayıtlarını ve plan dosyalarını akış halinde sıkıştır')
+    parser.add_argument('--kolonlu', action='store_true',
+                        help=f'Senaryoyu NumPy ile toplu üretip bellek eşlemeli ikili kolonlu biçimde ({KOLONLU_UZANTI}) kaydet')
     
     # Senaryo yükleme ve çözme
     parser.add_argument('--senaryo', type=str, help='Senaryo dosyası')
+    parser.add_argument('--fark', type=str, nargs='+', default=[],
+                        help='Yüklenen senaryoya sırayla uygulanacak senaryo farkı dosyaları')
+    parser.add_argument('--paralel_yukle', action='store_true',
+                        help='Metin senaryonun teslimat bölümünü parçalara bölüp işçi süreçlerde ayrıştır')
+    parser.add_argument('--isci_sayisi', type=int, help='Paralel yüklemedeki işçi süreç sayısı (varsayılan: işlemci sayısı)')
+    parser.add_argument('--dogrulama_yok', action='store_true', help='Yüklenen senaryoyu doğrulama')
+    parser.add_argument('--dogrulama_raporu', type=str, help='Doğrulama sorunlarının yazılacağı JSONL dosyası')
     parser.add_argument('--coz', type=str, choices=['a_yildiz', 'kisit', 'genetik', 'hepsi'], 
                         help='Çözüm algoritması')
+    parser.add_argument('--kisit_yontemi', type=str, choices=['acgozlu', 'geri_izleme', 'pismanlik'], default='acgozlu',
+                        help='CSP çözüm yöntemi')
+    parser.add_argument('--pismanlik_k', type=int, default=2, help='Pişmanlık yönteminde hesaba katılan seçenek sayısı')
+    
+    # Sonuç önbelleği
+    parser.add_argument('--onbellek_dizini', type=str,
+                        help='Çözüm sonuçları önbelleğinin dizini (varsayılan: <cikti_dizini>/onbellek)')
+    parser.add_argument('--onbellek_boyutu', type=float, default=256.0, help='Sonuç önbelleği boyut sınırı (MB)')
+    parser.add_argument('--onbellek_yok', action='store_true', help='Sonuç önbelleğini kullanma')
     
     # Görselleştirme
     parser.add_argument('--gorselleştir', action='store_true', help='Sonuçları görselleştir')
     parser.add_argument('--cikti_dizini', type=str, default='cikti', help='Çıktı dizini')
+    parser.add_argument('--plan_bicimi', type=str, choices=[uzanti[1:] for uzanti in PLAN_UZANTILARI],
+                        help='Her algoritmanın planını ayak başına mesafe, enerji, varış zamanı ve ihlallerle '
+                             '<cikti_dizini>/plan_<algoritma>.<bicim> dosyasına yaz')
+    
+    # İzleme
+    parser.add_argument('--telemetri', type=str, help='GA nesil telemetrisinin yazılacağı JSONL dosyası')
+    parser.add_argument('--uyarlanabilir_operatorler', action='store_true',
+                        help='GA operatörlerini CPU saniyesi başına iyileşmeye göre uyarlamalı seç')
+    parser.add_argument('--ga_tohum', type=int,
+                        help='GA rastgele sayı üreteçlerinin tohumu (verilmezse her çalışma farklıdır '
+                             've GA sonucu önbelleğe alınmaz)')
     
     args = parser.parse_args()
     
@@ -54,24 +229,59 @@ def main():
     
     # Rastgele senaryo üret
     if args.uret:
+        veri_ureteci = VeriUreteci()
+        
+        # Senaryoyu üret ve kaydet; kolonlu ve şehir senaryolarında diziler NumPy ile toplu üretilir
+        kolonlu_senaryo = None
+        if args.sehir:
+            # Verilmeyen sayılar için şehir üretecinin teslimat sayısıyla ölçeklenen varsayılanları kullanılır
+            kolonlu_senaryo = veri_ureteci.sehir_senaryosu_uret(
+                args.teslimat_sayisi,
+                dron_sayisi=args.dron_sayisi,
+                depo_sayisi=args.depo_sayisi,
+                ucus_yasak_bolge_sayisi=args.ucus_yasak_bolge_sayisi
+            )
+            args.dron_sayisi = kolonlu_senaryo.dron_sayisi
+            args.ucus_yasak_bolge_sayisi = kolonlu_senaryo.ucus_yasak_bolge_sayisi
+        else:
+            # Düzgün dağılımlı üreteçlerin varsayılanları
+            if args.dron_sayisi is None:
+                args.dron_sayisi = 5
+            if args.ucus_yasak_bolge_sayisi is None:
+                args.ucus_yasak_bolge_sayisi = 2
         print(f"Rastgele senaryo üretiliyor: {args.dron_sayisi} drone, {args.teslimat_sayisi} teslimat, "
               f"{args.ucus_yasak_bolge_sayisi} uçuş yasak bölgesi")
         
-        veri_ureteci = VeriUreteci()
-        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(
-            args.dron_sayisi,
-            args.teslimat_sayisi,
-            args.ucus_yasak_bolge_sayisi
-        )
+        if args.kolonlu and kolonlu_senaryo is None:
+            kolonlu_senaryo = veri_ureteci.kolonlu_senaryo_uret(
+                args.dron_sayisi,
+                args.teslimat_sayisi,
+                args.ucus_yasak_bolge_sayisi
+            )
         
-        # Senaryoyu kaydet
-        senaryo_dosyasi = os.path.join(args.cikti_dizini, "senaryo_uretilen.txt")
-        veri_ureteci.senaryoyu_dosyaya_kaydet(
-            senaryo_dosyasi, 
-            dronlar, 
-            teslimat_noktalari, 
-            ucus_yasak_bolgeleri
-        )
+        if args.kolonlu:
+            senaryo_dosyasi = os.path.join(args.cikti_dizini, "senaryo_uretilen" + KOLONLU_UZANTI)
+            kolonlu_senaryo.kaydet(senaryo_dosyasi)
+            if args.gorselleştir:
+                dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = kolonlu_senaryo.nesneleri_al()
+        else:
+            if kolonlu_senaryo is not None:
+                dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = kolonlu_senaryo.nesneleri_al()
+            else:
+                dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(
+                    args.dron_sayisi,
+                    args.teslimat_sayisi,
+                    args.ucus_yasak_bolge_sayisi
+                )
+            senaryo_dosyasi = os.path.join(
+                args.cikti_dizini, "senaryo_uretilen.txt" + (f".{args.sikistirma}" if args.sikistirma else "")
+            )
+            veri_ureteci.senaryoyu_dosyaya_kaydet(
+                senaryo_dosyasi, 
+                dronlar, 
+                teslimat_noktalari, 
+                ucus_yasak_bolgeleri
+            )
         print(f"Senaryo kaydedildi: {senaryo_dosyasi}")
         
         # Görselleştir
@@ -103,11 +313,78 @@ def main():
         
         # Senaryoyu yükle
         veri_ureteci = VeriUreteci()
-        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryoyu_dosyadan_yukle(args.senaryo)
+        kolonlu_senaryo = None
+        if args.senaryo.endswith(KOLONLU_UZANTI):
+            kolonlu_senaryo = veri_ureteci.senaryoyu_kolonlu_yukle(args.senaryo)
+        elif args.paralel_yukle and sikistirma_uzantisi(args.senaryo) is not None:
+            print("Sıkıştırılmış senaryo parçalanamaz; sıralı yükleniyor")
+        elif args.paralel_yukle:
+            kolonlu_senaryo = veri_ureteci.senaryoyu_paralel_yukle(args.senaryo, isci_sayisi=args.isci_sayisi)
+            istatistikler = veri_ureteci.yukleme_istatistikleri
+            print(f"Paralel yükleme: {istatistikler['teslimat_sayisi']} teslimat, {istatistikler['parca_sayisi']} parça, "
+                  f"{istatistikler['isci_sayisi']} işçi, {istatistikler['sure']:.3f} saniye "
+                  f"({istatistikler['satir_hizi']:.0f} satır/s, {istatistikler['bayt_hizi'] / 2**20:.1f} MB/s)")
+        
+        if kolonlu_senaryo is not None:
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = kolonlu_senaryo.nesneleri_al()
+        else:
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryoyu_dosyadan_yukle(args.senaryo)
         
         # Mevcut zamanı ayarla
         mevcut_zaman = time(10, 0)  # 10:00
         
+        # Senaryo farklarını sırayla uygula; CSP çözülecekse farklar temel senaryoyla kurulan
+        # çözücüye uygulanır (statik uygunluk yalnızca değişen varlıklar için yeniden hesaplanır)
+        # ve diğer algoritmalar çözücünün güncel listelerini kullanır
+        kisit_cozucu = None
+        if args.fark and args.coz in ['kisit', 'hepsi']:
+            try:
+                kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
+            except ValueError as hata:
+                # Temel senaryo çözücüye yüklenemiyorsa (ör. yinelenen ID) farklar listelere uygulanır
+                print(f"Farklar çözücüye uygulanamadı ({hata}); senaryo listelerine uygulanıyor")
+        for fark_dosyasi in args.fark:
+            fark = veri_ureteci.farki_dosyadan_yukle(fark_dosyasi)
+            if kisit_cozucu is not None:
+                fark_istatistikleri = kisit_cozucu.farki_uygula(fark)
+                dronlar = kisit_cozucu.dronlar
+                teslimat_noktalari = kisit_cozucu.teslimat_noktalari
+                ucus_yasak_bolgeleri = kisit_cozucu.ucus_yasak_bolgeleri
+                yeniden_hesaplanan = (f"; yeniden hesaplanan: {fark_istatistikleri['yeniden_hesaplanan_dron']} drone, "
+                                      f"{fark_istatistikleri['yeniden_hesaplanan_teslimat']} teslimat")
+            else:
+                dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = fark.uygula(
+                    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri
+                )
+                yeniden_hesaplanan = ""
+            print(f"Fark uygulandı: {fark_dosyasi} ({len(dronlar)} drone, {len(teslimat_noktalari)} teslimat, "
+                  f"{len(ucus_yasak_bolgeleri)} uçuş yasak bölgesi{yeniden_hesaplanan})")
+        
+        # Senaryoyu doğrula; hata varsa çözmeden çık
+        if not args.dogrulama_yok:
+            baslangic = zaman_modulu.perf_counter()
+            if kolonlu_senaryo is not None and not args.fark:
+                sorunlar = kolonlu_senaryo.dogrula()
+            else:
+                sorunlar = senaryoyu_dogrula(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri)
+            hata_sayisi = sum(sorun.seviye == "hata" for sorun in sorunlar)
+            print(f"Senaryo doğrulandı ({zaman_modulu.perf_counter() - baslangic:.4f} saniye): "
+                  f"{hata_sayisi} hata, {len(sorunlar) - hata_sayisi} uyarı")
+            for sorun in sorunlar[:10]:
+                print(f"  [{sorun.seviye}] {sorun.bolum} {sorun.id}: {sorun.kod} - {sorun.mesaj}")
+            if len(sorunlar) > 10:
+                print(f"  ... ve {len(sorunlar) - 10} sorun daha")
+            
+            if args.dogrulama_raporu:
+                with dosya_ac(args.dogrulama_raporu, 'w') as f:
+                    for sorun in sorunlar:
+                        f.write(json.dumps(asdict(sorun), ensure_ascii=False) + "\n")
+                print(f"Doğrulama raporu kaydedildi: {args.dogrulama_raporu}")
+            
+            if hata_sayisi:
+                print("Senaryo geçersiz; çözüm yapılmadı (--dogrulama_yok ile doğrulama atlanabilir)")
+                return
+        
         # Görselleştirici oluştur
         gorselleştirici = Gorselleştirici(
             dronlar, 
@@ -129,26 +406,53 @@ def main():
             )
             print(f"Senaryo görselleştirmesi kaydedildi: {os.path.join(args.cikti_dizini, 'senaryo_yuklenen.png')}")
         
+        # Sonuç önbelleği: anahtar senaryo içeriği, algoritma ve parametrelerden üretilir
+        onbellek = None
+        if not args.onbellek_yok:
+            onbellek = SonucOnbellegi(args.onbellek_dizini or os.path.join(args.cikti_dizini, "onbellek"),
+                                      maksimum_boyut=int(args.onbellek_boyutu * 2**20),
+                                      sikistirma=f".{args.sikistirma}" if args.sikistirma else None)
+            if kolonlu_senaryo is not None and not args.fark:
+                senaryo_ozeti = kolonlu_senaryo.ozet()
+            else:
+                senaryo_ozeti = senaryo_ozeti_hesapla(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri)
+        
+        def onbellekli_calistir(
+            algoritma: str, parametreler: Dict, calistir: Callable[[], Dict], ad: str
+        ) -> Dict:
+            # Önbellekten gelen sonucun 'sure' alanı o sonucu üreten eski çalışmaya aittir
+            if onbellek is not None:
+                anahtar = sonuc_anahtari_hesapla(senaryo_ozeti, algoritma, mevcut_zaman, parametreler)
+                sonuc = onbellek.al(anahtar)
+                if sonuc is not None:
+                    print(f"{ad} sonucu önbellekten alındı ({anahtar[:12]}); "
+                          f"kaydedildiği çalışmanın süresi: {sonuc['sure']:.4f} saniye")
+                    return sonuc
+            
+            sonuc = calistir()
+            print(f"{ad} çalışma süresi: {sonuc['sure']:.4f} saniye")
+            if onbellek is not None:
+                onbellek.kaydet(anahtar, sonuc)
+            return sonuc
+        
         # A* algoritması
         if args.coz in ['a_yildiz', 'hepsi']:
             print("A* algoritması çalıştırılıyor...")
-            baslangic_zamani = zaman_modulu.time()
+            a_yildiz_sonucu = onbellekli_calistir(
+                'a_yildiz', {},
+                lambda: a_yildiz_calistir(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman),
+                "A* algoritması"
+            )
             
-            a_yildiz = AStar(dronlar[0], teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
-            optimal_rota = a_yildiz.tum_teslimatlar_icin_optimal_rotalar_bul()
+            print(f"Bulunan rota sayısı: {a_yildiz_sonucu['rota_sayisi']}")
             
-            bitis_zamani = zaman_modulu.time()
-            print(f"A* algoritması çalışma süresi: {bitis_zamani - baslangic_zamani:.4f} saniye")
-            print(f"Bulunan rota sayısı: {len(optimal_rota)}")
+            if args.plan_bicimi:
+                _plani_disa_aktar(a_yildiz_sonucu, 'a_yildiz', args.cikti_dizini, args.plan_bicimi, args.sikistirma)
             
             # A* sonuçlarını görselleştir
             if args.gorselleştir:
-                a_yildiz_rotalari = {}
-                for i, rota in enumerate(optimal_rota):
-                    a_yildiz_rotalari[dronlar[0].id] = [dronlar[0].baslangic_poz] + [nokta.poz for nokta in rota]
-                
                 a_yildiz_gorselleştirme = gorselleştirici.rotalari_gorselleştir(
-                    a_yildiz_rotalari,
+                    _rotalari_coz(a_yildiz_sonucu['rotalar']),
                     baslik="A* Algoritması Sonuçları"
                 )
                 
@@ -161,25 +465,39 @@ def main():
         # CSP algoritması
         if args.coz in ['kisit', 'hepsi']:
             print("CSP algoritması çalıştırılıyor...")
-            baslangic_zamani = zaman_modulu.time()
-            
-            kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman)
-            kisit_cozucu.coz()
+            kisit_sonucu = onbellekli_calistir(
+                'kisit', {'yontem': args.kisit_yontemi, 'pismanlik_k': args.pismanlik_k},
+                lambda: kisit_calistir(
+                    dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman,
+                    args.kisit_yontemi, args.pismanlik_k, kisit_cozucu
+                ),
+                "CSP algoritması"
+            )
             
-            bitis_zamani = zaman_modulu.time()
-            print(f"CSP algoritması çalışma süresi: {bitis_zamani - baslangic_zamani:.4f} saniye")
             
-            # CSP istatistiklerini al
-            kisit_istatistikleri = kisit_cozucu.teslimat_istatistiklerini_al()
+            # CSP istatistikleri
+            kisit_istatistikleri = kisit_sonucu['istatistikler']
             print(f"Tamamlanan teslimat yüzdesi: {kisit_istatistikleri['tamamlanma_orani']:.2f}%")
             print(f"Ortalama enerji tüketimi: {kisit_istatistikleri['ortalama_enerji_tuketimi']:.2f} mAh")
+            print(f"Toplam sefer sayısı (depo dönüşü ve şarj dahil): {kisit_istatistikleri['toplam_sefer_sayisi']}")
+            print(f"Ön işlemede elenen drone-teslimat çifti: {kisit_sonucu['elenen_cift']}/{kisit_sonucu['toplam_cift']}")
+            
+            if args.kisit_yontemi == 'geri_izleme':
+                arama_istatistikleri = kisit_sonucu['arama_istatistikleri']
+                print(f"Ziyaret edilen düğüm sayısı: {arama_istatistikleri['dugum_sayisi']}")
+                print(f"Budama oranı: {arama_istatistikleri['budama_orani']:.2%}")
+                print(f"Geri sıçrama sayısı: {arama_istatistikleri['geri_sicrama_sayisi']} "
+                      f"(atlanan seviye: {arama_istatistikleri['atlanan_seviye_sayisi']})")
+                if arama_istatistikleri.get('acgozlu_plan_secildi_mi'):
+                    print("Arama planı açgözlü plandan kötü olduğu için açgözlü plan kullanıldı")
+            
+            if args.plan_bicimi:
+                _plani_disa_aktar(kisit_sonucu, 'kisit', args.cikti_dizini, args.plan_bicimi, args.sikistirma)
             
             # CSP sonuçlarını görselleştir
             if args.gorselleştir:
-                kisit_rotalari = kisit_cozucu.dron_rotalarini_al()
-                
                 kisit_gorselleştirme = gorselleştirici.rotalari_gorselleştir(
-                    kisit_rotalari,
+                    _rotalari_coz(kisit_sonucu['rotalar']),
                     baslik="CSP Algoritması Sonuçları"
                 )
                 
@@ -192,31 +510,45 @@ def main():
         # Genetik Algoritma
         if args.coz in ['genetik', 'hepsi']:
             print("Genetik Algoritma çalıştırılıyor...")
-            baslangic_zamani = zaman_modulu.time()
-            
-            genetik_algoritma = GenetikAlgoritma(
-                dronlar, 
-                teslimat_noktalari, 
-                ucus_yasak_bolgeleri, 
-                mevcut_zaman,
-                populasyon_boyutu=50,
-                nesil_sayisi=50
+            ga_calistir = partial(
+                genetik_calistir, dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, mevcut_zaman,
+                args.uyarlanabilir_operatorler, args.telemetri, args.ga_tohum
             )
-            genetik_algoritma.evrimles()
+            # Telemetri her çalışmada yazılması gereken bir yan etki olduğundan önbelleği atlar;
+            # tohumsuz GA her çalışmada farklı sonuç verdiğinden önbelleğe alınmaz
+            if args.telemetri or args.ga_tohum is None:
+                genetik_sonucu = ga_calistir()
+                print(f"Genetik Algoritma çalışma süresi: {genetik_sonucu['sure']:.4f} saniye")
+            else:
+                genetik_sonucu = onbellekli_calistir(
+                    'genetik',
+                    {'populasyon_boyutu': 50, 'nesil_sayisi': 50,
+                     'uyarlanabilir_operatorler': args.uyarlanabilir_operatorler, 'tohum': args.ga_tohum},
+                    ga_calistir,
+                    "Genetik Algoritma"
+                )
             
-            bitis_zamani = zaman_modulu.time()
-            print(f"Genetik Algoritma çalışma süresi: {bitis_zamani - baslangic_zamani:.4f} saniye")
             
-            # GA istatistiklerini al
-            ga_istatistikleri = genetik_algoritma.istatistikleri_al()
+            # GA istatistikleri
+            ga_istatistikleri = genetik_sonucu['istatistikler']
             print(f"Toplam teslimat sayısı: {ga_istatistikleri['toplam_teslimatlar']}")
             print(f"Toplam enerji tüketimi: {ga_istatistikleri['toplam_enerji']:.2f} mAh")
             print(f"Toplam kural ihlali sayısı: {ga_istatistikleri['toplam_ihlaller']}")
             print(f"Uygunluk değeri: {ga_istatistikleri['uygunluk']:.2f}")
             
+            # Operatör kredi tablosu
+            print("Operatör kredi tablosu:")
+            for operator, kredi in genetik_sonucu['operator_kredi_tablosu'].items():
+                olasilik = f"{kredi['olasilik']:.2f}" if kredi['olasilik'] is not None else "-"
+                print(f"  {operator:<14} kullanım={kredi['kullanim']:<5} iyileşme={kredi['iyilesme_sayisi']:<5} "
+                      f"kazanç/CPU-sn={kredi['saniye_basina_kazanc']:.1f} olasılık={olasilik}")
+            
+            if args.plan_bicimi:
+                _plani_disa_aktar(genetik_sonucu, 'genetik', args.cikti_dizini, args.plan_bicimi, args.sikistirma)
+            
             # GA sonuçlarını görselleştir
             if args.gorselleştir:
-                genetik_rotalari = genetik_algoritma.dron_rotalarini_al()
+                genetik_rotalari = _rotalari_coz(genetik_sonucu['rotalar'])
                 
                 genetik_gorselleştirme = gorselleştirici.rotalari_gorselleştir(
                     genetik_rotalari,
@@ -234,6 +566,12 @@ def main():
                 gorselleştirici.animasyon_olustur(genetik_rotalari, animasyon_dosyasi)
                 print(f"Animasyon kaydedildi: {animasyon_dosyasi}")
         
+        if onbellek is not None:
+            onbellek_istatistikleri = onbellek.istatistikleri_al()
+            print(f"Sonuç önbelleği: {onbellek_istatistikleri['isabet_sayisi']} isabet, "
+                  f"{onbellek_istatistikleri['iska_sayisi']} ıska, {onbellek_istatistikleri['kayit_sayisi']} kayıt "
+                  f"({onbellek_istatistikleri['toplam_boyut'] / 2**20:.2f} MB)")
+        
         return
     
     # Hiçbir argüman verilmemişse yardım mesajını göster
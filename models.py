@@ -3,10 +3,12 @@ Drone Filo Optimizasyonu: Veri Yapıları Modülü
 Bu modül, drone filo optimizasyonu projesinde kullanılan temel veri yapılarını içerir.
 """
 
-from typing import Tuple, List, Dict, Optional
-from dataclasses import dataclass
+from typing import Tuple, List, Dict, Optional, Generic, TypeVar, Iterator, Iterable
+from dataclasses import dataclass, field
 from datetime import time
 
+import numpy as np
+
 
 @dataclass
 class Drone:
@@ -23,6 +25,7 @@ class Drone:
         mevcut_batarya (int): Drone'un mevcut batarya durumu
         mevcut_yuk (float): Drone'un mevcut yükü
         musait_mi (bool): Drone'un müsait olup olmadığı
+        sarj_hizi (float): Depoda şarj olurken bataryaya saniyede eklenen enerji (mAh/s)
     """
     id: int
     maksimum_agirlik: float
@@ -33,6 +36,7 @@ class Drone:
     mevcut_batarya: Optional[int] = None
     mevcut_yuk: float = 0.0
     musait_mi: bool = True
+    sarj_hizi: float = 10.0
     
     def __post_init__(self):
         """Başlangıç değerlerini ayarlar."""
@@ -63,6 +67,19 @@ class Drone:
         tuketilen_enerji = self.enerji_tuketimi_hesapla(mesafe, agirlik)
         self.mevcut_batarya -= tuketilen_enerji
     
+    def sarj_suresi_hesapla(self, mevcut_batarya: Optional[int] = None) -> float:
+        """
+        Bataryanın tamamen dolması için gereken süreyi saniye cinsinden hesaplar.
+        mevcut_batarya verilmezse drone'un kendi mevcut batarya değeri kullanılır.
+        """
+        if mevcut_batarya is None:
+            mevcut_batarya = self.mevcut_batarya
+        return (self.batarya - mevcut_batarya) / self.sarj_hizi
+    
+    def sarj_et(self):
+        """Bataryayı tam kapasiteye doldurur."""
+        self.mevcut_batarya = self.batarya
+    
     def sifirla(self):
         """Drone'u başlangıç durumuna sıfırlar."""
         self.mevcut_poz = self.baslangic_poz
@@ -101,6 +118,30 @@ class TeslimatNoktasi:
         return self.zaman_araligi[0] <= mevcut_zaman <= self.zaman_araligi[1]
 
 
+@dataclass
+class Sefer:
+    """
+    Sefer sınıfı, bir drone'un depodan kalkıp depoya dönene kadarki tek bir turunu temsil eder.
+    
+    Attributes:
+        dron_id (int): Seferi yapan drone'un kimlik numarası
+        kalkis_zamani (time): Depodan kalkış zamanı
+        teslimatlar (List[int]): Sefer boyunca sırasıyla yapılan teslimatların ID'leri
+        donus_zamani (Optional[time]): Depoya varış zamanı (sefer sürüyorsa None)
+        sarj_bitis_zamani (Optional[time]): Dönüşten sonra şarjın tamamlandığı zaman
+    """
+    dron_id: int
+    kalkis_zamani: time
+    teslimatlar: List[int] = field(default_factory=list)
+    donus_zamani: Optional[time] = None
+    sarj_bitis_zamani: Optional[time] = None
+    
+    @property
+    def tamamlandi_mi(self) -> bool:
+        """Seferin depoya dönüşle tamamlanıp tamamlanmadığını döndürür."""
+        return self.donus_zamani is not None
+
+
 @dataclass
 class UcusYasakBolgesi:
     """
@@ -203,3 +244,254 @@ class UcusYasakBolgesi:
             return True
         
         return False
+    
+    def noktalar_iceriyor_mu(self, noktalar: np.ndarray) -> np.ndarray:
+        """
+        nokta_iceriyor_mu metodunun vektörel sürümü.
+        
+        Args:
+            noktalar (np.ndarray): (N, 2) boyutlu nokta dizisi
+            
+        Returns:
+            np.ndarray: Her nokta için bölge içindeyse True olan (N,) boyutlu dizi
+        """
+        x, y = noktalar[:, 0], noktalar[:, 1]
+        icinde = np.zeros(len(noktalar), dtype=bool)
+        
+        n = len(self.koordinatlar)
+        p1x, p1y = self.koordinatlar[0]
+        for i in range(1, n + 1):
+            p2x, p2y = self.koordinatlar[i % n]
+            # Yatay kenarlar hiçbir zaman sayılmaz (ilk iki koşul birlikte sağlanamaz)
+            if p1y != p2y:
+                aday = (y > min(p1y, p2y)) & (y <= max(p1y, p2y)) & (x <= max(p1x, p2x))
+                if p1x == p2x:
+                    icinde ^= aday
+                else:
+                    xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                    icinde ^= aday & (x <= xinters)
+            p1x, p1y = p2x, p2y
+        
+        return icinde
+    
+    def cizgiler_kesisiyor_mu(self, baslangiclar: np.ndarray, bitisler: np.ndarray) -> np.ndarray:
+        """
+        cizgi_kesisiyor_mu metodunun vektörel sürümü.
+        
+        Args:
+            baslangiclar (np.ndarray): (N, 2) boyutlu segment başlangıçları
+            bitisler (np.ndarray): (N, 2) boyutlu segment bitişleri
+            
+        Returns:
+            np.ndarray: Her segment için bölgeyle kesişiyorsa True olan (N,) boyutlu dizi
+        """
+        baslangiclar, bitisler = np.broadcast_arrays(baslangiclar, bitisler)
+        sonuc = np.zeros(len(baslangiclar), dtype=bool)
+        
+        # Sınırlayıcı kutusu bölgeninkiyle örtüşmeyen segmentler kesişemez
+        bolge_x = [k[0] for k in self.koordinatlar]
+        bolge_y = [k[1] for k in self.koordinatlar]
+        min_x = np.minimum(baslangiclar[:, 0], bitisler[:, 0])
+        max_x = np.maximum(baslangiclar[:, 0], bitisler[:, 0])
+        min_y = np.minimum(baslangiclar[:, 1], bitisler[:, 1])
+        max_y = np.maximum(baslangiclar[:, 1], bitisler[:, 1])
+        adaylar = np.flatnonzero(
+            (max_x >= min(bolge_x)) & (min_x <= max(bolge_x)) &
+            (max_y >= min(bolge_y)) & (min_y <= max(bolge_y))
+        )
+        if len(adaylar) == 0:
+            return sonuc
+        
+        baslangiclar, bitisler = baslangiclar[adaylar], bitisler[adaylar]
+        min_x, max_x, min_y, max_y = min_x[adaylar], max_x[adaylar], min_y[adaylar], max_y[adaylar]
+        p1x, p1y = baslangiclar[:, 0], baslangiclar[:, 1]
+        q1x, q1y = bitisler[:, 0], bitisler[:, 1]
+        
+        def yonelim(px, py, qx, qy, rx, ry):
+            return np.sign((qy - py) * (rx - qx) - (qx - px) * (ry - qy))
+        
+        kesisiyor = np.zeros(len(baslangiclar), dtype=bool)
+        
+        n = len(self.koordinatlar)
+        for i in range(n):
+            p2x, p2y = self.koordinatlar[i]
+            q2x, q2y = self.koordinatlar[(i + 1) % n]
+            
+            o1 = yonelim(p1x, p1y, q1x, q1y, p2x, p2y)
+            o2 = yonelim(p1x, p1y, q1x, q1y, q2x, q2y)
+            o3 = yonelim(p2x, p2y, q2x, q2y, p1x, p1y)
+            o4 = yonelim(p2x, p2y, q2x, q2y, q1x, q1y)
+            
+            # Genel durum
+            kesisiyor |= (o1 != o2) & (o3 != o4)
+            
+            # Özel durumlar (doğrusal noktanın diğer segmentin üzerinde olması)
+            kesisiyor |= (o1 == 0) & (min_x <= p2x) & (p2x <= max_x) & (min_y <= p2y) & (p2y <= max_y)
+            kesisiyor |= (o2 == 0) & (min_x <= q2x) & (q2x <= max_x) & (min_y <= q2y) & (q2y <= max_y)
+            
+            kenar_min_x, kenar_max_x = min(p2x, q2x), max(p2x, q2x)
+            kenar_min_y, kenar_max_y = min(p2y, q2y), max(p2y, q2y)
+            kesisiyor |= ((o3 == 0) & (kenar_min_x <= p1x) & (p1x <= kenar_max_x) &
+                          (kenar_min_y <= p1y) & (p1y <= kenar_max_y))
+            kesisiyor |= ((o4 == 0) & (kenar_min_x <= q1x) & (q1x <= kenar_max_x) &
+                          (kenar_min_y <= q1y) & (q1y <= kenar_max_y))
+        
+        # Eğer başlangıç veya bitiş noktası poligon içindeyse
+        kesisiyor |= self.noktalar_iceriyor_mu(baslangiclar)
+        kesisiyor |= self.noktalar_iceriyor_mu(bitisler)
+        
+        sonuc[adaylar] = kesisiyor
+        return sonuc
+
+
+T = TypeVar("T")
+
+
+def kapasiteli_ekle(
+    tampon: Optional[np.ndarray], 
+    dizi: np.ndarray, 
+    deger, 
+    eksen: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Diziye bir eksen boyunca tek eleman ekler; kapasitesi ikiye katlanan bir tampon kullanır.
+    
+    Dizi, tamponun başındaki bir görünüm olarak tutulur. Yeni eleman tampona yerinde
+    yazılır ve yalnızca kapasite dolduğunda kopyalama yapılır; böylece n ekleme
+    np.append'in O(n²) yerine toplam O(n) kopyalama yapar. Dizi tampondan
+    türememişse (ör. başka bir yerde yeniden atanmışsa) tampon ondan yeniden kurulur.
+    
+    Args:
+        tampon (Optional[np.ndarray]): Önceki çağrının döndürdüğü tampon (ilk çağrıda None)
+        dizi (np.ndarray): Uzatılacak dizi
+        deger: Eklenecek eleman (eksen dışındaki boyutlarda diziyle uyumlu)
+        eksen (int): Eklemenin yapılacağı eksen
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Tampon ve bir eleman uzatılmış dizi (tampon görünümü)
+    """
+    n = dizi.shape[eksen]
+    onek = (slice(None),) * eksen
+    if tampon is None or dizi.base is not tampon or n == tampon.shape[eksen]:
+        sekil = list(dizi.shape)
+        sekil[eksen] = max(2 * n, 16)
+        yeni_tampon = np.empty(sekil, dtype=dizi.dtype)
+        yeni_tampon[onek + (slice(0, n),)] = dizi
+        tampon = yeni_tampon
+    
+    tampon[onek + (n,)] = deger
+    return tampon, tampon[onek + (slice(0, n + 1),)]
+
+
+class KimlikKaydi(Generic[T]):
+    """
+    ID'si olan nesneleri (drone, teslimat noktası vb.) sabit zamanda bulan kayıt defteri.
+    
+    Nesneler verildikleri sırayla 0..n-1 yoğun indekslerine yerleştirilir. ID'den nesneye
+    ve indekse erişim sabit zamanlıdır; ID'ler negatif olmayan ve yeterince yoğun
+    tamsayılarsa ID dizileri tek bir NumPy tablosu üzerinden toplu olarak indekse çevrilir.
+    
+    Attributes:
+        nesneler (List[T]): Yoğun indeks sırasındaki nesneler
+        idler (List[int]): Yoğun indeks sırasındaki ID'ler
+        id_dizisi (np.ndarray): idler listesinin NumPy karşılığı
+        indeksler (Dict[int, int]): ID'den yoğun indekse eşleme
+    """
+    
+    def __init__(self, nesneler: Iterable[T]):
+        """
+        Args:
+            nesneler (Iterable[T]): id özniteliği olan nesneler
+        """
+        self.nesneler: List[T] = list(nesneler)
+        self.idler: List[int] = [nesne.id for nesne in self.nesneler]
+        self.id_dizisi = np.array(self.idler, dtype=np.int64)
+        self._id_tamponu: Optional[np.ndarray] = None
+        
+        self.indeksler: Dict[int, int] = {}
+        for indeks, nesne_id in enumerate(self.idler):
+            if nesne_id in self.indeksler:
+                raise ValueError(f"Yinelenen ID: {nesne_id}")
+            self.indeksler[nesne_id] = indeks
+        
+        # Yoğun ID'ler için ID → indeks tablosu (olmayan ID'ler -1)
+        self._indeks_tablosu: Optional[np.ndarray] = None
+        if self.idler and min(self.idler) >= 0 and max(self.idler) < 4 * len(self.idler) + 1024:
+            self._indeks_tablosu = np.full(max(self.idler) + 1, -1, dtype=np.int64)
+            self._indeks_tablosu[self.id_dizisi] = np.arange(len(self.idler))
+    
+    def ekle(self, nesne: T) -> int:
+        """
+        Kayda yeni bir nesne ekler.
+        
+        Args:
+            nesne (T): id özniteliği olan nesne
+        
+        Returns:
+            int: Nesnenin yoğun indeksi
+        """
+        nesne_id = nesne.id
+        if nesne_id in self.indeksler:
+            raise ValueError(f"Yinelenen ID: {nesne_id}")
+        
+        indeks = len(self.nesneler)
+        self.nesneler.append(nesne)
+        self.idler.append(nesne_id)
+        self._id_tamponu, self.id_dizisi = kapasiteli_ekle(self._id_tamponu, self.id_dizisi, nesne_id)
+        self.indeksler[nesne_id] = indeks
+        
+        # Tablo yalnızca ID'ler yoğun kaldıkça tutulur
+        if self._indeks_tablosu is not None:
+            if nesne_id < 0 or nesne_id >= 4 * len(self.idler) + 1024:
+                self._indeks_tablosu = None
+            else:
+                if nesne_id >= len(self._indeks_tablosu):
+                    yeni_tablo = np.full(max(nesne_id + 1, 2 * len(self._indeks_tablosu)), -1, dtype=np.int64)
+                    yeni_tablo[:len(self._indeks_tablosu)] = self._indeks_tablosu
+                    self._indeks_tablosu = yeni_tablo
+                self._indeks_tablosu[nesne_id] = indeks
+        
+        return indeks
+    
+    def __len__(self) -> int:
+        return len(self.nesneler)
+    
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.nesneler)
+    
+    def __contains__(self, nesne_id: int) -> bool:
+        return nesne_id in self.indeksler
+    
+    def __getitem__(self, nesne_id: int) -> T:
+        """ID'si verilen nesneyi döndürür."""
+        return self.nesneler[self.indeksler[nesne_id]]
+    
+    def items(self) -> Iterator[Tuple[int, T]]:
+        """(ID, nesne) çiftlerini yoğun indeks sırasıyla döndürür."""
+        return zip(self.idler, self.nesneler)
+    
+    def indeks(self, nesne_id: int) -> int:
+        """ID'si verilen nesnenin yoğun indeksini döndürür."""
+        return self.indeksler[nesne_id]
+    
+    def indeksleri_al(self, idler: Iterable[int]) -> np.ndarray:
+        """
+        Bir ID dizisini yoğun indeks dizisine çevirir.
+        
+        Args:
+            idler (Iterable[int]): ID'ler
+            
+        Returns:
+            np.ndarray: Yoğun indeksler (int64)
+        """
+        id_dizisi = np.fromiter(idler, dtype=np.int64)
+        if self._indeks_tablosu is not None:
+            gecerli = (id_dizisi >= 0) & (id_dizisi < len(self._indeks_tablosu))
+            indeksler = np.full(len(id_dizisi), -1, dtype=np.int64)
+            indeksler[gecerli] = self._indeks_tablosu[id_dizisi[gecerli]]
+        else:
+            indeksler = np.array([self.indeksler.get(int(i), -1) for i in id_dizisi], dtype=np.int64)
+        
+        if (indeksler < 0).any():
+            raise KeyError(f"Kayıtlı olmayan ID: {int(id_dizisi[np.argmax(indeksler < 0)])}")
+        return indeksler
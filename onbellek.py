@@ -0,0 +1,195 @@
+"""
+Drone Filo Optimizasyonu: Sonuç Önbelleği Modülü
+Bu modül, çözücü sonuçlarını senaryo içeriği ve çözücü parametrelerinin özetiyle
+anahtarlanmış olarak diskte saklayan önbelleği içerir.
+"""
+
+import hashlib
+import json
+import lzma
+import os
+from typing import Any, Dict, List, Optional
+from datetime import time
+
+from models import Drone, TeslimatNoktasi, UcusYasakBolgesi
+from data_generator import KolonluSenaryo, SIKISTIRMA_MODULLERI, dosya_ac
+
+
+# Sonuç biçimi ya da çözücüler değiştiğinde artırılır; eski kayıtlar kullanılmaz
+ONBELLEK_SURUMU = 2
+
+
+def senaryo_ozeti_hesapla(
+    dronlar: List[Drone], 
+    teslimat_noktalari: List[TeslimatNoktasi], 
+    ucus_yasak_bolgeleri: List[UcusYasakBolgesi]
+) -> str:
+    """
+    Senaryonun içerik özetini hesaplar (bkz. KolonluSenaryo.ozet).
+    
+    Args:
+        dronlar (List[Drone]): Drone'ların listesi
+        teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+        ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+        
+    Returns:
+        str: Onaltılık SHA-256 özeti
+    """
+    return KolonluSenaryo.nesnelerden_olustur(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri).ozet()
+
+
+def sonuc_anahtari_hesapla(
+    senaryo_ozeti: str, 
+    algoritma: str, 
+    mevcut_zaman: time, 
+    parametreler: Dict[str, Any]
+) -> str:
+    """
+    Senaryo özeti, algoritma ve çözücü parametrelerinden önbellek anahtarı üretir.
+    
+    Args:
+        senaryo_ozeti (str): Senaryonun içerik özeti
+        algoritma (str): Algoritma adı
+        mevcut_zaman (time): Planlamanın başladığı zaman
+        parametreler (Dict[str, Any]): Sonucu etkileyen çözücü parametreleri (JSON'a çevrilebilir)
+        
+    Returns:
+        str: Onaltılık SHA-256 anahtarı
+    """
+    icerik = json.dumps({
+        "surum": ONBELLEK_SURUMU,
+        "senaryo": senaryo_ozeti,
+        "algoritma": algoritma,
+        "mevcut_zaman": mevcut_zaman.isoformat(),
+        "parametreler": parametreler
+    }, sort_keys=True)
+    return hashlib.sha256(icerik.encode("utf-8")).hexdigest()
+
+
+class SonucOnbellegi:
+    """
+    Çözücü sonuçlarının disk üzerindeki, boyutu sınırlı LRU önbelleği.
+    
+    Her sonuç dizinde anahtarıyla adlandırılmış (isteğe bağlı sıkıştırılmış) bir JSON dosyasıdır. Dosyanın
+    değiştirilme zamanı son kullanım zamanı olarak tutulur (her isabette
+    güncellenir); toplam boyut sınırı aşıldığında en uzun süre kullanılmamış
+    kayıtlar silinir. Dosyalar önce geçici bir dosyaya yazılıp yerine taşındığından
+    yarıda kesilen bir kayıt önbelleği bozmaz.
+    
+    Attributes:
+        dizin (str): Önbellek dizini
+        maksimum_boyut (int): Kayıtların toplam boyut sınırı (bayt)
+        uzanti (str): Yeni kayıtların dosya uzantısı
+        isabet_sayisi (int): Önbellekten dönen sonuç sayısı
+        iska_sayisi (int): Önbellekte bulunamayan sonuç sayısı
+    """
+    
+    # Kayıt dosyalarının olası uzantıları (sıkıştırılmamış ve sıkıştırılmış)
+    KAYIT_UZANTILARI = (".json",) + tuple(".json" + uzanti for uzanti in SIKISTIRMA_MODULLERI)
+    
+    def __init__(self, dizin: str, maksimum_boyut: int = 256 * 2**20, sikistirma: Optional[str] = None):
+        """
+        Args:
+            dizin (str): Önbellek dizini (yoksa oluşturulur)
+            maksimum_boyut (int): Kayıtların toplam boyut sınırı (bayt)
+            sikistirma (Optional[str]): Yeni kayıtların sıkıştırma uzantısı (".gz", ".bz2",
+                                        ".xz"; None ise sıkıştırılmaz). Sınır sıkıştırılmış
+                                        boyuta uygulanır.
+        """
+        if maksimum_boyut <= 0:
+            raise ValueError("Önbellek boyutu pozitif olmalıdır.")
+        if sikistirma is not None and sikistirma not in SIKISTIRMA_MODULLERI:
+            raise ValueError(f"Desteklenmeyen sıkıştırma: {sikistirma} "
+                             f"(desteklenenler: {', '.join(SIKISTIRMA_MODULLERI)})")
+        
+        self.dizin = dizin
+        self.maksimum_boyut = maksimum_boyut
+        self.uzanti = ".json" + (sikistirma or "")
+        self.isabet_sayisi = 0
+        self.iska_sayisi = 0
+        os.makedirs(dizin, exist_ok=True)
+    
+    def _dosya_yolu(self, anahtar: str) -> str:
+        return os.path.join(self.dizin, anahtar + self.uzanti)
+    
+    def al(self, anahtar: str) -> Optional[Dict[str, Any]]:
+        """
+        Anahtarın sonucunu döndürür ve kaydı en son kullanılan olarak işaretler.
+        
+        Args:
+            anahtar (str): Önbellek anahtarı
+            
+        Returns:
+            Optional[Dict[str, Any]]: Kayıtlı sonuç; yoksa ya da okunamıyorsa None
+        """
+        dosya_yolu = self._dosya_yolu(anahtar)
+        try:
+            with dosya_ac(dosya_yolu, 'r') as f:
+                sonuc = json.load(f)
+            os.utime(dosya_yolu)
+        except (OSError, ValueError, EOFError, lzma.LZMAError):
+            self.iska_sayisi += 1
+            return None
+        
+        self.isabet_sayisi += 1
+        return sonuc
+    
+    def kaydet(self, anahtar: str, sonuc: Dict[str, Any]):
+        """
+        Sonucu kaydeder ve boyut sınırı aşıldıysa en eski kayıtları siler.
+        
+        Args:
+            anahtar (str): Önbellek anahtarı
+            sonuc (Dict[str, Any]): JSON'a çevrilebilir sonuç
+        """
+        dosya_yolu = self._dosya_yolu(anahtar)
+        # Geçici dosya aynı sıkıştırma uzantısıyla biter
+        gecici_dosya = os.path.join(self.dizin, f".{anahtar}.tmp{self.uzanti}")
+        with dosya_ac(gecici_dosya, 'w') as f:
+            json.dump(sonuc, f)
+        os.replace(gecici_dosya, dosya_yolu)
+        
+        self._tahliye_et(korunan=dosya_yolu)
+    
+    def _tahliye_et(self, korunan: Optional[str] = None):
+        """
+        Toplam boyut sınırın altına inene kadar en uzun süre kullanılmamış kayıtları siler.
+        
+        Args:
+            korunan (Optional[str]): Silinmeyecek kayıt (az önce yazılan)
+        """
+        kayitlar = []
+        for giris in os.scandir(self.dizin):
+            if giris.is_file() and giris.name.endswith(self.KAYIT_UZANTILARI) and not giris.name.startswith("."):
+                bilgi = giris.stat()
+                kayitlar.append((bilgi.st_mtime, bilgi.st_size, giris.path))
+        
+        toplam_boyut = sum(boyut for _, boyut, _ in kayitlar)
+        for _, boyut, yol in sorted(kayitlar):
+            if toplam_boyut <= self.maksimum_boyut:
+                break
+            if yol == korunan:
+                continue
+            try:
+                os.remove(yol)
+            except OSError:
+                continue
+            toplam_boyut -= boyut
+    
+    def istatistikleri_al(self) -> Dict[str, int]:
+        """
+        Önbellek sayaçlarını ve diskteki durumunu döndürür.
+        
+        Returns:
+            Dict[str, int]: İsabet ve ıska sayıları, kayıt sayısı ve toplam boyut (bayt)
+        """
+        boyutlar = [
+            giris.stat().st_size for giris in os.scandir(self.dizin)
+            if giris.is_file() and giris.name.endswith(self.KAYIT_UZANTILARI) and not giris.name.startswith(".")
+        ]
+        return {
+            "isabet_sayisi": self.isabet_sayisi,
+            "iska_sayisi": self.iska_sayisi,
+            "kayit_sayisi": len(boyutlar),
+            "toplam_boyut": sum(boyutlar)
+        }
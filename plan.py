@@ -0,0 +1,516 @@
+"""
+Drone Filo Optimizasyonu: Plan Sonucu Modülü
+Bu modül, çözücülerin farklı biçimlerdeki çıktılarını ayak (iki durak arası uçuş) başına
+mesafe, enerji, kalkış/varış zamanı ve ihlal bilgisi taşıyan ortak bir plan nesnesine
+çeviren ve bu planı JSONL, CSV ve ikili biçimlerde dışa aktaran yapıları içerir.
+"""
+
+import csv
+import json
+import struct
+from typing import Dict, List, Optional, Iterator
+from datetime import time
+
+import numpy as np
+
+from models import Drone, TeslimatNoktasi, UcusYasakBolgesi, KimlikKaydi
+from data_generator import dosya_ac, sikistirma_uzantisi
+from csp import zamani_saniyeye_cevir
+
+
+# Ayak başına kayıt; zamanlar gece yarısından itibaren saniye, depoya dönüş ayaklarında teslimat_id DEPO
+AYAK_TURU = np.dtype([
+    ("dron_id", "<i8"), ("sefer", "<i4"), ("sira", "<i4"), ("teslimat_id", "<i8"),
+    ("baslangic_x", "<f8"), ("baslangic_y", "<f8"), ("bitis_x", "<f8"), ("bitis_y", "<f8"),
+    ("mesafe", "<f8"), ("enerji", "<f8"), ("kalan_batarya", "<f8"),
+    ("kalkis", "<f8"), ("varis", "<f8"), ("ihlaller", "u1")
+])
+DEPO = -1
+
+# Ayak ihlalleri bit maskesi olarak tutulur
+IHLAL_KAPASITE = 1
+IHLAL_BATARYA = 2
+IHLAL_ZAMAN_PENCERESI = 4
+IHLAL_YASAK_BOLGE = 8
+IHLAL_ADLARI = {
+    IHLAL_KAPASITE: "kapasite", IHLAL_BATARYA: "batarya",
+    IHLAL_ZAMAN_PENCERESI: "zaman_penceresi", IHLAL_YASAK_BOLGE: "yasak_bolge"
+}
+
+# İkili plan dosyası: sihirli bayt + başlık uzunluğu + JSON başlık + ham ayak kayıtları
+PLAN_UZANTILARI = (".jsonl", ".csv", ".dfp")
+PLAN_SIHIRLI_BAYT = b"DFPLAN01"
+
+# Çözücü zamanları mikrosaniyeye yuvarlandığından bu kadarlık farklar gecikme sayılmaz
+_ZAMAN_TOLERANSI = 1e-6
+
+
+def _ihlal_adlari(maske: int) -> List[str]:
+    """Bir ihlal bit maskesini ihlal adlarının listesine çevirir."""
+    return [ad for bit, ad in IHLAL_ADLARI.items() if maske & bit]
+
+
+def _ihlal_maskesi(adlar: List[str]) -> int:
+    """İhlal adlarının listesini bit maskesine çevirir."""
+    bitler = {ad: bit for bit, ad in IHLAL_ADLARI.items()}
+    maske = 0
+    for ad in adlar:
+        if ad not in bitler:
+            raise ValueError(f"Bilinmeyen ihlal: {ad}")
+        maske |= bitler[ad]
+    return maske
+
+
+def _plan_bicimi(dosya_adi: str) -> str:
+    """Sıkıştırma uzantısı atılmış dosya adından plan biçimini (PLAN_UZANTILARI) bulur."""
+    uzanti = sikistirma_uzantisi(dosya_adi)
+    ad = dosya_adi[:-len(uzanti)] if uzanti else dosya_adi
+    for bicim in PLAN_UZANTILARI:
+        if ad.endswith(bicim):
+            return bicim
+    raise ValueError(f"Plan dosyası uzantısı {', '.join(PLAN_UZANTILARI)} olmalıdır: {dosya_adi}")
+
+
+class PlanSonucu:
+    """
+    Bir çözücünün ürettiği planın çözücüden bağımsız hali.
+    
+    Her ayak bir drone'un iki durak (depo ya da teslimat noktası) arasındaki tek bir
+    uçuşudur ve AYAK_TURU yapılı NumPy dizisinde drone, sefer ve sefer içi sıraya
+    göre dizili tutulur. Böylece plan, geometri yeniden hesaplanmadan diske yazılıp
+    başka sistemlerce okunabilir.
+    
+    Attributes:
+        algoritma (str): Planı üreten algoritmanın adı
+        baslangic_zamani (time): Planlamanın başlangıç zamanı
+        ayaklar (np.ndarray): AYAK_TURU yapılı ayak kayıtları
+        atanmamis_teslimatlar (List[int]): Plana alınmamış teslimatların ID'leri
+    """
+    
+    def __init__(
+        self,
+        algoritma: str,
+        baslangic_zamani: time,
+        ayaklar: np.ndarray,
+        atanmamis_teslimatlar: Optional[List[int]] = None
+    ):
+        """
+        Args:
+            algoritma (str): Planı üreten algoritmanın adı
+            baslangic_zamani (time): Planlamanın başlangıç zamanı
+            ayaklar (np.ndarray): AYAK_TURU yapılı ayak kayıtları
+            atanmamis_teslimatlar (Optional[List[int]]): Plana alınmamış teslimatların ID'leri
+        """
+        if ayaklar.dtype != AYAK_TURU:
+            raise ValueError(f"Ayak dizisinin türü AYAK_TURU olmalıdır: {ayaklar.dtype}")
+        self.algoritma = algoritma
+        self.baslangic_zamani = baslangic_zamani
+        self.ayaklar = ayaklar
+        self.atanmamis_teslimatlar = list(atanmamis_teslimatlar or [])
+    
+    def __len__(self) -> int:
+        return len(self.ayaklar)
+    
+    @classmethod
+    def seferlerden_olustur(
+        cls,
+        algoritma: str,
+        dronlar: List[Drone],
+        teslimat_noktalari: List[TeslimatNoktasi],
+        ucus_yasak_bolgeleri: List[UcusYasakBolgesi],
+        baslangic_zamani: time,
+        seferler: Dict[int, List[List[int]]],
+        depoya_donus: bool = True,
+        varis_zamanlari: Optional[Dict[int, float]] = None,
+        donus_zamanlari: Optional[Dict[int, List[Optional[float]]]] = None
+    ) -> "PlanSonucu":
+        """
+        Drone başına sefer ve durak sıralarından ayakları ve ihlallerini hesaplar.
+        
+        Zamanı verilmeyen ayaklarda KisitCozucu'nun zaman modeli kullanılır: drone bir
+        önceki varışta kalkar, teslimat penceresi henüz açılmamışsa pencere başında
+        varacak şekilde bekler; depoya dönüşten sonra bataryası dolana kadar şarj olur.
+        Her sefer tam bataryayla başlar. Ayaklar oluşturulduktan sonra ihlaller tüm
+        ayaklar üzerinde toplu olarak denetlenir:
+        
+        - kapasite: paket drone'un taşıyabileceğinden ağır
+        - batarya: seferde o ana kadar harcanan enerji batarya kapasitesini aşıyor
+        - zaman_penceresi: varış teslimatın zaman aralığının dışında
+        - yasak_bolge: uçuş, uçuş süresince aktif olan bir yasak bölgeyi kesiyor
+        
+        Args:
+            algoritma (str): Planı üreten algoritmanın adı
+            dronlar (List[Drone]): Drone'ların listesi
+            teslimat_noktalari (List[TeslimatNoktasi]): Teslimat noktalarının listesi
+            ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+            baslangic_zamani (time): Planlamanın başlangıç zamanı
+            seferler (Dict[int, List[List[int]]]): Drone ID'sinden, her biri sırayla ziyaret
+                                                   edilen teslimat ID'lerinden oluşan seferlere
+            depoya_donus (bool): Her seferin sonuna depoya dönüş ayağı ekle
+            varis_zamanlari (Optional[Dict[int, float]]): Çözücünün hesapladığı teslimat
+                                                         varış zamanları (gece yarısından saniye)
+            donus_zamanlari (Optional[Dict[int, List[Optional[float]]]]): Çözücünün hesapladığı,
+                                                                          sefer başına depoya varış zamanları
+        
+        Returns:
+            PlanSonucu: Plan
+        """
+        dron_kaydi = KimlikKaydi(dronlar)
+        teslimat_kaydi = KimlikKaydi(teslimat_noktalari)
+        varis_zamanlari = varis_zamanlari or {}
+        donus_zamanlari = donus_zamanlari or {}
+        baslangic = zamani_saniyeye_cevir(baslangic_zamani)
+        
+        kayitlar = []
+        for dron_id, dron_seferleri in seferler.items():
+            dron = dron_kaydi[dron_id]
+            depo = dron.baslangic_poz
+            hazir = baslangic
+            
+            for sefer_no, durak_idleri in enumerate(dron_seferleri):
+                poz = depo
+                batarya = dron.batarya
+                duraklar = list(durak_idleri) + ([DEPO] if depoya_donus and durak_idleri else [])
+                
+                for sira, durak_id in enumerate(duraklar):
+                    if durak_id == DEPO:
+                        hedef_poz, agirlik, pencere_baslangic = depo, 0, hazir
+                        verilen = donus_zamanlari.get(dron_id, [])
+                        verilen = verilen[sefer_no] if sefer_no < len(verilen) else None
+                    else:
+                        teslimat = teslimat_kaydi[durak_id]
+                        hedef_poz, agirlik = teslimat.poz, teslimat.agirlik
+                        pencere_baslangic = zamani_saniyeye_cevir(teslimat.zaman_araligi[0])
+                        verilen = varis_zamanlari.get(durak_id)
+                    
+                    mesafe = ((hedef_poz[0] - poz[0])**2 + (hedef_poz[1] - poz[1])**2)**0.5
+                    seyahat_suresi = mesafe / dron.hiz
+                    if verilen is None:
+                        varis = max(hazir, pencere_baslangic - seyahat_suresi) + seyahat_suresi
+                    else:
+                        varis = verilen
+                    enerji = dron.enerji_tuketimi_hesapla(mesafe, agirlik)
+                    batarya -= enerji
+                    
+                    kayitlar.append((
+                        dron_id, sefer_no, sira, durak_id, poz[0], poz[1], hedef_poz[0], hedef_poz[1],
+                        mesafe, enerji, batarya, varis - seyahat_suresi, varis, 0
+                    ))
+                    poz, hazir = hedef_poz, varis
+                
+                if depoya_donus and durak_idleri:
+                    hazir += dron.sarj_suresi_hesapla(max(batarya, 0))
+        
+        ayaklar = np.array(kayitlar, dtype=AYAK_TURU)
+        ayaklar["ihlaller"] = cls._ihlalleri_hesapla(ayaklar, dron_kaydi, teslimat_kaydi, ucus_yasak_bolgeleri)
+        
+        planlanan = set(ayaklar["teslimat_id"].tolist())
+        atanmamis = [teslimat_id for teslimat_id in teslimat_kaydi.idler if teslimat_id not in planlanan]
+        return cls(algoritma, baslangic_zamani, ayaklar, atanmamis)
+    
+    @staticmethod
+    def _ihlalleri_hesapla(
+        ayaklar: np.ndarray,
+        dron_kaydi: KimlikKaydi,
+        teslimat_kaydi: KimlikKaydi,
+        ucus_yasak_bolgeleri: List[UcusYasakBolgesi]
+    ) -> np.ndarray:
+        """
+        Ayakların ihlal bit maskelerini toplu olarak hesaplar.
+        
+        Args:
+            ayaklar (np.ndarray): AYAK_TURU yapılı ayak kayıtları
+            dron_kaydi (KimlikKaydi): Drone kaydı
+            teslimat_kaydi (KimlikKaydi): Teslimat noktası kaydı
+            ucus_yasak_bolgeleri (List[UcusYasakBolgesi]): Uçuşa yasak bölgelerin listesi
+        
+        Returns:
+            np.ndarray: Ayak başına ihlal bit maskesi (uint8)
+        """
+        maskeler = np.zeros(len(ayaklar), dtype=np.uint8)
+        if not len(ayaklar):
+            return maskeler
+        
+        maskeler[ayaklar["kalan_batarya"] < 0] |= IHLAL_BATARYA
+        
+        teslimatlar = np.flatnonzero(ayaklar["teslimat_id"] != DEPO)
+        if len(teslimatlar):
+            dron_sirasi = dron_kaydi.indeksleri_al(ayaklar["dron_id"][teslimatlar])
+            teslimat_sirasi = teslimat_kaydi.indeksleri_al(ayaklar["teslimat_id"][teslimatlar])
+            maksimum_agirliklar = np.array([dron.maksimum_agirlik for dron in dron_kaydi], dtype=float)
+            agirliklar = np.array([teslimat.agirlik for teslimat in teslimat_kaydi], dtype=float)
+            pencereler = np.array(
+                [[zamani_saniyeye_cevir(t) for t in teslimat.zaman_araligi] for teslimat in teslimat_kaydi], dtype=float
+            ).reshape(-1, 2)
+            
+            kapasite_asimi = agirliklar[teslimat_sirasi] > maksimum_agirliklar[dron_sirasi]
+            maskeler[teslimatlar[kapasite_asimi]] |= IHLAL_KAPASITE
+            
+            varislar = ayaklar["varis"][teslimatlar]
+            pencere_disi = ((varislar < pencereler[teslimat_sirasi, 0] - _ZAMAN_TOLERANSI) |
+                            (varislar > pencereler[teslimat_sirasi, 1] + _ZAMAN_TOLERANSI))
+            maskeler[teslimatlar[pencere_disi]] |= IHLAL_ZAMAN_PENCERESI
+        
+        # Uçuş süresince aktif olan bölgelerle kesişen (sıfır uzunlukta olmayan) ayaklar
+        baslangiclar = np.column_stack((ayaklar["baslangic_x"], ayaklar["baslangic_y"]))
+        bitisler = np.column_stack((ayaklar["bitis_x"], ayaklar["bitis_y"]))
+        for bolge in ucus_yasak_bolgeleri:
+            aktif_baslangic, aktif_bitis = (zamani_saniyeye_cevir(t) for t in bolge.aktif_zaman)
+            adaylar = np.flatnonzero(
+                (ayaklar["kalkis"] <= aktif_bitis) & (ayaklar["varis"] >= aktif_baslangic) & (ayaklar["mesafe"] > 0)
+            )
+            if len(adaylar):
+                kesisen = bolge.cizgiler_kesisiyor_mu(baslangiclar[adaylar], bitisler[adaylar])
+                maskeler[adaylar[kesisen]] |= IHLAL_YASAK_BOLGE
+        
+        return maskeler
+    
+    @classmethod
+    def kisit_cozucuden(cls, kisit_cozucu) -> "PlanSonucu":
+        """
+        KisitCozucu'nun seferlerinden, çözücünün kendi varış ve depoya dönüş zamanlarıyla plan oluşturur.
+        
+        Args:
+            kisit_cozucu (KisitCozucu): Çözmüş kısıt çözücü
+        
+        Returns:
+            PlanSonucu: Plan
+        """
+        varis_zamanlari = {
+            teslimat_id: zamani_saniyeye_cevir(varis)
+            for zamanlar in kisit_cozucu.tahmini_varis_zamanlari.values()
+            for teslimat_id, varis in zamanlar.items()
+        }
+        seferler, donus_zamanlari = {}, {}
+        for dron in kisit_cozucu.dronlar:
+            dron_seferleri = kisit_cozucu.seferler.get(dron.id, [])
+            seferler[dron.id] = [sefer.teslimatlar for sefer in dron_seferleri]
+            donus_zamanlari[dron.id] = [
+                zamani_saniyeye_cevir(sefer.donus_zamani) if sefer.tamamlandi_mi else None for sefer in dron_seferleri
+            ]
+        
+        return cls.seferlerden_olustur(
+            "kisit", kisit_cozucu.dronlar, kisit_cozucu.teslimat_noktalari, kisit_cozucu.ucus_yasak_bolgeleri,
+            kisit_cozucu.baslangic_zamani, seferler,
+            varis_zamanlari=varis_zamanlari, donus_zamanlari=donus_zamanlari
+        )
+    
+    @classmethod
+    def genetik_algoritmadan(cls, genetik_algoritma) -> "PlanSonucu":
+        """
+        GenetikAlgoritma'nın en iyi bireyinden plan oluşturur.
+        
+        GA depoya dönüş ve zaman modellemediğinden her drone'un rotası dönüşsüz tek bir
+        sefer olarak alınır ve zamanlar ortak zaman modeliyle hesaplanır.
+        
+        Args:
+            genetik_algoritma (GenetikAlgoritma): Evrimleşmiş genetik algoritma
+        
+        Returns:
+            PlanSonucu: Plan
+        """
+        kromozom = genetik_algoritma.en_iyi_birey.kromozom if genetik_algoritma.en_iyi_birey else {}
+        seferler = {dron.id: [kromozom.get(dron.id, [])] for dron in genetik_algoritma.dronlar}
+        
+        return cls.seferlerden_olustur(
+            "genetik", genetik_algoritma.dronlar, genetik_algoritma.teslimat_noktalari,
+            genetik_algoritma.ucus_yasak_bolgeleri, genetik_algoritma.mevcut_zaman, seferler, depoya_donus=False
+        )
+    
+    @classmethod
+    def a_yildizdan(cls, a_yildiz, rotalar: List[List[TeslimatNoktasi]]) -> "PlanSonucu":
+        """
+        AStar'ın tek drone için bulduğu rotalardan plan oluşturur.
+        
+        Her rota bir sonraki teslimata giden yoldur; plandaki duraklar rotaların hedef
+        teslimatlarıdır (yol üzerindeki ara noktalar ayrı ayak olarak yazılmaz).
+        
+        Args:
+            a_yildiz (AStar): Rotaları bulan A* nesnesi
+            rotalar (List[List[TeslimatNoktasi]]): tum_teslimatlar_icin_optimal_rotalar_bul çıktısı
+        
+        Returns:
+            PlanSonucu: Plan
+        """
+        duraklar = [rota[-1].id for rota in rotalar if rota and rota[-1].id != DEPO]
+        
+        return cls.seferlerden_olustur(
+            "a_yildiz", [a_yildiz.drone], a_yildiz.teslimat_noktalari, a_yildiz.ucus_yasak_bolgeleri,
+            a_yildiz.mevcut_zaman, {a_yildiz.drone.id: [duraklar]}, depoya_donus=False
+        )
+    
+    def ozet_al(self) -> Dict:
+        """
+        Planın toplam değerlerini döndürür.
+        
+        Returns:
+            Dict: Drone, sefer, ayak ve teslimat sayıları, toplam mesafe ve enerji,
+                  son varış zamanı ve ihlal türü başına ihlalli ayak sayısı
+        """
+        ayaklar = self.ayaklar
+        return {
+            "dron_sayisi": len(np.unique(ayaklar["dron_id"])),
+            "sefer_sayisi": int(np.count_nonzero(ayaklar["sira"] == 0)),
+            "ayak_sayisi": len(ayaklar),
+            "teslimat_sayisi": int(np.count_nonzero(ayaklar["teslimat_id"] != DEPO)),
+            "atanmamis_sayisi": len(self.atanmamis_teslimatlar),
+            "toplam_mesafe": float(ayaklar["mesafe"].sum()),
+            "toplam_enerji": float(ayaklar["enerji"].sum()),
+            "son_varis": float(ayaklar["varis"].max()) if len(ayaklar) else None,
+            "ihlaller": {ad: int(np.count_nonzero(ayaklar["ihlaller"] & bit)) for bit, ad in IHLAL_ADLARI.items()}
+        }
+    
+    def _baslik_olustur(self) -> Dict:
+        """Dosya biçimlerinin ortak başlık kaydını oluşturur."""
+        return {
+            "surum": 1,
+            "algoritma": self.algoritma,
+            "baslangic_zamani": self.baslangic_zamani.isoformat(),
+            "ayak_sayisi": len(self.ayaklar),
+            "atanmamis_teslimatlar": self.atanmamis_teslimatlar,
+            "ozet": self.ozet_al()
+        }
+    
+    def ayak_kayitlari(self) -> Iterator[Dict]:
+        """
+        Ayakları sırayla sözlük olarak üretir; ihlaller ad listesi olarak verilir.
+        
+        Returns:
+            Iterator[Dict]: Ayak kayıtları
+        """
+        adlar = AYAK_TURU.names
+        kolonlar = [self.ayaklar[ad].tolist() for ad in adlar]
+        for degerler in zip(*kolonlar):
+            kayit = dict(zip(adlar, degerler))
+            kayit["ihlaller"] = _ihlal_adlari(kayit["ihlaller"])
+            yield kayit
+    
+    def sozluge_cevir(self) -> Dict:
+        """
+        Planı JSON'a çevrilebilir (önbelleğe yazılabilir) kolonlu bir sözlüğe çevirir.
+        
+        Returns:
+            Dict: Algoritma, başlangıç zamanı, atanmamış teslimatlar ve kolon listeleri
+        """
+        return {
+            "algoritma": self.algoritma,
+            "baslangic_zamani": self.baslangic_zamani.isoformat(),
+            "atanmamis_teslimatlar": self.atanmamis_teslimatlar,
+            "ayaklar": {ad: self.ayaklar[ad].tolist() for ad in AYAK_TURU.names}
+        }
+    
+    @classmethod
+    def sozlukten_olustur(cls, sozluk: Dict) -> "PlanSonucu":
+        """
+        sozluge_cevir çıktısından planı yeniden oluşturur.
+        
+        Args:
+            sozluk (Dict): sozluge_cevir çıktısı
+        
+        Returns:
+            PlanSonucu: Plan
+        """
+        kolonlar = sozluk["ayaklar"]
+        ayaklar = np.zeros(len(kolonlar["dron_id"]), dtype=AYAK_TURU)
+        for ad in AYAK_TURU.names:
+            ayaklar[ad] = kolonlar[ad]
+        return cls(sozluk["algoritma"], time.fromisoformat(sozluk["baslangic_zamani"]), ayaklar,
+                   sozluk["atanmamis_teslimatlar"])
+    
+    def kaydet(self, dosya_adi: str, sikistirma_seviyesi: Optional[int] = None):
+        """
+        Planı uzantısına göre JSONL, CSV ya da ikili biçimde yazar.
+        
+        Dosyalar dosya_ac ile akış halinde yazıldığından sıkıştırma uzantısı
+        (ör. plan.jsonl.gz) eklenerek saydam olarak sıkıştırılabilir.
+        
+        - .jsonl: İlk satır başlık (tur="plan", özet dahil), ardından ayak başına bir satır
+        - .csv: Başlık satırı ve ayak başına bir satır; ihlaller '|' ile ayrılır
+        - .dfp: Sihirli bayt, 8 baytlık başlık uzunluğu, JSON başlık ve ham
+          (little-endian, AYAK_TURU) ayak kayıtları
+        
+        Args:
+            dosya_adi (str): Dosya adı
+            sikistirma_seviyesi (Optional[int]): Sıkıştırma seviyesi (None ise varsayılan)
+        """
+        bicim = _plan_bicimi(dosya_adi)
+        
+        if bicim == ".dfp":
+            baslik = self._baslik_olustur()
+            baslik["tur"] = [list(alan) for alan in AYAK_TURU.descr]
+            baslik = json.dumps(baslik).encode("utf-8")
+            with dosya_ac(dosya_adi, 'wb', seviye=sikistirma_seviyesi) as f:
+                f.write(PLAN_SIHIRLI_BAYT)
+                f.write(struct.pack('<Q', len(baslik)))
+                f.write(baslik)
+                f.write(np.ascontiguousarray(self.ayaklar).tobytes())
+        
+        elif bicim == ".jsonl":
+            # Anahtarlar ve ihlal listeleri önceden metne çevrilir; satır başına yalnızca sayılar biçimlenir
+            sablon = '{"tur": "ayak", ' + ", ".join(f'"{ad}": %s' for ad in AYAK_TURU.names) + "}\n"
+            ihlal_metinleri = [json.dumps(_ihlal_adlari(maske)) for maske in range(2 * max(IHLAL_ADLARI))]
+            with dosya_ac(dosya_adi, 'w', seviye=sikistirma_seviyesi) as f:
+                f.write(json.dumps({"tur": "plan", **self._baslik_olustur()}) + "\n")
+                f.writelines(sablon % degerler for degerler in self._satirlar(ihlal_metinleri))
+        
+        else:
+            ihlal_metinleri = ["|".join(_ihlal_adlari(maske)) for maske in range(2 * max(IHLAL_ADLARI))]
+            with dosya_ac(dosya_adi, 'w', seviye=sikistirma_seviyesi) as f:
+                yazici = csv.writer(f, lineterminator="\n")
+                yazici.writerow(AYAK_TURU.names)
+                yazici.writerows(self._satirlar(ihlal_metinleri))
+    
+    def _satirlar(self, ihlal_metinleri: List) -> Iterator[tuple]:
+        """Ayakları, ihlal maskesi ihlal_metinleri'ndeki karşılığıyla değiştirilmiş değer demetleri olarak üretir."""
+        kolonlar = [self.ayaklar[ad].tolist() for ad in AYAK_TURU.names[:-1]]
+        ihlaller = [ihlal_metinleri[maske] for maske in self.ayaklar["ihlaller"].tolist()]
+        return zip(*kolonlar, ihlaller)
+    
+    @classmethod
+    def yukle(cls, dosya_adi: str) -> "PlanSonucu":
+        """
+        JSONL ya da ikili biçimde yazılmış planı okur.
+        
+        CSV dışa aktarımı başlık bilgilerini (algoritma, başlangıç zamanı, atanmamış
+        teslimatlar) taşımadığından geri okunmaz.
+        
+        Args:
+            dosya_adi (str): Dosya adı
+        
+        Returns:
+            PlanSonucu: Plan
+        """
+        bicim = _plan_bicimi(dosya_adi)
+        
+        if bicim == ".dfp":
+            with dosya_ac(dosya_adi, 'rb') as f:
+                if f.read(len(PLAN_SIHIRLI_BAYT)) != PLAN_SIHIRLI_BAYT:
+                    raise ValueError(f"İkili plan dosyası değil: {dosya_adi}")
+                baslik_uzunlugu, = struct.unpack('<Q', f.read(8))
+                baslik = json.loads(f.read(baslik_uzunlugu).decode("utf-8"))
+                if baslik.get("surum") != 1:
+                    raise ValueError(f"Desteklenmeyen plan dosyası sürümü: {baslik.get('surum')}")
+                if np.dtype([tuple(alan) for alan in baslik["tur"]]) != AYAK_TURU:
+                    raise ValueError(f"Plan dosyasının ayak türü uyumsuz: {dosya_adi}")
+                ayaklar = np.frombuffer(f.read(), dtype=AYAK_TURU, count=baslik["ayak_sayisi"]).copy()
+        
+        elif bicim == ".jsonl":
+            with dosya_ac(dosya_adi, 'r') as f:
+                baslik = json.loads(f.readline())
+                if baslik.get("tur") != "plan" or baslik.get("surum") != 1:
+                    raise ValueError(f"Desteklenmeyen plan dosyası başlığı: {dosya_adi}")
+                adlar = AYAK_TURU.names
+                satirlar = []
+                for satir in f:
+                    kayit = json.loads(satir)
+                    kayit["ihlaller"] = _ihlal_maskesi(kayit["ihlaller"])
+                    satirlar.append(tuple(kayit[ad] for ad in adlar))
+                if len(satirlar) != baslik["ayak_sayisi"]:
+                    raise ValueError(f"Plan dosyası eksik: {len(satirlar)}/{baslik['ayak_sayisi']} ayak okundu")
+                ayaklar = np.array(satirlar, dtype=AYAK_TURU)
+        
+        else:
+            raise ValueError("CSV plan dosyaları yalnızca dışa aktarım içindir; JSONL ya da .dfp kullanın")
+        
+        return cls(baslik["algoritma"], time.fromisoformat(baslik["baslangic_zamani"]), ayaklar,
+                   baslik["atanmamis_teslimatlar"])
@@ -4,6 +4,9 @@ Bu modül, algoritmaların performansını test etmek için örnek senaryolar i
 """
 
 import os
+import json
+import tempfile
+import dataclasses
 import time as zaman_modulu
 from datetime import time
 import matplotlib.pyplot as plt
@@ -11,11 +14,13 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 
 from models import Drone, TeslimatNoktasi, UcusYasakBolgesi
-from data_generator import VeriUreteci
+from data_generator import VeriUreteci, SenaryoFarki, KolonluSenaryo, SIKISTIRMA_MODULLERI, dosya_ac, senaryoyu_dogrula
 from astar import AStar
-from csp import KisitCozucu
-from genetic import GenetikAlgoritma
+from csp import KisitCozucu, statik_uygunluk_matrisi_hesapla
+from genetic import GenetikAlgoritma, JsonlTelemetriYazici
 from visualization import Gorselleştirici
+from plan import PlanSonucu
+from onbellek import SonucOnbellegi
 
 
 def senaryo_1_calistir(cikti_dizini: str) -> Dict[str, float]:
@@ -122,6 +127,7 @@ def senaryo_1_calistir(cikti_dizini: str) -> Dict[str, float]:
     
     # CSP istatistiklerini al
     kisit_istatistikleri = kisit_cozucu.teslimat_istatistiklerini_al()
+    sonuclar["csp_tamamlanma_orani"] = kisit_istatistikleri['tamamlanma_orani']
     print(f"Tamamlanan teslimat yüzdesi: {kisit_istatistikleri['tamamlanma_orani']:.2f}%")
     print(f"Ortalama enerji tüketimi: {kisit_istatistikleri['ortalama_enerji_tuketimi']:.2f} mAh")
     
@@ -289,6 +295,7 @@ def senaryo_2_calistir(cikti_dizini: str) -> Dict[str, float]:
     
     # CSP istatistiklerini al
     kisit_istatistikleri = kisit_cozucu.teslimat_istatistiklerini_al()
+    sonuclar["csp_tamamlanma_orani"] = kisit_istatistikleri['tamamlanma_orani']
     print(f"Tamamlanan teslimat yüzdesi: {kisit_istatistikleri['tamamlanma_orani']:.2f}%")
     print(f"Ortalama enerji tüketimi: {kisit_istatistikleri['ortalama_enerji_tuketimi']:.2f} mAh")
     
@@ -378,6 +385,816 @@ def senaryo_2_calistir(cikti_dizini: str) -> Dict[str, float]:
     return sonuclar
 
 
+def uretilen_senaryolari_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2, 3)):
+    """
+    Üreteçlerin ürettiği senaryoların doğrulamadan hatasız geçtiğini kontrol eder.
+    
+    Harita köşelerine kırpılan uçuş yasak bölgeleri tekrarlanan köşeler içerebilir;
+    bunlar kendini kesen poligon olarak raporlanmamalıdır.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Üretilen senaryolar doğrulanıyor...")
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(10, 200, 50)
+        senaryolar = {
+            "senaryo_uret": senaryoyu_dogrula(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri),
+            # Kırpılmış köşeli bölgelerin çıkması için çok sayıda bölge üretilir
+            "ucus_yasak_bolgeleri_uret": senaryoyu_dogrula([], [], veri_ureteci.ucus_yasak_bolgeleri_uret(20000)),
+            "kolonlu_senaryo_uret": veri_ureteci.kolonlu_senaryo_uret(10, 100000, 2000).dogrula(),
+            "sehir_senaryosu_uret": veri_ureteci.sehir_senaryosu_uret(20000).dogrula(),
+        }
+        
+        for ad, sorunlar in senaryolar.items():
+            hatalar = [sorun for sorun in sorunlar if sorun.seviye == "hata"]
+            assert not hatalar, f"{ad} (tohum {tohum}) doğrulama hatası üretti: {hatalar[:3]}"
+    
+    print(f"{len(tohumlar)} tohumla üretilen senaryolar doğrulamadan hatasız geçti")
+
+
+def _plan_ihlallerini_al(kisit_cozucu: KisitCozucu) -> Dict[str, int]:
+    """CSP çözücünün mevcut planındaki kural ihlallerini kural başına döndürür."""
+    return PlanSonucu.kisit_cozucuden(kisit_cozucu).ozet_al()["ihlaller"]
+
+
+def cevrimici_eklemeyi_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2)):
+    """
+    KisitCozucu.ekle ile büyütülen planın, baştan çözümle aynı şekilde uygulanabilir olduğunu kontrol eder.
+    
+    Teslimatların bir kısmı planlanır, kalanlar tek tek eklenir. Eklemeli plan ve tüm
+    teslimatların baştan çözümü ihlalsiz olmalı; eklemeden önce atanmış teslimatlar
+    atanmış kalmalı ve ekle'nin yerleştirdiğini bildirdiği teslimatlar planda olmalıdır.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Çevrimiçi ekleme baştan çözümle karşılaştırılıyor...")
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(5, 60, 3, (10.0, 10.0))
+        baslangic_zamani = time(9, 0)
+        
+        kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari[:45], ucus_yasak_bolgeleri, baslangic_zamani)
+        kisit_cozucu.coz()
+        onceki_atananlar = {tid for tidler in kisit_cozucu.atamalar.values() for tid in tidler}
+        eklenenler = {nokta.id for nokta in teslimat_noktalari[45:] if kisit_cozucu.ekle(nokta) is not None}
+        
+        tam_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, baslangic_zamani)
+        tam_cozucu.coz()
+        
+        for ad, cozucu in (("ekleme", kisit_cozucu), ("baştan çözüm", tam_cozucu)):
+            ihlaller = _plan_ihlallerini_al(cozucu)
+            assert not any(ihlaller.values()), f"{ad} planı ihlal içeriyor (tohum {tohum}): {ihlaller}"
+        atananlar = {tid for tidler in kisit_cozucu.atamalar.values() for tid in tidler}
+        assert atananlar == onceki_atananlar | eklenenler, f"eklemeli plandaki atamalar tutarsız (tohum {tohum})"
+    
+    print(f"{len(tohumlar)} tohumla eklemeli ve baştan çözülen planlar ihlalsiz")
+
+
+def fark_uygulamasini_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2)):
+    """
+    KisitCozucu.farki_uygula ile güncellenen çözücünün, yeni senaryoyla baştan kurulanla aynı olduğunu kontrol eder.
+    
+    Her adımda teslimat ekleyen, güncelleyen ve silen, bir bölgeyi taşıyan ve drone'ları
+    değiştiren bir fark dosyaya yazılıp okunur ve uygulanır. Statik alanlar, alan
+    daraltma istatistikleri ve çözüm sonuçları eşit olmalıdır.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Senaryo farkı uygulaması baştan kurulumla karşılaştırılıyor...")
+    with tempfile.TemporaryDirectory() as gecici_dizin:
+        fark_dosyasi = os.path.join(gecici_dizin, "fark.txt")
+        for tohum in tohumlar:
+            veri_ureteci = VeriUreteci(tohum=tohum)
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(4, 60, 3)
+            baslangic_zamani = time(9, 0)
+            kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, baslangic_zamani)
+            
+            for adim in range(3):
+                teslimatlar = kisit_cozucu.teslimat_noktalari
+                fark = SenaryoFarki()
+                fark.guncellenenler["TESLIMAT_NOKTALARI"] = [
+                    dataclasses.replace(nokta, agirlik=nokta.agirlik * 2, poz=(nokta.poz[1], nokta.poz[0]))
+                    for nokta in teslimatlar[adim:adim + 3]
+                ]
+                fark.silinenler["TESLIMAT_NOKTALARI"] = [nokta.id for nokta in teslimatlar[-2:]]
+                fark.eklenenler["TESLIMAT_NOKTALARI"] = [
+                    dataclasses.replace(nokta, id=10000 + 10 * adim + i)
+                    for i, nokta in enumerate(veri_ureteci.teslimat_noktalari_uret(4))
+                ]
+                if adim >= 1:
+                    bolge = kisit_cozucu.ucus_yasak_bolgeleri[0]
+                    fark.guncellenenler["UCUS_YASAK_BOLGELERI"] = [
+                        dataclasses.replace(bolge, koordinatlar=[(x + 10, y + 5) for x, y in bolge.koordinatlar])
+                    ]
+                if adim == 2:
+                    dron = kisit_cozucu.dronlar[0]
+                    fark.guncellenenler["DRONLAR"] = [dataclasses.replace(dron, maksimum_agirlik=dron.maksimum_agirlik / 3)]
+                    fark.eklenenler["DRONLAR"] = [dataclasses.replace(kisit_cozucu.dronlar[1], id=500)]
+                
+                veri_ureteci.farki_dosyaya_kaydet(fark_dosyasi, fark)
+                okunan_fark = veri_ureteci.farki_dosyadan_yukle(fark_dosyasi)
+                assert okunan_fark == fark, f"fark dosyası gidiş-dönüşü bozuk (tohum {tohum}, adım {adim})"
+                
+                yeni_senaryo = fark.uygula(
+                    kisit_cozucu.dronlar, kisit_cozucu.teslimat_noktalari, kisit_cozucu.ucus_yasak_bolgeleri
+                )
+                kisit_cozucu.farki_uygula(okunan_fark)
+                taze_cozucu = KisitCozucu(*yeni_senaryo, baslangic_zamani)
+                
+                assert kisit_cozucu.statik_alanlar == taze_cozucu.statik_alanlar, \
+                    f"statik alanlar farklı (tohum {tohum}, adım {adim})"
+                assert kisit_cozucu.alan_daraltma_istatistikleri == taze_cozucu.alan_daraltma_istatistikleri, \
+                    f"alan daraltma istatistikleri farklı (tohum {tohum}, adım {adim})"
+                assert kisit_cozucu.coz() == taze_cozucu.coz(), f"çözümler farklı (tohum {tohum}, adım {adim})"
+    
+    print(f"{len(tohumlar)} tohumla farkı uygulanan ve baştan kurulan çözücüler aynı")
+
+
+def plan_gidis_donusunu_dogrula(tohumlar: Tuple[int, ...] = (0, 1)):
+    """
+    CSP ve GA planlarının .dfp ve JSONL dosyalarına yazılıp aynen okunduğunu kontrol eder.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Plan dosyalarının gidiş-dönüşü kontrol ediliyor...")
+    with tempfile.TemporaryDirectory() as gecici_dizin:
+        for tohum in tohumlar:
+            veri_ureteci = VeriUreteci(tohum=tohum)
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(5, 40, 3)
+            baslangic_zamani = time(9, 0)
+            
+            kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, baslangic_zamani)
+            kisit_cozucu.coz()
+            genetik_algoritma = GenetikAlgoritma(
+                dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, baslangic_zamani,
+                populasyon_boyutu=20, nesil_sayisi=5, tohum=tohum
+            )
+            genetik_algoritma.evrimles()
+            
+            for plan in (PlanSonucu.kisit_cozucuden(kisit_cozucu), PlanSonucu.genetik_algoritmadan(genetik_algoritma)):
+                for uzanti in (".dfp", ".jsonl", ".jsonl.gz"):
+                    dosya_adi = os.path.join(gecici_dizin, "plan" + uzanti)
+                    plan.kaydet(dosya_adi)
+                    okunan = PlanSonucu.yukle(dosya_adi)
+                    
+                    konum = f"{plan.algoritma} {uzanti} (tohum {tohum})"
+                    assert okunan.algoritma == plan.algoritma, konum
+                    assert okunan.baslangic_zamani == plan.baslangic_zamani, konum
+                    assert okunan.atanmamis_teslimatlar == plan.atanmamis_teslimatlar, konum
+                    assert okunan.ayaklar.tobytes() == plan.ayaklar.tobytes(), f"ayaklar farklı: {konum}"
+                    assert okunan.ozet_al() == plan.ozet_al(), f"özetler farklı: {konum}"
+    
+    print(f"{len(tohumlar)} tohumla CSP ve GA planları .dfp ve JSONL gidiş-dönüşünden aynen geçti")
+
+
+def sicak_baslangic_tohumlarini_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2, 3)):
+    """
+    GA sıcak başlangıcındaki CSP tohumunun GA modelinde ihlalsiz olduğunu kontrol eder.
+    
+    Küçük senaryolarda CSP tohumu ihlal içermemeli; daha kalabalık senaryolarda saf en
+    yakın komşu tohumundan fazla ihlal içermemelidir. Her iki tohum da her teslimatı
+    tam bir kez içermelidir.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("GA sıcak başlangıç tohumları kontrol ediliyor...")
+    for teslimat_sayisi in (30, 50):
+        for tohum in tohumlar:
+            veri_ureteci = VeriUreteci(tohum=tohum)
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(5, teslimat_sayisi, 3)
+            genetik_algoritma = GenetikAlgoritma(
+                dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0), tohum=tohum, sicak_baslangic=True
+            )
+            kisit_tohumu, en_yakin_komsu_tohumu = genetik_algoritma._tohum_kromozomlarini_olustur()
+            
+            for kromozom in (kisit_tohumu, en_yakin_komsu_tohumu):
+                teslimatlar = sorted(tid for rota in kromozom.values() for tid in rota)
+                assert teslimatlar == sorted(nokta.id for nokta in teslimat_noktalari), \
+                    f"tohum kromozomu teslimatları tam bir kez içermiyor (tohum {tohum})"
+            
+            kisit_ihlali = genetik_algoritma._kromozom_ihlallerini_say(kisit_tohumu)
+            en_yakin_komsu_ihlali = genetik_algoritma._kromozom_ihlallerini_say(en_yakin_komsu_tohumu)
+            konum = f"{teslimat_sayisi} teslimat, tohum {tohum}"
+            if teslimat_sayisi == 30:
+                assert kisit_ihlali == 0, f"CSP tohumu {kisit_ihlali} ihlal içeriyor ({konum})"
+            assert kisit_ihlali <= en_yakin_komsu_ihlali, \
+                f"CSP tohumu en yakın komşudan fazla ihlal içeriyor: {kisit_ihlali} > {en_yakin_komsu_ihlali} ({konum})"
+    
+    print(f"{len(tohumlar)} tohumla CSP sıcak başlangıç tohumu ihlalsiz")
+
+
+def sicak_baslangici_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2)):
+    """
+    GA sıcak başlangıcının tohum çözümleri popülasyona aynen koyduğunu ve başlangıcı iyileştirdiğini kontrol eder.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("GA sıcak başlangıcı soğuk başlangıçla karşılaştırılıyor...")
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(5, 30, 3)
+        
+        ilk_kayitlar = {}
+        for sicak_baslangic in (False, True):
+            genetik_algoritma = GenetikAlgoritma(
+                dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0),
+                populasyon_boyutu=20, nesil_sayisi=0, tohum=tohum, sicak_baslangic=sicak_baslangic
+            )
+            ilk_kayitlar[sicak_baslangic] = next(genetik_algoritma.evrimles_adim_adim())
+        
+        # Tohumlar popülasyonun ilk satırlarına aynen yerleştirilir
+        tohum_kromozomlari = GenetikAlgoritma(
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0), tohum=tohum
+        )._tohum_kromozomlarini_olustur()
+        for satir, kromozom in enumerate(tohum_kromozomlari):
+            assert genetik_algoritma._kromozomu_coz(genetik_algoritma.kromozom_matrisi[satir]) == kromozom, \
+                f"{satir}. tohum popülasyona aynen konmamış (tohum {tohum})"
+        
+        sicak, soguk = ilk_kayitlar[True]["en_iyi_uygunluk"], ilk_kayitlar[False]["en_iyi_uygunluk"]
+        assert sicak >= soguk, f"sıcak başlangıç soğuktan kötü (tohum {tohum}): {sicak} < {soguk}"
+    
+    print(f"{len(tohumlar)} tohumla sıcak başlangıcın ilk popülasyonu soğuk başlangıçtan iyi")
+
+
+def kontrol_noktasindan_devami_dogrula(tohumlar: Tuple[int, ...] = (0, 1)):
+    """
+    Kontrol noktasından devam eden GA çalışmasının kesintisiz çalışmayla aynı sonucu verdiğini kontrol eder.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("GA kontrol noktasından devam kontrol ediliyor...")
+    with tempfile.TemporaryDirectory() as gecici_dizin:
+        kontrol_noktasi_dosyasi = os.path.join(gecici_dizin, "ga.npz")
+        for tohum in tohumlar:
+            veri_ureteci = VeriUreteci(tohum=tohum)
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(4, 30, 3)
+            senaryo = (dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(10, 0))
+            ortak = dict(populasyon_boyutu=20, tohum=tohum)
+            
+            # İlk 10 nesil kontrol noktası alınarak çalıştırılır ve kesilir
+            kesilen = GenetikAlgoritma(
+                *senaryo, nesil_sayisi=10,
+                kontrol_noktasi_dosyasi=kontrol_noktasi_dosyasi, kontrol_noktasi_araligi=5, **ortak
+            )
+            kesilen.evrimles()
+            
+            devam_eden = GenetikAlgoritma(*senaryo, nesil_sayisi=15, **ortak)
+            assert devam_eden.kontrol_noktasini_yukle(kontrol_noktasi_dosyasi) == 10, \
+                f"kontrol noktası son nesli kaydetmemiş (tohum {tohum})"
+            devam_eden = GenetikAlgoritma(*senaryo, nesil_sayisi=15, **ortak)
+            devam_eden.kontrol_noktasindan_devam_et(kontrol_noktasi_dosyasi)
+            
+            kesintisiz = GenetikAlgoritma(*senaryo, nesil_sayisi=15, **ortak)
+            kesintisiz.evrimles()
+            
+            assert devam_eden.en_iyi_uygunluk_al() == kesintisiz.en_iyi_uygunluk_al(), \
+                f"devam eden çalışmanın uygunluğu farklı (tohum {tohum})"
+            assert devam_eden.en_iyi_birey.kromozom == kesintisiz.en_iyi_birey.kromozom, \
+                f"devam eden çalışmanın en iyi rotaları farklı (tohum {tohum})"
+    
+    print(f"{len(tohumlar)} tohumla kontrol noktasından devam kesintisiz çalışmayla aynı")
+
+
+def nesil_telemetrisini_dogrula(tohumlar: Tuple[int, ...] = (0, 1)):
+    """
+    GA nesil telemetrisinin her nesil için bir kayıt ürettiğini ve JSONL yazıcının aynı kayıtları yazdığını kontrol eder.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("GA nesil telemetrisi kontrol ediliyor...")
+    nesil_sayisi = 8
+    with tempfile.TemporaryDirectory() as gecici_dizin:
+        telemetri_dosyasi = os.path.join(gecici_dizin, "telemetri.jsonl")
+        for tohum in tohumlar:
+            veri_ureteci = VeriUreteci(tohum=tohum)
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(4, 25, 2)
+            senaryo = (dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(10, 0))
+            
+            genetik_algoritma = GenetikAlgoritma(*senaryo, populasyon_boyutu=20, nesil_sayisi=nesil_sayisi, tohum=tohum)
+            kayitlar = list(genetik_algoritma.evrimles_adim_adim())
+            
+            assert [kayit["nesil"] for kayit in kayitlar] == list(range(nesil_sayisi + 1)), \
+                f"telemetri her nesil için bir kayıt üretmemiş (tohum {tohum})"
+            en_iyi_uygunluklar = [kayit["en_iyi_uygunluk"] for kayit in kayitlar]
+            assert all(onceki <= sonraki for onceki, sonraki in zip(en_iyi_uygunluklar, en_iyi_uygunluklar[1:])), \
+                f"en iyi uygunluk nesiller boyunca düşmüş (tohum {tohum})"
+            assert en_iyi_uygunluklar[-1] == genetik_algoritma.en_iyi_uygunluk_al(), \
+                f"son telemetri kaydı en iyi bireyle uyuşmuyor (tohum {tohum})"
+            
+            # Aynı tohumla geri çağırma üzerinden yazılan JSONL kayıtları da aynı olmalı
+            if os.path.exists(telemetri_dosyasi):
+                os.remove(telemetri_dosyasi)
+            with JsonlTelemetriYazici(telemetri_dosyasi) as yazici:
+                GenetikAlgoritma(*senaryo, populasyon_boyutu=20, nesil_sayisi=nesil_sayisi, tohum=tohum).evrimles(yazici)
+            with open(telemetri_dosyasi, encoding="utf-8") as dosya:
+                yazilan_kayitlar = [json.loads(satir) for satir in dosya]
+            
+            # Geçen süre çalışmadan çalışmaya değiştiği için karşılaştırılmaz
+            def sureden_bagimsiz(kayit_listesi):
+                return [{anahtar: deger for anahtar, deger in kayit.items() if anahtar != "gecen_sure"}
+                        for kayit in kayit_listesi]
+            assert sureden_bagimsiz(yazilan_kayitlar) == sureden_bagimsiz(kayitlar), \
+                f"JSONL telemetri kayıtları üreteç kayıtlarından farklı (tohum {tohum})"
+    
+    print(f"{len(tohumlar)} tohumla nesil telemetrisi tutarlı")
+
+
+def uyarlanabilir_operatorleri_dogrula(tohumlar: Tuple[int, ...] = (0, 1)):
+    """
+    Uyarlanabilir operatör olasılıklarının geçerli bir dağılım oluşturduğunu ve kredi tablosunun tutarlı olduğunu kontrol eder.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("GA uyarlanabilir operatörleri kontrol ediliyor...")
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(4, 25, 2)
+        senaryo = (dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(10, 0))
+        
+        genetik_algoritma = GenetikAlgoritma(
+            *senaryo, populasyon_boyutu=20, nesil_sayisi=10, tohum=tohum, uyarlanabilir_operatorler=True
+        )
+        genetik_algoritma.evrimles()
+        tablo = genetik_algoritma.operator_kredi_tablosu_al()
+        
+        for grup, operatorler in GenetikAlgoritma.OPERATOR_GRUPLARI.items():
+            olasiliklar = [tablo[operator]["olasilik"] for operator in operatorler]
+            assert abs(sum(olasiliklar) - 1.0) < 1e-9, f"{grup} olasılıkları 1'e toplanmıyor (tohum {tohum})"
+            assert min(olasiliklar) >= GenetikAlgoritma.OPERATOR_MIN_OLASILIGI - 1e-12, \
+                f"{grup} operatörlerinden biri en küçük olasılığın altına düşmüş (tohum {tohum})"
+            assert sum(tablo[operator]["kullanim"] for operator in operatorler) > 0, \
+                f"{grup} grubundan hiç operatör uygulanmamış (tohum {tohum})"
+        for operator, satir in tablo.items():
+            assert satir["iyilesme_sayisi"] <= satir["kullanim"], \
+                f"{operator} kullanımından fazla iyileşme saymış (tohum {tohum})"
+        
+        # Uyarlanabilir seçim kapalıyken klasik operatörler kullanılır ve olasılık raporlanmaz
+        genetik_algoritma = GenetikAlgoritma(*senaryo, populasyon_boyutu=20, nesil_sayisi=5, tohum=tohum)
+        genetik_algoritma.evrimles()
+        klasik_tablo = genetik_algoritma.operator_kredi_tablosu_al()
+        assert all(satir["olasilik"] is None for satir in klasik_tablo.values()), \
+            f"klasik GA operatör olasılığı raporlamış (tohum {tohum})"
+        assert klasik_tablo["rota_degisimi"]["kullanim"] == klasik_tablo["yerel_arama"]["kullanim"] == 0, \
+            f"klasik GA uyarlanabilir operatörleri kullanmış (tohum {tohum})"
+    
+    print(f"{len(tohumlar)} tohumla uyarlanabilir operatör olasılıkları ve kredi tablosu tutarlı")
+
+
+def geri_izlemeli_aramayi_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2, 3)):
+    """
+    Geri izlemeli CSP aramasının ihlalsiz ve açgözlü plan kadar iyi bir plan döndürdüğünü kontrol eder.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Geri izlemeli arama açgözlü planla karşılaştırılıyor...")
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(4, 30, 3)
+        
+        acgozlu_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0))
+        acgozlu_cozucu.coz()
+        geri_izleme_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0))
+        geri_izleme_cozucu.coz("geri_izleme", zaman_butcesi=2.0)
+        
+        ihlaller = _plan_ihlallerini_al(geri_izleme_cozucu)
+        assert not any(ihlaller.values()), f"geri izleme planı ihlal içeriyor (tohum {tohum}): {ihlaller}"
+        atananlar = [tid for tidler in geri_izleme_cozucu.atamalar.values() for tid in tidler]
+        assert len(atananlar) == len(set(atananlar)), f"geri izleme bir teslimatı iki kez atamış (tohum {tohum})"
+        
+        acgozlu = acgozlu_cozucu.teslimat_istatistiklerini_al()["tamamlanma_orani"]
+        geri_izleme = geri_izleme_cozucu.teslimat_istatistiklerini_al()["tamamlanma_orani"]
+        assert geri_izleme >= acgozlu, f"geri izleme açgözlüden az teslimat yapmış (tohum {tohum}): {geri_izleme} < {acgozlu}"
+    
+    print(f"{len(tohumlar)} tohumla geri izlemeli arama ihlalsiz ve açgözlü plan kadar iyi")
+
+
+def statik_alan_daraltmayi_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2)):
+    """
+    Statik alan daraltmanın yalnızca gerçekten imkansız drone-teslimat çiftlerini elediğini kontrol eder.
+    
+    Elenen her çift için drone'un tam bataryayla depodan yalnızca o teslimata gidip
+    döndüğü tek duraklı plan (en iyimser durum) PlanSonucu ile denetlenir ve en az bir
+    ihlal içermelidir. Rastgele senaryolara batarya ve yasak bölge kurallarını da
+    tetikleyen elle kurulmuş bir senaryo eklenir.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Statik alan daraltma kontrol ediliyor...")
+    senaryolar = [VeriUreteci(tohum=tohum).senaryo_uret(5, 40, 4) for tohum in tohumlar]
+    senaryolar.append((
+        [Drone(1, 5.0, 500, 10.0, (0.0, 0.0)), Drone(2, 5.0, 10000, 10.0, (0.0, 0.0))],
+        [TeslimatNoktasi(1, (100.0, 0.0), 1.0, 3, (time(9, 0), time(12, 0))),
+         TeslimatNoktasi(2, (50.0, 50.0), 1.0, 3, (time(9, 0), time(12, 0))),
+         TeslimatNoktasi(3, (10.0, 10.0), 1.0, 3, (time(9, 0), time(12, 0)))],
+        [UcusYasakBolgesi(1, [(40.0, 40.0), (60.0, 40.0), (60.0, 60.0), (40.0, 60.0)], (time(0, 0), time(23, 59)))]
+    ))
+    
+    elenen_kurallar = dict.fromkeys(("kapasite", "batarya", "zaman_penceresi", "yasak_bolge"), 0)
+    for sira, (dronlar, teslimat_noktalari, ucus_yasak_bolgeleri) in enumerate(senaryolar):
+        uygun, istatistikler = statik_uygunluk_matrisi_hesapla(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0))
+        for kural in elenen_kurallar:
+            elenen_kurallar[kural] += istatistikler[kural]
+        assert sum(istatistikler[kural] for kural in elenen_kurallar) == np.count_nonzero(~uygun), \
+            f"kural istatistikleri elenen çift sayısıyla uyuşmuyor (senaryo {sira})"
+        
+        for dron_sirasi, teslimat_sirasi in zip(*np.nonzero(~uygun)):
+            plan = PlanSonucu.seferlerden_olustur(
+                "statik", dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0),
+                {dronlar[dron_sirasi].id: [[teslimat_noktalari[teslimat_sirasi].id]]}
+            )
+            assert any(plan.ozet_al()["ihlaller"].values()), \
+                f"uygulanabilir çift elenmiş (senaryo {sira}): drone {dronlar[dron_sirasi].id}, " \
+                f"teslimat {teslimat_noktalari[teslimat_sirasi].id}"
+        
+        # AC-3 yayılımı alanları yalnızca daraltabilir
+        zorunlu_uygun, _ = statik_uygunluk_matrisi_hesapla(
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0), tum_teslimatlar_zorunlu=True
+        )
+        assert not (zorunlu_uygun & ~uygun).any(), f"AC-3 elenmiş bir çifti geri eklemiş (senaryo {sira})"
+    
+    assert all(elenen_kurallar.values()), f"bazı kurallar hiç denenmedi: {elenen_kurallar}"
+    print(f"{len(senaryolar)} senaryoda statik olarak elenen çiftlerin hepsi uygulanamaz: {elenen_kurallar}")
+
+
+def uygunluk_matrisini_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2)):
+    """
+    Vektörel uygunluk matrisinin tekil uygunluk kontrolüyle her çift için aynı olduğunu kontrol eder.
+    
+    Karşılaştırma başlangıç durumunda, her drone'a birkaç teslimat elle atandıktan sonra
+    ve çözüm bittikten sonra yapılır.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Vektörel uygunluk matrisi tekil kontrolle karşılaştırılıyor...")
+    
+    def matrisleri_karsilastir(kisit_cozucu: KisitCozucu, asama: str, tohum: int):
+        dron_idleri = [dron.id for dron in kisit_cozucu.dronlar]
+        matris = kisit_cozucu.uygunluk_matrisi_hesapla()
+        tekil = np.array([
+            [kisit_cozucu._dron_teslimat_yapabilir_mi(dron_id, nokta.id) for nokta in kisit_cozucu.teslimat_noktalari]
+            for dron_id in dron_idleri
+        ])
+        assert np.array_equal(matris, tekil), f"{asama} uygunluk matrisi tekil kontrolden farklı (tohum {tohum})"
+        assert np.array_equal(kisit_cozucu.uygunluk_matrisi_hesapla(dron_idleri[1::2]), matris[1::2]), \
+            f"{asama} drone alt kümesinin satırları tüm matristen farklı (tohum {tohum})"
+    
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(5, 40, 4, (10.0, 10.0))
+        kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0))
+        matrisleri_karsilastir(kisit_cozucu, "başlangıç", tohum)
+        
+        # Drone'ları farklı konum, batarya ve zamanlara taşımak için uygun son teslimatları ata
+        for _ in range(3):
+            for dron in dronlar:
+                uygunlar = np.flatnonzero(
+                    kisit_cozucu.uygunluk_matrisi_hesapla([dron.id])[0] & ~kisit_cozucu.durum.teslim_edildi
+                )
+                if len(uygunlar):
+                    teslimat_id = teslimat_noktalari[uygunlar[-1]].id
+                    kisit_cozucu.atamalar[dron.id].append(teslimat_id)
+                    kisit_cozucu._dron_durumunu_guncelle(dron.id, teslimat_id)
+        matrisleri_karsilastir(kisit_cozucu, "kısmi plan", tohum)
+        
+        kisit_cozucu.coz()
+        matrisleri_karsilastir(kisit_cozucu, "çözüm sonrası", tohum)
+    
+    print(f"{len(tohumlar)} tohumla vektörel uygunluk matrisi tekil kontrolle aynı")
+
+
+def senaryo_nesnelerinin_korundugunu_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2)):
+    """
+    KisitCozucu'nun senaryo nesnelerini kopyalamadan ama değiştirmeden kullandığını kontrol eder.
+    
+    Her yöntemle çözümden ve çevrimiçi eklemeden sonra çağıranın drone ve teslimat
+    nesneleri ile teslimat listesi aynı kalmalı; aynı çözücüyle tekrarlanan çözüm ve
+    aynı nesneleri paylaşan ikinci bir çözücü aynı planı üretmelidir.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Çözücünün senaryo nesnelerini koruduğu kontrol ediliyor...")
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(5, 40, 3)
+        onceki_dronlar = [dataclasses.asdict(dron) for dron in dronlar]
+        onceki_teslimatlar = [dataclasses.asdict(nokta) for nokta in teslimat_noktalari]
+        planlanan_teslimatlar = teslimat_noktalari[:30]
+        
+        kisit_cozucu = KisitCozucu(dronlar, planlanan_teslimatlar, ucus_yasak_bolgeleri, time(9, 0))
+        ilk_plan = kisit_cozucu.coz()
+        kisit_cozucu.coz("pismanlik")
+        kisit_cozucu.coz("geri_izleme", zaman_butcesi=1.0)
+        assert kisit_cozucu.coz() == ilk_plan, f"tekrarlanan çözüm farklı plan üretti (tohum {tohum})"
+        for nokta in teslimat_noktalari[30:]:
+            kisit_cozucu.ekle(nokta)
+        
+        assert [dataclasses.asdict(dron) for dron in dronlar] == onceki_dronlar, \
+            f"çözücü drone nesnelerini değiştirmiş (tohum {tohum})"
+        assert [dataclasses.asdict(nokta) for nokta in teslimat_noktalari] == onceki_teslimatlar, \
+            f"çözücü teslimat nesnelerini değiştirmiş (tohum {tohum})"
+        assert planlanan_teslimatlar == teslimat_noktalari[:30], \
+            f"çevrimiçi ekleme çağıranın teslimat listesini değiştirmiş (tohum {tohum})"
+        
+        ikinci_cozucu = KisitCozucu(dronlar, planlanan_teslimatlar, ucus_yasak_bolgeleri, time(9, 0))
+        assert ikinci_cozucu.coz() == ilk_plan, \
+            f"aynı nesnelerle kurulan ikinci çözücü farklı plan üretti (tohum {tohum})"
+    
+    print(f"{len(tohumlar)} tohumla senaryo nesneleri çözümden etkilenmiyor")
+
+
+def pismanlik_eklemesini_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2, 3, 4, 5)):
+    """
+    Pişmanlık-k ekleme sezgiselinin ihlalsiz ve açgözlü plan kadar çok teslimat yapan bir plan ürettiğini kontrol eder.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Pişmanlık-k eklemesi açgözlü planla karşılaştırılıyor...")
+    for tohum in tohumlar:
+        veri_ureteci = VeriUreteci(tohum=tohum)
+        dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = veri_ureteci.senaryo_uret(5, 40, 3)
+        
+        acgozlu_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0))
+        acgozlu_cozucu.coz()
+        acgozlu = acgozlu_cozucu.teslimat_istatistiklerini_al()["tamamlanma_orani"]
+        
+        for pismanlik_k in (2, 3):
+            kisit_cozucu = KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0))
+            kisit_cozucu.coz("pismanlik", pismanlik_k=pismanlik_k)
+            
+            ihlaller = _plan_ihlallerini_al(kisit_cozucu)
+            assert not any(ihlaller.values()), f"pişmanlık-{pismanlik_k} planı ihlal içeriyor (tohum {tohum}): {ihlaller}"
+            atananlar = [tid for tidler in kisit_cozucu.atamalar.values() for tid in tidler]
+            assert len(atananlar) == len(set(atananlar)), f"pişmanlık-{pismanlik_k} bir teslimatı iki kez atamış (tohum {tohum})"
+            
+            pismanlik = kisit_cozucu.teslimat_istatistiklerini_al()["tamamlanma_orani"]
+            assert pismanlik >= acgozlu, \
+                f"pişmanlık-{pismanlik_k} açgözlüden az teslimat yapmış (tohum {tohum}): {pismanlik} < {acgozlu}"
+    
+    try:
+        KisitCozucu(dronlar, teslimat_noktalari, ucus_yasak_bolgeleri, time(9, 0)).coz("pismanlik", pismanlik_k=1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("pişmanlık derecesi 1 kabul edilmiş")
+    
+    print(f"{len(tohumlar)} tohumla pişmanlık-k planları ihlalsiz ve açgözlü plan kadar iyi")
+
+
+def kolonlu_senaryo_dosyasini_dogrula(tohumlar: Tuple[int, ...] = (0, 1, 2)):
+    """
+    Kolonlu (.dfk) senaryo dosyasının kayıpsız kaydedilip yüklendiğini ve içerik özetinin kararlı olduğunu kontrol eder.
+    
+    Bellek eşlemeli ve belleğe okunan yüklemeler aynı nesneleri vermeli; özet kolonlu
+    dosyadan, metin dosyasından ve nesnelerden hesaplandığında aynı olmalı, içerik
+    değişince değişmelidir.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Kolonlu senaryo dosyası kontrol ediliyor...")
+    with tempfile.TemporaryDirectory() as gecici_dizin:
+        kolonlu_dosya = os.path.join(gecici_dizin, "senaryo.dfk")
+        metin_dosyasi = os.path.join(gecici_dizin, "senaryo.txt")
+        for tohum in tohumlar:
+            veri_ureteci = VeriUreteci(tohum=tohum)
+            senaryo = veri_ureteci.senaryo_uret(5, 50, 3)
+            kolonlu_senaryo = KolonluSenaryo.nesnelerden_olustur(*senaryo)
+            ozet = kolonlu_senaryo.ozet()
+            
+            veri_ureteci.senaryoyu_kolonlu_kaydet(kolonlu_dosya, *senaryo)
+            for bellek_esleme in (True, False):
+                yuklenen = veri_ureteci.senaryoyu_kolonlu_yukle(kolonlu_dosya, bellek_esleme)
+                assert yuklenen.nesneleri_al() == senaryo, \
+                    f"kolonlu dosyadan yüklenen senaryo farklı (tohum {tohum}, bellek eşleme {bellek_esleme})"
+                assert yuklenen.ozet() == ozet, \
+                    f"kolonlu dosyadan yüklenen senaryonun özeti farklı (tohum {tohum}, bellek eşleme {bellek_esleme})"
+                assert yuklenen.teslimat_noktalarini_al(slice(10, 20)) == senaryo[1][10:20], \
+                    f"kolonlu dosyadan kısmi teslimat okuması farklı (tohum {tohum}, bellek eşleme {bellek_esleme})"
+            # Bellek eşlemesi kapanmadan geçici dosyanın üzerine yazılmasın
+            del yuklenen
+            
+            veri_ureteci.senaryoyu_dosyaya_kaydet(metin_dosyasi, *senaryo)
+            metin_senaryosu = veri_ureteci.senaryoyu_dosyadan_yukle(metin_dosyasi)
+            assert KolonluSenaryo.nesnelerden_olustur(*metin_senaryosu).ozet() == ozet, \
+                f"metin dosyasından yüklenen senaryonun özeti farklı (tohum {tohum})"
+            
+            dronlar, teslimat_noktalari, ucus_yasak_bolgeleri = senaryo
+            degisen_teslimat = dataclasses.replace(teslimat_noktalari[0], oncelik=teslimat_noktalari[0].oncelik % 5 + 1)
+            degisen_ozet = KolonluSenaryo.nesnelerden_olustur(
+                dronlar, [degisen_teslimat] + teslimat_noktalari[1:], ucus_yasak_bolgeleri
+            ).ozet()
+            assert degisen_ozet != ozet, f"değişen önceliğe rağmen özet aynı kalmış (tohum {tohum})"
+        
+        try:
+            KolonluSenaryo.yukle(metin_dosyasi)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("metin senaryo dosyası kolonlu senaryo olarak yüklenmiş")
+    
+    print(f"{len(tohumlar)} tohumla kolonlu senaryo dosyası kayıpsız ve özeti kararlı")
+
+
+def kolonlu_uretimi_dogrula(tohumlar: Tuple[int, ...] = (0, 1)):
+    """
+    Toplu (NumPy) senaryo üretiminin tekrarlanabilir olduğunu ve nesne üreteciyle aynı dağılımlardan örneklediğini kontrol eder.
+    
+    Aynı tohum aynı senaryoyu (aynı özeti), farklı tohum farklı senaryoyu vermeli.
+    Büyük örneklemde kesikli kolonların (öncelik, zaman aralıkları, köşe sayısı) değer
+    kümeleri nesne üretecininkiyle aynı olmalı; sürekli kolonlar aynı sınırlar içinde
+    kalmalı ve ortalamaları standart sapmanın onda birinden fazla ayrışmamalıdır.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Toplu senaryo üretimi nesne üreteciyle karşılaştırılıyor...")
+    ornek_sayisi = 20000
+    for tohum in tohumlar:
+        ozetler = [VeriUreteci(tohum=ilk).kolonlu_senaryo_uret(5, 50, 3).ozet() for ilk in (tohum, tohum, tohum + 100)]
+        assert ozetler[0] == ozetler[1], f"aynı tohumla toplu üretim farklı senaryo verdi (tohum {tohum})"
+        assert ozetler[0] != ozetler[2], f"farklı tohumlarla toplu üretim aynı senaryoyu verdi (tohum {tohum})"
+        
+        toplu_ureteci, nesne_ureteci = VeriUreteci(tohum=tohum), VeriUreteci(tohum=tohum)
+        toplu = {
+            **toplu_ureteci.dron_kolonlari_uret(2000),
+            **toplu_ureteci.teslimat_kolonlari_uret(ornek_sayisi),
+            **toplu_ureteci.ucus_yasak_bolge_kolonlari_uret(ornek_sayisi)
+        }
+        tekil = KolonluSenaryo.nesnelerden_olustur(
+            nesne_ureteci.dronlari_uret(2000),
+            nesne_ureteci.teslimat_noktalari_uret(ornek_sayisi),
+            nesne_ureteci.ucus_yasak_bolgeleri_uret(ornek_sayisi)
+        ).diziler
+        
+        for ad in ("teslimat_oncelik", "teslimat_zaman_araligi", "bolge_aktif_zaman", "bolge_kose_ofsetleri"):
+            # Köşe ofsetlerinden bölge başına köşe sayıları karşılaştırılır
+            toplu_dizi, tekil_dizi = (np.diff(d[ad]) if ad == "bolge_kose_ofsetleri" else d[ad] for d in (toplu, tekil))
+            toplu_degerler = set(map(tuple, toplu_dizi.reshape(len(toplu_dizi), -1).tolist()))
+            tekil_degerler = set(map(tuple, tekil_dizi.reshape(len(tekil_dizi), -1).tolist()))
+            assert toplu_degerler == tekil_degerler, f"{ad} değer kümesi nesne üretecinden farklı (tohum {tohum})"
+        
+        sinirlar = {
+            "dron_maksimum_agirlik": (1.0, 5.0), "dron_batarya": (5000, 10000), "dron_hiz": (5.0, 15.0),
+            "teslimat_agirlik": (0.5, 4.0), "teslimat_poz": (0.0, 100.0), "bolge_koordinatlar": (0.0, 100.0)
+        }
+        for ad, (alt, ust) in sinirlar.items():
+            degerler, ornek = np.asarray(toplu[ad]), np.asarray(tekil[ad])
+            assert alt <= degerler.min() and degerler.max() <= ust, f"{ad} [{alt}, {ust}] dışına çıkmış (tohum {tohum})"
+            assert abs(degerler.mean() - ornek.mean()) < 0.1 * ornek.std(), \
+                f"{ad} ortalaması nesne üretecinden ayrışıyor (tohum {tohum})"
+    
+    print(f"{len(tohumlar)} tohumla toplu üretim tekrarlanabilir ve nesne üreteciyle aynı dağılımda")
+
+
+def sonuc_onbellegi_tahliyesini_dogrula(sikistirmalar: Tuple[Optional[str], ...] = (None, ".gz")):
+    """
+    Sonuç önbelleğinin boyut sınırı aşılınca en uzun süre kullanılmamış kayıtları sildiğini kontrol eder.
+    
+    Aynı boyutta üç kayıt sığan bir önbelleğe üç kayıt yazılır ve son kullanım zamanları
+    geçmişe sırayla ayarlanır. En eski kayıt okunduktan sonra yazılan dördüncü kayıt,
+    okunanı değil ikinci en eski kaydı tahliye etmelidir. Sınırdan büyük tek kayıt
+    yazıldığı anda silinmemeli, sonraki yazmada tahliye edilmelidir.
+    
+    Args:
+        sikistirmalar (Tuple[Optional[str], ...]): Denenecek kayıt sıkıştırmaları
+    """
+    print("Sonuç önbelleği LRU tahliyesi kontrol ediliyor...")
+    for sikistirma in sikistirmalar:
+        with tempfile.TemporaryDirectory() as gecici_dizin:
+            # Aynı boyutta sıkıştırılan/yazılan sonuçlar
+            sonuclar = {anahtar: {"anahtar": anahtar, "veri": list(range(300))} for anahtar in "abcd"}
+            olcum = SonucOnbellegi(os.path.join(gecici_dizin, "olcum"), sikistirma=sikistirma)
+            olcum.kaydet("a", sonuclar["a"])
+            kayit_boyutu = olcum.istatistikleri_al()["toplam_boyut"]
+            
+            onbellek = SonucOnbellegi(
+                os.path.join(gecici_dizin, "onbellek"), maksimum_boyut=3 * kayit_boyutu + kayit_boyutu // 2,
+                sikistirma=sikistirma
+            )
+            simdi = zaman_modulu.time()
+            for yas, anahtar in zip((30, 20, 10), "abc"):
+                onbellek.kaydet(anahtar, sonuclar[anahtar])
+                os.utime(onbellek._dosya_yolu(anahtar), (simdi - yas, simdi - yas))
+            
+            assert onbellek.al("a") == sonuclar["a"], f"kayıt okunamadı (sıkıştırma {sikistirma})"
+            onbellek.kaydet("d", sonuclar["d"])
+            
+            assert onbellek.al("b") is None, f"en uzun süre kullanılmamış kayıt silinmemiş (sıkıştırma {sikistirma})"
+            for anahtar in "acd":
+                assert onbellek.al(anahtar) == sonuclar[anahtar], \
+                    f"'{anahtar}' kaydı yanlışlıkla silinmiş (sıkıştırma {sikistirma})"
+            istatistikler = onbellek.istatistikleri_al()
+            assert istatistikler["kayit_sayisi"] == 3 and istatistikler["toplam_boyut"] <= onbellek.maksimum_boyut, \
+                f"önbellek boyut sınırını aşmış (sıkıştırma {sikistirma}): {istatistikler}"
+            assert (istatistikler["isabet_sayisi"], istatistikler["iska_sayisi"]) == (4, 1), \
+                f"isabet/ıska sayaçları yanlış (sıkıştırma {sikistirma}): {istatistikler}"
+            
+            # Sınırdan büyük kayıt yazıldığı anda korunur, sonraki yazmada tahliye edilir
+            kucuk = SonucOnbellegi(os.path.join(gecici_dizin, "kucuk"), maksimum_boyut=1, sikistirma=sikistirma)
+            kucuk.kaydet("a", sonuclar["a"])
+            assert kucuk.al("a") == sonuclar["a"], f"az önce yazılan kayıt silinmiş (sıkıştırma {sikistirma})"
+            kucuk.kaydet("b", sonuclar["b"])
+            assert kucuk.al("a") is None and kucuk.al("b") == sonuclar["b"], \
+                f"sınırdan büyük eski kayıt tahliye edilmemiş (sıkıştırma {sikistirma})"
+    
+    print(f"{len(sikistirmalar)} sıkıştırma ayarıyla önbellek en uzun süre kullanılmamış kayıtları tahliye ediyor")
+
+
+def sikistirilmis_dosyalari_dogrula(tohumlar: Tuple[int, ...] = (0, 1)):
+    """
+    dosya_ac'ın desteklenen her sıkıştırma uzantısında kayıpsız yazıp okuduğunu kontrol eder.
+    
+    Sıkıştırılmış senaryo dosyası sıkıştırılmamışla aynı senaryoyu vermeli, içeriği ilgili
+    modülle açıldığında aynı metin olmalı ve dosya daha küçük olmalıdır. Ekleme kipinde
+    yazılan akışlar art arda okunmalı ve sıkıştırılmış dosyalar paralel yüklemede
+    reddedilmelidir.
+    
+    Args:
+        tohumlar (Tuple[int, ...]): Denenecek rastgele sayı üreteci tohumları
+    """
+    print("Sıkıştırılmış dosyalar kontrol ediliyor...")
+    with tempfile.TemporaryDirectory() as gecici_dizin:
+        duz_dosya = os.path.join(gecici_dizin, "senaryo.txt")
+        for tohum in tohumlar:
+            veri_ureteci = VeriUreteci(tohum=tohum)
+            senaryo = veri_ureteci.senaryo_uret(5, 200, 4)
+            veri_ureteci.senaryoyu_dosyaya_kaydet(duz_dosya, *senaryo)
+            duz_senaryo = veri_ureteci.senaryoyu_dosyadan_yukle(duz_dosya)
+            with open(duz_dosya, encoding="utf-8") as f:
+                duz_metin = f.read()
+            
+            for uzanti, modul in SIKISTIRMA_MODULLERI.items():
+                sikistirilmis_dosya = duz_dosya + uzanti
+                veri_ureteci.senaryoyu_dosyaya_kaydet(sikistirilmis_dosya, *senaryo)
+                
+                assert veri_ureteci.senaryoyu_dosyadan_yukle(sikistirilmis_dosya) == duz_senaryo, \
+                    f"{uzanti} senaryosu sıkıştırılmamış senaryodan farklı yüklendi (tohum {tohum})"
+                with modul.open(sikistirilmis_dosya, 'rt', encoding="utf-8") as f:
+                    assert f.read() == duz_metin, f"{uzanti} dosyasının açılmış içeriği farklı (tohum {tohum})"
+                assert os.path.getsize(sikistirilmis_dosya) < os.path.getsize(duz_dosya), \
+                    f"{uzanti} dosyası sıkıştırılmamış dosyadan küçük değil (tohum {tohum})"
+                
+                try:
+                    veri_ureteci.senaryoyu_paralel_yukle(sikistirilmis_dosya)
+                except ValueError:
+                    pass
+                else:
+                    raise AssertionError(f"{uzanti} dosyası bayt aralıklarına bölünerek yüklenmiş")
+    
+        # Ekleme kipi her çağrıda yeni bir akış ekler; ikili kip de desteklenir
+        for uzanti in SIKISTIRMA_MODULLERI:
+            ekleme_dosyasi = os.path.join(gecici_dizin, "kayitlar.jsonl" + uzanti)
+            for satir in ("ilk\n", "ikinci\n"):
+                with dosya_ac(ekleme_dosyasi, 'a') as f:
+                    f.write(satir)
+            with dosya_ac(ekleme_dosyasi, 'rb') as f:
+                assert f.read() == b"ilk\nikinci\n", f"{uzanti} dosyasına eklenen akışlar art arda okunmadı"
+    
+    print(f"{len(tohumlar)} tohumla {', '.join(SIKISTIRMA_MODULLERI)} dosyaları kayıpsız yazılıp okundu")
+
+
+def tutarlilik_testlerini_calistir():
+    """
+    Grafik üretmeyen, tekrarlanabilir tutarlılık testlerini çalıştırır.
+    
+    Başarısız bir kontrol AssertionError fırlatır.
+    """
+    uretilen_senaryolari_dogrula()
+    cevrimici_eklemeyi_dogrula()
+    fark_uygulamasini_dogrula()
+    plan_gidis_donusunu_dogrula()
+    sicak_baslangic_tohumlarini_dogrula()
+    sicak_baslangici_dogrula()
+    kontrol_noktasindan_devami_dogrula()
+    nesil_telemetrisini_dogrula()
+    uyarlanabilir_operatorleri_dogrula()
+    geri_izlemeli_aramayi_dogrula()
+    statik_alan_daraltmayi_dogrula()
+    uygunluk_matrisini_dogrula()
+    senaryo_nesnelerinin_korundugunu_dogrula()
+    pismanlik_eklemesini_dogrula()
+    kolonlu_senaryo_dosyasini_dogrula()
+    kolonlu_uretimi_dogrula()
+    sonuc_onbellegi_tahliyesini_dogrula()
+    sikistirilmis_dosyalari_dogrula()
+
+
 def testleri_calistir(cikti_dizini: str = "cikti"):
     """
     Tüm test senaryolarını çalıştırır.
@@ -393,6 +1210,9 @@ def testleri_calistir(cikti_dizini: str = "cikti"):
     os.makedirs(cikti_dizini, exist_ok=True)
     print(f"Çıktılar şu dizine kaydedilecek: {cikti_dizini}")
     
+    # Üretilen senaryoların doğrulamadan geçtiğini ve çözücülerin tutarlılığını kontrol et
+    tutarlilik_testlerini_calistir()
+    
     # Senaryo 1'i çalıştır
     senaryo1_sonuclari = senaryo_1_calistir(cikti_dizini)
     
@@ -406,13 +1226,13 @@ def testleri_calistir(cikti_dizini: str = "cikti"):
     print(f"A* çalışma süresi: {senaryo1_sonuclari.get('a_yildiz_suresi', 0):.4f} saniye")
     print(f"CSP çalışma süresi: {senaryo1_sonuclari.get('csp_suresi', 0):.4f} saniye")
     print(f"GA çalışma süresi: {senaryo1_sonuclari.get('ga_suresi', 0):.4f} saniye")
-    print(f"CSP tamamlanan teslimat yüzdesi: 15.00%")
+    print(f"CSP tamamlanan teslimat yüzdesi: {senaryo1_sonuclari.get('csp_tamamlanma_orani', 0):.2f}%")
     print(f"GA toplam teslimat sayısı: 20")
     
     print("Senaryo 2 (10 drone, 50 teslimat, 5 dinamik uçuş yasak bölgesi):")
     print(f"CSP çalışma süresi: {senaryo2_sonuclari.get('csp_suresi', 0):.4f} saniye")
     print(f"GA çalışma süresi: {senaryo2_sonuclari.get('ga_suresi', 0):.4f} saniye")
-    print(f"CSP tamamlanan teslimat yüzdesi: 18.00%")
+    print(f"CSP tamamlanan teslimat yüzdesi: {senaryo2_sonuclari.get('csp_tamamlanma_orani', 0):.2f}%")
     print(f"GA toplam teslimat sayısı: 50")
     
     # Genel karşılaştırma grafiği
@@ -461,3 +1281,7 @@ def testleri_calistir(cikti_dizini: str = "cikti"):
         "senaryo1": senaryo1_sonuclari,
         "senaryo2": senaryo2_sonuclari
     }
+
+
+if __name__ == "__main__":
+    tutarlilik_testlerini_calistir()
@@ -11,7 +11,7 @@ import random
 from datetime import time
 from matplotlib.colors import to_rgba
 
-from models import Drone, TeslimatNoktasi, UcusYasakBolgesi
+from models import Drone, TeslimatNoktasi, UcusYasakBolgesi, KimlikKaydi
 
 
 class Gorselleştirici:
@@ -51,8 +51,8 @@ class Gorselleştirici:
         ]
         
         # Drone ve teslimat noktalarını ID'lerine göre eşle
-        self.dron_sozlugu = {dron.id: dron for dron in dronlar}
-        self.teslimat_sozlugu = {nokta.id: nokta for nokta in teslimat_noktalari}
+        self.dron_kaydi = KimlikKaydi(dronlar)
+        self.teslimat_kaydi = KimlikKaydi(teslimat_noktalari)
         
         # Renk paleti oluştur
         self.dron_renkleri = self._renkleri_olustur(len(dronlar))
@@ -476,7 +476,7 @@ class Gorselleştirici:
             for dron_id in rotalar.keys():
                 if dron_id in dron_isaretcileri:
                     dron_isaretcileri[dron_id].set_offsets(
-                        np.array([self.dron_sozlugu[dron_id].baslangic_poz])
+                        np.array([self.dron_kaydi[dron_id].baslangic_poz])
                     )
             
             zaman_metni.set_text("Adım: 0")
@@ -502,7 +502,7 @@ class Gorselleştirici:
                             cizgi = eksen.plot(
                                 [rota[j][0], rota[j+1][0]], 
                                 [rota[j][1], rota[j+1][1]],
-                                color=self.dron_renkleri[list(rotalar.keys()).index(dron_id)],
+                                color=self.dron_renkleri[self.dron_kaydi.indeks(dron_id)],
                                 linewidth=2,
                                 alpha=0.7,
                                 zorder=2